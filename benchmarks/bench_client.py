@@ -0,0 +1,320 @@
+'''
+bench_client.py
+
+Benchmark and load-test suite for the clients, run against the local stub server.
+
+Scenarios: throughput and p50 / p99 latency of LineEndpoint calls, decode cost of big lists per
+JSON backend, concurrency scaling of the blocking and async clients, memory held per decoded
+response, columnar tables versus row dicts and throughput under 429 throttling with retries. Every
+client retries the stub's injected 429 / 500 answers, so --error-rate and --throttle-rate slow the
+scenarios down instead of aborting them; requests still failing are counted per scenario. Results
+are written to benchmarks/results/<timestamp>.json and compared with the previous run made with
+the same configuration, flagging metrics that got worse by more than the threshold.
+
+Usage: python benchmarks/bench_client.py [--quick] [--latency 0.005] [--payload-scale 1] [--compare results/x.json]
+'''
+from typing import Callable, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from stub_server import StubTfLServer
+from tfl.client import Client
+from tfl.decoding import available_backends
+from tfl.exceptions import TFLAPIException
+from tfl.metrics import MetricsCollector
+from tfl.ratelimit import RetryPolicy
+
+RESULTS = Path(__file__).resolve().parent / 'results'
+THRESHOLD = 0.10
+
+# LineEndpoint calls measured for latency, by name
+LINE_CALLS: Dict[str, Callable] = {
+    'get_line_status': lambda line: line.get_line_status(['victoria', 'central'], False),
+    'get_line_status_by_mode': lambda line: line.get_line_status_by_mode(['tube'], True),
+    'get_arrival_predictions': lambda line: line.get_arrival_predictions(['victoria'], '940GZZLUOXC'),
+    'get_valid_routes_for_modes': lambda line: line.get_valid_routes_for_modes(['bus']),
+}
+MEMORY_PATHS = {
+    'line_statuses': 'Line/Mode/tube/Status',
+    'arrivals': 'StopPoint/940GZZLUOXC/Arrivals',
+    'line_routes': 'Line/Mode/bus/Route',
+}
+
+def retry_policy() -> RetryPolicy:
+    '''
+    Retries for the benchmark clients, covering the 429 and 500 answers the stub injects.
+    '''
+    return RetryPolicy(max_retries=10, backoff=0.001, statuses=(429, 500, 503))
+
+def succeeded(call: Callable, *args) -> bool:
+    '''
+    Make a benchmarked call, returning False instead of raising if it failed after its retries.
+    '''
+    try:
+        call(*args)
+    except TFLAPIException:
+        return False
+    return True
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def bench_line_calls(server: StubTfLServer, requests: int) -> Dict[str, float]:
+    '''
+    Sequential LineEndpoint calls: throughput and latency percentiles.
+    '''
+    results = {}
+    client = Client(api_url=server.url, retry_policy=retry_policy())
+    for name, call in LINE_CALLS.items():
+        succeeded(call, client.line)
+        timings = []
+        failures = 0
+        start = time.perf_counter()
+        for _ in range(requests):
+            begin = time.perf_counter()
+            failures += not succeeded(call, client.line)
+            timings.append(time.perf_counter() - begin)
+        results[f'line.{name}.requests_per_s'] = requests / (time.perf_counter() - start)
+        results[f'line.{name}.p50_ms'] = percentile(timings, 0.5) * 1000
+        results[f'line.{name}.p99_ms'] = percentile(timings, 0.99) * 1000
+        results[f'line.{name}.failures'] = failures
+    client.close()
+    return results
+
+def bench_decode(server: StubTfLServer, requests: int) -> Dict[str, float]:
+    '''
+    Decode time of the biggest list payload per JSON backend, from the client's decode phase.
+    '''
+    results = {}
+    for backend in available_backends():
+        client = Client(api_url=server.url, json_backend=backend, retry_policy=retry_policy())
+        metrics = MetricsCollector().attach(client)
+        for _ in range(max(requests // 10, 3)):
+            succeeded(client.get, MEMORY_PATHS['line_routes'])
+        decode = metrics.to_dict()['GET Line/Mode/{modes}/Route']['latency']['decode']
+        size = metrics.to_dict()['GET Line/Mode/{modes}/Route']['bytes']
+        results[f'decode.{backend}.ms'] = decode['sum'] / decode['count'] * 1000
+        results[f'decode.{backend}.mb_per_s'] = size['sum'] / decode['sum'] / 1e6
+        client.close()
+    return results
+
+def bench_concurrency(server: StubTfLServer, requests: int, levels=(1, 4, 16, 64)) -> Dict[str, float]:
+    '''
+    Throughput of one shared client as the number of concurrent callers grows.
+    '''
+    results = {}
+    for level in levels:
+        client = Client(api_url=server.url, pool_size=level, retry_policy=retry_policy())
+        with ThreadPoolExecutor(max_workers=level) as executor:
+            list(executor.map(lambda _: succeeded(client.line.get_line_status, ['victoria'], False), range(level)))
+            start = time.perf_counter()
+            done = list(executor.map(lambda _: succeeded(client.line.get_line_status, ['victoria'], False), range(requests)))
+            results[f'concurrency.threads_{level}.requests_per_s'] = requests / (time.perf_counter() - start)
+            results[f'concurrency.threads_{level}.failures'] = done.count(False)
+        client.close()
+    try:
+        from tfl.async_client import AsyncClient
+    except ImportError:
+        return results
+
+    async def run(level):
+        async with AsyncClient(api_url=server.url, pool_size=level, retry_policy=retry_policy()) as client:
+            semaphore = asyncio.Semaphore(level)
+
+            async def call():
+                async with semaphore:
+                    try:
+                        await client.line.get_line_status(['victoria'], False)
+                    except TFLAPIException:
+                        return False
+                    return True
+
+            await asyncio.gather(*(call() for _ in range(level)))
+            start = time.perf_counter()
+            done = await asyncio.gather(*(call() for _ in range(requests)))
+            return requests / (time.perf_counter() - start), done.count(False)
+
+    for level in levels:
+        try:
+            rate, failures = asyncio.run(run(level))
+        except ImportError:
+            break
+        results[f'concurrency.async_{level}.requests_per_s'] = rate
+        results[f'concurrency.async_{level}.failures'] = failures
+    return results
+
+def bench_memory(server: StubTfLServer, responses: int = 5) -> Dict[str, float]:
+    '''
+    Memory held per decoded response, as dicts and as entities.
+    '''
+    results = {}
+    for entities in (False, True):
+        client = Client(api_url=server.url, entities=entities, retry_policy=retry_policy())
+        for name, path in MEMORY_PATHS.items():
+            client.get(path)
+            gc.collect()
+            tracemalloc.start()
+            held = [client.get(path) for _ in range(responses)]
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del held
+            results[f"memory.{name}.{'entities' if entities else 'dicts'}_kb"] = current / responses / 1024
+        client.close()
+    return results
+
+def bench_tables(server: StubTfLServer, repeats: int = 5) -> Dict[str, float]:
+    '''
+    Conversion time and memory of route sections as a Table versus a list of row dicts.
+    '''
+    try:
+        from tfl.tables import route_sections_table
+    except ImportError:
+        return {}
+    client = Client(api_url=server.url, retry_policy=retry_policy())
+    lines = client.get(MEMORY_PATHS['line_routes'])
+    client.close()
+
+    def row_dicts(lines):
+        return [{'line_id': line['id'], 'mode_name': line['modeName'], **section} for line in lines for section in line['routeSections']]
+
+    results = {}
+    for name, convert in (('rows', row_dicts), ('table', route_sections_table)):
+        convert(lines)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            convert(lines)
+        results[f'tables.route_sections.{name}_ms'] = (time.perf_counter() - start) / repeats * 1000
+        gc.collect()
+        tracemalloc.start()
+        held = convert(lines)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del held
+        results[f'tables.route_sections.{name}_kb'] = current / 1024
+    return results
+
+def bench_throttling(server: StubTfLServer, requests: int) -> Dict[str, float]:
+    '''
+    Throughput and retries when the stub answers a share of the requests with 429.
+    '''
+    server.throttle_rate, throttle_rate = max(server.throttle_rate, 0.1), server.throttle_rate
+    client = Client(api_url=server.url, retry_policy=retry_policy())
+    metrics = MetricsCollector().attach(client)
+    start = time.perf_counter()
+    for _ in range(requests):
+        succeeded(client.line.get_line_status, ['victoria'], False)
+    elapsed = time.perf_counter() - start
+    server.throttle_rate = throttle_rate
+    client.close()
+    endpoint = metrics.to_dict()['GET Line/{ids}/Status']
+    return {'throttled.requests_per_s': requests / elapsed, 'throttled.retries_per_request': endpoint['retries'] / requests}
+
+def run_suite(requests: int = 200, latency: float = 0.0, payload_scale: float = 1.0, error_rate: float = 0.0, throttle_rate: float = 0.0) -> Dict:
+    '''
+    Run every scenario against a fresh stub server, returning the run metadata and flat metrics.
+    '''
+    with StubTfLServer(latency=latency, payload_scale=payload_scale, error_rate=error_rate, throttle_rate=throttle_rate) as server:
+        metrics = {}
+        metrics.update(bench_line_calls(server, requests))
+        metrics.update(bench_decode(server, requests))
+        metrics.update(bench_concurrency(server, requests))
+        metrics.update(bench_memory(server))
+        metrics.update(bench_tables(server))
+        metrics.update(bench_throttling(server, requests))
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, cwd=Path(__file__).parent).stdout.strip()
+    except OSError:
+        revision = ''
+    meta = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': revision,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {'requests': requests, 'latency': latency, 'payload_scale': payload_scale, 'error_rate': error_rate, 'throttle_rate': throttle_rate},
+    }
+    return {'meta': meta, 'metrics': metrics}
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith('_per_s')
+
+def compare(current: Dict, previous: Dict, threshold: float = THRESHOLD) -> List[Dict]:
+    '''
+    Returns a row per metric present in both runs with its relative change and whether it regressed.
+
+    Raises ValueError if the runs were made with different configurations, whose metrics do not
+    compare.
+    '''
+    config = current.get('meta', {}).get('config')
+    previous_config = previous.get('meta', {}).get('config')
+    if config is not None and previous_config is not None and config != previous_config:
+        changed = sorted(name for name in config.keys() | previous_config.keys() if config.get(name) != previous_config.get(name))
+        raise ValueError(f"runs made with different configurations: {', '.join(f'{name} {previous_config.get(name)} -> {config.get(name)}' for name in changed)}")
+    rows = []
+    for metric, value in current['metrics'].items():
+        before = previous['metrics'].get(metric)
+        if before is None or before == 0:
+            continue
+        change = (value - before) / before
+        worse = -change if higher_is_better(metric) else change
+        rows.append({'metric': metric, 'previous': before, 'current': value, 'change': change, 'regressed': worse > threshold})
+    return rows
+
+def save(results: Dict, directory: Path = RESULTS) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{results['meta']['created'].replace(':', '').replace('+0000', 'Z')}.json"
+    path.write_text(json.dumps(results, indent=2))
+    return path
+
+def latest(directory: Path = RESULTS, exclude: Path|None = None) -> Path|None:
+    runs = sorted(path for path in directory.glob('*.json') if path != exclude)
+    return runs[-1] if runs else None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--quick', action='store_true', help='20 requests per scenario')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--payload-scale', type=float, default=1.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--compare', help='results file to compare with, by default the previous run')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    parser.add_argument('--output', default=str(RESULTS))
+    args = parser.parse_args()
+    results = run_suite(20 if args.quick else args.requests, args.latency, args.payload_scale, args.error_rate, args.throttle_rate)
+    path = save(results, Path(args.output))
+    print(f"{'metric':<52}{'value':>14}")
+    for metric, value in results['metrics'].items():
+        print(f'{metric:<52}{value:>14.3f}')
+    print(f'\nSaved to {path}')
+    baseline = Path(args.compare) if args.compare else latest(Path(args.output), exclude=path)
+    if baseline is None:
+        return
+    try:
+        rows = compare(results, json.loads(baseline.read_text()), args.threshold)
+    except ValueError as exc:
+        print(f'\nNot compared with {baseline.name}: {exc}')
+        return
+    regressions = [row for row in rows if row['regressed']]
+    print(f'\nCompared with {baseline.name}: {len(regressions)} of {len(rows)} metrics worse by more than {args.threshold:.0%}')
+    for row in regressions:
+        print(f"  {row['metric']:<50}{row['previous']:>12.3f} -> {row['current']:>12.3f} ({row['change']:+.1%})")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
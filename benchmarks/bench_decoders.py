@@ -0,0 +1,39 @@
+'''
+bench_decoders.py
+
+Compares the JSON backends available to BaseClient on recorded or synthesized payloads.
+
+Usage: python benchmarks/bench_decoders.py [recorded_payload.json ...]
+'''
+from pathlib import Path
+import json
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from payloads import PAYLOADS
+from tfl.decoding import available_backends, get_decoder
+
+def load_payloads(paths):
+    '''
+    Returns (name, bytes) pairs from the given files, or from the synthesized payloads.
+    '''
+    if paths:
+        return [(Path(path).name, Path(path).read_bytes()) for path in paths]
+    return [(name, json.dumps(build()).encode()) for name, build in PAYLOADS.items()]
+
+def main(paths):
+    backends = available_backends()
+    print(f"{'payload':<20}{'bytes':>12}" + ''.join(f'{name:>12}' for name in backends) + '   (ms per decode)')
+    for name, body in load_payloads(paths):
+        timings = []
+        for backend in backends:
+            decode = get_decoder(backend)
+            runs, total = timeit.Timer(lambda: decode(body)).autorange()
+            timings.append(total / runs * 1000)
+        print(f'{name:<20}{len(body):>12}' + ''.join(f'{ms:>12.3f}' for ms in timings))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,44 @@
+'''
+bench_endpoints.py
+
+Measures the Python overhead of building a request in the endpoint methods, with the network and
+the rest of the client pipeline replaced by a client whose get returns immediately.
+
+Usage: python benchmarks/bench_endpoints.py
+'''
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from tfl.client import LineEndpoint
+from tfl.endpoints import JourneyEndpoint, PlaceEndpoint, StopPointEndpoint
+
+class NullClient():
+    '''
+    Stand-in client returning the request instead of sending it.
+    '''
+    def get(self, path, signed=False, **kwargs):
+        return path, kwargs
+
+    def get_batched(self, path, ids, signed=False, **kwargs):
+        return path, ids, kwargs
+
+def main():
+    client = NullClient()
+    line, stoppoint, journey, place = LineEndpoint(client), StopPointEndpoint(client), JourneyEndpoint(client), PlaceEndpoint(client)
+    cases = {
+        'client.get (baseline)': lambda: client.get('StopPoint/940GZZLUOXC/Arrivals', params=None),
+        'line f-string method': lambda: line.get_line_status_by_mode(['tube', 'dlr'], True),
+        'place.get_at': lambda: place.get_at(['Borough'], 51.5, -0.12),
+        'stoppoint.arrivals': lambda: stoppoint.arrivals('940GZZLUOXC'),
+        'journey.journey_results': lambda: journey.journey_results('1000001', '1000002', mode=['tube'], time_is='Arriving', date='20240101', time='0900'),
+    }
+    print(f"{'call':<28}{'us per call':>14}")
+    for name, call in cases.items():
+        runs, total = timeit.Timer(call).autorange()
+        print(f'{name:<28}{total / runs * 1e6:>14.2f}')
+
+if __name__ == '__main__':
+    main()
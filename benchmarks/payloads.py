@@ -0,0 +1,98 @@
+'''
+payloads.py
+
+Synthesized payloads shaped like TfL Unified API responses, for benchmarks and the stub server.
+'''
+from typing import Dict, List
+import random
+
+def line_statuses(count: int = 20, seed: int = 0) -> List[Dict]:
+    '''
+    Line/{ids}/Status shaped payload.
+    '''
+    rng = random.Random(seed)
+    return [{
+        '$type': 'Tfl.Api.Presentation.Entities.Line, Tfl.Api.Presentation.Entities',
+        'id': f'line-{i}',
+        'name': f'Line {i}',
+        'modeName': rng.choice(['tube', 'bus', 'dlr', 'overground']),
+        'disruptions': [],
+        'created': '2024-01-01T12:00:00.000Z',
+        'modified': '2024-01-01T12:00:00.000Z',
+        'lineStatuses': [{
+            'id': 0,
+            'lineId': f'line-{i}',
+            'statusSeverity': rng.choice([10, 9, 6]),
+            'statusSeverityDescription': rng.choice(['Good Service', 'Minor Delays', 'Severe Delays']),
+            'reason': 'Signal failure at ' + ' '.join(rng.choice(['North', 'South', 'Park', 'Road', 'Cross']) for _ in range(6)),
+            'created': '0001-01-01T00:00:00',
+            'validityPeriods': [{'fromDate': '2024-01-01T06:00:00Z', 'toDate': '2024-01-02T01:00:00Z', 'isNow': True}],
+        }],
+        'routeSections': [],
+        'serviceTypes': [{'name': 'Regular', 'uri': f'/Line/Route?ids=line-{i}&serviceTypes=Regular'}],
+        'crowding': {},
+    } for i in range(count)]
+
+def arrivals(count: int = 200, seed: int = 0) -> List[Dict]:
+    '''
+    Line/{ids}/Arrivals/{stopPointId} shaped payload.
+    '''
+    rng = random.Random(seed)
+    return [{
+        '$type': 'Tfl.Api.Presentation.Entities.Prediction, Tfl.Api.Presentation.Entities',
+        'id': str(rng.randrange(10 ** 9)),
+        'operationType': 1,
+        'vehicleId': f'{rng.randrange(10 ** 4):04d}',
+        'naptanId': '940GZZLUOXC',
+        'stationName': 'Oxford Circus Underground Station',
+        'lineId': 'victoria',
+        'lineName': 'Victoria',
+        'platformName': 'Southbound - Platform 4',
+        'direction': 'inbound',
+        'bearing': '',
+        'destinationNaptanId': '940GZZLUBXN',
+        'destinationName': 'Brixton Underground Station',
+        'timestamp': '2024-01-01T12:00:00.1234567Z',
+        'timeToStation': rng.randrange(30, 1800),
+        'currentLocation': 'Approaching Green Park',
+        'towards': 'Brixton',
+        'expectedArrival': '2024-01-01T12:05:00Z',
+        'timeToLive': '2024-01-01T12:05:30Z',
+        'modeName': 'tube',
+        'timing': {'countdownServerAdjustment': '00:00:00', 'source': '0001-01-01T00:00:00', 'insert': '0001-01-01T00:00:00', 'read': '2024-01-01T12:00:00Z', 'sent': '2024-01-01T12:00:00Z', 'received': '0001-01-01T00:00:00'},
+    } for _ in range(count)]
+
+def line_routes(count: int = 700, sections: int = 4, seed: int = 0) -> List[Dict]:
+    '''
+    Line/Mode/{modes}/Route shaped payload, e.g. every bus route.
+    '''
+    rng = random.Random(seed)
+    return [{
+        '$type': 'Tfl.Api.Presentation.Entities.Line, Tfl.Api.Presentation.Entities',
+        'id': str(i),
+        'name': str(i),
+        'modeName': 'bus',
+        'disruptions': [],
+        'created': '2024-01-01T12:00:00.000Z',
+        'modified': '2024-01-01T12:00:00.000Z',
+        'lineStatuses': [],
+        'routeSections': [{
+            'name': f'Stop {rng.randrange(10 ** 5)} - Stop {rng.randrange(10 ** 5)}',
+            'direction': rng.choice(['inbound', 'outbound']),
+            'originationName': f'Stop {rng.randrange(10 ** 5)}',
+            'destinationName': f'Stop {rng.randrange(10 ** 5)}',
+            'originator': f'490{rng.randrange(10 ** 8):08d}',
+            'destination': f'490{rng.randrange(10 ** 8):08d}',
+            'serviceType': 'Regular',
+            'validTo': '2024-12-31T00:00:00Z',
+            'validFrom': '2024-01-01T00:00:00Z',
+        } for _ in range(sections)],
+        'serviceTypes': [{'name': 'Regular', 'uri': f'/Line/Route?ids={i}&serviceTypes=Regular'}],
+        'crowding': {},
+    } for i in range(count)]
+
+PAYLOADS = {
+    'line_statuses': line_statuses,
+    'arrivals': arrivals,
+    'line_routes': line_routes,
+}
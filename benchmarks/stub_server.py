@@ -0,0 +1,236 @@
+'''
+stub_server.py
+
+Local stand-in for the TfL Unified API used by the benchmarks and load tests.
+
+Every GET operation of swagger_file.json is served: requests are matched to their path template
+and answered with a recorded payload when one is available, a payload from payloads.py for the
+endpoints with realistic sizes, or a payload synthesized from the response schema. Latency, payload
+size and error / 429 rates are configurable.
+
+Usage: python benchmarks/stub_server.py [--port 8000] [--latency 0.05] [--throttle-rate 0.01] ...
+'''
+from typing import Any, Callable, Dict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import payloads
+from tfl.endpoints import PATH_TEMPLATES
+from tfl.metrics import OTHER, TemplateMatcher
+
+SWAGGER = Path(__file__).resolve().parent.parent / 'swagger_file.json'
+
+# templates answered with the payloads.py builders, called with a scaled element count
+BUILDERS: Dict[str, Callable[[int], Any]] = {
+    'Line/{ids}/Status': lambda count: payloads.line_statuses(count),
+    'Line/Mode/{modes}/Status': lambda count: payloads.line_statuses(count),
+    'Line/{ids}/Arrivals/{stopPointId}': lambda count: payloads.arrivals(count * 10),
+    'StopPoint/{id}/Arrivals': lambda count: payloads.arrivals(count * 10),
+    'Line/Route': lambda count: payloads.line_routes(count * 35),
+    'Line/Mode/{modes}/Route': lambda count: payloads.line_routes(count * 35),
+}
+
+class SchemaSynthesizer():
+    '''
+    Builds example payloads from the response schemas of swagger_file.json.
+
+    Arrays get list_length elements at the top level and nested_length below, and nesting stops
+    at max_depth so recursive definitions stay finite.
+    '''
+    def __init__(self, spec: Dict, list_length: int = 20, nested_length: int = 2, max_depth: int = 3) -> None:
+        self.spec = spec
+        self.list_length = list_length
+        self.nested_length = nested_length
+        self.max_depth = max_depth
+
+    def response_schema(self, template: str) -> Dict|None:
+        operation = self.spec['paths'].get('/' + template, {}).get('get', {})
+        return operation.get('responses', {}).get('200', {}).get('schema')
+
+    def build(self, schema: Dict|None, name: str = 'value', depth: int = 0, index: int = 0) -> Any:
+        if not schema:
+            return {}
+        if '$ref' in schema:
+            schema = self.spec['definitions'][schema['$ref'].rsplit('/', 1)[1]]
+        kind = schema.get('type', 'object')
+        if kind == 'array':
+            length = self.list_length if depth == 0 else self.nested_length
+            if depth >= self.max_depth:
+                return []
+            return [self.build(schema.get('items'), name, depth + 1, i) for i in range(length)]
+        if kind == 'object':
+            if depth > self.max_depth:
+                return {}
+            return {key: self.build(value, key, depth + 1, index) for key, value in schema.get('properties', {}).items()}
+        if kind == 'string':
+            return '2024-01-01T12:00:00Z' if schema.get('format') == 'date-time' else f'{name}-{index}'
+        if kind == 'integer':
+            return index
+        if kind == 'number':
+            return 51.5 + index / 1000
+        if kind == 'boolean':
+            return index % 2 == 0
+        return None
+
+class StubHandler(BaseHTTPRequestHandler):
+    '''
+    Answers GET requests from the owning StubTfLServer.
+    '''
+    protocol_version = 'HTTP/1.1'
+    # headers and body leave in one segment, avoiding delayed ACK stalls on keep-alive connections
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        status, body, headers = self.server.stub.respond(urlsplit(self.path).path.lstrip('/'))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubTfLServer():
+    '''
+    Threaded HTTP server replaying TfL shaped payloads for every swagger GET endpoint.
+
+    Parameters
+    ----------
+    latency : float, default: 0.0
+        Seconds every answer is delayed by.
+    jitter : float, default: 0.0
+        Maximum extra delay, drawn uniformly per request.
+    payload_scale : float, default: 1.0
+        Multiplies the number of elements in list payloads.
+    error_rate : float, default: 0.0
+        Fraction of requests answered with 500.
+    throttle_rate : float, default: 0.0
+        Fraction of requests answered with 429 and ``Retry-After: 0``.
+    recordings : str | Path | None, optional
+        Directory of recorded responses, named after the request path or path template with '/'
+        replaced by '__', e.g. ``Line__Mode__bus__Route.json``. Recorded paths take precedence.
+    seed : int, default: 0
+        Seed of the latency and error draws.
+    port : int, default: 0
+        Port to listen on, 0 for any free port.
+
+    Attributes
+    ----------
+    url : str
+        Base url to pass to the clients.
+    requests : int
+        Requests answered so far.
+
+    Examples
+    --------
+    >>> with StubTfLServer(latency=0.02, throttle_rate=0.05) as server:
+    ...     client = Client(api_url=server.url)
+    '''
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, payload_scale: float = 1.0, error_rate: float = 0.0, throttle_rate: float = 0.0, recordings: str|Path|None = None, seed: int = 0, port: int = 0) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.payload_scale = payload_scale
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.requests = 0
+        self.matcher = TemplateMatcher(PATH_TEMPLATES)
+        self.synthesizer = SchemaSynthesizer(json.loads(SWAGGER.read_text()), list_length=max(1, round(20 * payload_scale)))
+        self.recorded: Dict[str, bytes] = {}
+        if recordings is not None:
+            for file in Path(recordings).glob('*.json'):
+                self.recorded[file.stem.replace('__', '/')] = file.read_bytes()
+        self._bodies: Dict[str, bytes] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self._thread = None
+
+    def body_for(self, path: str) -> bytes|None:
+        '''
+        Returns the encoded payload served for path, or None if no GET operation matches.
+        '''
+        template = self.matcher.match(path)
+        key = path if path in self.recorded else template
+        body = self._bodies.get(key)
+        if body is None:
+            if key in self.recorded:
+                body = self.recorded[key]
+            elif template in BUILDERS:
+                body = json.dumps(BUILDERS[template](max(1, round(20 * self.payload_scale)))).encode()
+            elif template != OTHER:
+                body = json.dumps(self.synthesizer.build(self.synthesizer.response_schema(template))).encode()
+            else:
+                return None
+            self._bodies[key] = body
+        return body
+
+    def respond(self, path: str):
+        '''
+        Returns the (status, body, headers) answer to a GET of path, after the configured delay.
+        '''
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            draw = self._random.random()
+        if delay:
+            time.sleep(delay)
+        if draw < self.throttle_rate:
+            return 429, b'{"statusCode":429,"message":"Rate limit is exceeded."}', {'Retry-After': '0'}
+        if draw < self.throttle_rate + self.error_rate:
+            return 500, b'{"httpStatusCode":500,"message":"Internal error"}', {}
+        body = self.body_for(path)
+        if body is None:
+            return 404, b'{"httpStatusCode":404,"message":"Not found"}', {}
+        return 200, body, {}
+
+    def start(self) -> 'StubTfLServer':
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> 'StubTfLServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--payload-scale', type=float, default=1.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--recordings')
+    args = parser.parse_args()
+    server = StubTfLServer(args.latency, args.jitter, args.payload_scale, args.error_rate, args.throttle_rate, args.recordings, port=args.port)
+    print(f'Serving on {server.url}')
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+'''
+generate_endpoints.py
+
+Generates src/tfl/endpoints.py, one endpoint group per swagger tag, from swagger_file.json.
+The Line group is hand-written in tfl.client.LineEndpoint and is skipped.
+
+Usage: python scripts/generate_endpoints.py
+'''
+from pathlib import Path
+import json
+import re
+import textwrap
+
+from generate_entities import snake_case
+
+ROOT = Path(__file__).resolve().parent.parent
+SWAGGER = ROOT / 'swagger_file.json'
+OUTPUT = ROOT / 'src' / 'tfl' / 'endpoints.py'
+
+SKIP_TAGS = ('Line',)
+ANNOTATIONS = {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool', 'array': 'List[str]'}
+
+# Paths whose operationId is shared with another path of the same tag
+METHOD_NAMES = {
+    '/Occupancy/CarPark': 'get_all_car_parks',
+    '/Occupancy/CarPark/{id}': 'get_car_park',
+    '/Road': 'get_all',
+    '/StopPoint/{id}/placeTypes': 'get_place_types',
+    '/StopPoint/Search': 'search_by_query',
+}
+
+def method_name(path, operation, tag):
+    if path in METHOD_NAMES:
+        return METHOD_NAMES[path]
+    return snake_case(operation['operationId'][len(tag) + 1:])
+
+def argument_name(api_name, taken):
+    name = snake_case(re.sub(r'\W', '_', api_name))
+    name = re.sub(r'_+', '_', name)
+    while name in taken:
+        name += '_'
+    taken.add(name)
+    return name
+
+def wrap(text, indent):
+    return textwrap.fill(' '.join(text.split()), width=100, initial_indent=indent, subsequent_indent=indent)
+
+def constant_name(tag, method):
+    return f'_{snake_case(tag).upper()}_{method.upper()}'
+
+def param_source(name, param):
+    items = param.get('items', {})
+    enum = param.get('enum') or items.get('enum')
+    args = [repr(name), repr(param['name']), repr(param['type'])]
+    if param.get('required'):
+        args.append('required=True')
+    if enum:
+        args.append(f'enum={tuple(enum)!r}')
+    return f"Param({', '.join(args)})"
+
+# inline checks of the well-typed case, anything else goes through Operation.check_*
+CLASS_CHECKS = {
+    'string': '{0}.__class__ is not str',
+    'integer': '{0}.__class__ is not int',
+    'number': '{0}.__class__ is not float and {0}.__class__ is not int',
+    'boolean': '{0}.__class__ is not bool',
+}
+
+def check(name, param, statement, indent):
+    items = param.get('items', {})
+    if param['type'] == 'array' or param.get('enum') or items.get('enum'):
+        return [indent + statement]
+    return [indent + f"if {CLASS_CHECKS[param['type']].format(name)}:", indent + '    ' + statement]
+
+def path_parameters(path, parameters):
+    '''
+    Some templates name placeholders that the spec declares as query parameters, e.g.
+    /Place/{type}/At/{Lat}/{Lon} with query lat and lon plus their location.lat / location.lon
+    model binding duplicates. Promote those to path parameters and drop the duplicates.
+    '''
+    placeholders = re.findall(r'\{([^}]+)\}', path)
+    declared = {p['name'] for p in parameters if p['in'] == 'path'}
+    promoted = {name.lower(): name for name in placeholders if name not in declared}
+    # the model binding duplicates carry the precise type, e.g. number for location.lat
+    types = {p['name'].rsplit('.', 1)[1].lower(): p['type'] for p in parameters if '.' in p['name']}
+    result = []
+    for param in parameters:
+        if param['in'] == 'query' and param['name'].lower() in promoted:
+            name = param['name'].lower()
+            result.append(dict(param, name=promoted[name], type=types.get(name, param['type']), required=True, **{'in': 'path'}))
+        elif not (param['in'] == 'query' and '.' in param['name'] and param['name'].rsplit('.', 1)[1].lower() in promoted):
+            result.append(param)
+    return result
+
+def render_operation(tag, path, operation):
+    method = method_name(path, operation, tag)
+    taken = {'self'}
+    params = []
+    for param in path_parameters(path, operation.get('parameters', [])):
+        params.append((argument_name(param['name'], taken), param))
+    path_params = [(name, p) for name, p in params if p['in'] == 'path']
+    query_params = [(name, p) for name, p in params if p['in'] == 'query']
+    constant = constant_name(tag, method)
+    definition = (f"{constant} = Operation({path.strip('/')!r}, "
+                  f"({''.join(param_source(n, p) + ', ' for n, p in path_params)}), "
+                  f"({''.join(param_source(n, p) + ', ' for n, p in query_params)}))")
+    required = [(n, p) for n, p in params if p['in'] == 'path' or p.get('required')]
+    optional = [(n, p) for n, p in params if not (p['in'] == 'path' or p.get('required'))]
+    signature = ['self'] + [f"{n}: {ANNOTATIONS[p['type']]}" for n, p in required] + [f"{n}: {ANNOTATIONS[p['type']]}|None = None" for n, p in optional]
+    lines = [f"    def {method}({', '.join(signature)}):", '        """', wrap(operation.get('summary') or method, '        ')]
+    if params:
+        lines += ['', '        Parameters', '        ----------']
+        for name, param in required + optional:
+            lines.append(f"        {name} : {ANNOTATIONS[param['type']]}" + ('' if param in [p for _, p in required] else ' | None, optional'))
+            if param.get('description'):
+                lines.append(wrap(param['description'], '            '))
+    lines.append('        """')
+    body = []
+    template = path.strip('/')
+    batch = None
+    for index, (name, param) in enumerate(path_params):
+        body += check(name, param, f'{constant}.check_path({index}, {name})', '        ')
+        if param['type'] != 'array':
+            replacement = '{' + name + '}'
+        elif name == 'ids':
+            batch, replacement = name, '{{ids}}'
+        else:
+            body.append(f"        {name}_list = ','.join({name})")
+            replacement = '{' + name + '_list}'
+        template = template.replace('{' + param['name'] + '}', replacement)
+    if query_params:
+        body.append('        params = {}')
+        for index, (name, param) in enumerate(query_params):
+            statement = f'{constant}.check_query({index}, {name})'
+            if param.get('required'):
+                body += check(name, param, statement, '        ')
+                body.append(f"        params[{param['name']!r}] = {name}")
+            else:
+                body.append(f'        if {name} is not None:')
+                body += check(name, param, statement, '            ')
+                body.append(f"            params[{param['name']!r}] = {name}")
+    if any(p['type'] != 'array' or name != 'ids' for name, p in path_params):
+        template = f"f'{template}'"
+    else:
+        template = repr(template.replace('{{ids}}', '{ids}'))
+    arguments = template + (f', {batch}' if batch else '') + (', params=params or None' if query_params else '')
+    body.append(f"        return self.client.{'get_batched' if batch else 'get'}({arguments})")
+    lines += body
+    return definition, '\n'.join(lines)
+
+def main():
+    spec = json.loads(SWAGGER.read_text())
+    groups = {}
+    templates = []
+    for path, operations in spec['paths'].items():
+        operation = operations.get('get')
+        if operation is None:
+            continue
+        templates.append(path.strip('/'))
+        tag = operation['tags'][0]
+        if tag in SKIP_TAGS:
+            continue
+        groups.setdefault(tag, []).append(render_operation(tag, path, operation))
+    definitions, classes, attributes = [], [], []
+    for tag, rendered in groups.items():
+        definitions += [definition for definition, _ in rendered]
+        methods = '\n\n'.join(method for _, method in rendered)
+        classes.append('\n'.join([
+            f'class {tag}Endpoint(Endpoint):',
+            '    """',
+            f'    Endpoints under /{tag} of the TfL Unified API.',
+            '    """',
+            methods,
+        ]))
+        attributes.append(f'    {tag.lower()!r}: {tag}Endpoint,')
+    source = '\n'.join([
+        '"""endpoints.py',
+        '',
+        'Generated from swagger_file.json by scripts/generate_endpoints.py, do not edit by hand.',
+        '"""',
+        'from typing import List',
+        'from tfl.endpoint_base import Endpoint, Operation, Param',
+        '',
+        '\n'.join(definitions),
+        '',
+        '\n\n'.join(classes),
+        '',
+        '# client attribute -> endpoint group',
+        'ENDPOINT_GROUPS = {',
+        '\n'.join(attributes),
+        '}',
+        '',
+        '# path template of every GET operation, Line included',
+        'PATH_TEMPLATES = (',
+        '\n'.join(f'    {template!r},' for template in templates),
+        ')',
+        '',
+    ])
+    OUTPUT.write_text(source)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+'''
+generate_entities.py
+
+Generates src/tfl/entities.py from the definitions in swagger_file.json.
+
+Usage: python scripts/generate_entities.py
+'''
+from pathlib import Path
+import json
+import keyword
+import re
+
+ROOT = Path(__file__).resolve().parent.parent
+SWAGGER = ROOT / 'swagger_file.json'
+OUTPUT = ROOT / 'src' / 'tfl' / 'entities.py'
+
+PREFIXES = ('Tfl.Api.Presentation.Entities.', 'Tfl.Api.Common.', 'System.Data.Spatial.', 'System.')
+PRIMITIVES = {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool'}
+
+def snake_case(name: str) -> str:
+    '''
+    Convert a camelCase JSON key into a python attribute name.
+    '''
+    name = re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name)
+    name = re.sub(r'(?<=[A-Z])([A-Z][a-z])', r'_\1', name).lower()
+    return name + '_' if keyword.iskeyword(name) else name
+
+def class_names(definitions):
+    '''
+    Map each definition to a class name, prefixing the namespace when the short name is ambiguous.
+    '''
+    short = {}
+    for full in definitions:
+        stripped = full
+        for prefix in PREFIXES:
+            if full.startswith(prefix):
+                stripped = full[len(prefix):]
+                break
+        short[full] = stripped.split('.')
+    counts = {}
+    for parts in short.values():
+        counts[parts[-1]] = counts.get(parts[-1], 0) + 1
+    return {full: ''.join(parts) if counts[parts[-1]] > 1 else parts[-1] for full, parts in short.items()}
+
+def ref_name(ref: str) -> str:
+    return ref.rsplit('/', 1)[-1]
+
+def describe(prop, names):
+    '''
+    Returns (field kind, type description) for a swagger property.
+    '''
+    if '$ref' in prop:
+        target = names.get(ref_name(prop['$ref']))
+        return ('entity', target) if target else ('plain', 'object')
+    if prop.get('type') == 'array':
+        items = prop['items']
+        if '$ref' in items:
+            target = names.get(ref_name(items['$ref']))
+            return ('list', target) if target else ('plain', 'List[object]')
+        return 'plain', f"List[{PRIMITIVES.get(items.get('type'), 'object')}]"
+    if prop.get('format') == 'date-time':
+        return 'datetime', 'datetime'
+    return 'plain', PRIMITIVES.get(prop.get('type'), 'object')
+
+def swagger_type(prop) -> str:
+    '''
+    Returns the swagger type of a property, 'date-time' for timestamps and 'object' for references.
+    '''
+    if prop.get('format') == 'date-time':
+        return 'date-time'
+    return prop.get('type', 'object')
+
+def render_class(full, definition, names):
+    name = names[full]
+    slots, fields, types, descriptors, attributes = [], [], [], [], []
+    for key, prop in definition['properties'].items():
+        attr = snake_case(key)
+        kind, type_ = describe(prop, names)
+        types.append(swagger_type(prop))
+        note = ''
+        if kind == 'plain':
+            slots.append(attr)
+            fields.append((attr, key))
+            if 'enum' in prop:
+                note = 'One of ' + ', '.join(prop['enum']) + '.'
+        else:
+            slots.append('_' + attr)
+            fields.append(('_' + attr, key))
+            if kind == 'datetime':
+                descriptors.append(f'{attr} = DateTimeField()')
+                note = 'Parsed on first access.'
+            elif kind == 'entity':
+                descriptors.append(f"{attr} = EntityField('{type_}')")
+                note = 'Materialized on first access.'
+            else:
+                descriptors.append(f"{attr} = EntityListField('{type_}')")
+                type_ = f'List[{type_}]'
+                note = 'Materialized on first access.'
+        attributes.append((attr, type_, note))
+    lines = [f'class {name}(Entity):', '    """', f'    {full}', '']
+    if attributes:
+        lines += ['    Attributes', '    ----------']
+        for attr, type_, note in attributes:
+            lines.append(f'    {attr} : {type_}')
+            if note:
+                lines.append(f'        {note}')
+    lines.append('    """')
+    lines.append(f'    __slots__ = {tuple(slots)!r}')
+    lines.append(f"    _schema = '{full}'")
+    lines.append(f'    _fields = {tuple(fields)!r}')
+    lines.append(f'    _types = {tuple(types)!r}')
+    lines += ['    ' + descriptor for descriptor in descriptors]
+    return '\n'.join(lines)
+
+def response_routes(paths, names):
+    routes = []
+    for path, operations in paths.items():
+        schema = operations.get('get', {}).get('responses', {}).get('200', {}).get('schema')
+        if not schema:
+            continue
+        is_array = schema.get('type') == 'array'
+        ref = schema['items'].get('$ref') if is_array else schema.get('$ref')
+        target = names.get(ref_name(ref)) if ref else None
+        if target:
+            routes.append((path.strip('/'), target, is_array))
+    return routes
+
+def main():
+    spec = json.loads(SWAGGER.read_text())
+    definitions = {full: d for full, d in spec['definitions'].items() if d.get('properties')}
+    names = class_names(definitions)
+    blocks = [render_class(full, definition, names) for full, definition in definitions.items()]
+    routes = ',\n'.join(f'    {route!r}' for route in response_routes(spec['paths'], names))
+    source = '\n'.join([
+        '"""entities.py',
+        '',
+        'Generated from swagger_file.json by scripts/generate_entities.py, do not edit by hand.',
+        '"""',
+        'from tfl.entity_base import DateTimeField, Entity, EntityField, EntityListField, ResponseTypes',
+        '',
+        '\n\n'.join(blocks),
+        '',
+        f'RESPONSE_TYPES = ResponseTypes([\n{routes},\n])',
+        '',
+    ])
+    OUTPUT.write_text(source)
+
+if __name__ == '__main__':
+    main()
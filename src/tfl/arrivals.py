@@ -0,0 +1,221 @@
+'''
+arrivals.py
+'''
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Sequence
+import asyncio
+import time
+
+ADDED = 'added'
+UPDATED = 'updated'
+REMOVED = 'removed'
+
+# A prediction is reported as updated when one of these changes. timeToStation is left out as it
+# only counts down between polls; expectedArrival moves when the prediction itself changes.
+DEFAULT_COMPARE_FIELDS = ('expectedArrival', 'platformName', 'destinationName', 'towards', 'currentLocation')
+
+class ArrivalEvent(NamedTuple):
+    """
+    Change to the arrival board of a monitored stop.
+
+    Attributes
+    ----------
+    kind : str
+        ADDED, UPDATED or REMOVED.
+    key : str
+        Prediction key, see ArrivalsMonitor.key_for.
+    prediction : Dict
+        The current prediction, or the last known one for REMOVED events.
+    previous : Dict | None
+        The prediction it replaces for UPDATED events.
+    """
+    kind: str
+    key: str
+    prediction: Dict
+    previous: Dict|None = None
+
+class ArrivalsMonitor():
+    """
+    Polls the arrival predictions of a set of stops and reports only what changed between polls.
+
+    Polling is adaptive: while a vehicle is due within near_threshold seconds the stops are polled
+    every min_interval seconds, otherwise the interval stretches with the time to the next arrival
+    up to max_interval.
+
+    Works with both ``Client`` and ``AsyncClient``: iterate the monitor (or call events) on a blocking
+    client, ``async for`` over it (or call aevents) on an async one.
+
+    Parameters
+    ----------
+    client : Client | AsyncClient
+        Client used for the requests.
+    stop_point_ids : Sequence[str]
+        Naptan ids of the stops to monitor.
+    line_ids : Sequence[str] | None, optional
+        Restrict predictions to these lines using Line/{ids}/Arrivals/{stopPointId}. By default every
+        line calling at the stops is included (StopPoint/{id}/Arrivals).
+    min_interval : float, default: 5.0
+        Seconds between polls while an arrival is imminent.
+    max_interval : float, default: 60.0
+        Longest time between polls.
+    near_threshold : float, default: 120.0
+        An arrival within this many seconds counts as imminent.
+    compare_fields : Sequence[str], default: DEFAULT_COMPARE_FIELDS
+        Prediction fields compared to detect updates.
+
+    Attributes
+    ----------
+    predictions : Dict[str, Dict]
+        Current predictions keyed on ArrivalsMonitor.key_for.
+    interval : float
+        Delay before the next poll.
+    polls : int
+        Number of polls made.
+    errors : int
+        Stop requests that failed; the stop keeps its previous board for that poll.
+    last_error : Exception | None
+        Exception of the latest failed stop request.
+    failures : Dict[str, Exception]
+        Stops whose request failed in the latest poll, with the exception raised.
+
+    Examples
+    --------
+    >>> monitor = ArrivalsMonitor(client, ['940GZZLUOXC', '940GZZLUGPK'])
+    >>> for event in monitor:
+    ...     print(event.kind, event.prediction['lineName'], event.prediction['expectedArrival'])
+    """
+    def __init__(self, client, stop_point_ids: Sequence[str], line_ids: Sequence[str]|None = None, min_interval: float = 5.0, max_interval: float = 60.0, near_threshold: float = 120.0, compare_fields: Sequence[str] = DEFAULT_COMPARE_FIELDS) -> None:
+        self.client = client
+        self.stop_point_ids = list(stop_point_ids)
+        self.line_ids = list(line_ids) if line_ids else None
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.near_threshold = near_threshold
+        self.compare_fields = tuple(compare_fields)
+        self.predictions: Dict[str, Dict] = {}
+        self.interval = min_interval
+        self.polls = 0
+        self.errors = 0
+        self.last_error = None
+        self.failures: Dict[str, Exception] = {}
+        self._signatures: Dict[str, tuple] = {}
+        self._boards: Dict[str, Iterable[Dict]] = {}
+
+    @staticmethod
+    def key_for(prediction: Dict) -> str:
+        """
+        Returns the key identifying a prediction across polls: its id, or the stop and vehicle id.
+        """
+        return prediction.get('id') or f"{prediction.get('naptanId')}/{prediction.get('vehicleId')}"
+
+    def _request(self, stop_point_id: str):
+        if self.line_ids:
+            return self.client.line.get_arrival_predictions(self.line_ids, stop_point_id)
+        return self.client.get(f'StopPoint/{stop_point_id}/Arrivals')
+
+    def _update_boards(self, results: Iterable) -> List[ArrivalEvent]:
+        # results holds a board or an exception per stop; a failed stop keeps its previous board
+        self.failures = {}
+        for stop_point_id, result in zip(self.stop_point_ids, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                # cancellation of a request from gather stops the poll
+                raise result
+            if isinstance(result, Exception):
+                self.failures[stop_point_id] = result
+                self.errors += 1
+                self.last_error = result
+            else:
+                self._boards[stop_point_id] = result
+        return self.update(self._boards[stop_point_id] for stop_point_id in self.stop_point_ids if stop_point_id in self._boards)
+
+    def update(self, responses: Iterable[Iterable[Dict]]) -> List[ArrivalEvent]:
+        """
+        Replace the current predictions with those in responses and return the resulting events.
+        """
+        current: Dict[str, Dict] = {}
+        signatures: Dict[str, tuple] = {}
+        fields = self.compare_fields
+        for response in responses:
+            for prediction in response or ():
+                if hasattr(prediction, 'to_dict'):
+                    prediction = prediction.to_dict()
+                key = self.key_for(prediction)
+                current[key] = prediction
+                signatures[key] = tuple(prediction.get(field) for field in fields)
+        events = []
+        for key, prediction in current.items():
+            signature = self._signatures.get(key)
+            if signature is None:
+                events.append(ArrivalEvent(ADDED, key, prediction))
+            elif signature != signatures[key]:
+                events.append(ArrivalEvent(UPDATED, key, prediction, self.predictions[key]))
+        events.extend(ArrivalEvent(REMOVED, key, prediction) for key, prediction in self.predictions.items() if key not in current)
+        self.predictions, self._signatures = current, signatures
+        self.interval = self.next_interval()
+        return events
+
+    def next_interval(self) -> float:
+        """
+        Returns the delay before the next poll given the current predictions.
+        """
+        soonest = min((p['timeToStation'] for p in self.predictions.values() if p.get('timeToStation') is not None), default=None)
+        if soonest is None:
+            return self.max_interval
+        if soonest <= self.near_threshold:
+            return self.min_interval
+        return min(self.max_interval, max(self.min_interval, soonest / 4))
+
+    def poll(self) -> List[ArrivalEvent]:
+        """
+        Fetch the arrival boards once through a blocking client and return the changes.
+
+        A stop whose request fails keeps its previous board and is reported in failures.
+        """
+        self.polls += 1
+        results = []
+        for stop_point_id in self.stop_point_ids:
+            try:
+                results.append(self._request(stop_point_id))
+            except Exception as exc:
+                results.append(exc)
+        return self._update_boards(results)
+
+    async def poll_async(self) -> List[ArrivalEvent]:
+        """
+        Fetch the arrival boards once, concurrently, through an AsyncClient and return the changes.
+        """
+        self.polls += 1
+        return self._update_boards(await asyncio.gather(*(self._request(stop_point_id) for stop_point_id in self.stop_point_ids), return_exceptions=True))
+
+    def events(self, max_polls: int|None = None) -> Iterator[ArrivalEvent]:
+        """
+        Poll on the adaptive interval, yielding events as they are detected.
+
+        Parameters
+        ----------
+        max_polls : int | None, optional
+            Stop after this many polls, by default poll forever.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            yield from self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.interval)
+
+    async def aevents(self, max_polls: int|None = None) -> AsyncIterator[ArrivalEvent]:
+        """
+        Async counterpart of events for use with an AsyncClient.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            for event in await self.poll_async():
+                yield event
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(self.interval)
+
+    def __iter__(self) -> Iterator[ArrivalEvent]:
+        return self.events()
+
+    def __aiter__(self) -> AsyncIterator[ArrivalEvent]:
+        return self.aevents()
@@ -0,0 +1,426 @@
+'''
+async_client.py
+'''
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List
+import asyncio
+import json
+import time
+from tfl.batching import chunk_ids, merge_batches
+from tfl.cache import ResponseCache, ValidatorStore
+from tfl.client import _MISSING, BaseClient, LineEndpoint, flatten_params
+from tfl.coalescing import AsyncSingleFlight
+from tfl.decoding import Decoder
+from tfl.exceptions import TFLAPIException, TFLRequestException
+from tfl.instrumentation import AFTER_RESPONSE, BEFORE_REQUEST, CACHE, COALESCED, NETWORK, ON_ERROR, SNAPSHOT, STALE, RequestRecord
+from tfl.ratelimit import RateLimiter, RetryPolicy
+from tfl.streaming import aiter_json_array
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+if TYPE_CHECKING:
+    from tfl.resilience import ResiliencePolicy
+    from tfl.snapshot import SnapshotStore
+
+def _connect_trace_config() -> 'aiohttp.TraceConfig':
+    """
+    Returns a trace config adding the time spent opening connections to the RequestRecord passed
+    as trace_request_ctx; requests made without a record are not traced.
+    """
+    async def on_start(session, context, params) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def on_end(session, context, params) -> None:
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx.connect += time.perf_counter() - context.connect_start
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(on_start)
+    trace_config.on_connection_create_end.append(on_end)
+    return trace_config
+
+class AsyncBaseClient(BaseClient):
+    """
+    AsyncBaseClient object to store headers and initiate API calls from an asyncio event loop.
+
+    Requests are sent over a single ``aiohttp.ClientSession`` whose connector keeps a bounded
+    pool of keep-alive connections, so many requests can be in flight at once from one thread.
+
+    Parameters
+    ----------
+    api_url : str, default: 'https://api.tfl.gov.uk/'
+        The root url for the TFL Unified API from which all endpoints can be accessed.
+    pool_size : int, default: 100
+        Maximum number of simultaneous connections held by the connection pool.
+    connect_timeout : float, default: 3.05
+        Seconds to wait for a connection to the API to be established.
+    read_timeout : float, default: 30.0
+        Seconds to wait between bytes of the response before giving up.
+    keepalive_timeout : float, default: 30.0
+        Seconds an idle connection is kept open for reuse.
+    cache : ResponseCache | None, optional
+        Cache consulted for GET requests before going over the network, by default None (no caching).
+    validators : ValidatorStore | None, optional
+        Store of ETag / Last-Modified validators for conditional GET requests, by default None (disabled).
+    coalesce : bool, default: False
+        Share one HTTP round trip between concurrent identical GET requests.
+    entities : bool, default: False
+        Return responses as the slotted entity classes from ``tfl.entities`` instead of dicts.
+    json_backend : str | Callable[[bytes], Any] | None, optional
+        JSON decoder used for response bodies, by default the fastest installed backend.
+    rate_limiter : RateLimiter | None, optional
+        Token bucket every request must draw from; may be shared with blocking clients. By default None.
+    retry_policy : RetryPolicy | None, optional
+        Retry schedule for 429 / 503 answers honouring Retry-After, by default None (no retries).
+    snapshot : SnapshotStore | None, optional
+        Memory-mapped snapshot of static responses (see ``client.prefetch``) that GET requests are
+        served from while it is fresh, by default None.
+    resilience : ResiliencePolicy | None, optional
+        Circuit breakers, hedging and stale-while-revalidate for GET requests, by default None.
+
+    See Also
+    --------
+    AsyncClient : AsyncBaseClient object with functions for calling the TFL Unified API
+    BaseClient : Blocking equivalent built on ``requests``.
+
+    Notes
+    -----
+    Requires the optional ``aiohttp`` dependency (``pip install tfl[async]``). The session is
+    created lazily on the first request so the client can be constructed outside a running loop.
+
+    Examples
+    --------
+    >>> async with AsyncClient() as client:
+    ...     statuses = await client.line.get_line_status(['victoria'], True)
+
+    Raises
+    ------
+    TFLAPIException
+        If the API responds with a non 2xx status code.
+    TFLRequestException
+        If the response body is not valid JSON.
+    """
+    def __init__(self, api_url = 'https://api.tfl.gov.uk/', pool_size: int = 100, keepalive_timeout: float = 30.0, cache: ResponseCache|None = None, validators: ValidatorStore|None = None, coalesce: bool = False, entities: bool = False, json_backend: str|Decoder|None = None, rate_limiter: RateLimiter|None = None, retry_policy: RetryPolicy|None = None, snapshot: 'SnapshotStore|None' = None, connect_timeout: float = 3.05, read_timeout: float = 30.0, resilience: 'ResiliencePolicy|None' = None) -> None:
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp, install it with 'pip install tfl[async]'")
+        self.keepalive_timeout = keepalive_timeout
+        super().__init__(api_url = api_url, cache = cache, validators = validators, coalesce = coalesce, entities = entities, json_backend = json_backend, rate_limiter = rate_limiter, retry_policy = retry_policy, snapshot = snapshot, connect_timeout = connect_timeout, read_timeout = read_timeout, pool_size = pool_size, resilience = resilience)
+
+    def _init_single_flight(self) -> AsyncSingleFlight:
+        return AsyncSingleFlight()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # aiohttp sessions must be created inside the event loop that uses them
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_timeout)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout),
+                trace_configs=[_connect_trace_config()],
+            )
+        return self.session
+
+    async def _request(self, method, uri: str, signed: bool, params=None, raw: bool = False, record: RequestRecord|None = None, **kwargs):
+        if signed:
+            pass
+        validator_key, validator_entry, headers = self._conditional_headers(method, uri, {'params': params}, raw)
+        session = self._get_session()
+        if record is None:
+            async with session.request(method.upper(), uri, params=flatten_params(params), headers=headers, **kwargs) as response:
+                data = await self._handle_response(response, validator_entry, self.decoder, raw)
+        else:
+            record.attempts += 1
+            record.status = record.bytes = record.ttfb = record.download = record.decode = None
+            record.connect = 0.0
+            self.hooks.emit(BEFORE_REQUEST, record)
+            start = time.perf_counter()
+            async with session.request(method.upper(), uri, params=flatten_params(params), headers=headers, trace_request_ctx=record, **kwargs) as response:
+                headers_received = time.perf_counter()
+                record.ttfb = max(headers_received - start - record.connect, 0.0)
+                record.status = response.status
+                record.bytes = len(await response.read())
+                downloaded = time.perf_counter()
+                record.download = downloaded - headers_received
+                data = await self._handle_response(response, validator_entry, self.decoder, raw)
+                record.decode = time.perf_counter() - downloaded
+        if validator_key is not None:
+            self._store_validators(validator_key, response, data)
+        return data
+
+    @staticmethod
+    async def _handle_response(response: 'aiohttp.ClientResponse', validator_entry=None, decoder: Decoder = json.loads, raw: bool = False):
+        """
+        Internal helper for handling API responses from the TFL server.
+        Raises the appropriate exceptions when necessary; otherwise, returns the
+        response decoded with decoder, or the undecoded body if raw is set.
+        A 304 Not Modified answer to a conditional request returns the payload
+        stored in validator_entry.
+        """
+        if response.status == 304 and validator_entry is not None:
+            return validator_entry[2]
+        body = await response.read()
+        if not 200 <= response.status < 300:
+            raise TFLAPIException(response, response.status, body.decode(errors='replace'))
+        if raw:
+            return body
+        try:
+            return decoder(body)
+        except ValueError as exc:
+            raise TFLRequestException(f"Invalid Response: {body.decode(errors='replace')}") from exc
+
+    async def _send(self, method, path: str, uri: str, signed: bool, record: RequestRecord|None = None, **kwargs):
+        """
+        Make the request once a rate limit token is available, retrying throttled answers.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self.rate_limiter.priority_for(path))
+            try:
+                return await self._request(method, uri, signed, record=record, **kwargs)
+            except TFLAPIException as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request_api(self, method, path: str, signed: bool = False, **kwargs):
+        if not self.hooks:
+            return await self._fetch(method, path, signed, None, **kwargs)
+        record = RequestRecord(method, path, kwargs.get('params'))
+        try:
+            data = await self._fetch(method, path, signed, record, **kwargs)
+        except Exception as exc:
+            record.elapsed = time.perf_counter() - record.start
+            record.error = exc
+            self.hooks.emit(ON_ERROR, record)
+            raise
+        record.elapsed = time.perf_counter() - record.start
+        self.hooks.emit(AFTER_RESPONSE, record)
+        return data
+
+    async def _fetch(self, method, path: str, signed: bool, record: RequestRecord|None, **kwargs):
+        stored = self._from_snapshot(method, path, kwargs)
+        if stored is not _MISSING:
+            if record is not None:
+                record.source = SNAPSHOT
+            return stored
+        cache_key = self._cache_key(method, path, kwargs)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key[0], _MISSING)
+            if record is not None:
+                record.cache = 'miss' if cached is _MISSING else 'hit'
+            if cached is not _MISSING:
+                if record is not None:
+                    record.source = CACHE
+                return cached
+        if cache_key is not None and record is None:
+            # timing the request measures its body, the size the response is cached at
+            record = RequestRecord(method, path, kwargs.get('params'))
+        uri = self._create_api_uri(path, signed)
+        key = None
+        if method == 'get' and (self.single_flight is not None or self.resilience is not None):
+            key = cache_key[0] if cache_key is not None else self._request_key(method, path, kwargs, kwargs.get('raw', False))
+        if self.single_flight is not None and method == 'get':
+            data = await self.single_flight.do(key, self._network, method, path, uri, signed, key, record=record, **kwargs)
+        else:
+            data = await self._network(method, path, uri, signed, key, record=record, **kwargs)
+        age = None
+        if self.resilience is not None:
+            from tfl.resilience import stale_age
+            age = stale_age(data)
+        if record is not None:
+            record.source = STALE if age is not None else NETWORK if record.attempts else COALESCED
+            record.age = age
+        if cache_key is not None and age is None:
+            # a 304 or a shared round trip leaves no body length, the cache then estimates it
+            size = record.bytes if record.status != 304 else None
+            self.cache.set(cache_key[0], data, cache_key[1], size)
+        return data
+
+    async def _network(self, method, path: str, uri: str, signed: bool, key, record: RequestRecord|None = None, **kwargs):
+        if self.resilience is None or method != 'get':
+            return await self._send(method, path, uri, signed, record=record, **kwargs)
+        return await self.resilience.call_async(path, key, lambda record: self._send(method, path, uri, signed, record=record, **kwargs), record)
+
+    async def get(self, path, signed=False, raw: bool = False, **kwargs):
+        if raw:
+            return await self._request_api('get', path, signed, raw=True, **kwargs)
+        data = await self._request_api('get', path, signed, **kwargs)
+        if self.entities:
+            if self.resilience is not None:
+                # keep the mark of a stale answer on its entities
+                from tfl.resilience import carry_stale
+                return carry_stale(data, self._to_entities(path, data))
+            return self._to_entities(path, data)
+        return data
+
+    async def stream_get(self, path, signed=False, params=None, chunk_size: int = 64 * 1024) -> AsyncIterator[Any]:
+        """
+        GET an endpoint returning a JSON array and yield its elements as the body is downloaded.
+        Streamed responses bypass the cache but go through the rate limiter, the retry policy
+        and the hooks.
+        """
+        uri = self._create_api_uri(path, signed)
+        convert = self._item_converter(path) if self.entities else None
+        record = RequestRecord('get', path, params) if self.hooks else None
+        try:
+            response = await self._open_stream(path, uri, params, record)
+            try:
+                async for item in aiter_json_array(self._counted(response.content.iter_chunked(chunk_size), record)):
+                    yield item if convert is None else convert(item)
+            finally:
+                response.release()
+        except Exception as exc:
+            if record is not None:
+                record.elapsed = time.perf_counter() - record.start
+                record.error = exc
+                self.hooks.emit(ON_ERROR, record)
+            raise
+        if record is not None:
+            record.source = NETWORK
+            record.elapsed = time.perf_counter() - record.start
+            self.hooks.emit(AFTER_RESPONSE, record)
+
+    async def _open_stream(self, path: str, uri: str, params, record: RequestRecord|None) -> 'aiohttp.ClientResponse':
+        """
+        Async counterpart of ``Client._open_stream``.
+        """
+        session = self._get_session()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self.rate_limiter.priority_for(path))
+            if record is not None:
+                record.attempts += 1
+                record.status = record.bytes = record.ttfb = None
+                record.connect = 0.0
+                self.hooks.emit(BEFORE_REQUEST, record)
+            start = time.perf_counter()
+            response = await session.get(uri, params=flatten_params(params), trace_request_ctx=record)
+            if record is not None:
+                record.ttfb = max(time.perf_counter() - start - record.connect, 0.0)
+                record.status = response.status
+            if 200 <= response.status < 300:
+                return response
+            try:
+                exc = TFLAPIException(response, response.status, await response.text())
+            finally:
+                response.release()
+            delay = self._retry_delay(exc, attempt)
+            if delay is None:
+                raise exc
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    async def _counted(chunks: AsyncIterator[bytes], record: RequestRecord|None) -> AsyncIterator[bytes]:
+        if record is None:
+            async for chunk in chunks:
+                yield chunk
+            return
+        record.bytes = 0
+        async for chunk in chunks:
+            record.bytes += len(chunk)
+            yield chunk
+
+    async def post(self, path, signed=False, **kwargs) -> Dict:
+        return await self._request_api('post', path, signed, **kwargs)
+
+    async def put(self, path, signed=False,  **kwargs) -> Dict:
+        return await self._request_api('put', path, signed, **kwargs)
+
+    async def delete(self, path, signed=False, **kwargs) -> Dict:
+        return await self._request_api('delete', path, signed, **kwargs)
+
+    async def get_batched(self, path: str, ids: List[str], signed=False, **kwargs) -> List:
+        """
+        GET a comma-list endpoint for any number of ids, requesting URL-safe chunks concurrently.
+        """
+        batches = chunk_ids(ids)
+        if len(batches) <= 1:
+            return await self.get(path.replace('{ids}', ','.join(ids)), signed, **kwargs)
+        results = await asyncio.gather(*(self.get(path.replace('{ids}', batch), signed, **kwargs) for batch in batches))
+        return merge_batches(results)
+
+    async def prefetch(self, modes: List[str], include: List[str]|None = None, concurrency: int = 32, progress=None, snapshot: str|None = None):
+        """
+        Async counterpart of ``BaseClient.prefetch``.
+        """
+        from tfl.prefetch import DEFAULT_INCLUDE, Prefetcher
+        prefetcher = Prefetcher(self, modes, include or DEFAULT_INCLUDE, concurrency, progress=progress)
+        await prefetcher.run_async()
+        if snapshot is not None:
+            prefetcher.save(snapshot)
+        return prefetcher
+
+    async def close(self) -> None:
+        """
+        Close the underlying session and release pooled connections.
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+class AsyncClient(AsyncBaseClient):
+    """
+    AsyncClient object to store headers and initiate API calls from an asyncio event loop.
+
+    Exposes the same endpoint groups as ``Client``; every endpoint method returns an awaitable.
+
+    Parameters
+    ----------
+    api_url : str, default: 'https://api.tfl.gov.uk/'
+        The root url from which all endpoints can be accessed.
+    pool_size : int, default: 100
+        Maximum number of simultaneous connections held by the connection pool.
+    connect_timeout : float, default: 3.05
+        Seconds to wait for a connection to the API to be established.
+    read_timeout : float, default: 30.0
+        Seconds to wait between bytes of the response before giving up.
+    keepalive_timeout : float, default: 30.0
+        Seconds an idle connection is kept open for reuse.
+    cache : ResponseCache | None, optional
+        Cache consulted for GET requests before going over the network, by default None (no caching).
+    validators : ValidatorStore | None, optional
+        Store of ETag / Last-Modified validators for conditional GET requests, by default None (disabled).
+    coalesce : bool, default: False
+        Share one HTTP round trip between concurrent identical GET requests.
+    entities : bool, default: False
+        Return responses as the slotted entity classes from ``tfl.entities`` instead of dicts.
+    json_backend : str | Callable[[bytes], Any] | None, optional
+        JSON decoder used for response bodies, by default the fastest installed backend.
+    rate_limiter : RateLimiter | None, optional
+        Token bucket every request must draw from; may be shared with blocking clients. By default None.
+    retry_policy : RetryPolicy | None, optional
+        Retry schedule for 429 / 503 answers honouring Retry-After, by default None (no retries).
+    snapshot : SnapshotStore | None, optional
+        Memory-mapped snapshot of static responses (see ``client.prefetch``) that GET requests are
+        served from while it is fresh, by default None.
+    resilience : ResiliencePolicy | None, optional
+        Circuit breakers, hedging and stale-while-revalidate for GET requests, by default None.
+
+    See Also
+    --------
+    Client : Blocking client with the same endpoint groups.
+
+    Examples
+    --------
+    >>> async with AsyncClient() as client:
+    ...     boards = await asyncio.gather(*(
+    ...         client.line.get_arrival_predictions(['victoria'], stop) for stop in stops
+    ...     ))
+    """
+    def __init__(self, api_url='https://api.tfl.gov.uk/', pool_size: int = 100, keepalive_timeout: float = 30.0, cache: ResponseCache|None = None, validators: ValidatorStore|None = None, coalesce: bool = False, entities: bool = False, json_backend: str|Decoder|None = None, rate_limiter: RateLimiter|None = None, retry_policy: RetryPolicy|None = None, snapshot: 'SnapshotStore|None' = None, connect_timeout: float = 3.05, read_timeout: float = 30.0, resilience: 'ResiliencePolicy|None' = None) -> None:
+        super().__init__(api_url = api_url, pool_size = pool_size, keepalive_timeout = keepalive_timeout, cache = cache, validators = validators, coalesce = coalesce, entities = entities, json_backend = json_backend, rate_limiter = rate_limiter, retry_policy = retry_policy, snapshot = snapshot, connect_timeout = connect_timeout, read_timeout = read_timeout, resilience = resilience)
+        self.line = LineEndpoint(self)
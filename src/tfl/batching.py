@@ -0,0 +1,243 @@
+'''
+batching.py
+'''
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set
+import threading
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    import asyncio
+
+# TfL documents a limit of approx. 20 ids per request; the character limit keeps long
+# bus route lists well inside common URL length limits.
+MAX_BATCH_IDS = 20
+MAX_BATCH_CHARS = 1000
+
+def chunk_ids(ids: Iterable[str], max_ids: int = MAX_BATCH_IDS, max_chars: int = MAX_BATCH_CHARS) -> List[str]:
+    """
+    Split ids into comma-joined chunks that each respect the id count and character limits.
+
+    Parameters
+    ----------
+    ids : Iterable[str]
+        Ids in the order they should be requested.
+    max_ids : int, default: MAX_BATCH_IDS
+        Maximum number of ids per chunk.
+    max_chars : int, default: MAX_BATCH_CHARS
+        Maximum length of a comma-joined chunk. A single id longer than this gets its own chunk.
+
+    Returns
+    -------
+    List[str]
+        Comma-joined chunks in input order.
+
+    Examples
+    --------
+    >>> chunk_ids(['victoria', 'circle', 'central'], max_ids=2)
+    ['victoria,circle', 'central']
+    """
+    chunks = []
+    current: List[str] = []
+    length = 0
+    for id_ in ids:
+        extra = len(id_) + (1 if current else 0)
+        if current and (len(current) >= max_ids or length + extra > max_chars):
+            chunks.append(','.join(current))
+            current, length, extra = [], 0, len(id_)
+        current.append(id_)
+        length += extra
+    if current:
+        chunks.append(','.join(current))
+    return chunks
+
+def merge_batches(results: Iterable[Any]) -> List:
+    """
+    Concatenate the list responses of each chunk, in chunk order.
+    """
+    merged = []
+    for result in results:
+        if isinstance(result, list):
+            merged.extend(result)
+        else:
+            merged.append(result)
+    return merged
+
+def _group_by_id(items: List[Dict], key: str|Callable[[Dict], str]) -> Dict[str, List[Dict]]:
+    get_key = key if callable(key) else lambda item: item.get(key)
+    grouped: Dict[str, List[Dict]] = {}
+    for item in items:
+        item_id = get_key(item)
+        grouped.setdefault(str(item_id).lower(), []).append(item)
+    return grouped
+
+class MicroBatcher():
+    """
+    Combines single-id calls made by many threads within a short window into one multi-id request.
+
+    Parameters
+    ----------
+    fetch : Callable[[List[str]], List[Dict]]
+        Function requesting several ids at once, e.g. ``lambda ids: client.line.get_line_status(ids, True)``.
+    key : str | Callable[[Dict], str], default: 'id'
+        Field (or function) identifying which requested id a response item belongs to,
+        e.g. 'id' for lines and statuses, 'lineId' for arrival predictions.
+    window : float, default: 0.01
+        Seconds to wait for more ids after the first id of a batch arrives.
+    max_batch_size : int, default: MAX_BATCH_IDS
+        A batch is sent immediately once it holds this many distinct ids.
+
+    Attributes
+    ----------
+    batches : int
+        Number of multi-id requests sent.
+    submitted : int
+        Number of single-id calls served.
+
+    Examples
+    --------
+    >>> batcher = MicroBatcher(lambda ids: client.line.get_line_status(ids, True))
+    >>> batcher.get('victoria')
+    [{'id': 'victoria', ...}]
+    """
+    def __init__(self, fetch: Callable[[List[str]], List[Dict]], key: str|Callable[[Dict], str] = 'id', window: float = 0.01, max_batch_size: int = MAX_BATCH_IDS) -> None:
+        self.fetch = fetch
+        self.key = key
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.submitted = 0
+        self._pending: Dict[str, List[Future]] = {}
+        self._timer: threading.Timer|None = None
+        self._lock = threading.Lock()
+
+    def submit(self, id_: str) -> 'Future':
+        """
+        Queue id_ for the next batch and return a future resolving to the items for that id.
+        """
+        from concurrent.futures import Future
+        future = Future()
+        flush_now = False
+        with self._lock:
+            self.submitted += 1
+            self._pending.setdefault(id_, []).append(future)
+            if len(self._pending) >= self.max_batch_size:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+        return future
+
+    def get(self, id_: str) -> List[Dict]:
+        """
+        Returns the items for id_, sharing a request with other ids submitted in the same window.
+        """
+        return self.submit(id_).result()
+
+    def flush(self) -> None:
+        """
+        Send every pending id now.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if pending:
+                self.batches += 1
+        if not pending:
+            return
+        try:
+            grouped = _group_by_id(self.fetch(list(pending)), self.key)
+        except BaseException as exc:
+            for futures in pending.values():
+                for future in futures:
+                    future.set_exception(exc)
+            return
+        for id_, futures in pending.items():
+            items = grouped.get(id_.lower(), [])
+            for future in futures:
+                future.set_result(items)
+
+class AsyncMicroBatcher():
+    """
+    Combines single-id coroutine calls made within a short window into one multi-id request.
+
+    Parameters
+    ----------
+    fetch : Callable[[List[str]], Awaitable[List[Dict]]]
+        Coroutine function requesting several ids at once,
+        e.g. ``lambda ids: client.line.get_line_status(ids, True)`` on an ``AsyncClient``.
+    key : str | Callable[[Dict], str], default: 'id'
+        Field (or function) identifying which requested id a response item belongs to.
+    window : float, default: 0.01
+        Seconds to wait for more ids after the first id of a batch arrives.
+    max_batch_size : int, default: MAX_BATCH_IDS
+        A batch is sent immediately once it holds this many distinct ids.
+
+    See Also
+    --------
+    MicroBatcher : Thread based equivalent.
+    """
+    def __init__(self, fetch: Callable, key: str|Callable[[Dict], str] = 'id', window: float = 0.01, max_batch_size: int = MAX_BATCH_IDS) -> None:
+        self.fetch = fetch
+        self.key = key
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.submitted = 0
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._handle: asyncio.TimerHandle|None = None
+        # the loop only holds weak references to tasks, so flushes in progress are kept here
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, id_: str) -> List[Dict]:
+        """
+        Returns the items for id_, sharing a request with other ids submitted in the same window.
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.submitted += 1
+        self._pending.setdefault(id_, []).append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._schedule_flush(loop)
+        elif self._handle is None:
+            self._handle = loop.call_later(self.window, self._schedule_flush, loop)
+        return await future
+
+    def _schedule_flush(self, loop: 'asyncio.AbstractEventLoop') -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            self.batches += 1
+            task = loop.create_task(self._flush(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, pending: 'Dict[str, List[asyncio.Future]]') -> None:
+        import asyncio
+        try:
+            grouped = _group_by_id(await self.fetch(list(pending)), self.key)
+        except BaseException as exc:
+            # every waiter must be resolved, a cancelled fetch cancels them
+            cancelled = isinstance(exc, asyncio.CancelledError)
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        if cancelled:
+                            future.cancel()
+                        else:
+                            future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for id_, futures in pending.items():
+            items = grouped.get(id_.lower(), [])
+            for future in futures:
+                if not future.done():
+                    future.set_result(items)
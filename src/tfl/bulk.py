@@ -0,0 +1,164 @@
+'''
+bulk.py
+'''
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+import multiprocessing
+import os
+import pickle
+from tfl.exceptions import TFLAPIException, TFLRequestException
+
+class Call(NamedTuple):
+    """
+    One endpoint call of a bulk run.
+
+    Attributes
+    ----------
+    method : str
+        Dotted name of the client method e.g. 'line.get_line_status_between_dates',
+        'stoppoint.arrivals' or 'get'.
+    args : Tuple
+        Positional arguments.
+    kwargs : Tuple[Tuple[str, Any], ...]
+        Keyword arguments as (name, value) pairs, see Call.of.
+    """
+    method: str
+    args: Tuple = ()
+    kwargs: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def of(cls, method: str, *args, **kwargs) -> 'Call':
+        """
+        Build a call the way the method would be called, e.g. Call.of('line.get_line_status', ids, detail=True).
+        """
+        return cls(method, args, tuple(kwargs.items()))
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one call: its position in the submitted calls, the value returned (after
+    postprocessing) or the exception raised.
+    """
+    index: int
+    call: Call
+    value: Any = None
+    error: BaseException|None = None
+
+# client of the current worker process, see _init_worker
+_client = None
+_postprocess = None
+
+def _init_worker(client_options: Dict, cache_dir: str|None, postprocess: Callable|None) -> None:
+    global _client, _postprocess
+    from tfl.client import Client
+    options = dict(client_options)
+    if cache_dir is not None:
+        from tfl.disk_cache import DiskCache
+        options['cache'] = DiskCache(cache_dir)
+    _client = Client(**options)
+    _postprocess = postprocess
+
+def _picklable(exc: BaseException) -> BaseException:
+    if isinstance(exc, TFLAPIException):
+        # the response holds the connection; its status and message are already on the exception
+        exc.response = exc.request = None
+        exc.args = (None, exc.status_code, exc.message)
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return TFLRequestException(f'{type(exc).__name__}: {exc}')
+    return exc
+
+def _run_calls(batch: List[Tuple[int, Call]]) -> List[BulkResult]:
+    results = []
+    for index, call in batch:
+        try:
+            target = _client
+            for name in call.method.split('.'):
+                target = getattr(target, name)
+            value = target(*call.args, **dict(call.kwargs))
+            if _postprocess is not None:
+                value = _postprocess(call, value)
+            results.append(BulkResult(index, call, value))
+        except Exception as exc:
+            results.append(BulkResult(index, call, error=_picklable(exc)))
+    return results
+
+class BulkExecutor():
+    """
+    Runs many endpoint calls across a pool of worker processes and streams the results back in
+    completion order.
+
+    Every worker builds its own Client, with its own pooled session, so decoding and any
+    postprocessing run in parallel instead of contending for the GIL. Calls are sent to the
+    workers in chunks of chunksize to amortize the inter-process overhead. With cache_dir set the
+    workers share a DiskCache, so a response fetched by one worker (or an earlier run) is reused
+    by the others.
+
+    Parameters
+    ----------
+    processes : int | None, optional
+        Number of worker processes, by default the number of CPUs.
+    client_options : Dict | None, optional
+        Keyword arguments for the Client of every worker e.g. {'api_url': ..., 'pool_size': 4}.
+        Must be picklable.
+    cache_dir : str | Path | None, optional
+        Directory of a DiskCache shared by the workers, by default no cache.
+    postprocess : Callable[[Call, Any], Any] | None, optional
+        Module level function applied to every response in the worker, e.g. to reduce it to the
+        rows needed before it is sent back.
+    chunksize : int, default: 4
+        Calls sent to a worker at a time.
+    start_method : str, default: 'spawn'
+        multiprocessing start method of the workers. 'spawn' is safe with the threads a client
+        may have started; 'fork' starts faster.
+
+    Examples
+    --------
+    >>> calls = [Call.of('line.get_line_status_between_dates', ids, True, start, end) for ids, (start, end) in jobs]
+    >>> calls += [Call.of('line.get_disruptions_for_modes', [mode]) for mode in modes]
+    >>> with BulkExecutor(cache_dir='/tmp/tfl-cache') as executor:
+    ...     for result in executor.map(calls):
+    ...         if result.error is None:
+    ...             store(result.call, result.value)
+    """
+    def __init__(self, processes: int|None = None, client_options: Dict|None = None, cache_dir: str|Path|None = None, postprocess: Callable[[Call, Any], Any]|None = None, chunksize: int = 4, start_method: str = 'spawn') -> None:
+        self.processes = processes or os.cpu_count() or 1
+        self.chunksize = max(1, chunksize)
+        initargs = (dict(client_options or {}), None if cache_dir is None else str(cache_dir), postprocess)
+        self._pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=multiprocessing.get_context(start_method), initializer=_init_worker, initargs=initargs)
+
+    def map(self, calls: Iterable[Call]) -> Iterator[BulkResult]:
+        """
+        Run calls, yielding a BulkResult for each as soon as it completes.
+
+        At most two chunks per worker are queued at a time, so calls may be a lazy iterable.
+        """
+        calls = enumerate(calls)
+        pending = set()
+
+        def submit() -> bool:
+            batch = [item for _, item in zip(range(self.chunksize), calls)]
+            if batch:
+                pending.add(self._pool.submit(_run_calls, batch))
+            return bool(batch)
+
+        while len(pending) < 2 * self.processes and submit():
+            pass
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                submit()
+
+    def close(self) -> None:
+        """
+        Stop the worker processes.
+        """
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> 'BulkExecutor':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,317 @@
+'''
+cache.py
+'''
+from typing import Any, Dict, Iterable, Tuple
+from collections import OrderedDict
+import fnmatch
+import re
+import threading
+import time
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# First matching pattern wins, so more specific paths must come before general ones.
+DEFAULT_TTL_RULES: Tuple[Tuple[str, float], ...] = (
+    ('Line/Meta/*', 12 * HOUR),
+    ('Line/*/StopPoints', 12 * HOUR),
+    ('Line/*/Route/Sequence/*', 6 * HOUR),
+    ('Line/*/Route', 6 * HOUR),
+    ('Line/Route', 6 * HOUR),
+    ('Line/*/Timetable/*', 6 * HOUR),
+    ('Line/*/Status/*/to/*', 1 * HOUR),
+    ('Line/*/Arrivals/*', 10),
+    ('Line/*/Status', 30),
+    ('Line/Status/*', 30),
+    ('Line/*/Disruption', 30),
+    ('Line/Search/*', 1 * HOUR),
+    ('Line/Mode/*', 1 * HOUR),
+    ('Line/*', 1 * HOUR),
+)
+
+def make_cache_key(method: str, path: str, params: Any = None) -> Tuple:
+    """
+    Build a hashable cache key from the request method, path and query parameters.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method e.g. get
+    path : str
+        Path relative to the api url e.g. Line/victoria/Status
+    params : Any, optional
+        Query parameters. Dicts are sorted by key so that equivalent requests share a key.
+
+    Returns
+    -------
+    Tuple
+        (method, path, params) with every component normalized.
+    """
+    if isinstance(params, dict):
+        params = tuple(sorted((str(k), _normalize_value(v)) for k, v in params.items() if v is not None))
+    elif params is not None:
+        params = str(params)
+    return (method.lower(), path.strip('/'), params)
+
+def _normalize_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (list, tuple)):
+        return ','.join(str(v) for v in value)
+    return str(value)
+
+_SIZE_SAMPLES = 8
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the size in bytes of a decoded JSON payload as compact JSON, for responses whose
+    body length is unknown. Raw bodies are measured directly.
+
+    Long lists are extrapolated from an evenly spaced sample of their items, so the cost is
+    bounded by the shape of a payload rather than its length.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 2 + sum(len(str(key)) + 4 + estimate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        if len(value) <= _SIZE_SAMPLES:
+            return 2 + sum(estimate_size(item) + 1 for item in value)
+        step = len(value) / _SIZE_SAMPLES
+        sampled = sum(estimate_size(value[int(i * step)]) + 1 for i in range(_SIZE_SAMPLES))
+        return 2 + sampled * len(value) // _SIZE_SAMPLES
+    if value is None or isinstance(value, (bool, int, float)):
+        return len(str(value))
+    if hasattr(value, 'to_dict'):
+        return estimate_size(value.to_dict())
+    return len(str(value))
+
+class TTLRules():
+    """
+    Ordered mapping of path patterns to cache lifetimes.
+
+    Parameters
+    ----------
+    rules : Iterable[Tuple[str, float]], optional
+        (pattern, ttl seconds) pairs using shell-style wildcards, e.g. ('Line/*/Status', 30).
+        The first pattern matching a path wins. By default DEFAULT_TTL_RULES.
+    default_ttl : float, default: 0
+        Lifetime for paths that match no pattern. 0 disables caching for those paths.
+    """
+    def __init__(self, rules: Iterable[Tuple[str, float]] = DEFAULT_TTL_RULES, default_ttl: float = 0) -> None:
+        self.rules = tuple(rules)
+        self.default_ttl = default_ttl
+        self._compiled = [(re.compile(fnmatch.translate(pattern)), ttl) for pattern, ttl in self.rules]
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Returns the lifetime in seconds for the given normalized path.
+        """
+        for pattern, ttl in self._compiled:
+            if pattern.match(path):
+                return ttl
+        return self.default_ttl
+
+class ResponseCache():
+    """
+    Thread-safe LRU cache of decoded API responses with per-path lifetimes.
+
+    Entries are evicted least recently used first once either ``max_entries`` or ``max_bytes``
+    is exceeded, and are dropped on lookup once their lifetime has passed.
+
+    Parameters
+    ----------
+    ttl_rules : TTLRules | None, optional
+        Lifetimes per path pattern. By default ``TTLRules()``.
+    max_entries : int, default: 1024
+        Maximum number of cached responses.
+    max_bytes : int, default: 64 * 1024 * 1024
+        Maximum approximate size of all cached responses, in bytes.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that were absent or expired.
+    evictions : int
+        Number of entries removed to stay within the size bounds.
+
+    Notes
+    -----
+    Cached payloads are returned by reference, so callers must not mutate them.
+
+    Any object with the same ``get``/``set``/``ttl_for`` methods can be passed to ``Client``
+    in place of this class.
+    """
+    def __init__(self, ttl_rules: TTLRules|None = None, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.ttl_rules = ttl_rules if ttl_rules is not None else TTLRules()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Returns the lifetime in seconds for the given normalized path.
+        """
+        return self.ttl_rules.ttl_for(path)
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """
+        Returns the cached value for key, or default if it is absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, size, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.current_bytes -= size
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Tuple, value: Any, ttl: float, size: int|None = None) -> None:
+        """
+        Store value under key for ttl seconds, evicting old entries if the cache is full.
+        """
+        if ttl <= 0:
+            return
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self.current_bytes += size
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, key: Tuple) -> None:
+        """
+        Remove key from the cache if present.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache. Counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit/miss/eviction counters and current occupancy.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class ValidatorStore():
+    """
+    Thread-safe LRU store of HTTP validators (ETag / Last-Modified) and the decoded payload they describe.
+
+    When a stored resource is requested again the client sends ``If-None-Match`` /
+    ``If-Modified-Since`` and, if the server answers ``304 Not Modified``, returns the stored
+    payload without downloading or decoding the body again.
+
+    Parameters
+    ----------
+    max_entries : int, default: 256
+        Maximum number of resources to keep validators for.
+
+    Attributes
+    ----------
+    revalidated : int
+        Number of requests answered with 304 and served from the store.
+    """
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self.revalidated = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Tuple[str|None, str|None, Any]|None:
+        """
+        Returns the (etag, last_modified, value) stored for key, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def conditional_headers(entry: Tuple[str|None, str|None, Any]) -> Dict[str, str]:
+        """
+        Returns the conditional request headers for a stored entry.
+        """
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def store(self, key: Tuple, headers, value: Any) -> None:
+        """
+        Store the validators found in the response headers alongside the decoded payload.
+        Responses without an ETag or Last-Modified header are not stored.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return
+        with self._lock:
+            self._entries[key] = (etag, last_modified, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def mark_revalidated(self) -> None:
+        """
+        Count a request answered with 304 Not Modified.
+        """
+        with self._lock:
+            self.revalidated += 1
+
+    def clear(self) -> None:
+        """
+        Remove every stored validator.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,59 @@
 '''
 Client.py
 '''
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
 import json
-import requests
+import threading
+import time
+from tfl.batching import chunk_ids, merge_batches
+from tfl.cache import ResponseCache, ValidatorStore, make_cache_key
+from tfl.coalescing import SingleFlight
+from tfl.decoding import Decoder, get_decoder
 from tfl.exceptions import TFLAPIException, TFLRequestException
+from tfl.instrumentation import AFTER_RESPONSE, BEFORE_REQUEST, CACHE, COALESCED, NETWORK, ON_ERROR, SNAPSHOT, STALE, Hooks, RequestRecord, take_connect_time
+from tfl.ratelimit import RateLimiter, RetryPolicy
+from tfl.streaming import iter_json_array
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    import requests
+    from tfl.resilience import ResiliencePolicy
+    from tfl.snapshot import SnapshotStore
+
+_MISSING = object()
+
+def flatten_params(params):
+    """
+    Serialize query parameters the way the TFL API expects them.
+
+    Booleans become 'true' / 'false', lists and tuples become comma separated strings and
+    None values are dropped. Anything other than a dict is returned unchanged.
+
+    Examples
+    --------
+    >>> flatten_params({'detail': True, 'modes': ['tube', 'dlr'], 'severityLevel': None})
+    {'detail': 'true', 'modes': 'tube,dlr'}
+    """
+    if not isinstance(params, dict):
+        return params
+    flat = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            flat[key] = 'true' if value else 'false'
+        elif isinstance(value, (list, tuple)):
+            flat[key] = ','.join(str(v) for v in value)
+        else:
+            flat[key] = str(value)
+    return flat
+
+def response_status(response) -> int:
+    """
+    Returns the HTTP status code of a requests or aiohttp response.
+    """
+    status = getattr(response, 'status_code', None)
+    return response.status if status is None else status
 
 class BaseClient():
     """
@@ -14,6 +63,39 @@ class BaseClient():
     ----------
     api_url : str, default: 'https://api.tfl.gov.uk/'
         The root url for the TFL Unified API from which all endpoints can be accessed.
+    cache : ResponseCache | None, optional
+        Cache consulted for GET requests before going over the network, by default None (no caching).
+    validators : ValidatorStore | None, optional
+        Store of ETag / Last-Modified validators used to send conditional GET requests and serve
+        304 Not Modified responses from the stored payload, by default None (disabled).
+    coalesce : bool, default: False
+        Share one HTTP round trip between concurrent identical GET requests. Counters are
+        available from ``single_flight.stats()``.
+    entities : bool, default: False
+        Return responses as the slotted entity classes from ``tfl.entities`` instead of dicts.
+    json_backend : str | Callable[[bytes], Any] | None, optional
+        JSON decoder used for response bodies: a backend name from ``tfl.decoding.JSON_BACKENDS``,
+        a callable taking bytes, or None to use the fastest installed backend (orjson, msgspec,
+        ujson, then the standard library).
+    rate_limiter : RateLimiter | None, optional
+        Token bucket every request must draw from, e.g. ``RateLimiter.shared(app_key)`` to share one
+        quota between clients, by default None (unlimited).
+    retry_policy : RetryPolicy | None, optional
+        Retry schedule for 429 / 503 answers honouring Retry-After, by default None (no retries).
+    snapshot : SnapshotStore | None, optional
+        Memory-mapped snapshot of static responses (see ``client.prefetch``) that GET requests are
+        served from while it is fresh, by default None.
+    connect_timeout : float, default: 3.05
+        Seconds to wait for a connection to the API to be established.
+    read_timeout : float, default: 30.0
+        Seconds to wait between bytes of the response before giving up.
+    pool_size : int, default: 10
+        Maximum number of keep-alive connections kept by the session. Should be at least the
+        number of threads sharing the client.
+    max_retries : int, default: 3
+        Retries for failed connection attempts. Requests that reached the server are not retried here.
+    resilience : ResiliencePolicy | None, optional
+        Circuit breakers, hedging and stale-while-revalidate for GET requests, by default None.
 
     Returns
     -------
@@ -35,11 +117,45 @@ class BaseClient():
     TFLRequestException
         _description_
     """
-    def __init__(self, api_url = 'https://api.tfl.gov.uk/') -> None:
+    def __init__(self, api_url = 'https://api.tfl.gov.uk/', cache: ResponseCache|None = None, validators: ValidatorStore|None = None, coalesce: bool = False, entities: bool = False, json_backend: str|Decoder|None = None, rate_limiter: RateLimiter|None = None, retry_policy: RetryPolicy|None = None, snapshot: 'SnapshotStore|None' = None, connect_timeout: float = 3.05, read_timeout: float = 30.0, pool_size: int = 10, max_retries: int = 3, resilience: 'ResiliencePolicy|None' = None) -> None:
         self.test = 'test'
         self.api_url = api_url
-        self.session = self._init_session()
-        self.request_timeout = 1000
+        self.cache = cache
+        self.validators = validators
+        self.single_flight = self._init_single_flight() if coalesce else None
+        self.entities = entities
+        self.decoder = get_decoder(json_backend)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.snapshot = snapshot
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.request_timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.resilience = resilience
+        # created by the first request, see _get_session
+        self.session = None
+        self._session_lock = threading.Lock()
+        self.batch_workers = 8
+        self._batch_executor = None
+        self.hooks = Hooks()
+
+    def __getattr__(self, name: str):
+        # endpoint groups are created on first access so that importing the client and
+        # constructing it does not load the generated tfl.endpoints module
+        if name.startswith('_'):
+            raise AttributeError(name)
+        from tfl.endpoints import ENDPOINT_GROUPS
+        if name not in ENDPOINT_GROUPS:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        endpoint = ENDPOINT_GROUPS[name](self)
+        setattr(self, name, endpoint)
+        return endpoint
+
+    def __dir__(self):
+        from tfl.endpoints import ENDPOINT_GROUPS
+        return sorted(set(super().__dir__()) | set(ENDPOINT_GROUPS))
 
     def _get_headers(self) -> Dict:
         """
@@ -55,47 +171,358 @@ class BaseClient():
         }
         return headers
 
-    def _init_session(self) -> requests.Session:
+    def _init_single_flight(self) -> SingleFlight:
+        return SingleFlight()
+
+    def _init_session(self) -> 'requests.Session':
+        # imported here so that importing and constructing a client stays cheap
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from tfl.instrumentation import timed_pool_classes
         headers = self._get_headers()
         session = requests.session()
         session.headers.update(headers)
+        # only connection failures are retried here, throttling is handled by retry_policy
+        retries = Retry(total=self.max_retries, connect=self.max_retries, read=0, status=0, other=0, backoff_factor=0.1, respect_retry_after_header=False)
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retries)
+        # connections time their handshakes for the connect phase of RequestRecord
+        adapter.poolmanager.pool_classes_by_scheme = timed_pool_classes()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         return session
 
-    def _request(self, method, uri: str, signed: bool, **kwargs):    
-        print(kwargs)
-        # set default requests timeout
-        kwargs['timeout'] = self.request_timeout
+    def _get_session(self) -> 'requests.Session':
+        if self.session is None:
+            with self._session_lock:
+                if self.session is None:
+                    self.session = self._init_session()
+        return self.session
+
+    def _request(self, method, uri: str, signed: bool, raw: bool = False, params=None, record: RequestRecord|None = None, **kwargs):
+        validator_key, validator_entry, headers = self._conditional_headers(method, uri, {'params': params}, raw)
         if signed:
             pass
-        response = getattr(self.session, method)(uri, params = kwargs)
-        return self._handle_response(response)
+        if record is None:
+            response = getattr(self._get_session(), method)(uri, params = flatten_params(params), headers = headers, timeout = self.request_timeout, **kwargs)
+            data = self._handle_response(response, validator_entry, self.decoder, raw)
+        else:
+            response, data = self._timed_request(record, method, uri, params, headers, validator_entry, raw, **kwargs)
+        if validator_key is not None:
+            self._store_validators(validator_key, response, data)
+        return data
+
+    def _timed_request(self, record: RequestRecord, method, uri: str, params, headers, validator_entry, raw: bool, **kwargs):
+        """
+        Make the request while recording its phases: the response is streamed so that the wait
+        for the headers and the body download can be told apart.
+        """
+        record.attempts += 1
+        record.status = record.bytes = record.connect = record.ttfb = record.download = record.decode = None
+        self.hooks.emit(BEFORE_REQUEST, record)
+        session = self._get_session()
+        take_connect_time()
+        start = time.perf_counter()
+        response = getattr(session, method)(uri, params = flatten_params(params), headers = headers, timeout = self.request_timeout, stream = True, **kwargs)
+        headers_received = time.perf_counter()
+        record.connect = take_connect_time()
+        record.ttfb = max(headers_received - start - record.connect, 0.0)
+        record.status = response.status_code
+        record.bytes = len(response.content)
+        downloaded = time.perf_counter()
+        record.download = downloaded - headers_received
+        data = self._handle_response(response, validator_entry, self.decoder, raw)
+        record.decode = time.perf_counter() - downloaded
+        return response, data
 
     @staticmethod
-    def _handle_response(response: requests.Response):
-        """Internal helper for handling API responses from the Binance server.
+    def _request_key(method, path: str, kwargs: Dict, raw: bool = False):
+        """
+        Returns the key identifying a request for caching, coalescing and revalidation.
+        """
+        key = make_cache_key(method, path, kwargs.get('params'))
+        return key + ('raw',) if raw else key
+
+    def _conditional_headers(self, method, uri: str, kwargs: Dict, raw: bool = False):
+        """
+        Returns the (key, stored entry, headers) used to make a conditional request, or Nones if disabled.
+        """
+        if self.validators is None or method != 'get':
+            return None, None, None
+        key = self._request_key(method, uri, kwargs, raw)
+        entry = self.validators.get(key)
+        if entry is None:
+            return key, None, None
+        return key, entry, self.validators.conditional_headers(entry)
+
+    def _store_validators(self, key, response, data) -> None:
+        if response_status(response) == 304:
+            self.validators.mark_revalidated()
+        else:
+            self.validators.store(key, response.headers, data)
+
+    @staticmethod
+    def _handle_response(response: 'requests.Response', validator_entry=None, decoder: Decoder = json.loads, raw: bool = False):
+        """Internal helper for handling API responses from the TFL server.
         Raises the appropriate exceptions when necessary; otherwise, returns the
-        response.
+        response decoded with decoder, or the undecoded body if raw is set.
+        A 304 Not Modified answer to a conditional request returns the payload
+        stored in validator_entry.
         """
         # print(response.status_code)
+        if response.status_code == 304 and validator_entry is not None:
+            return validator_entry[2]
         if not 200 <= response.status_code < 300:
             raise TFLAPIException(response, response.status_code, response.text)
+        if raw:
+            return response.content
         try:
-            return response.json()
+            return decoder(response.content)
         except ValueError as exc:
             raise TFLRequestException(f'Invalid Response: {response.text}') from exc
 
     def _create_api_uri(self, path: str, signed: bool = True) -> str:
-        url = self.api_url
+        url = self.api_url.rstrip('/')
         if signed:
             pass
-        return url + '/' + path
+        return url + '/' + path.lstrip('/')
+
+    def _cache_key(self, method, path: str, kwargs: Dict):
+        """
+        Returns the (key, ttl) pair to cache this request under, or None if it should not be cached.
+        """
+        if self.cache is None or method != 'get':
+            return None
+        key = self._request_key(method, path, kwargs, kwargs.get('raw', False))
+        ttl = self.cache.ttl_for(key[1])
+        if ttl <= 0:
+            return None
+        return key, ttl
+
+    def _retry_delay(self, exc: TFLAPIException, attempt: int) -> float|None:
+        """
+        Returns how long to wait before retrying a failed request, or None to give up.
+        """
+        if self.retry_policy is None:
+            return None
+        delay = self.retry_policy.delay_for(exc.status_code, getattr(exc.response, 'headers', None), attempt)
+        if delay is not None and self.rate_limiter is not None:
+            self.rate_limiter.pause(delay)
+        return delay
+
+    def _send(self, method, path: str, uri: str, signed: bool, record: RequestRecord|None = None, **kwargs):
+        """
+        Make the request once a rate limit token is available, retrying throttled answers.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.rate_limiter.priority_for(path))
+            try:
+                return self._request(method, uri, signed, record=record, **kwargs)
+            except TFLAPIException as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _from_snapshot(self, method, path: str, kwargs: Dict):
+        """
+        Returns the response to this request stored in a fresh snapshot, or _MISSING.
+        """
+        if self.snapshot is None or method != 'get' or kwargs.get('raw') or not self.snapshot.fresh:
+            return _MISSING
+        return self.snapshot.get(path, kwargs.get('params'), _MISSING)
 
     def _request_api(self, method, path: str, signed: bool = False, **kwargs):
+        if not self.hooks:
+            return self._fetch(method, path, signed, None, **kwargs)
+        record = RequestRecord(method, path, kwargs.get('params'))
+        try:
+            data = self._fetch(method, path, signed, record, **kwargs)
+        except Exception as exc:
+            record.elapsed = time.perf_counter() - record.start
+            record.error = exc
+            self.hooks.emit(ON_ERROR, record)
+            raise
+        record.elapsed = time.perf_counter() - record.start
+        self.hooks.emit(AFTER_RESPONSE, record)
+        return data
+
+    def _fetch(self, method, path: str, signed: bool, record: RequestRecord|None, **kwargs):
+        """
+        Answer a request from the snapshot, the cache, an identical request in flight or the network.
+        """
+        stored = self._from_snapshot(method, path, kwargs)
+        if stored is not _MISSING:
+            if record is not None:
+                record.source = SNAPSHOT
+            return stored
+        cache_key = self._cache_key(method, path, kwargs)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key[0], _MISSING)
+            if record is not None:
+                record.cache = 'miss' if cached is _MISSING else 'hit'
+            if cached is not _MISSING:
+                if record is not None:
+                    record.source = CACHE
+                return cached
+        if cache_key is not None and record is None:
+            # timing the request measures its body, the size the response is cached at
+            record = RequestRecord(method, path, kwargs.get('params'))
+        uri = self._create_api_uri(path, signed)
+        key = None
+        if method == 'get' and (self.single_flight is not None or self.resilience is not None):
+            key = cache_key[0] if cache_key is not None else self._request_key(method, path, kwargs, kwargs.get('raw', False))
+        if self.single_flight is not None and method == 'get':
+            data = self.single_flight.do(key, self._network, method, path, uri, signed, key, record=record, **kwargs)
+        else:
+            data = self._network(method, path, uri, signed, key, record=record, **kwargs)
+        age = None
+        if self.resilience is not None:
+            from tfl.resilience import stale_age
+            age = stale_age(data)
+        if record is not None:
+            # a request that shared the round trip of another made no attempt of its own
+            record.source = STALE if age is not None else NETWORK if record.attempts else COALESCED
+            record.age = age
+        if cache_key is not None and age is None:
+            # a 304 or a shared round trip leaves no body length, the cache then estimates it
+            size = record.bytes if record.status != 304 else None
+            self.cache.set(cache_key[0], data, cache_key[1], size)
+        return data
+
+    def _network(self, method, path: str, uri: str, signed: bool, key, record: RequestRecord|None = None, **kwargs):
+        """
+        Send the request, through the resilience policy for GETs when the client has one.
+        """
+        if self.resilience is None or method != 'get':
+            return self._send(method, path, uri, signed, record=record, **kwargs)
+        return self.resilience.call(path, key, lambda record: self._send(method, path, uri, signed, record=record, **kwargs), record)
+
+    @staticmethod
+    def _to_entities(path: str, data):
+        """
+        Convert a decoded response into entities according to the swagger response type of path.
+        """
+        # imported here so the generated models are only loaded by clients that use them
+        from tfl.entities import RESPONSE_TYPES
+        converter = RESPONSE_TYPES.converter_for(path)
+        return data if converter is None else converter(data)
+
+    def get(self, path, signed=False, raw: bool = False, **kwargs):
+        """
+        GET path relative to the api url.
+
+        If raw is set the undecoded response body is returned as bytes, e.g. for forwarding
+        payloads without a decode/re-encode round trip.
+        """
+        if raw:
+            return self._request_api('get', path, signed, raw=True, **kwargs)
+        data = self._request_api('get', path, signed, **kwargs)
+        if self.entities:
+            if self.resilience is not None:
+                # keep the mark of a stale answer on its entities
+                from tfl.resilience import carry_stale
+                return carry_stale(data, self._to_entities(path, data))
+            return self._to_entities(path, data)
+        return data
+
+    @staticmethod
+    def _item_converter(path: str):
+        """
+        Returns the entity type of each element of the array response for path, or None.
+        """
+        from tfl.entities import RESPONSE_TYPES
+        match = RESPONSE_TYPES.entity_for(path)
+        if match is None or not match[1]:
+            return None
+        return match[0].from_dict
+
+    def stream_get(self, path, signed=False, params=None, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+        """
+        GET an endpoint returning a JSON array and yield its elements as the body is downloaded.
+
+        The response is read in chunks and decoded incrementally, so peak memory is bounded by
+        the largest element instead of the whole payload. Streamed responses bypass the cache
+        but go through the rate limiter, the retry policy and the hooks like other requests; the
+        after_response hook fires once the last element has been yielded.
+
+        Parameters
+        ----------
+        path : str
+            Path relative to the api url e.g. 'Line/Route'
+        params : Dict | None, optional
+            Query parameters, by default None.
+        chunk_size : int, default: 64 * 1024
+            Number of bytes read from the socket at a time.
+
+        Raises
+        ------
+        TFLAPIException
+            If the API responds with a non 2xx status code.
+        TFLRequestException
+            If the body is not a JSON array.
+        """
         uri = self._create_api_uri(path, signed)
-        return self._request(method, uri, signed, **kwargs)
+        convert = self._item_converter(path) if self.entities else None
+        record = RequestRecord('get', path, params) if self.hooks else None
+        try:
+            with self._open_stream(path, uri, params, record) as response:
+                for item in iter_json_array(self._counted(response.iter_content(chunk_size), record)):
+                    yield item if convert is None else convert(item)
+        except Exception as exc:
+            if record is not None:
+                record.elapsed = time.perf_counter() - record.start
+                record.error = exc
+                self.hooks.emit(ON_ERROR, record)
+            raise
+        if record is not None:
+            record.source = NETWORK
+            record.elapsed = time.perf_counter() - record.start
+            self.hooks.emit(AFTER_RESPONSE, record)
 
-    def get(self, path, signed=False, **kwargs):
-        return self._request_api('get', path, signed, **kwargs)
+    def _open_stream(self, path: str, uri: str, params, record: RequestRecord|None) -> 'requests.Response':
+        """
+        Returns the response of a streamed GET once its headers arrive, waiting for a rate limit
+        token first and retrying throttled answers like _send. The body is left unread.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.rate_limiter.priority_for(path))
+            if record is not None:
+                record.attempts += 1
+                record.status = record.bytes = record.connect = record.ttfb = None
+                self.hooks.emit(BEFORE_REQUEST, record)
+                take_connect_time()
+            start = time.perf_counter()
+            response = self._get_session().get(uri, params=flatten_params(params), timeout=self.request_timeout, stream=True)
+            if record is not None:
+                record.connect = take_connect_time()
+                record.ttfb = max(time.perf_counter() - start - record.connect, 0.0)
+                record.status = response.status_code
+            if 200 <= response.status_code < 300:
+                return response
+            with response:
+                exc = TFLAPIException(response, response.status_code, response.text)
+            delay = self._retry_delay(exc, attempt)
+            if delay is None:
+                raise exc
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _counted(chunks: Iterator[bytes], record: RequestRecord|None) -> Iterator[bytes]:
+        # the download of a stream interleaves with its consumer, so only its size is recorded
+        if record is None:
+            yield from chunks
+            return
+        record.bytes = 0
+        for chunk in chunks:
+            record.bytes += len(chunk)
+            yield chunk
 
     def post(self, path, signed=False, **kwargs) -> Dict:
         return self._request_api('post', path, signed, **kwargs)
@@ -106,14 +533,119 @@ class BaseClient():
     def delete(self, path, signed=False, **kwargs) -> Dict:
         return self._request_api('delete', path, signed, **kwargs)
 
+    def _get_batch_executor(self) -> 'ThreadPoolExecutor':
+        if self._batch_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._batch_executor = ThreadPoolExecutor(max_workers=self.batch_workers, thread_name_prefix='tfl-batch')
+        return self._batch_executor
+
+    def get_batched(self, path: str, ids: List[str], signed=False, **kwargs) -> List:
+        """
+        GET a comma-list endpoint for any number of ids.
+
+        The ids are split into URL-safe chunks which are requested in parallel, and the list
+        responses are concatenated in input order.
+
+        Parameters
+        ----------
+        path : str
+            Path containing an ``{ids}`` placeholder e.g. 'Line/{ids}/Status'
+        ids : List[str]
+            Ids to substitute into the path.
+
+        Examples
+        --------
+        >>> self.get_batched('Line/{ids}/Status', bus_route_ids, params={'detail': True})
+        """
+        batches = chunk_ids(ids)
+        if len(batches) <= 1:
+            return self.get(path.replace('{ids}', ','.join(ids)), signed, **kwargs)
+        executor = self._get_batch_executor()
+        futures = [executor.submit(self.get, path.replace('{ids}', batch), signed, **kwargs) for batch in batches]
+        return merge_batches(future.result() for future in futures)
+
+    def prefetch(self, modes: List[str], include: List[str]|None = None, concurrency: int = 8, progress=None, snapshot: str|None = None):
+        """
+        Warm up the static data (lines, routes, stations, timetables) of whole modes in parallel.
+
+        Responses are stored in the client's cache when it has one and, if snapshot is given,
+        written to that file.
+
+        Parameters
+        ----------
+        modes : List[str]
+            Modes to prefetch e.g. ['tube', 'dlr'].
+        include : List[str] | None, optional
+            Any of 'routes', 'stops' and 'timetables', by default all of them.
+        concurrency : int, default: 8
+            Maximum number of requests in flight.
+        progress : Callable[[PrefetchProgress], None] | None, optional
+            Called after every request with the number of completed, failed and planned requests.
+        snapshot : str | None, optional
+            File to write the responses to, readable by ``tfl.snapshot.SnapshotStore``.
+
+        Returns
+        -------
+        Prefetcher
+            The executed plan, with its responses and errors.
+        """
+        from tfl.prefetch import DEFAULT_INCLUDE, Prefetcher
+        prefetcher = Prefetcher(self, modes, include or DEFAULT_INCLUDE, concurrency, progress=progress)
+        prefetcher.run()
+        if snapshot is not None:
+            prefetcher.save(snapshot)
+        return prefetcher
+
+    def close(self) -> None:
+        """
+        Release the worker threads and pooled connections held by the client.
+        """
+        if self._batch_executor is not None:
+            self._batch_executor.shutdown(wait=False)
+            self._batch_executor = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
 class Client(BaseClient):
     """
     Client object to store headers and initiate API calls from.
 
+    Endpoint groups are available as attributes: ``line`` plus one per swagger tag from
+    ``tfl.endpoints`` (``stoppoint``, ``journey``, ``road``, ``bikepoint``, ...), loaded on first
+    access.
+
     Parameters
     ----------
     api_url : str, default: 'https://api.tfl.gov.uk/'
         The root url from which all endpoints can be accessed.
+    cache : ResponseCache | None, optional
+        Cache consulted for GET requests before going over the network, by default None (no caching).
+    validators : ValidatorStore | None, optional
+        Store of ETag / Last-Modified validators for conditional GET requests, by default None (disabled).
+    coalesce : bool, default: False
+        Share one HTTP round trip between concurrent identical GET requests.
+    entities : bool, default: False
+        Return responses as the slotted entity classes from ``tfl.entities`` instead of dicts.
+    json_backend : str | Callable[[bytes], Any] | None, optional
+        JSON decoder used for response bodies, by default the fastest installed backend.
+    rate_limiter : RateLimiter | None, optional
+        Token bucket every request must draw from, by default None (unlimited).
+    retry_policy : RetryPolicy | None, optional
+        Retry schedule for 429 / 503 answers honouring Retry-After, by default None (no retries).
+    snapshot : SnapshotStore | None, optional
+        Memory-mapped snapshot of static responses (see ``client.prefetch``) that GET requests are
+        served from while it is fresh, by default None.
+    connect_timeout : float, default: 3.05
+        Seconds to wait for a connection to the API to be established.
+    read_timeout : float, default: 30.0
+        Seconds to wait between bytes of the response before giving up.
+    pool_size : int, default: 10
+        Maximum number of keep-alive connections kept by the session.
+    max_retries : int, default: 3
+        Retries for failed connection attempts.
+    resilience : ResiliencePolicy | None, optional
+        Circuit breakers, hedging and stale-while-revalidate for GET requests, by default None.
 
     See Also
     --------
@@ -125,8 +657,8 @@ class Client(BaseClient):
     Examples
     --------
     """
-    def __init__(self, api_url='https://api.tfl.gov.uk/') -> None:
-        super().__init__(api_url = api_url)
+    def __init__(self, api_url='https://api.tfl.gov.uk/', cache: ResponseCache|None = None, validators: ValidatorStore|None = None, coalesce: bool = False, entities: bool = False, json_backend: str|Decoder|None = None, rate_limiter: RateLimiter|None = None, retry_policy: RetryPolicy|None = None, snapshot: 'SnapshotStore|None' = None, connect_timeout: float = 3.05, read_timeout: float = 30.0, pool_size: int = 10, max_retries: int = 3, resilience: 'ResiliencePolicy|None' = None) -> None:
+        super().__init__(api_url = api_url, cache = cache, validators = validators, coalesce = coalesce, entities = entities, json_backend = json_backend, rate_limiter = rate_limiter, retry_policy = retry_policy, snapshot = snapshot, connect_timeout = connect_timeout, read_timeout = read_timeout, pool_size = pool_size, max_retries = max_retries, resilience = resilience)
         self.line = LineEndpoint(self)
 
 class LineEndpoint():
@@ -218,7 +750,7 @@ class LineEndpoint():
         Parameters
         ----------
         ids : List[str]
-            A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.
+            A list of line ids e.g. victoria,circle,N133. Lists longer than approx. 20 ids are split into parallel requests.
 
         >>> self.get_lines_by_ids(['victoria','circle'])
         [
@@ -239,8 +771,7 @@ class LineEndpoint():
         }
         ]
         """
-        id_list = ','.join(ids)
-        return self.client.get(f'Line/{id_list}')
+        return self.client.get_batched('Line/{ids}', ids)
     
     def get_lines_for_mode(self, modes: List[str]):
         """
@@ -274,6 +805,18 @@ class LineEndpoint():
         mode_list = ','.join(modes)
         return self.client.get(f'Line/Mode/{mode_list}')
     
+    def iter_lines_for_mode(self, modes: List[str]) -> Iterator[Dict]:
+        """
+        Streaming version of get_lines_for_mode, yielding one line at a time as the response is downloaded.
+
+        Parameters
+        ----------
+        modes : List[str]
+            A comma-separated list of modes e.g. tube,dlr
+        """
+        mode_list = ','.join(modes)
+        return self.client.stream_get(f'Line/Mode/{mode_list}')
+
     def get_valid_routes_for_all_lines(self, service_types: List[str]=["Regular"]):
         """
         Get all valid routes for all lines, including the name and id of the originating and terminating stops for each route.
@@ -303,9 +846,25 @@ class LineEndpoint():
             "crowding": {...}
         }
         ]"""
-        return self.client.get("Line/Route", params=json.dumps({'serviceTypes':','.join(service_types)}))
+        return self.client.get("Line/Route", params={'serviceTypes':service_types})
 
 
+    def iter_valid_routes_for_all_lines(self, service_types: List[str]=["Regular"]) -> Iterator[Dict]:
+        """
+        Streaming version of get_valid_routes_for_all_lines, yielding one line at a time as the response is downloaded.
+
+        Parameters
+        ----------
+        service_types : List[str], optional
+            A comma seperated list of service types to filter on. Supported values: Regular, Night. By default ["Regular"].
+
+        Examples
+        --------
+        >>> for line in self.iter_valid_routes_for_all_lines():
+        ...     print(line['id'], len(line['routeSections']))
+        """
+        return self.client.stream_get("Line/Route", params={'serviceTypes':service_types})
+
     def get_valid_routes_for_line_ids(self, ids:List[str], service_types: List[str]=["Regular"]):
         """
         Get all valid routes for given line ids, including the name and id of the originating and terminating stops for each route.
@@ -313,7 +872,7 @@ class LineEndpoint():
         Parameters
         ----------
         ids : List[str]
-            A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.
+            A list of line ids e.g. victoria,circle,N133. Lists longer than approx. 20 ids are split into parallel requests.
         service_types : List[str], optional
             A comma seperated list of service types to filter on. Supported values: Regular, Night. By default ["Regular"].
         
@@ -337,8 +896,7 @@ class LineEndpoint():
             "crowding": {...}
         }
         ]"""
-        id_list = ','.join(ids)
-        return self.client.get(f'Line/{id_list}/Route', params=json.dumps({'ServiceTypes':','.join(service_types)}))
+        return self.client.get_batched('Line/{ids}/Route', ids, params={'serviceTypes':service_types})
 
 
     def get_valid_routes_for_modes(self, modes:List[str], service_types: List[str]=["Regular"]):
@@ -373,7 +931,38 @@ class LineEndpoint():
         }
         ]"""
         mode_list = ','.join(modes)
-        return self.client.get(f'Line/Mode/{mode_list}/Route', params=json.dumps({'serviceTypes':','.join(service_types)}))
+        return self.client.get(f'Line/Mode/{mode_list}/Route', params={'serviceTypes':service_types})
+
+    def get_valid_routes_for_modes_table(self, modes:List[str], service_types: List[str]=["Regular"]):
+        """
+        Columnar version of get_valid_routes_for_modes with one row per routeSection, see tfl.tables.ROUTE_SECTIONS.
+
+        Examples
+        --------
+        >>> table = self.get_valid_routes_for_modes_table(['bus'])
+        >>> table.column('origination_name')
+        """
+        from tfl.tables import route_sections_table, then
+        return then(self.get_valid_routes_for_modes(modes, service_types), route_sections_table)
+
+    def iter_valid_routes_for_modes(self, modes:List[str], service_types: List[str]=["Regular"]) -> Iterator[Dict]:
+        """
+        Streaming version of get_valid_routes_for_modes, yielding one line at a time as the response is downloaded.
+
+        Parameters
+        ----------
+        modes : List[str]
+            A comma-separated list of modes e.g. tube,dlr
+        service_types : List[str], optional
+            A comma seperated list of service types to filter on. Supported values: Regular, Night. By default ["Regular"].
+
+        Examples
+        --------
+        >>> for line in self.iter_valid_routes_for_modes(['bus']):
+        ...     print(line['id'], len(line['routeSections']))
+        """
+        mode_list = ','.join(modes)
+        return self.client.stream_get(f'Line/Mode/{mode_list}/Route', params={'serviceTypes':service_types})
 
     def get_valid_routes_for_line_id(self, line_id:str, direction:str, service_types: List[str]=["Regular"], exclude_crowding: bool=False):
         """
@@ -407,7 +996,7 @@ class LineEndpoint():
         "orderedLineRoutes": [...]
         }
         """
-        return self.client.get(f'Line/{line_id}/Route/Sequence/{direction}', params=json.dumps({'serviceTypes':','.join(service_types), 'excludeCrowding':exclude_crowding}))
+        return self.client.get(f'Line/{line_id}/Route/Sequence/{direction}', params={'serviceTypes':service_types, 'excludeCrowding':exclude_crowding})
 
     def get_line_status_between_dates(self, ids: List[str], detail: bool, start_date: str, end_date: str):
         """
@@ -442,8 +1031,7 @@ class LineEndpoint():
         ]
         """
         id_list = ','.join(ids)
-        # return self.client.get(f"Line/{id_list}/Status/{start_date}/to/{end_date}", params=json.dumps({'detail':detail, 'dateRange.startDate':start_date,'dateRange.endDate':end_date}))
-        return self.client.get(f"Line/{id_list}/Status/{start_date}/to/{end_date}", params={"detail":str(detail).lower()})
+        return self.client.get(f"Line/{id_list}/Status/{start_date}/to/{end_date}", params={"detail":detail})
 
     def get_line_status(self, ids: List[str], detail: bool):
         """
@@ -452,7 +1040,7 @@ class LineEndpoint():
         Parameters
         ----------
         ids : List[str]
-            A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.
+            A list of line ids e.g. victoria,circle,N133. Lists longer than approx. 20 ids are split into parallel requests.
         detail : bool
             Include details of the disruptions that are causing the line status including the affected stops and routes
 
@@ -474,8 +1062,26 @@ class LineEndpoint():
         }
         ]
         """
-        id_list = ','.join(ids)
-        return self.client.get(f"Line/{id_list}/Status", params={'detail':detail})
+        return self.client.get_batched('Line/{ids}/Status', ids, params={'detail':detail})
+
+    def get_line_status_table(self, ids: List[str], detail: bool):
+        """
+        Columnar version of get_line_status with one row per lineStatus, see tfl.tables.LINE_STATUSES.
+
+        Parameters
+        ----------
+        ids : List[str]
+            A list of line ids e.g. victoria,circle,N133.
+        detail : bool
+            Include details of the disruptions that are causing the line status.
+
+        Examples
+        --------
+        >>> table = self.get_line_status_table(['victoria', 'circle'], False)
+        >>> table.to_arrow()
+        """
+        from tfl.tables import line_statuses_table, then
+        return then(self.get_line_status(ids, detail), line_statuses_table)
 
     def search_lines_or_routes(self, query: str, modes: List[str]|None=None, service_types: List[str]=["Regular"]):
         """
@@ -574,10 +1180,7 @@ class LineEndpoint():
         severity : int | None, optional
             If specified, ensures that only those line status(es) are returned within the lines that have disruptions with the matching severity level. By default None.
         """
-        if severity is None:
-            return self.client.get(f"Line/Mode/{','.join(modes)}/Status")
-        else:
-            return self.client.get(f"Line/Mode/{','.join(modes)}/Status", params={"severityLevel":severity}) 
+        return self.client.get(f"Line/Mode/{','.join(modes)}/Status", params={"detail":detail, "severityLevel":severity})
 
     def get_stations(self, line_id: str, tfl_operated_national_rail_stations_only: bool = False):
         """
@@ -617,9 +1220,9 @@ class LineEndpoint():
         Parameters
         ----------
         ids : List[str]
-            A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.
+            A list of line ids e.g. victoria,circle,N133. Lists longer than approx. 20 ids are split into parallel requests.
         """
-        return self.client.get(f"Line/{','.join(ids)}/Disruption")
+        return self.client.get_batched('Line/{ids}/Disruption', ids)
 
     def get_disruptions_for_modes(self, modes:List[str]):
         """
@@ -639,7 +1242,7 @@ class LineEndpoint():
         Parameters
         ----------
         ids : List[str]
-            A comma-separated list of line ids e.g. victoria,circle,N133. Max. approx. 20 ids.
+            A list of line ids e.g. victoria,circle,N133. Lists longer than approx. 20 ids are split into parallel requests.
         stop_point_id : str
             Id of stop to get arrival predictions for (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query} endpoint to find a stop point id from a station name).
         direction : str, optional
@@ -652,4 +1255,16 @@ class LineEndpoint():
             params["direction"] = direction
         if destination_station_id is not None:
             params["destinationStationId"] = destination_station_id
-        return self.client.get(f"Line/{','.join(ids)}/Arrivals/{stop_point_id}", params=params)
+        return self.client.get_batched(f"Line/{{ids}}/Arrivals/{stop_point_id}", ids, params=params)
+
+    def get_arrival_predictions_table(self, ids: List[str], stop_point_id: str, direction:str|None=None, destination_station_id:str|None=None):
+        """
+        Columnar version of get_arrival_predictions with one row per prediction, see tfl.tables.ARRIVALS.
+
+        Examples
+        --------
+        >>> table = self.get_arrival_predictions_table(['victoria'], '940GZZLUOXC')
+        >>> table.to_records()
+        """
+        from tfl.tables import arrivals_table, then
+        return then(self.get_arrival_predictions(ids, stop_point_id, direction, destination_station_id), arrivals_table)
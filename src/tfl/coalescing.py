@@ -0,0 +1,142 @@
+'''
+coalescing.py
+'''
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable
+import threading
+
+if TYPE_CHECKING:
+    import asyncio
+
+class _Call():
+    __slots__ = ('event', 'result', 'exception')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+
+class SingleFlight():
+    """
+    Deduplicates concurrent calls that share a key across threads.
+
+    While a call for a key is outstanding, later callers with the same key block until it
+    finishes and receive the same result, or the same exception, instead of running it again.
+
+    Attributes
+    ----------
+    calls : int
+        Number of calls that were actually executed.
+    coalesced : int
+        Number of calls that waited on an outstanding call instead of executing.
+
+    Examples
+    --------
+    >>> flight = SingleFlight()
+    >>> flight.do(('get', 'Line/victoria/Status', None), fetch)
+    """
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) unless a call with the same key is already in flight,
+        in which case wait for it and return its outcome.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as exc:
+            call.exception = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the executed/coalesced counters and the number of calls in flight.
+        """
+        with self._lock:
+            return {'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
+
+class AsyncSingleFlight():
+    """
+    Deduplicates concurrent coroutine calls that share a key within an event loop.
+
+    Attributes
+    ----------
+    calls : int
+        Number of calls that were actually executed.
+    coalesced : int
+        Number of calls that awaited an outstanding call instead of executing.
+
+    See Also
+    --------
+    SingleFlight : Thread based equivalent.
+    """
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Await fn(*args, **kwargs) unless a call with the same key is already in flight,
+        in which case await its outcome instead.
+
+        Cancelling the caller running fn does not cancel the callers awaiting it: the key is
+        dropped and the first of them to resume runs fn again for the others.
+        """
+        import asyncio
+        future = self._calls.get(key)
+        while future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # this caller was cancelled, not the one it was waiting on
+                    raise
+            future = self._calls.get(key)
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.calls += 1
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the executed/coalesced counters and the number of calls in flight.
+        """
+        return {'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
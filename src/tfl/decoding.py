@@ -0,0 +1,76 @@
+'''
+decoding.py
+'''
+from typing import Any, Callable, Dict, List
+import importlib
+import json
+
+Decoder = Callable[[bytes], Any]
+
+def _load_orjson() -> Decoder:
+    return importlib.import_module('orjson').loads
+
+def _load_msgspec() -> Decoder:
+    return importlib.import_module('msgspec.json').decode
+
+def _load_ujson() -> Decoder:
+    return importlib.import_module('ujson').loads
+
+def _load_json() -> Decoder:
+    return json.loads
+
+# In order of preference when no backend is requested explicitly.
+JSON_BACKENDS: Dict[str, Callable[[], Decoder]] = {
+    'orjson': _load_orjson,
+    'msgspec': _load_msgspec,
+    'ujson': _load_ujson,
+    'json': _load_json,
+}
+
+def available_backends() -> List[str]:
+    """
+    Returns the names of the JSON backends that can be imported, fastest first.
+    """
+    available = []
+    for name, load in JSON_BACKENDS.items():
+        try:
+            load()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+def get_decoder(backend: str|Decoder|None = None) -> Decoder:
+    """
+    Resolve a JSON decoder taking the raw response bytes.
+
+    Parameters
+    ----------
+    backend : str | Callable[[bytes], Any] | None, optional
+        Name of a backend in JSON_BACKENDS, a callable used as is, or None to pick the fastest
+        installed backend and fall back to the standard library json module.
+
+    Returns
+    -------
+    Callable[[bytes], Any]
+        Function decoding a JSON document. Decoding errors are raised as ValueError subclasses.
+
+    Raises
+    ------
+    ValueError
+        If backend names an unknown backend.
+    ImportError
+        If backend names a backend that is not installed.
+    """
+    if callable(backend):
+        return backend
+    if backend is not None:
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend {backend!r}, expected one of {', '.join(JSON_BACKENDS)}")
+        return JSON_BACKENDS[backend]()
+    for load in JSON_BACKENDS.values():
+        try:
+            return load()
+        except ImportError:
+            continue
+    return json.loads
@@ -0,0 +1,171 @@
+'''
+disk_cache.py
+'''
+from typing import Any, Dict, Tuple
+from pathlib import Path
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from tfl.cache import TTLRules
+from tfl.decoding import Decoder, get_decoder
+
+# expires at (unix time), kind, key length
+_HEADER = struct.Struct('<dBI')
+_JSON = 0
+_BYTES = 1
+
+class DiskCache():
+    """
+    Response cache kept in a directory, shared by every process and client pointing at it.
+
+    Each entry is one file named after a hash of its key, holding the expiry time, the key and
+    the compact JSON (or raw bytes) of the response. Entries are written next to their
+    destination and renamed into place, so concurrent readers and writers in other processes never
+    see a partial entry and need no locking. Expired entries are removed when they are read.
+
+    Has the ``get``/``set``/``ttl_for`` methods of ``ResponseCache`` and can be passed to ``Client``
+    in its place.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding the entries, created if missing.
+    ttl_rules : TTLRules | None, optional
+        Lifetimes per path pattern. By default ``TTLRules()``.
+    max_bytes : int, default: 256 * 1024 * 1024
+        Responses larger than this are not stored.
+    decoder : str | Callable[[bytes], Any] | None, optional
+        JSON decoder for the entries, see ``tfl.decoding.get_decoder``.
+
+    Attributes
+    ----------
+    hits : int
+    misses : int
+        Counters of this instance only.
+
+    Examples
+    --------
+    >>> cache = DiskCache('/tmp/tfl-cache')
+    >>> Client(cache=cache).line.get_valid_routes_for_line_id('victoria', 'inbound')
+    >>> Client(cache=DiskCache('/tmp/tfl-cache')).line.get_valid_routes_for_line_id('victoria', 'inbound')  # from disk
+    """
+    def __init__(self, directory: str|Path, ttl_rules: TTLRules|None = None, max_bytes: int = 256 * 1024 * 1024, decoder: str|Decoder|None = None) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_rules = ttl_rules if ttl_rules is not None else TTLRules()
+        self.max_bytes = max_bytes
+        self.decoder = get_decoder(decoder)
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Returns the lifetime in seconds for the given normalized path.
+        """
+        return self.ttl_rules.ttl_for(path)
+
+    def _path_for(self, key_bytes: bytes) -> Path:
+        digest = hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+        return self.directory / digest[:2] / digest[2:]
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """
+        Returns the cached value for key, or default if it is absent or expired.
+        """
+        key_bytes = repr(key).encode()
+        path = self._path_for(key_bytes)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return default
+        try:
+            expires_at, kind, key_length = _HEADER.unpack_from(data)
+        except struct.error:
+            # truncated, e.g. by a full disk or a crash outside the rename protocol
+            return self._drop(path, default)
+        start = _HEADER.size + key_length
+        if data[_HEADER.size:start] != key_bytes:
+            self.misses += 1
+            return default
+        if expires_at <= time.time():
+            return self._drop(path, default)
+        body = data[start:]
+        if kind == _BYTES:
+            value = body
+        else:
+            try:
+                value = self.decoder(body)
+            except ValueError:
+                return self._drop(path, default)
+        self.hits += 1
+        return value
+
+    def _drop(self, path: Path, default: Any) -> Any:
+        # remove an unusable entry and count the lookup as a miss
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        self.misses += 1
+        return default
+
+    def set(self, key: Tuple, value: Any, ttl: float, size: int|None = None) -> None:
+        """
+        Store value under key for ttl seconds. Entries that cannot be written, e.g. on a full
+        disk, are skipped.
+        """
+        if ttl <= 0:
+            return
+        if isinstance(value, (bytes, bytearray)):
+            kind, body = _BYTES, bytes(value)
+        else:
+            kind, body = _JSON, json.dumps(value, separators=(',', ':'), default=str).encode()
+        if len(body) > self.max_bytes:
+            return
+        key_bytes = repr(key).encode()
+        path = self._path_for(key_bytes)
+        temporary = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            path.parent.mkdir(exist_ok=True)
+            temporary.write_bytes(_HEADER.pack(time.time() + ttl, kind, len(key_bytes)) + key_bytes + body)
+            os.replace(temporary, path)
+        except OSError:
+            try:
+                temporary.unlink()
+            except OSError:
+                pass
+
+    def invalidate(self, key: Tuple) -> None:
+        """
+        Remove key from the cache if present.
+        """
+        try:
+            self._path_for(repr(key).encode()).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache. Entries being written by other processes are left alone.
+        """
+        for path in self.directory.glob('*/*'):
+            if path.name.endswith('.tmp'):
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit/miss counters of this instance and the entries on disk.
+        """
+        paths = [path for path in self.directory.glob('*/*') if not path.name.endswith('.tmp')]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(paths), 'bytes': sum(path.stat().st_size for path in paths)}
+
+    def __len__(self) -> int:
+        return sum(1 for path in self.directory.glob('*/*') if not path.name.endswith('.tmp'))
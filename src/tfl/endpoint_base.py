@@ -0,0 +1,115 @@
+'''
+endpoint_base.py
+'''
+from typing import Dict, Sequence, Tuple
+
+# swagger type -> accepted python types
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    'string': (str,),
+    'integer': (int,),
+    'number': (int, float),
+    'boolean': (bool,),
+    'array': (list, tuple),
+}
+
+class Param():
+    """
+    Parameter of an API operation.
+
+    Parameters
+    ----------
+    name : str
+        Python argument name e.g. from_.
+    api_name : str
+        Name in the path template or query string e.g. from.
+    type : str
+        Swagger type: string, integer, number, boolean or array (of strings).
+    required : bool, default: False
+    enum : Tuple[str, ...] | None, optional
+        Allowed values, or allowed items for arrays, compared regardless of case like the API does.
+    """
+    __slots__ = ('name', 'api_name', 'type', 'required', 'enum', '_members', '_accepts')
+
+    def __init__(self, name: str, api_name: str, type: str = 'string', required: bool = False, enum: Tuple[str, ...]|None = None) -> None:
+        self.name = name
+        self.api_name = api_name
+        self.type = type
+        self.required = required
+        self.enum = frozenset(enum) if enum else None
+        # the API matches enum values regardless of case, e.g. timeIs=arriving
+        self._members = frozenset(member.casefold() for member in enum) if enum else None
+        self._accepts = _TYPES[type]
+
+    def validate(self, value) -> None:
+        """
+        Raise TypeError or ValueError if value is not acceptable for this parameter.
+        """
+        # bool is an int subclass but never a valid integer / number argument
+        if not isinstance(value, self._accepts) or (isinstance(value, bool) and self.type != 'boolean'):
+            raise TypeError(f'{self.name} must be {self.type}, got {type(value).__name__}')
+        if self.type == 'array':
+            for item in value:
+                if not isinstance(item, str):
+                    raise TypeError(f'{self.name} items must be strings, got {type(item).__name__}')
+            if self.enum is not None and not self._members.issuperset(item.casefold() for item in value):
+                raise ValueError(f"{self.name} items must be among {', '.join(sorted(self.enum))}")
+        elif self.enum is not None and value.casefold() not in self._members:
+            raise ValueError(f"{self.name} must be one of {', '.join(sorted(self.enum))}, got {value!r}")
+
+class Operation():
+    """
+    Description of a GET operation used by the generated endpoint methods.
+
+    The generator compiles each path template into an f-string and each parameter into an inline
+    class check, so a call with well-typed arguments costs about as much as a hand-written
+    f-string method. Anything unusual (wrong type, None for a required value, enum or array
+    values) is handed to check_path / check_query, which validate against the Param specs and
+    raise TypeError or ValueError before any request is made.
+
+    Parameters
+    ----------
+    template : str
+        Path template relative to the api url e.g. 'StopPoint/{id}/Arrivals'.
+    path_params : Sequence[Param]
+        Path parameters, in signature order.
+    query_params : Sequence[Param], optional
+        Query parameters, in signature order.
+    """
+    __slots__ = ('template', 'path_params', 'query_params')
+
+    def __init__(self, template: str, path_params: Sequence[Param], query_params: Sequence[Param] = ()) -> None:
+        self.template = template
+        self.path_params = tuple(path_params)
+        self.query_params = tuple(query_params)
+
+    @staticmethod
+    def _check(param: Param, value) -> None:
+        if value is None:
+            if param.required:
+                raise TypeError(f'{param.name} is required')
+            return
+        param.validate(value)
+
+    def check_path(self, index: int, value) -> None:
+        """
+        Validate the value of path parameter index.
+        """
+        self._check(self.path_params[index], value)
+
+    def check_query(self, index: int, value) -> None:
+        """
+        Validate the value of query parameter index.
+        """
+        self._check(self.query_params[index], value)
+
+class Endpoint():
+    """
+    Base class for the generated endpoint groups in ``tfl.endpoints``.
+
+    Parameters
+    ----------
+    client : BaseClient
+        Client the requests are sent through; on an AsyncClient every method returns an awaitable.
+    """
+    def __init__(self, client) -> None:
+        self.client = client
@@ -0,0 +1,1717 @@
+"""endpoints.py
+
+Generated from swagger_file.json by scripts/generate_endpoints.py, do not edit by hand.
+"""
+from typing import List
+from tfl.endpoint_base import Endpoint, Operation, Param
+
+_ACCIDENT_STATS_GET = Operation('AccidentStats/{year}', (Param('year', 'year', 'integer', required=True), ), ())
+_AIR_QUALITY_GET = Operation('AirQuality', (), ())
+_BIKE_POINT_GET_ALL = Operation('BikePoint', (), ())
+_BIKE_POINT_GET = Operation('BikePoint/{id}', (Param('id', 'id', 'string', required=True), ), ())
+_BIKE_POINT_SEARCH = Operation('BikePoint/Search', (), (Param('query', 'query', 'string', required=True), ))
+_CABWISE_GET = Operation('Cabwise/search', (), (Param('lat', 'lat', 'number', required=True), Param('lon', 'lon', 'number', required=True), Param('optype', 'optype', 'string'), Param('wc', 'wc', 'string'), Param('radius', 'radius', 'number'), Param('name', 'name', 'string'), Param('max_results', 'maxResults', 'integer'), Param('legacy_format', 'legacyFormat', 'boolean'), Param('force_xml', 'forceXml', 'boolean'), Param('twenty_four_seven_only', 'twentyFourSevenOnly', 'boolean'), ))
+_JOURNEY_META = Operation('Journey/Meta/Modes', (), ())
+_JOURNEY_JOURNEY_RESULTS = Operation('Journey/JourneyResults/{from}/to/{to}', (Param('from_', 'from', 'string', required=True), Param('to', 'to', 'string', required=True), ), (Param('via', 'via', 'string'), Param('national_search', 'nationalSearch', 'boolean'), Param('date', 'date', 'string'), Param('time', 'time', 'string'), Param('time_is', 'timeIs', 'string', enum=('Arriving', 'Departing')), Param('journey_preference', 'journeyPreference', 'string', enum=('LeastInterchange', 'LeastTime', 'LeastWalking')), Param('mode', 'mode', 'array'), Param('accessibility_preference', 'accessibilityPreference', 'array', enum=('NoRequirements', 'NoSolidStairs', 'NoEscalators', 'NoElevators', 'StepFreeToVehicle', 'StepFreeToPlatform')), Param('from_name', 'fromName', 'string'), Param('to_name', 'toName', 'string'), Param('via_name', 'viaName', 'string'), Param('max_transfer_minutes', 'maxTransferMinutes', 'string'), Param('max_walking_minutes', 'maxWalkingMinutes', 'string'), Param('walking_speed', 'walkingSpeed', 'string', enum=('Slow', 'Average', 'Fast')), Param('cycle_preference', 'cyclePreference', 'string', enum=('None', 'LeaveAtStation', 'TakeOnTransport', 'AllTheWay', 'CycleHire')), Param('adjustment', 'adjustment', 'string'), Param('bike_proficiency', 'bikeProficiency', 'array', enum=('Easy', 'Moderate', 'Fast')), Param('alternative_cycle', 'alternativeCycle', 'boolean'), Param('alternative_walking', 'alternativeWalking', 'boolean'), Param('apply_html_markup', 'applyHtmlMarkup', 'boolean'), Param('use_multi_modal_call', 'useMultiModalCall', 'boolean'), Param('walking_optimization', 'walkingOptimization', 'boolean'), Param('taxi_only_trip', 'taxiOnlyTrip', 'boolean'), Param('route_between_entrances', 'routeBetweenEntrances', 'boolean'), Param('use_real_time_live_arrivals', 'useRealTimeLiveArrivals', 'boolean'), Param('calc_one_direction', 'calcOneDirection', 'boolean'), Param('include_alternative_routes', 'includeAlternativeRoutes', 'boolean'), Param('override_multi_modal_scenario', 'overrideMultiModalScenario', 'integer'), ))
+_MODE_GET_ACTIVE_SERVICE_TYPES = Operation('Mode/ActiveServiceTypes', (), ())
+_MODE_ARRIVALS = Operation('Mode/{mode}/Arrivals', (Param('mode', 'mode', 'string', required=True), ), (Param('count', 'count', 'integer'), ))
+_OCCUPANCY_GET_CAR_PARK = Operation('Occupancy/CarPark/{id}', (Param('id', 'id', 'string', required=True), ), ())
+_OCCUPANCY_GET_ALL_CAR_PARKS = Operation('Occupancy/CarPark', (), ())
+_OCCUPANCY_GET_CHARGE_CONNECTOR_STATUS = Operation('Occupancy/ChargeConnector/{ids}', (Param('ids', 'ids', 'array', required=True), ), ())
+_OCCUPANCY_GET_ALL_CHARGE_CONNECTOR_STATUS = Operation('Occupancy/ChargeConnector', (), ())
+_OCCUPANCY_GET_BIKE_POINTS_OCCUPANCIES = Operation('Occupancy/BikePoints/{ids}', (Param('ids', 'ids', 'array', required=True), ), ())
+_PLACE_META_CATEGORIES = Operation('Place/Meta/Categories', (), ())
+_PLACE_META_PLACE_TYPES = Operation('Place/Meta/PlaceTypes', (), ())
+_PLACE_GET_STREETS_BY_POST_CODE = Operation('Place/Address/Streets/{Postcode}', (Param('postcode', 'Postcode', 'string', required=True), ), ())
+_PLACE_GET_BY_TYPE = Operation('Place/Type/{types}', (Param('types', 'types', 'array', required=True), ), (Param('active_only', 'activeOnly', 'boolean'), ))
+_PLACE_GET = Operation('Place/{id}', (Param('id', 'id', 'string', required=True), ), (Param('include_children', 'includeChildren', 'boolean'), ))
+_PLACE_GET_BY_GEO = Operation('Place', (), (Param('radius', 'radius', 'number'), Param('categories', 'categories', 'array'), Param('include_children', 'includeChildren', 'boolean'), Param('type', 'type', 'array'), Param('active_only', 'activeOnly', 'boolean'), Param('number_of_places_to_return', 'numberOfPlacesToReturn', 'integer'), Param('place_geo_sw_lat', 'placeGeo.swLat', 'number'), Param('place_geo_sw_lon', 'placeGeo.swLon', 'number'), Param('place_geo_ne_lat', 'placeGeo.neLat', 'number'), Param('place_geo_ne_lon', 'placeGeo.neLon', 'number'), Param('place_geo_lat', 'placeGeo.lat', 'number'), Param('place_geo_lon', 'placeGeo.lon', 'number'), ))
+_PLACE_GET_AT = Operation('Place/{type}/At/{Lat}/{Lon}', (Param('type', 'type', 'array', required=True), Param('lat', 'Lat', 'number', required=True), Param('lon', 'Lon', 'number', required=True), ), ())
+_PLACE_GET_OVERLAY = Operation('Place/{type}/overlay/{z}/{Lat}/{Lon}/{width}/{height}', (Param('z', 'z', 'integer', required=True), Param('type', 'type', 'array', required=True), Param('width', 'width', 'integer', required=True), Param('height', 'height', 'integer', required=True), Param('lat', 'Lat', 'number', required=True), Param('lon', 'Lon', 'number', required=True), ), ())
+_PLACE_SEARCH = Operation('Place/Search', (), (Param('name', 'name', 'string', required=True), Param('types', 'types', 'array'), ))
+_ROAD_GET_ALL = Operation('Road', (), ())
+_ROAD_GET = Operation('Road/{ids}', (Param('ids', 'ids', 'array', required=True), ), ())
+_ROAD_STATUS = Operation('Road/{ids}/Status', (Param('ids', 'ids', 'array', required=True), ), (Param('date_range_nullable_start_date', 'dateRangeNullable.startDate', 'string'), Param('date_range_nullable_end_date', 'dateRangeNullable.endDate', 'string'), ))
+_ROAD_DISRUPTION = Operation('Road/{ids}/Disruption', (Param('ids', 'ids', 'array', required=True), ), (Param('strip_content', 'stripContent', 'boolean'), Param('severities', 'severities', 'array'), Param('categories', 'categories', 'array'), Param('closures', 'closures', 'boolean'), ))
+_ROAD_DISRUPTED_STREETS = Operation('Road/all/Street/Disruption', (), (Param('start_date', 'startDate', 'string', required=True), Param('end_date', 'endDate', 'string', required=True), ))
+_ROAD_DISRUPTION_BY_ID = Operation('Road/all/Disruption/{disruptionIds}', (Param('disruption_ids', 'disruptionIds', 'array', required=True), ), (Param('strip_content', 'stripContent', 'boolean'), ))
+_ROAD_META_CATEGORIES = Operation('Road/Meta/Categories', (), ())
+_ROAD_META_SEVERITIES = Operation('Road/Meta/Severities', (), ())
+_SEARCH_GET = Operation('Search', (), (Param('query', 'query', 'string', required=True), ))
+_SEARCH_BUS_SCHEDULES = Operation('Search/BusSchedules', (), (Param('query', 'query', 'string', required=True), ))
+_SEARCH_META_SEARCH_PROVIDERS = Operation('Search/Meta/SearchProviders', (), ())
+_SEARCH_META_CATEGORIES = Operation('Search/Meta/Categories', (), ())
+_SEARCH_META_SORTS = Operation('Search/Meta/Sorts', (), ())
+_STOP_POINT_META_CATEGORIES = Operation('StopPoint/Meta/Categories', (), ())
+_STOP_POINT_META_STOP_TYPES = Operation('StopPoint/Meta/StopTypes', (), ())
+_STOP_POINT_META_MODES = Operation('StopPoint/Meta/Modes', (), ())
+_STOP_POINT_GET = Operation('StopPoint/{ids}', (Param('ids', 'ids', 'array', required=True), ), (Param('include_crowding_data', 'includeCrowdingData', 'boolean'), ))
+_STOP_POINT_GET_PLACE_TYPES = Operation('StopPoint/{id}/placeTypes', (Param('id', 'id', 'string', required=True), ), (Param('place_types', 'placeTypes', 'array', required=True), ))
+_STOP_POINT_CROWDING = Operation('StopPoint/{id}/Crowding/{line}', (Param('id', 'id', 'string', required=True), Param('line', 'line', 'string', required=True), ), (Param('direction', 'direction', 'string', required=True, enum=('inbound', 'outbound', 'all')), ))
+_STOP_POINT_GET_BY_TYPE = Operation('StopPoint/Type/{types}', (Param('types', 'types', 'array', required=True), ), ())
+_STOP_POINT_GET_BY_TYPE_WITH_PAGINATION = Operation('StopPoint/Type/{types}/page/{page}', (Param('types', 'types', 'array', required=True), Param('page', 'page', 'integer', required=True), ), ())
+_STOP_POINT_GET_SERVICE_TYPES = Operation('StopPoint/ServiceTypes', (), (Param('id', 'id', 'string', required=True), Param('line_ids', 'lineIds', 'array'), Param('modes', 'modes', 'array'), ))
+_STOP_POINT_ARRIVALS = Operation('StopPoint/{id}/Arrivals', (Param('id', 'id', 'string', required=True), ), ())
+_STOP_POINT_ARRIVAL_DEPARTURES = Operation('StopPoint/{id}/ArrivalDepartures', (Param('id', 'id', 'string', required=True), ), (Param('line_ids', 'lineIds', 'array', required=True), ))
+_STOP_POINT_REACHABLE_FROM = Operation('StopPoint/{id}/CanReachOnLine/{lineId}', (Param('id', 'id', 'string', required=True), Param('line_id', 'lineId', 'string', required=True), ), (Param('service_types', 'serviceTypes', 'array', enum=('Regular', 'Night')), ))
+_STOP_POINT_ROUTE = Operation('StopPoint/{id}/Route', (Param('id', 'id', 'string', required=True), ), (Param('service_types', 'serviceTypes', 'array', enum=('Regular', 'Night')), ))
+_STOP_POINT_DISRUPTION_BY_MODE = Operation('StopPoint/Mode/{modes}/Disruption', (Param('modes', 'modes', 'array', required=True), ), (Param('include_route_blocked_stops', 'includeRouteBlockedStops', 'boolean'), ))
+_STOP_POINT_DISRUPTION = Operation('StopPoint/{ids}/Disruption', (Param('ids', 'ids', 'array', required=True), ), (Param('get_family', 'getFamily', 'boolean'), Param('include_route_blocked_stops', 'includeRouteBlockedStops', 'boolean'), Param('flatten_response', 'flattenResponse', 'boolean'), ))
+_STOP_POINT_DIRECTION = Operation('StopPoint/{id}/DirectionTo/{toStopPointId}', (Param('id', 'id', 'string', required=True), Param('to_stop_point_id', 'toStopPointId', 'string', required=True), ), (Param('line_id', 'lineId', 'string'), ))
+_STOP_POINT_GET_BY_GEO_POINT = Operation('StopPoint', (), (Param('stop_types', 'stopTypes', 'array', required=True), Param('radius', 'radius', 'integer'), Param('use_stop_point_hierarchy', 'useStopPointHierarchy', 'boolean'), Param('modes', 'modes', 'array'), Param('categories', 'categories', 'array'), Param('return_lines', 'returnLines', 'boolean'), Param('location_lat', 'location.lat', 'number', required=True), Param('location_lon', 'location.lon', 'number', required=True), ))
+_STOP_POINT_GET_BY_MODE = Operation('StopPoint/Mode/{modes}', (Param('modes', 'modes', 'array', required=True), ), (Param('page', 'page', 'integer'), ))
+_STOP_POINT_SEARCH = Operation('StopPoint/Search/{query}', (Param('query', 'query', 'string', required=True), ), (Param('modes', 'modes', 'array'), Param('fares_only', 'faresOnly', 'boolean'), Param('max_results', 'maxResults', 'integer'), Param('lines', 'lines', 'array'), Param('include_hubs', 'includeHubs', 'boolean'), Param('tfl_operated_national_rail_stations_only', 'tflOperatedNationalRailStationsOnly', 'boolean'), ))
+_STOP_POINT_SEARCH_BY_QUERY = Operation('StopPoint/Search', (), (Param('query', 'query', 'string', required=True), Param('modes', 'modes', 'array'), Param('fares_only', 'faresOnly', 'boolean'), Param('max_results', 'maxResults', 'integer'), Param('lines', 'lines', 'array'), Param('include_hubs', 'includeHubs', 'boolean'), Param('tfl_operated_national_rail_stations_only', 'tflOperatedNationalRailStationsOnly', 'boolean'), ))
+_STOP_POINT_GET_BY_SMS = Operation('StopPoint/Sms/{id}', (Param('id', 'id', 'string', required=True), ), (Param('output', 'output', 'string'), ))
+_STOP_POINT_GET_TAXI_RANKS_BY_IDS = Operation('StopPoint/{stopPointId}/TaxiRanks', (Param('stop_point_id', 'stopPointId', 'string', required=True), ), ())
+_STOP_POINT_GET_CAR_PARKS_BY_ID = Operation('StopPoint/{stopPointId}/CarParks', (Param('stop_point_id', 'stopPointId', 'string', required=True), ), ())
+_TRAVEL_TIME_GET_OVERLAY = Operation('TravelTimes/overlay/{z}/mapcenter/{mapCenterLat}/{mapCenterLon}/pinlocation/{pinLat}/{pinLon}/dimensions/{width}/{height}', (Param('z', 'z', 'integer', required=True), Param('pin_lat', 'pinLat', 'number', required=True), Param('pin_lon', 'pinLon', 'number', required=True), Param('map_center_lat', 'mapCenterLat', 'number', required=True), Param('map_center_lon', 'mapCenterLon', 'number', required=True), Param('width', 'width', 'integer', required=True), Param('height', 'height', 'integer', required=True), ), (Param('scenario_title', 'scenarioTitle', 'string', required=True), Param('time_of_day_id', 'timeOfDayId', 'string', required=True), Param('mode_id', 'modeId', 'string', required=True), Param('direction', 'direction', 'string', required=True, enum=('Average', 'From', 'To')), Param('travel_time_interval', 'travelTimeInterval', 'integer', required=True), ))
+_TRAVEL_TIME_GET_COMPARE_OVERLAY = Operation('TravelTimes/compareOverlay/{z}/mapcenter/{mapCenterLat}/{mapCenterLon}/pinlocation/{pinLat}/{pinLon}/dimensions/{width}/{height}', (Param('z', 'z', 'integer', required=True), Param('pin_lat', 'pinLat', 'number', required=True), Param('pin_lon', 'pinLon', 'number', required=True), Param('map_center_lat', 'mapCenterLat', 'number', required=True), Param('map_center_lon', 'mapCenterLon', 'number', required=True), Param('width', 'width', 'integer', required=True), Param('height', 'height', 'integer', required=True), ), (Param('scenario_title', 'scenarioTitle', 'string', required=True), Param('time_of_day_id', 'timeOfDayId', 'string', required=True), Param('mode_id', 'modeId', 'string', required=True), Param('direction', 'direction', 'string', required=True, enum=('Average', 'From', 'To')), Param('travel_time_interval', 'travelTimeInterval', 'integer', required=True), Param('compare_type', 'compareType', 'string', required=True), Param('compare_value', 'compareValue', 'string', required=True), ))
+_VEHICLE_GET = Operation('Vehicle/{ids}/Arrivals', (Param('ids', 'ids', 'array', required=True), ), ())
+
+class AccidentStatsEndpoint(Endpoint):
+    """
+    Endpoints under /AccidentStats of the TfL Unified API.
+    """
+    def get(self, year: int):
+        """
+        Gets all accident details for accidents occuring in the specified year
+
+        Parameters
+        ----------
+        year : int
+            The year for which to filter the accidents on.
+        """
+        if year.__class__ is not int:
+            _ACCIDENT_STATS_GET.check_path(0, year)
+        return self.client.get(f'AccidentStats/{year}')
+
+class AirQualityEndpoint(Endpoint):
+    """
+    Endpoints under /AirQuality of the TfL Unified API.
+    """
+    def get(self):
+        """
+        Gets air quality data feed
+        """
+        return self.client.get('AirQuality')
+
+class BikePointEndpoint(Endpoint):
+    """
+    Endpoints under /BikePoint of the TfL Unified API.
+    """
+    def get_all(self):
+        """
+        Gets all bike point locations. The Place object has an addtionalProperties array which
+        contains the nbBikes, nbDocks and nbSpaces numbers which give the status of the BikePoint. A
+        mismatch in these numbers i.e. nbDocks - (nbBikes + nbSpaces) != 0 indicates broken docks.
+        """
+        return self.client.get('BikePoint')
+
+    def get(self, id: str):
+        """
+        Gets the bike point with the given id.
+
+        Parameters
+        ----------
+        id : str
+            A bike point id (a list of ids can be obtained from the above BikePoint call)
+        """
+        if id.__class__ is not str:
+            _BIKE_POINT_GET.check_path(0, id)
+        return self.client.get(f'BikePoint/{id}')
+
+    def search(self, query: str):
+        """
+        Search for bike stations by their name, a bike point's name often contains information about
+        the name of the street or nearby landmarks, for example. Note that the search result does
+        not contain the PlaceProperties i.e. the status or occupancy of the BikePoint, to get that
+        information you should retrieve the BikePoint by its id on /BikePoint/id.
+
+        Parameters
+        ----------
+        query : str
+            The search term e.g. "St. James"
+        """
+        params = {}
+        if query.__class__ is not str:
+            _BIKE_POINT_SEARCH.check_query(0, query)
+        params['query'] = query
+        return self.client.get('BikePoint/Search', params=params or None)
+
+class CabwiseEndpoint(Endpoint):
+    """
+    Endpoints under /Cabwise of the TfL Unified API.
+    """
+    def get(self, lat: float, lon: float, optype: str|None = None, wc: str|None = None, radius: float|None = None, name: str|None = None, max_results: int|None = None, legacy_format: bool|None = None, force_xml: bool|None = None, twenty_four_seven_only: bool|None = None):
+        """
+        Gets taxis and minicabs contact information
+
+        Parameters
+        ----------
+        lat : float
+            Latitude
+        lon : float
+            Longitude
+        optype : str | None, optional
+            Operator Type e.g Minicab, Executive, Limousine
+        wc : str | None, optional
+            Wheelchair accessible
+        radius : float | None, optional
+            The radius of the bounding circle in metres
+        name : str | None, optional
+            Trading name of operating company
+        max_results : int | None, optional
+            An optional parameter to limit the number of results return. Default and maximum is 20.
+        legacy_format : bool | None, optional
+            Legacy Format
+        force_xml : bool | None, optional
+            Force Xml
+        twenty_four_seven_only : bool | None, optional
+            Twenty Four Seven Only
+        """
+        params = {}
+        if lat.__class__ is not float and lat.__class__ is not int:
+            _CABWISE_GET.check_query(0, lat)
+        params['lat'] = lat
+        if lon.__class__ is not float and lon.__class__ is not int:
+            _CABWISE_GET.check_query(1, lon)
+        params['lon'] = lon
+        if optype is not None:
+            if optype.__class__ is not str:
+                _CABWISE_GET.check_query(2, optype)
+            params['optype'] = optype
+        if wc is not None:
+            if wc.__class__ is not str:
+                _CABWISE_GET.check_query(3, wc)
+            params['wc'] = wc
+        if radius is not None:
+            if radius.__class__ is not float and radius.__class__ is not int:
+                _CABWISE_GET.check_query(4, radius)
+            params['radius'] = radius
+        if name is not None:
+            if name.__class__ is not str:
+                _CABWISE_GET.check_query(5, name)
+            params['name'] = name
+        if max_results is not None:
+            if max_results.__class__ is not int:
+                _CABWISE_GET.check_query(6, max_results)
+            params['maxResults'] = max_results
+        if legacy_format is not None:
+            if legacy_format.__class__ is not bool:
+                _CABWISE_GET.check_query(7, legacy_format)
+            params['legacyFormat'] = legacy_format
+        if force_xml is not None:
+            if force_xml.__class__ is not bool:
+                _CABWISE_GET.check_query(8, force_xml)
+            params['forceXml'] = force_xml
+        if twenty_four_seven_only is not None:
+            if twenty_four_seven_only.__class__ is not bool:
+                _CABWISE_GET.check_query(9, twenty_four_seven_only)
+            params['twentyFourSevenOnly'] = twenty_four_seven_only
+        return self.client.get('Cabwise/search', params=params or None)
+
+class JourneyEndpoint(Endpoint):
+    """
+    Endpoints under /Journey of the TfL Unified API.
+    """
+    def meta(self):
+        """
+        Gets a list of all of the available journey planner modes
+        """
+        return self.client.get('Journey/Meta/Modes')
+
+    def journey_results(self, from_: str, to: str, via: str|None = None, national_search: bool|None = None, date: str|None = None, time: str|None = None, time_is: str|None = None, journey_preference: str|None = None, mode: List[str]|None = None, accessibility_preference: List[str]|None = None, from_name: str|None = None, to_name: str|None = None, via_name: str|None = None, max_transfer_minutes: str|None = None, max_walking_minutes: str|None = None, walking_speed: str|None = None, cycle_preference: str|None = None, adjustment: str|None = None, bike_proficiency: List[str]|None = None, alternative_cycle: bool|None = None, alternative_walking: bool|None = None, apply_html_markup: bool|None = None, use_multi_modal_call: bool|None = None, walking_optimization: bool|None = None, taxi_only_trip: bool|None = None, route_between_entrances: bool|None = None, use_real_time_live_arrivals: bool|None = None, calc_one_direction: bool|None = None, include_alternative_routes: bool|None = None, override_multi_modal_scenario: int|None = None):
+        """
+        Perform a Journey Planner search from the parameters specified in simple types
+
+        Parameters
+        ----------
+        from_ : str
+            Origin of the journey. Can be WGS84 coordinates expressed as "lat,long", a UK postcode,
+            a Naptan (StopPoint) id, an ICS StopId, or a free-text string (will cause disambiguation
+            unless it exactly matches a point of interest name).
+        to : str
+            Destination of the journey. Can be WGS84 coordinates expressed as "lat,long", a UK
+            postcode, a Naptan (StopPoint) id, an ICS StopId, or a free-text string (will cause
+            disambiguation unless it exactly matches a point of interest name).
+        via : str | None, optional
+            Travel through point on the journey. Can be WGS84 coordinates expressed as "lat,long", a
+            UK postcode, a Naptan (StopPoint) id, an ICS StopId, or a free-text string (will cause
+            disambiguation unless it exactly matches a point of interest name).
+        national_search : bool | None, optional
+            Does the journey cover stops outside London? eg. "nationalSearch=true"
+        date : str | None, optional
+            The date must be in yyyyMMdd format
+        time : str | None, optional
+            The time must be in HHmm format
+        time_is : str | None, optional
+            Does the time given relate to arrival or leaving time? Possible options: "departing" |
+            "arriving"
+        journey_preference : str | None, optional
+            The journey preference eg possible options: "leastinterchange" | "leasttime" |
+            "leastwalking"
+        mode : List[str] | None, optional
+            The mode must be a comma separated list of modes. eg possible options: "public-
+            bus,overground,train,tube,coach,dlr,cablecar,tram,river,walking,cycle"
+        accessibility_preference : List[str] | None, optional
+            The accessibility preference must be a comma separated list eg.
+            "noSolidStairs,noEscalators,noElevators,stepFreeToVehicle,stepFreeToPlatform"
+        from_name : str | None, optional
+            An optional name to associate with the origin of the journey in the results.
+        to_name : str | None, optional
+            An optional name to associate with the destination of the journey in the results.
+        via_name : str | None, optional
+            An optional name to associate with the via point of the journey in the results.
+        max_transfer_minutes : str | None, optional
+            The max walking time in minutes for transfer eg. "120"
+        max_walking_minutes : str | None, optional
+            The max walking time in minutes for journeys eg. "120"
+        walking_speed : str | None, optional
+            The walking speed. eg possible options: "slow" | "average" | "fast".
+        cycle_preference : str | None, optional
+            The cycle preference. eg possible options: "allTheWay" | "leaveAtStation" |
+            "takeOnTransport" | "cycleHire"
+        adjustment : str | None, optional
+            Time adjustment command. eg possible options: "TripFirst" | "TripLast"
+        bike_proficiency : List[str] | None, optional
+            A comma separated list of cycling proficiency levels. eg possible options:
+            "easy,moderate,fast"
+        alternative_cycle : bool | None, optional
+            Option to determine whether to return alternative cycling journey
+        alternative_walking : bool | None, optional
+            Option to determine whether to return alternative walking journey
+        apply_html_markup : bool | None, optional
+            Flag to determine whether certain text (e.g. walking instructions) should be output with
+            HTML tags or not.
+        use_multi_modal_call : bool | None, optional
+            A boolean to indicate whether or not to return 3 public transport journeys, a bus
+            journey, a cycle hire journey, a personal cycle journey and a walking journey
+        walking_optimization : bool | None, optional
+            A boolean to indicate whether to optimize journeys using walking
+        taxi_only_trip : bool | None, optional
+            A boolean to indicate whether to return one or more taxi journeys. Note, setting this to
+            true will override "useMultiModalCall".
+        route_between_entrances : bool | None, optional
+            A boolean to indicate whether public transport routes should include directions between
+            platforms and station entrances.
+        use_real_time_live_arrivals : bool | None, optional
+            A boolean to indicate if we want to receive real time live arrivals data where
+            available.
+        calc_one_direction : bool | None, optional
+            A boolean to make Journey Planner calculate journeys in one temporal direction only. In
+            other words, only calculate journeys after the 'depart' time, or before the 'arrive'
+            time. By default, the Journey Planner engine (EFA) calculates journeys in both temporal
+            directions.
+        include_alternative_routes : bool | None, optional
+            A boolean to make Journey Planner return alternative routes. Alternative routes are
+            calculated by removing one or more lines included in the fastest route and re-
+            calculating. By default, these journeys will not be returned.
+        override_multi_modal_scenario : int | None, optional
+            An optional integer to indicate what multi modal scenario we want to use.
+        """
+        if from_.__class__ is not str:
+            _JOURNEY_JOURNEY_RESULTS.check_path(0, from_)
+        if to.__class__ is not str:
+            _JOURNEY_JOURNEY_RESULTS.check_path(1, to)
+        params = {}
+        if via is not None:
+            if via.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(0, via)
+            params['via'] = via
+        if national_search is not None:
+            if national_search.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(1, national_search)
+            params['nationalSearch'] = national_search
+        if date is not None:
+            if date.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(2, date)
+            params['date'] = date
+        if time is not None:
+            if time.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(3, time)
+            params['time'] = time
+        if time_is is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(4, time_is)
+            params['timeIs'] = time_is
+        if journey_preference is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(5, journey_preference)
+            params['journeyPreference'] = journey_preference
+        if mode is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(6, mode)
+            params['mode'] = mode
+        if accessibility_preference is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(7, accessibility_preference)
+            params['accessibilityPreference'] = accessibility_preference
+        if from_name is not None:
+            if from_name.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(8, from_name)
+            params['fromName'] = from_name
+        if to_name is not None:
+            if to_name.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(9, to_name)
+            params['toName'] = to_name
+        if via_name is not None:
+            if via_name.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(10, via_name)
+            params['viaName'] = via_name
+        if max_transfer_minutes is not None:
+            if max_transfer_minutes.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(11, max_transfer_minutes)
+            params['maxTransferMinutes'] = max_transfer_minutes
+        if max_walking_minutes is not None:
+            if max_walking_minutes.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(12, max_walking_minutes)
+            params['maxWalkingMinutes'] = max_walking_minutes
+        if walking_speed is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(13, walking_speed)
+            params['walkingSpeed'] = walking_speed
+        if cycle_preference is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(14, cycle_preference)
+            params['cyclePreference'] = cycle_preference
+        if adjustment is not None:
+            if adjustment.__class__ is not str:
+                _JOURNEY_JOURNEY_RESULTS.check_query(15, adjustment)
+            params['adjustment'] = adjustment
+        if bike_proficiency is not None:
+            _JOURNEY_JOURNEY_RESULTS.check_query(16, bike_proficiency)
+            params['bikeProficiency'] = bike_proficiency
+        if alternative_cycle is not None:
+            if alternative_cycle.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(17, alternative_cycle)
+            params['alternativeCycle'] = alternative_cycle
+        if alternative_walking is not None:
+            if alternative_walking.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(18, alternative_walking)
+            params['alternativeWalking'] = alternative_walking
+        if apply_html_markup is not None:
+            if apply_html_markup.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(19, apply_html_markup)
+            params['applyHtmlMarkup'] = apply_html_markup
+        if use_multi_modal_call is not None:
+            if use_multi_modal_call.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(20, use_multi_modal_call)
+            params['useMultiModalCall'] = use_multi_modal_call
+        if walking_optimization is not None:
+            if walking_optimization.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(21, walking_optimization)
+            params['walkingOptimization'] = walking_optimization
+        if taxi_only_trip is not None:
+            if taxi_only_trip.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(22, taxi_only_trip)
+            params['taxiOnlyTrip'] = taxi_only_trip
+        if route_between_entrances is not None:
+            if route_between_entrances.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(23, route_between_entrances)
+            params['routeBetweenEntrances'] = route_between_entrances
+        if use_real_time_live_arrivals is not None:
+            if use_real_time_live_arrivals.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(24, use_real_time_live_arrivals)
+            params['useRealTimeLiveArrivals'] = use_real_time_live_arrivals
+        if calc_one_direction is not None:
+            if calc_one_direction.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(25, calc_one_direction)
+            params['calcOneDirection'] = calc_one_direction
+        if include_alternative_routes is not None:
+            if include_alternative_routes.__class__ is not bool:
+                _JOURNEY_JOURNEY_RESULTS.check_query(26, include_alternative_routes)
+            params['includeAlternativeRoutes'] = include_alternative_routes
+        if override_multi_modal_scenario is not None:
+            if override_multi_modal_scenario.__class__ is not int:
+                _JOURNEY_JOURNEY_RESULTS.check_query(27, override_multi_modal_scenario)
+            params['overrideMultiModalScenario'] = override_multi_modal_scenario
+        return self.client.get(f'Journey/JourneyResults/{from_}/to/{to}', params=params or None)
+
+class ModeEndpoint(Endpoint):
+    """
+    Endpoints under /Mode of the TfL Unified API.
+    """
+    def get_active_service_types(self):
+        """
+        Returns the service type active for a mode. Currently only supports tube
+        """
+        return self.client.get('Mode/ActiveServiceTypes')
+
+    def arrivals(self, mode: str, count: int|None = None):
+        """
+        Gets the next arrival predictions for all stops of a given mode
+
+        Parameters
+        ----------
+        mode : str
+            A mode name e.g. tube, dlr
+        count : int | None, optional
+            A number of arrivals to return for each stop, -1 to return all available.
+        """
+        if mode.__class__ is not str:
+            _MODE_ARRIVALS.check_path(0, mode)
+        params = {}
+        if count is not None:
+            if count.__class__ is not int:
+                _MODE_ARRIVALS.check_query(0, count)
+            params['count'] = count
+        return self.client.get(f'Mode/{mode}/Arrivals', params=params or None)
+
+class OccupancyEndpoint(Endpoint):
+    """
+    Endpoints under /Occupancy of the TfL Unified API.
+    """
+    def get_car_park(self, id: str):
+        """
+        Gets the occupancy for a car park with a given id
+
+        Parameters
+        ----------
+        id : str
+        """
+        if id.__class__ is not str:
+            _OCCUPANCY_GET_CAR_PARK.check_path(0, id)
+        return self.client.get(f'Occupancy/CarPark/{id}')
+
+    def get_all_car_parks(self):
+        """
+        Gets the occupancy for all car parks that have occupancy data
+        """
+        return self.client.get('Occupancy/CarPark')
+
+    def get_charge_connector_status(self, ids: List[str]):
+        """
+        Gets the occupancy for a charge connectors with a given id (sourceSystemPlaceId)
+
+        Parameters
+        ----------
+        ids : List[str]
+        """
+        _OCCUPANCY_GET_CHARGE_CONNECTOR_STATUS.check_path(0, ids)
+        return self.client.get_batched('Occupancy/ChargeConnector/{ids}', ids)
+
+    def get_all_charge_connector_status(self):
+        """
+        Gets the occupancy for all charge connectors
+        """
+        return self.client.get('Occupancy/ChargeConnector')
+
+    def get_bike_points_occupancies(self, ids: List[str]):
+        """
+        Get the occupancy for bike points.
+
+        Parameters
+        ----------
+        ids : List[str]
+        """
+        _OCCUPANCY_GET_BIKE_POINTS_OCCUPANCIES.check_path(0, ids)
+        return self.client.get_batched('Occupancy/BikePoints/{ids}', ids)
+
+class PlaceEndpoint(Endpoint):
+    """
+    Endpoints under /Place of the TfL Unified API.
+    """
+    def meta_categories(self):
+        """
+        Gets a list of all of the available place property categories and keys.
+        """
+        return self.client.get('Place/Meta/Categories')
+
+    def meta_place_types(self):
+        """
+        Gets a list of the available types of Place.
+        """
+        return self.client.get('Place/Meta/PlaceTypes')
+
+    def get_streets_by_post_code(self, postcode: str):
+        """
+        Gets the set of streets associated with a post code.
+
+        Parameters
+        ----------
+        postcode : str
+        """
+        if postcode.__class__ is not str:
+            _PLACE_GET_STREETS_BY_POST_CODE.check_path(0, postcode)
+        return self.client.get(f'Place/Address/Streets/{postcode}')
+
+    def get_by_type(self, types: List[str], active_only: bool|None = None):
+        """
+        Gets all places of a given type
+
+        Parameters
+        ----------
+        types : List[str]
+            A comma-separated list of the types to return. Max. approx 12 types. A valid list of
+            place types can be obtained from the /Place/Meta/placeTypes endpoint.
+        active_only : bool | None, optional
+            An optional parameter to limit the results to active records only (Currently only the
+            'VariableMessageSign' place type is supported)
+        """
+        _PLACE_GET_BY_TYPE.check_path(0, types)
+        types_list = ','.join(types)
+        params = {}
+        if active_only is not None:
+            if active_only.__class__ is not bool:
+                _PLACE_GET_BY_TYPE.check_query(0, active_only)
+            params['activeOnly'] = active_only
+        return self.client.get(f'Place/Type/{types_list}', params=params or None)
+
+    def get(self, id: str, include_children: bool|None = None):
+        """
+        Gets the place with the given id.
+
+        Parameters
+        ----------
+        id : str
+            The id of the place, you can use the /Place/Types/{types} endpoint to get a list of
+            places for a given type including their ids
+        include_children : bool | None, optional
+            Defaults to false. If true child places e.g. individual charging stations at a charge
+            point while be included, otherwise just the URLs of any child places will be returned
+        """
+        if id.__class__ is not str:
+            _PLACE_GET.check_path(0, id)
+        params = {}
+        if include_children is not None:
+            if include_children.__class__ is not bool:
+                _PLACE_GET.check_query(0, include_children)
+            params['includeChildren'] = include_children
+        return self.client.get(f'Place/{id}', params=params or None)
+
+    def get_by_geo(self, radius: float|None = None, categories: List[str]|None = None, include_children: bool|None = None, type: List[str]|None = None, active_only: bool|None = None, number_of_places_to_return: int|None = None, place_geo_sw_lat: float|None = None, place_geo_sw_lon: float|None = None, place_geo_ne_lat: float|None = None, place_geo_ne_lon: float|None = None, place_geo_lat: float|None = None, place_geo_lon: float|None = None):
+        """
+        Gets the places that lie within a geographic region. The geographic region of interest can
+        either be specified by using a lat/lon geo-point and a radius in metres to return places
+        within the locus defined by the lat/lon of its centre or alternatively, by the use of a
+        bounding box defined by the lat/lon of its north-west and south-east corners. Optionally
+        filters on type and can strip properties for a smaller payload.
+
+        Parameters
+        ----------
+        radius : float | None, optional
+            The radius of the bounding circle in metres when only lat/lon are specified.
+        categories : List[str] | None, optional
+            An optional list of comma separated property categories to return in the Place's
+            property bag. If null or empty, all categories of property are returned. Pass the
+            keyword "none" to return no properties (a valid list of categories can be obtained from
+            the /Place/Meta/categories endpoint)
+        include_children : bool | None, optional
+            Defaults to false. If true child places e.g. individual charging stations at a charge
+            point while be included, otherwise just the URLs of any child places will be returned
+        type : List[str] | None, optional
+            Place types to filter on, or null to return all types
+        active_only : bool | None, optional
+            An optional parameter to limit the results to active records only (Currently only the
+            'VariableMessageSign' place type is supported)
+        number_of_places_to_return : int | None, optional
+            If specified, limits the number of returned places equal to the given value
+        place_geo_sw_lat : float | None, optional
+        place_geo_sw_lon : float | None, optional
+        place_geo_ne_lat : float | None, optional
+        place_geo_ne_lon : float | None, optional
+        place_geo_lat : float | None, optional
+        place_geo_lon : float | None, optional
+        """
+        params = {}
+        if radius is not None:
+            if radius.__class__ is not float and radius.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(0, radius)
+            params['radius'] = radius
+        if categories is not None:
+            _PLACE_GET_BY_GEO.check_query(1, categories)
+            params['categories'] = categories
+        if include_children is not None:
+            if include_children.__class__ is not bool:
+                _PLACE_GET_BY_GEO.check_query(2, include_children)
+            params['includeChildren'] = include_children
+        if type is not None:
+            _PLACE_GET_BY_GEO.check_query(3, type)
+            params['type'] = type
+        if active_only is not None:
+            if active_only.__class__ is not bool:
+                _PLACE_GET_BY_GEO.check_query(4, active_only)
+            params['activeOnly'] = active_only
+        if number_of_places_to_return is not None:
+            if number_of_places_to_return.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(5, number_of_places_to_return)
+            params['numberOfPlacesToReturn'] = number_of_places_to_return
+        if place_geo_sw_lat is not None:
+            if place_geo_sw_lat.__class__ is not float and place_geo_sw_lat.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(6, place_geo_sw_lat)
+            params['placeGeo.swLat'] = place_geo_sw_lat
+        if place_geo_sw_lon is not None:
+            if place_geo_sw_lon.__class__ is not float and place_geo_sw_lon.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(7, place_geo_sw_lon)
+            params['placeGeo.swLon'] = place_geo_sw_lon
+        if place_geo_ne_lat is not None:
+            if place_geo_ne_lat.__class__ is not float and place_geo_ne_lat.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(8, place_geo_ne_lat)
+            params['placeGeo.neLat'] = place_geo_ne_lat
+        if place_geo_ne_lon is not None:
+            if place_geo_ne_lon.__class__ is not float and place_geo_ne_lon.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(9, place_geo_ne_lon)
+            params['placeGeo.neLon'] = place_geo_ne_lon
+        if place_geo_lat is not None:
+            if place_geo_lat.__class__ is not float and place_geo_lat.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(10, place_geo_lat)
+            params['placeGeo.lat'] = place_geo_lat
+        if place_geo_lon is not None:
+            if place_geo_lon.__class__ is not float and place_geo_lon.__class__ is not int:
+                _PLACE_GET_BY_GEO.check_query(11, place_geo_lon)
+            params['placeGeo.lon'] = place_geo_lon
+        return self.client.get('Place', params=params or None)
+
+    def get_at(self, type: List[str], lat: float, lon: float):
+        """
+        Gets any places of the given type whose geography intersects the given latitude and
+        longitude. In practice this means the Place must be polygonal e.g. a BoroughBoundary.
+
+        Parameters
+        ----------
+        type : List[str]
+            The place type (a valid list of place types can be obtained from the
+            /Place/Meta/placeTypes endpoint)
+        lat : float
+        lon : float
+        """
+        _PLACE_GET_AT.check_path(0, type)
+        type_list = ','.join(type)
+        if lat.__class__ is not float and lat.__class__ is not int:
+            _PLACE_GET_AT.check_path(1, lat)
+        if lon.__class__ is not float and lon.__class__ is not int:
+            _PLACE_GET_AT.check_path(2, lon)
+        return self.client.get(f'Place/{type_list}/At/{lat}/{lon}')
+
+    def get_overlay(self, z: int, type: List[str], width: int, height: int, lat: float, lon: float):
+        """
+        Gets the place overlay for a given set of co-ordinates and a given width/height.
+
+        Parameters
+        ----------
+        z : int
+            The zoom level
+        type : List[str]
+            The place type (a valid list of place types can be obtained from the
+            /Place/Meta/placeTypes endpoint)
+        width : int
+            The width of the requested overlay.
+        height : int
+            The height of the requested overlay.
+        lat : float
+        lon : float
+        """
+        if z.__class__ is not int:
+            _PLACE_GET_OVERLAY.check_path(0, z)
+        _PLACE_GET_OVERLAY.check_path(1, type)
+        type_list = ','.join(type)
+        if width.__class__ is not int:
+            _PLACE_GET_OVERLAY.check_path(2, width)
+        if height.__class__ is not int:
+            _PLACE_GET_OVERLAY.check_path(3, height)
+        if lat.__class__ is not float and lat.__class__ is not int:
+            _PLACE_GET_OVERLAY.check_path(4, lat)
+        if lon.__class__ is not float and lon.__class__ is not int:
+            _PLACE_GET_OVERLAY.check_path(5, lon)
+        return self.client.get(f'Place/{type_list}/overlay/{z}/{lat}/{lon}/{width}/{height}')
+
+    def search(self, name: str, types: List[str]|None = None):
+        """
+        Gets all places that matches the given query
+
+        Parameters
+        ----------
+        name : str
+            The name of the place, you can use the /Place/Types/{types} endpoint to get a list of
+            places for a given type including their names.
+        types : List[str] | None, optional
+            A comma-separated list of the types to return. Max. approx 12 types.
+        """
+        params = {}
+        if name.__class__ is not str:
+            _PLACE_SEARCH.check_query(0, name)
+        params['name'] = name
+        if types is not None:
+            _PLACE_SEARCH.check_query(1, types)
+            params['types'] = types
+        return self.client.get('Place/Search', params=params or None)
+
+class RoadEndpoint(Endpoint):
+    """
+    Endpoints under /Road of the TfL Unified API.
+    """
+    def get_all(self):
+        """
+        Gets all roads managed by TfL
+        """
+        return self.client.get('Road')
+
+    def get(self, ids: List[str]):
+        """
+        Gets the road with the specified id (e.g. A1)
+
+        Parameters
+        ----------
+        ids : List[str]
+            Comma-separated list of road identifiers e.g. "A406, A2" (a full list of supported road
+            identifiers can be found at the /Road/ endpoint)
+        """
+        _ROAD_GET.check_path(0, ids)
+        return self.client.get_batched('Road/{ids}', ids)
+
+    def status(self, ids: List[str], date_range_nullable_start_date: str|None = None, date_range_nullable_end_date: str|None = None):
+        """
+        Gets the specified roads with the status aggregated over the date range specified, or now
+        until the end of today if no dates are passed.
+
+        Parameters
+        ----------
+        ids : List[str]
+            Comma-separated list of road identifiers e.g. "A406, A2" or use "all" to ignore id
+            filter (a full list of supported road identifiers can be found at the /Road/ endpoint)
+        date_range_nullable_start_date : str | None, optional
+        date_range_nullable_end_date : str | None, optional
+        """
+        _ROAD_STATUS.check_path(0, ids)
+        params = {}
+        if date_range_nullable_start_date is not None:
+            if date_range_nullable_start_date.__class__ is not str:
+                _ROAD_STATUS.check_query(0, date_range_nullable_start_date)
+            params['dateRangeNullable.startDate'] = date_range_nullable_start_date
+        if date_range_nullable_end_date is not None:
+            if date_range_nullable_end_date.__class__ is not str:
+                _ROAD_STATUS.check_query(1, date_range_nullable_end_date)
+            params['dateRangeNullable.endDate'] = date_range_nullable_end_date
+        return self.client.get_batched('Road/{ids}/Status', ids, params=params or None)
+
+    def disruption(self, ids: List[str], strip_content: bool|None = None, severities: List[str]|None = None, categories: List[str]|None = None, closures: bool|None = None):
+        """
+        Get active disruptions, filtered by road ids
+
+        Parameters
+        ----------
+        ids : List[str]
+            Comma-separated list of road identifiers e.g. "A406, A2" use all for all to ignore id
+            filter (a full list of supported road identifiers can be found at the /Road/ endpoint)
+        strip_content : bool | None, optional
+            Optional, defaults to false. When true, removes every property/node except for id,
+            point, severity, severityDescription, startDate, endDate, corridor details, location,
+            comments and streets
+        severities : List[str] | None, optional
+            an optional list of Severity names to filter on (a valid list of severities can be
+            obtained from the /Road/Meta/severities endpoint)
+        categories : List[str] | None, optional
+            an optional list of category names to filter on (a valid list of categories can be
+            obtained from the /Road/Meta/categories endpoint)
+        closures : bool | None, optional
+            Optional, defaults to true. When true, always includes disruptions that have road
+            closures, regardless of the severity filter. When false, the severity filter works as
+            normal.
+        """
+        _ROAD_DISRUPTION.check_path(0, ids)
+        params = {}
+        if strip_content is not None:
+            if strip_content.__class__ is not bool:
+                _ROAD_DISRUPTION.check_query(0, strip_content)
+            params['stripContent'] = strip_content
+        if severities is not None:
+            _ROAD_DISRUPTION.check_query(1, severities)
+            params['severities'] = severities
+        if categories is not None:
+            _ROAD_DISRUPTION.check_query(2, categories)
+            params['categories'] = categories
+        if closures is not None:
+            if closures.__class__ is not bool:
+                _ROAD_DISRUPTION.check_query(3, closures)
+            params['closures'] = closures
+        return self.client.get_batched('Road/{ids}/Disruption', ids, params=params or None)
+
+    def disrupted_streets(self, start_date: str, end_date: str):
+        """
+        Gets a list of disrupted streets. If no date filters are provided, current disruptions are
+        returned.
+
+        Parameters
+        ----------
+        start_date : str
+            Optional, the start time to filter on.
+        end_date : str
+            Optional, The end time to filter on.
+        """
+        params = {}
+        if start_date.__class__ is not str:
+            _ROAD_DISRUPTED_STREETS.check_query(0, start_date)
+        params['startDate'] = start_date
+        if end_date.__class__ is not str:
+            _ROAD_DISRUPTED_STREETS.check_query(1, end_date)
+        params['endDate'] = end_date
+        return self.client.get('Road/all/Street/Disruption', params=params or None)
+
+    def disruption_by_id(self, disruption_ids: List[str], strip_content: bool|None = None):
+        """
+        Gets a list of active disruptions filtered by disruption Ids.
+
+        Parameters
+        ----------
+        disruption_ids : List[str]
+            Comma-separated list of disruption identifiers to filter by.
+        strip_content : bool | None, optional
+            Optional, defaults to false. When true, removes every property/node except for id,
+            point, severity, severityDescription, startDate, endDate, corridor details, location and
+            comments.
+        """
+        _ROAD_DISRUPTION_BY_ID.check_path(0, disruption_ids)
+        disruption_ids_list = ','.join(disruption_ids)
+        params = {}
+        if strip_content is not None:
+            if strip_content.__class__ is not bool:
+                _ROAD_DISRUPTION_BY_ID.check_query(0, strip_content)
+            params['stripContent'] = strip_content
+        return self.client.get(f'Road/all/Disruption/{disruption_ids_list}', params=params or None)
+
+    def meta_categories(self):
+        """
+        Gets a list of valid RoadDisruption categories
+        """
+        return self.client.get('Road/Meta/Categories')
+
+    def meta_severities(self):
+        """
+        Gets a list of valid RoadDisruption severity codes
+        """
+        return self.client.get('Road/Meta/Severities')
+
+class SearchEndpoint(Endpoint):
+    """
+    Endpoints under /Search of the TfL Unified API.
+    """
+    def get(self, query: str):
+        """
+        Search the site for occurrences of the query string. The maximum number of results returned
+        is equal to the maximum page size of 100. To return subsequent pages, use the paginated
+        overload.
+
+        Parameters
+        ----------
+        query : str
+            The search query
+        """
+        params = {}
+        if query.__class__ is not str:
+            _SEARCH_GET.check_query(0, query)
+        params['query'] = query
+        return self.client.get('Search', params=params or None)
+
+    def bus_schedules(self, query: str):
+        """
+        Searches the bus schedules folder on S3 for a given bus number.
+
+        Parameters
+        ----------
+        query : str
+            The search query
+        """
+        params = {}
+        if query.__class__ is not str:
+            _SEARCH_BUS_SCHEDULES.check_query(0, query)
+        params['query'] = query
+        return self.client.get('Search/BusSchedules', params=params or None)
+
+    def meta_search_providers(self):
+        """
+        Gets the available searchProvider names.
+        """
+        return self.client.get('Search/Meta/SearchProviders')
+
+    def meta_categories(self):
+        """
+        Gets the available search categories.
+        """
+        return self.client.get('Search/Meta/Categories')
+
+    def meta_sorts(self):
+        """
+        Gets the available sorting options.
+        """
+        return self.client.get('Search/Meta/Sorts')
+
+class StopPointEndpoint(Endpoint):
+    """
+    Endpoints under /StopPoint of the TfL Unified API.
+    """
+    def meta_categories(self):
+        """
+        Gets the list of available StopPoint additional information categories
+        """
+        return self.client.get('StopPoint/Meta/Categories')
+
+    def meta_stop_types(self):
+        """
+        Gets the list of available StopPoint types
+        """
+        return self.client.get('StopPoint/Meta/StopTypes')
+
+    def meta_modes(self):
+        """
+        Gets the list of available StopPoint modes
+        """
+        return self.client.get('StopPoint/Meta/Modes')
+
+    def get(self, ids: List[str], include_crowding_data: bool|None = None):
+        """
+        Gets a list of StopPoints corresponding to the given list of stop ids.
+
+        Parameters
+        ----------
+        ids : List[str]
+            A comma-separated list of stop point ids (station naptan code e.g. 940GZZLUASL). Max.
+            approx. 20 ids. You can use /StopPoint/Search/{query} endpoint to find a stop point id
+            from a station name.
+        include_crowding_data : bool | None, optional
+            Include the crowding data (static). To Filter further use:
+            /StopPoint/{ids}/Crowding/{line}
+        """
+        _STOP_POINT_GET.check_path(0, ids)
+        params = {}
+        if include_crowding_data is not None:
+            if include_crowding_data.__class__ is not bool:
+                _STOP_POINT_GET.check_query(0, include_crowding_data)
+            params['includeCrowdingData'] = include_crowding_data
+        return self.client.get_batched('StopPoint/{ids}', ids, params=params or None)
+
+    def get_place_types(self, id: str, place_types: List[str]):
+        """
+        Get a list of places corresponding to a given id and place types.
+
+        Parameters
+        ----------
+        id : str
+            A naptan id for a stop point (station naptan code e.g. 940GZZLUASL).
+        place_types : List[str]
+            A comcomma-separated value representing the place types.
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_GET_PLACE_TYPES.check_path(0, id)
+        params = {}
+        _STOP_POINT_GET_PLACE_TYPES.check_query(0, place_types)
+        params['placeTypes'] = place_types
+        return self.client.get(f'StopPoint/{id}/placeTypes', params=params or None)
+
+    def crowding(self, id: str, line: str, direction: str):
+        """
+        Gets all the Crowding data (static) for the StopPointId, plus crowding data for a given line
+        and optionally a particular direction.
+
+        Parameters
+        ----------
+        id : str
+            The Naptan id of the stop
+        line : str
+            A particular line e.g. victoria, circle, northern etc.
+        direction : str
+            The direction of travel. Can be inbound or outbound.
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_CROWDING.check_path(0, id)
+        if line.__class__ is not str:
+            _STOP_POINT_CROWDING.check_path(1, line)
+        params = {}
+        _STOP_POINT_CROWDING.check_query(0, direction)
+        params['direction'] = direction
+        return self.client.get(f'StopPoint/{id}/Crowding/{line}', params=params or None)
+
+    def get_by_type(self, types: List[str]):
+        """
+        Gets all stop points of a given type
+
+        Parameters
+        ----------
+        types : List[str]
+            A comma-separated list of the types to return. Max. approx. 12 types. A list of valid
+            stop types can be obtained from the StopPoint/meta/stoptypes endpoint.
+        """
+        _STOP_POINT_GET_BY_TYPE.check_path(0, types)
+        types_list = ','.join(types)
+        return self.client.get(f'StopPoint/Type/{types_list}')
+
+    def get_by_type_with_pagination(self, types: List[str], page: int):
+        """
+        Gets all the stop points of given type(s) with a page number
+
+        Parameters
+        ----------
+        types : List[str]
+        page : int
+        """
+        _STOP_POINT_GET_BY_TYPE_WITH_PAGINATION.check_path(0, types)
+        types_list = ','.join(types)
+        if page.__class__ is not int:
+            _STOP_POINT_GET_BY_TYPE_WITH_PAGINATION.check_path(1, page)
+        return self.client.get(f'StopPoint/Type/{types_list}/page/{page}')
+
+    def get_service_types(self, id: str, line_ids: List[str]|None = None, modes: List[str]|None = None):
+        """
+        Gets the service types for a given stoppoint
+
+        Parameters
+        ----------
+        id : str
+            The Naptan id of the stop
+        line_ids : List[str] | None, optional
+            The lines which contain the given Naptan id (all lines relevant to the given stoppoint
+            if empty)
+        modes : List[str] | None, optional
+            The modes which the lines are relevant to (all if empty)
+        """
+        params = {}
+        if id.__class__ is not str:
+            _STOP_POINT_GET_SERVICE_TYPES.check_query(0, id)
+        params['id'] = id
+        if line_ids is not None:
+            _STOP_POINT_GET_SERVICE_TYPES.check_query(1, line_ids)
+            params['lineIds'] = line_ids
+        if modes is not None:
+            _STOP_POINT_GET_SERVICE_TYPES.check_query(2, modes)
+            params['modes'] = modes
+        return self.client.get('StopPoint/ServiceTypes', params=params or None)
+
+    def arrivals(self, id: str):
+        """
+        Gets the list of arrival predictions for the given stop point id
+
+        Parameters
+        ----------
+        id : str
+            A StopPoint id (station naptan code e.g. 940GZZLUASL, you can use
+            /StopPoint/Search/{query} endpoint to find a stop point id from a station name)
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_ARRIVALS.check_path(0, id)
+        return self.client.get(f'StopPoint/{id}/Arrivals')
+
+    def arrival_departures(self, id: str, line_ids: List[str]):
+        """
+        Gets the list of arrival and departure predictions for the given stop point id (overground,
+        Elizabeth line and thameslink only)
+
+        Parameters
+        ----------
+        id : str
+            A StopPoint id (station naptan code e.g. 940GZZLUASL, you can use
+            /StopPoint/Search/{query} endpoint to find a stop point id from a station name)
+        line_ids : List[str]
+            A comma-separated list of line ids e.g. elizabeth, london-overground, thameslink
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_ARRIVAL_DEPARTURES.check_path(0, id)
+        params = {}
+        _STOP_POINT_ARRIVAL_DEPARTURES.check_query(0, line_ids)
+        params['lineIds'] = line_ids
+        return self.client.get(f'StopPoint/{id}/ArrivalDepartures', params=params or None)
+
+    def reachable_from(self, id: str, line_id: str, service_types: List[str]|None = None):
+        """
+        Gets Stopoints that are reachable from a station/line combination.
+
+        Parameters
+        ----------
+        id : str
+            The id (station naptan code e.g. 940GZZLUASL, you can use /StopPoint/Search/{query}
+            endpoint to find a stop point id from a station name) of the stop point to filter by
+        line_id : str
+            Line id of the line to filter by (e.g. victoria)
+        service_types : List[str] | None, optional
+            A comma-separated list of service types to filter on. If not specified. Supported
+            values: Regular, Night. Defaulted to 'Regular' if not specified
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_REACHABLE_FROM.check_path(0, id)
+        if line_id.__class__ is not str:
+            _STOP_POINT_REACHABLE_FROM.check_path(1, line_id)
+        params = {}
+        if service_types is not None:
+            _STOP_POINT_REACHABLE_FROM.check_query(0, service_types)
+            params['serviceTypes'] = service_types
+        return self.client.get(f'StopPoint/{id}/CanReachOnLine/{line_id}', params=params or None)
+
+    def route(self, id: str, service_types: List[str]|None = None):
+        """
+        Returns the route sections for all the lines that service the given stop point ids
+
+        Parameters
+        ----------
+        id : str
+            A stop point id (station naptan codes e.g. 940GZZLUASL, you can use
+            /StopPoint/Search/{query} endpoint to find a stop point id from a station name)
+        service_types : List[str] | None, optional
+            A comma-separated list of service types to filter on. If not specified. Supported
+            values: Regular, Night. Defaulted to 'Regular' if not specified
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_ROUTE.check_path(0, id)
+        params = {}
+        if service_types is not None:
+            _STOP_POINT_ROUTE.check_query(0, service_types)
+            params['serviceTypes'] = service_types
+        return self.client.get(f'StopPoint/{id}/Route', params=params or None)
+
+    def disruption_by_mode(self, modes: List[str], include_route_blocked_stops: bool|None = None):
+        """
+        Gets a distinct list of disrupted stop points for the given modes
+
+        Parameters
+        ----------
+        modes : List[str]
+            A comma-seperated list of modes e.g. tube,dlr
+        include_route_blocked_stops : bool | None, optional
+        """
+        _STOP_POINT_DISRUPTION_BY_MODE.check_path(0, modes)
+        modes_list = ','.join(modes)
+        params = {}
+        if include_route_blocked_stops is not None:
+            if include_route_blocked_stops.__class__ is not bool:
+                _STOP_POINT_DISRUPTION_BY_MODE.check_query(0, include_route_blocked_stops)
+            params['includeRouteBlockedStops'] = include_route_blocked_stops
+        return self.client.get(f'StopPoint/Mode/{modes_list}/Disruption', params=params or None)
+
+    def disruption(self, ids: List[str], get_family: bool|None = None, include_route_blocked_stops: bool|None = None, flatten_response: bool|None = None):
+        """
+        Gets all disruptions for the specified StopPointId, plus disruptions for any child Naptan
+        records it may have.
+
+        Parameters
+        ----------
+        ids : List[str]
+            A comma-seperated list of stop point ids. Max. approx. 20 ids. You can use
+            /StopPoint/Search/{query} endpoint to find a stop point id from a station name.
+        get_family : bool | None, optional
+            Specify true to return disruptions for entire family, or false to return disruptions for
+            just this stop point. Defaults to false.
+        include_route_blocked_stops : bool | None, optional
+        flatten_response : bool | None, optional
+            Specify true to associate all disruptions with parent stop point. (Only applicable when
+            getFamily is true).
+        """
+        _STOP_POINT_DISRUPTION.check_path(0, ids)
+        params = {}
+        if get_family is not None:
+            if get_family.__class__ is not bool:
+                _STOP_POINT_DISRUPTION.check_query(0, get_family)
+            params['getFamily'] = get_family
+        if include_route_blocked_stops is not None:
+            if include_route_blocked_stops.__class__ is not bool:
+                _STOP_POINT_DISRUPTION.check_query(1, include_route_blocked_stops)
+            params['includeRouteBlockedStops'] = include_route_blocked_stops
+        if flatten_response is not None:
+            if flatten_response.__class__ is not bool:
+                _STOP_POINT_DISRUPTION.check_query(2, flatten_response)
+            params['flattenResponse'] = flatten_response
+        return self.client.get_batched('StopPoint/{ids}/Disruption', ids, params=params or None)
+
+    def direction(self, id: str, to_stop_point_id: str, line_id: str|None = None):
+        """
+        Returns the canonical direction, "inbound" or "outbound", for a given pair of stop point Ids
+        in the direction from -&gt; to.
+
+        Parameters
+        ----------
+        id : str
+            Originating stop id (station naptan code e.g. 940GZZLUASL, you can use
+            /StopPoint/Search/{query} endpoint to find a stop point id from a station name)
+        to_stop_point_id : str
+            Destination stop id (station naptan code e.g. 940GZZLUASL, you can use
+            /StopPoint/Search/{query} endpoint to find a stop point id from a station name)
+        line_id : str | None, optional
+            Optional line id filter e.g. victoria
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_DIRECTION.check_path(0, id)
+        if to_stop_point_id.__class__ is not str:
+            _STOP_POINT_DIRECTION.check_path(1, to_stop_point_id)
+        params = {}
+        if line_id is not None:
+            if line_id.__class__ is not str:
+                _STOP_POINT_DIRECTION.check_query(0, line_id)
+            params['lineId'] = line_id
+        return self.client.get(f'StopPoint/{id}/DirectionTo/{to_stop_point_id}', params=params or None)
+
+    def get_by_geo_point(self, stop_types: List[str], location_lat: float, location_lon: float, radius: int|None = None, use_stop_point_hierarchy: bool|None = None, modes: List[str]|None = None, categories: List[str]|None = None, return_lines: bool|None = None):
+        """
+        Gets a list of StopPoints within {radius} by the specified criteria
+
+        Parameters
+        ----------
+        stop_types : List[str]
+            a list of stopTypes that should be returned (a list of valid stop types can be obtained
+            from the StopPoint/meta/stoptypes endpoint)
+        location_lat : float
+        location_lon : float
+        radius : int | None, optional
+            the radius of the bounding circle in metres (default : 200)
+        use_stop_point_hierarchy : bool | None, optional
+            Re-arrange the output into a parent/child hierarchy
+        modes : List[str] | None, optional
+            the list of modes to search (comma separated mode names e.g. tube,dlr)
+        categories : List[str] | None, optional
+            an optional list of comma separated property categories to return in the StopPoint's
+            property bag. If null or empty, all categories of property are returned. Pass the
+            keyword "none" to return no properties (a valid list of categories can be obtained from
+            the /StopPoint/Meta/categories endpoint)
+        return_lines : bool | None, optional
+            true to return the lines that each stop point serves as a nested resource
+        """
+        params = {}
+        _STOP_POINT_GET_BY_GEO_POINT.check_query(0, stop_types)
+        params['stopTypes'] = stop_types
+        if radius is not None:
+            if radius.__class__ is not int:
+                _STOP_POINT_GET_BY_GEO_POINT.check_query(1, radius)
+            params['radius'] = radius
+        if use_stop_point_hierarchy is not None:
+            if use_stop_point_hierarchy.__class__ is not bool:
+                _STOP_POINT_GET_BY_GEO_POINT.check_query(2, use_stop_point_hierarchy)
+            params['useStopPointHierarchy'] = use_stop_point_hierarchy
+        if modes is not None:
+            _STOP_POINT_GET_BY_GEO_POINT.check_query(3, modes)
+            params['modes'] = modes
+        if categories is not None:
+            _STOP_POINT_GET_BY_GEO_POINT.check_query(4, categories)
+            params['categories'] = categories
+        if return_lines is not None:
+            if return_lines.__class__ is not bool:
+                _STOP_POINT_GET_BY_GEO_POINT.check_query(5, return_lines)
+            params['returnLines'] = return_lines
+        if location_lat.__class__ is not float and location_lat.__class__ is not int:
+            _STOP_POINT_GET_BY_GEO_POINT.check_query(6, location_lat)
+        params['location.lat'] = location_lat
+        if location_lon.__class__ is not float and location_lon.__class__ is not int:
+            _STOP_POINT_GET_BY_GEO_POINT.check_query(7, location_lon)
+        params['location.lon'] = location_lon
+        return self.client.get('StopPoint', params=params or None)
+
+    def get_by_mode(self, modes: List[str], page: int|None = None):
+        """
+        Gets a list of StopPoints filtered by the modes available at that StopPoint.
+
+        Parameters
+        ----------
+        modes : List[str]
+            A comma-seperated list of modes e.g. tube,dlr
+        page : int | None, optional
+            The data set page to return. Page 1 equates to the first 1000 stop points, page 2
+            equates to 1001-2000 etc. Must be entered for bus mode as data set is too large.
+        """
+        _STOP_POINT_GET_BY_MODE.check_path(0, modes)
+        modes_list = ','.join(modes)
+        params = {}
+        if page is not None:
+            if page.__class__ is not int:
+                _STOP_POINT_GET_BY_MODE.check_query(0, page)
+            params['page'] = page
+        return self.client.get(f'StopPoint/Mode/{modes_list}', params=params or None)
+
+    def search(self, query: str, modes: List[str]|None = None, fares_only: bool|None = None, max_results: int|None = None, lines: List[str]|None = None, include_hubs: bool|None = None, tfl_operated_national_rail_stations_only: bool|None = None):
+        """
+        Search StopPoints by their common name, or their 5-digit Countdown Bus Stop Code.
+
+        Parameters
+        ----------
+        query : str
+            The query string, case-insensitive. Leading and trailing wildcards are applied
+            automatically.
+        modes : List[str] | None, optional
+            An optional, parameter separated list of the modes to filter by
+        fares_only : bool | None, optional
+            True to only return stations in that have Fares data available for single fares to
+            another station.
+        max_results : int | None, optional
+            An optional result limit, defaulting to and with a maximum of 50. Since children of the
+            stop point heirarchy are returned for matches, it is possible that the flattened result
+            set will contain more than 50 items.
+        lines : List[str] | None, optional
+            An optional, parameter separated list of the lines to filter by
+        include_hubs : bool | None, optional
+            If true, returns results including HUBs.
+        tfl_operated_national_rail_stations_only : bool | None, optional
+            If the national-rail mode is included, this flag will filter the national rail stations
+            so that only those operated by TfL are returned
+        """
+        if query.__class__ is not str:
+            _STOP_POINT_SEARCH.check_path(0, query)
+        params = {}
+        if modes is not None:
+            _STOP_POINT_SEARCH.check_query(0, modes)
+            params['modes'] = modes
+        if fares_only is not None:
+            if fares_only.__class__ is not bool:
+                _STOP_POINT_SEARCH.check_query(1, fares_only)
+            params['faresOnly'] = fares_only
+        if max_results is not None:
+            if max_results.__class__ is not int:
+                _STOP_POINT_SEARCH.check_query(2, max_results)
+            params['maxResults'] = max_results
+        if lines is not None:
+            _STOP_POINT_SEARCH.check_query(3, lines)
+            params['lines'] = lines
+        if include_hubs is not None:
+            if include_hubs.__class__ is not bool:
+                _STOP_POINT_SEARCH.check_query(4, include_hubs)
+            params['includeHubs'] = include_hubs
+        if tfl_operated_national_rail_stations_only is not None:
+            if tfl_operated_national_rail_stations_only.__class__ is not bool:
+                _STOP_POINT_SEARCH.check_query(5, tfl_operated_national_rail_stations_only)
+            params['tflOperatedNationalRailStationsOnly'] = tfl_operated_national_rail_stations_only
+        return self.client.get(f'StopPoint/Search/{query}', params=params or None)
+
+    def search_by_query(self, query: str, modes: List[str]|None = None, fares_only: bool|None = None, max_results: int|None = None, lines: List[str]|None = None, include_hubs: bool|None = None, tfl_operated_national_rail_stations_only: bool|None = None):
+        """
+        Search StopPoints by their common name, or their 5-digit Countdown Bus Stop Code.
+
+        Parameters
+        ----------
+        query : str
+            The query string, case-insensitive. Leading and trailing wildcards are applied
+            automatically.
+        modes : List[str] | None, optional
+            An optional, parameter separated list of the modes to filter by
+        fares_only : bool | None, optional
+            True to only return stations in that have Fares data available for single fares to
+            another station.
+        max_results : int | None, optional
+            An optional result limit, defaulting to and with a maximum of 50. Since children of the
+            stop point heirarchy are returned for matches, it is possible that the flattened result
+            set will contain more than 50 items.
+        lines : List[str] | None, optional
+            An optional, parameter separated list of the lines to filter by
+        include_hubs : bool | None, optional
+            If true, returns results including HUBs.
+        tfl_operated_national_rail_stations_only : bool | None, optional
+            If the national-rail mode is included, this flag will filter the national rail stations
+            so that only those operated by TfL are returned
+        """
+        params = {}
+        if query.__class__ is not str:
+            _STOP_POINT_SEARCH_BY_QUERY.check_query(0, query)
+        params['query'] = query
+        if modes is not None:
+            _STOP_POINT_SEARCH_BY_QUERY.check_query(1, modes)
+            params['modes'] = modes
+        if fares_only is not None:
+            if fares_only.__class__ is not bool:
+                _STOP_POINT_SEARCH_BY_QUERY.check_query(2, fares_only)
+            params['faresOnly'] = fares_only
+        if max_results is not None:
+            if max_results.__class__ is not int:
+                _STOP_POINT_SEARCH_BY_QUERY.check_query(3, max_results)
+            params['maxResults'] = max_results
+        if lines is not None:
+            _STOP_POINT_SEARCH_BY_QUERY.check_query(4, lines)
+            params['lines'] = lines
+        if include_hubs is not None:
+            if include_hubs.__class__ is not bool:
+                _STOP_POINT_SEARCH_BY_QUERY.check_query(5, include_hubs)
+            params['includeHubs'] = include_hubs
+        if tfl_operated_national_rail_stations_only is not None:
+            if tfl_operated_national_rail_stations_only.__class__ is not bool:
+                _STOP_POINT_SEARCH_BY_QUERY.check_query(6, tfl_operated_national_rail_stations_only)
+            params['tflOperatedNationalRailStationsOnly'] = tfl_operated_national_rail_stations_only
+        return self.client.get('StopPoint/Search', params=params or None)
+
+    def get_by_sms(self, id: str, output: str|None = None):
+        """
+        Gets a StopPoint for a given sms code.
+
+        Parameters
+        ----------
+        id : str
+            A 5-digit Countdown Bus Stop Code e.g. 73241, 50435, 56334.
+        output : str | None, optional
+            If set to "web", a 302 redirect to relevant website bus stop page is returned. Valid
+            values are : web. All other values are ignored.
+        """
+        if id.__class__ is not str:
+            _STOP_POINT_GET_BY_SMS.check_path(0, id)
+        params = {}
+        if output is not None:
+            if output.__class__ is not str:
+                _STOP_POINT_GET_BY_SMS.check_query(0, output)
+            params['output'] = output
+        return self.client.get(f'StopPoint/Sms/{id}', params=params or None)
+
+    def get_taxi_ranks_by_ids(self, stop_point_id: str):
+        """
+        Gets a list of taxi ranks corresponding to the given stop point id.
+
+        Parameters
+        ----------
+        stop_point_id : str
+            stopPointId is required to get the taxi ranks.
+        """
+        if stop_point_id.__class__ is not str:
+            _STOP_POINT_GET_TAXI_RANKS_BY_IDS.check_path(0, stop_point_id)
+        return self.client.get(f'StopPoint/{stop_point_id}/TaxiRanks')
+
+    def get_car_parks_by_id(self, stop_point_id: str):
+        """
+        Get car parks corresponding to the given stop point id.
+
+        Parameters
+        ----------
+        stop_point_id : str
+            stopPointId is required to get the car parks.
+        """
+        if stop_point_id.__class__ is not str:
+            _STOP_POINT_GET_CAR_PARKS_BY_ID.check_path(0, stop_point_id)
+        return self.client.get(f'StopPoint/{stop_point_id}/CarParks')
+
+class TravelTimeEndpoint(Endpoint):
+    """
+    Endpoints under /TravelTime of the TfL Unified API.
+    """
+    def get_overlay(self, z: int, pin_lat: float, pin_lon: float, map_center_lat: float, map_center_lon: float, scenario_title: str, time_of_day_id: str, mode_id: str, width: int, height: int, direction: str, travel_time_interval: int):
+        """
+        Gets the TravelTime overlay.
+
+        Parameters
+        ----------
+        z : int
+            The zoom level.
+        pin_lat : float
+            The latitude of the pin.
+        pin_lon : float
+            The longitude of the pin.
+        map_center_lat : float
+            The map center latitude.
+        map_center_lon : float
+            The map center longitude.
+        scenario_title : str
+            The title of the scenario.
+        time_of_day_id : str
+            The id for the time of day (AM/INTER/PM)
+        mode_id : str
+            The id of the mode.
+        width : int
+            The width of the requested overlay.
+        height : int
+            The height of the requested overlay.
+        direction : str
+            The direction of travel.
+        travel_time_interval : int
+            The total minutes between the travel time bands
+        """
+        if z.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(0, z)
+        if pin_lat.__class__ is not float and pin_lat.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(1, pin_lat)
+        if pin_lon.__class__ is not float and pin_lon.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(2, pin_lon)
+        if map_center_lat.__class__ is not float and map_center_lat.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(3, map_center_lat)
+        if map_center_lon.__class__ is not float and map_center_lon.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(4, map_center_lon)
+        if width.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(5, width)
+        if height.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_path(6, height)
+        params = {}
+        if scenario_title.__class__ is not str:
+            _TRAVEL_TIME_GET_OVERLAY.check_query(0, scenario_title)
+        params['scenarioTitle'] = scenario_title
+        if time_of_day_id.__class__ is not str:
+            _TRAVEL_TIME_GET_OVERLAY.check_query(1, time_of_day_id)
+        params['timeOfDayId'] = time_of_day_id
+        if mode_id.__class__ is not str:
+            _TRAVEL_TIME_GET_OVERLAY.check_query(2, mode_id)
+        params['modeId'] = mode_id
+        _TRAVEL_TIME_GET_OVERLAY.check_query(3, direction)
+        params['direction'] = direction
+        if travel_time_interval.__class__ is not int:
+            _TRAVEL_TIME_GET_OVERLAY.check_query(4, travel_time_interval)
+        params['travelTimeInterval'] = travel_time_interval
+        return self.client.get(f'TravelTimes/overlay/{z}/mapcenter/{map_center_lat}/{map_center_lon}/pinlocation/{pin_lat}/{pin_lon}/dimensions/{width}/{height}', params=params or None)
+
+    def get_compare_overlay(self, z: int, pin_lat: float, pin_lon: float, map_center_lat: float, map_center_lon: float, scenario_title: str, time_of_day_id: str, mode_id: str, width: int, height: int, direction: str, travel_time_interval: int, compare_type: str, compare_value: str):
+        """
+        Gets the TravelTime overlay.
+
+        Parameters
+        ----------
+        z : int
+            The zoom level.
+        pin_lat : float
+            The latitude of the pin.
+        pin_lon : float
+            The longitude of the pin.
+        map_center_lat : float
+            The map center latitude.
+        map_center_lon : float
+            The map center longitude.
+        scenario_title : str
+            The title of the scenario.
+        time_of_day_id : str
+            The id for the time of day (AM/INTER/PM)
+        mode_id : str
+            The id of the mode.
+        width : int
+            The width of the requested overlay.
+        height : int
+            The height of the requested overlay.
+        direction : str
+            The direction of travel.
+        travel_time_interval : int
+            The total minutes between the travel time bands
+        compare_type : str
+        compare_value : str
+        """
+        if z.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(0, z)
+        if pin_lat.__class__ is not float and pin_lat.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(1, pin_lat)
+        if pin_lon.__class__ is not float and pin_lon.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(2, pin_lon)
+        if map_center_lat.__class__ is not float and map_center_lat.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(3, map_center_lat)
+        if map_center_lon.__class__ is not float and map_center_lon.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(4, map_center_lon)
+        if width.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(5, width)
+        if height.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_path(6, height)
+        params = {}
+        if scenario_title.__class__ is not str:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(0, scenario_title)
+        params['scenarioTitle'] = scenario_title
+        if time_of_day_id.__class__ is not str:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(1, time_of_day_id)
+        params['timeOfDayId'] = time_of_day_id
+        if mode_id.__class__ is not str:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(2, mode_id)
+        params['modeId'] = mode_id
+        _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(3, direction)
+        params['direction'] = direction
+        if travel_time_interval.__class__ is not int:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(4, travel_time_interval)
+        params['travelTimeInterval'] = travel_time_interval
+        if compare_type.__class__ is not str:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(5, compare_type)
+        params['compareType'] = compare_type
+        if compare_value.__class__ is not str:
+            _TRAVEL_TIME_GET_COMPARE_OVERLAY.check_query(6, compare_value)
+        params['compareValue'] = compare_value
+        return self.client.get(f'TravelTimes/compareOverlay/{z}/mapcenter/{map_center_lat}/{map_center_lon}/pinlocation/{pin_lat}/{pin_lon}/dimensions/{width}/{height}', params=params or None)
+
+class VehicleEndpoint(Endpoint):
+    """
+    Endpoints under /Vehicle of the TfL Unified API.
+    """
+    def get(self, ids: List[str]):
+        """
+        Gets the predictions for a given list of vehicle Id's.
+
+        Parameters
+        ----------
+        ids : List[str]
+            A comma-separated list of vehicle ids e.g. LX58CFV,LX11AZB,LX58CFE. Max approx. 25 ids.
+        """
+        _VEHICLE_GET.check_path(0, ids)
+        return self.client.get_batched('Vehicle/{ids}/Arrivals', ids)
+
+# client attribute -> endpoint group
+ENDPOINT_GROUPS = {
+    'accidentstats': AccidentStatsEndpoint,
+    'airquality': AirQualityEndpoint,
+    'bikepoint': BikePointEndpoint,
+    'cabwise': CabwiseEndpoint,
+    'journey': JourneyEndpoint,
+    'mode': ModeEndpoint,
+    'occupancy': OccupancyEndpoint,
+    'place': PlaceEndpoint,
+    'road': RoadEndpoint,
+    'search': SearchEndpoint,
+    'stoppoint': StopPointEndpoint,
+    'traveltime': TravelTimeEndpoint,
+    'vehicle': VehicleEndpoint,
+}
+
+# path template of every GET operation, Line included
+PATH_TEMPLATES = (
+    'AccidentStats/{year}',
+    'AirQuality',
+    'BikePoint',
+    'BikePoint/{id}',
+    'BikePoint/Search',
+    'Cabwise/search',
+    'Journey/Meta/Modes',
+    'Journey/JourneyResults/{from}/to/{to}',
+    'Line/Meta/Modes',
+    'Line/Meta/Severity',
+    'Line/Meta/DisruptionCategories',
+    'Line/Meta/ServiceTypes',
+    'Line/{ids}',
+    'Line/Mode/{modes}',
+    'Line/Route',
+    'Line/{ids}/Route',
+    'Line/Mode/{modes}/Route',
+    'Line/{id}/Route/Sequence/{direction}',
+    'Line/{ids}/Status/{StartDate}/to/{EndDate}',
+    'Line/{ids}/Status',
+    'Line/Search/{query}',
+    'Line/Status/{severity}',
+    'Line/Mode/{modes}/Status',
+    'Line/{id}/StopPoints',
+    'Line/{id}/Timetable/{fromStopPointId}',
+    'Line/{id}/Timetable/{fromStopPointId}/to/{toStopPointId}',
+    'Line/{ids}/Disruption',
+    'Line/Mode/{modes}/Disruption',
+    'Line/{ids}/Arrivals/{stopPointId}',
+    'Mode/ActiveServiceTypes',
+    'Mode/{mode}/Arrivals',
+    'Occupancy/CarPark/{id}',
+    'Occupancy/CarPark',
+    'Occupancy/ChargeConnector/{ids}',
+    'Occupancy/ChargeConnector',
+    'Occupancy/BikePoints/{ids}',
+    'Place/Meta/Categories',
+    'Place/Meta/PlaceTypes',
+    'Place/Address/Streets/{Postcode}',
+    'Place/Type/{types}',
+    'Place/{id}',
+    'Place',
+    'Place/{type}/At/{Lat}/{Lon}',
+    'Place/{type}/overlay/{z}/{Lat}/{Lon}/{width}/{height}',
+    'Place/Search',
+    'Road',
+    'Road/{ids}',
+    'Road/{ids}/Status',
+    'Road/{ids}/Disruption',
+    'Road/all/Street/Disruption',
+    'Road/all/Disruption/{disruptionIds}',
+    'Road/Meta/Categories',
+    'Road/Meta/Severities',
+    'Search',
+    'Search/BusSchedules',
+    'Search/Meta/SearchProviders',
+    'Search/Meta/Categories',
+    'Search/Meta/Sorts',
+    'StopPoint/Meta/Categories',
+    'StopPoint/Meta/StopTypes',
+    'StopPoint/Meta/Modes',
+    'StopPoint/{ids}',
+    'StopPoint/{id}/placeTypes',
+    'StopPoint/{id}/Crowding/{line}',
+    'StopPoint/Type/{types}',
+    'StopPoint/Type/{types}/page/{page}',
+    'StopPoint/ServiceTypes',
+    'StopPoint/{id}/Arrivals',
+    'StopPoint/{id}/ArrivalDepartures',
+    'StopPoint/{id}/CanReachOnLine/{lineId}',
+    'StopPoint/{id}/Route',
+    'StopPoint/Mode/{modes}/Disruption',
+    'StopPoint/{ids}/Disruption',
+    'StopPoint/{id}/DirectionTo/{toStopPointId}',
+    'StopPoint',
+    'StopPoint/Mode/{modes}',
+    'StopPoint/Search/{query}',
+    'StopPoint/Search',
+    'StopPoint/Sms/{id}',
+    'StopPoint/{stopPointId}/TaxiRanks',
+    'StopPoint/{stopPointId}/CarParks',
+    'TravelTimes/overlay/{z}/mapcenter/{mapCenterLat}/{mapCenterLon}/pinlocation/{pinLat}/{pinLon}/dimensions/{width}/{height}',
+    'TravelTimes/compareOverlay/{z}/mapcenter/{mapCenterLat}/{mapCenterLon}/pinlocation/{pinLat}/{pinLon}/dimensions/{width}/{height}',
+    'Vehicle/{ids}/Arrivals',
+)
@@ -1 +1,2647 @@
-"""entities.py"""
+"""entities.py
+
+Generated from swagger_file.json by scripts/generate_entities.py, do not edit by hand.
+"""
+from tfl.entity_base import DateTimeField, Entity, EntityField, EntityListField, ResponseTypes
+
+class AccidentDetail(Entity):
+    """
+    Tfl.Api.Presentation.Entities.AccidentStats.AccidentDetail
+
+    Attributes
+    ----------
+    id : int
+    lat : float
+    lon : float
+    location : str
+    date : datetime
+        Parsed on first access.
+    severity : str
+    borough : str
+    casualties : List[Casualty]
+        Materialized on first access.
+    vehicles : List[Vehicle]
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'lat', 'lon', 'location', '_date', 'severity', 'borough', '_casualties', '_vehicles')
+    _schema = 'Tfl.Api.Presentation.Entities.AccidentStats.AccidentDetail'
+    _fields = (('id', 'id'), ('lat', 'lat'), ('lon', 'lon'), ('location', 'location'), ('_date', 'date'), ('severity', 'severity'), ('borough', 'borough'), ('_casualties', 'casualties'), ('_vehicles', 'vehicles'))
+    _types = ('integer', 'number', 'number', 'string', 'date-time', 'string', 'string', 'array', 'array')
+    date = DateTimeField()
+    casualties = EntityListField('Casualty')
+    vehicles = EntityListField('Vehicle')
+
+class Casualty(Entity):
+    """
+    Tfl.Api.Presentation.Entities.AccidentStats.Casualty
+
+    Attributes
+    ----------
+    age : int
+    class_ : str
+    severity : str
+    mode : str
+    age_band : str
+    """
+    __slots__ = ('age', 'class_', 'severity', 'mode', 'age_band')
+    _schema = 'Tfl.Api.Presentation.Entities.AccidentStats.Casualty'
+    _fields = (('age', 'age'), ('class_', 'class'), ('severity', 'severity'), ('mode', 'mode'), ('age_band', 'ageBand'))
+    _types = ('integer', 'string', 'string', 'string', 'string')
+
+class Vehicle(Entity):
+    """
+    Tfl.Api.Presentation.Entities.AccidentStats.Vehicle
+
+    Attributes
+    ----------
+    type : str
+    """
+    __slots__ = ('type',)
+    _schema = 'Tfl.Api.Presentation.Entities.AccidentStats.Vehicle'
+    _fields = (('type', 'type'),)
+    _types = ('string',)
+
+class AccidentStatsOrderedSummary(Entity):
+    """
+    Tfl.Api.Presentation.Entities.AccidentStats.AccidentStatsOrderedSummary
+
+    Attributes
+    ----------
+    year : int
+    borough : str
+    accidents : int
+    """
+    __slots__ = ('year', 'borough', 'accidents')
+    _schema = 'Tfl.Api.Presentation.Entities.AccidentStats.AccidentStatsOrderedSummary'
+    _fields = (('year', 'year'), ('borough', 'borough'), ('accidents', 'accidents'))
+    _types = ('integer', 'string', 'integer')
+
+class Place(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Place
+
+    Attributes
+    ----------
+    id : str
+    url : str
+    common_name : str
+    distance : float
+    place_type : str
+    additional_properties : List[AdditionalProperties]
+        Materialized on first access.
+    children : List[Place]
+        Materialized on first access.
+    children_urls : List[str]
+    lat : float
+    lon : float
+    """
+    __slots__ = ('id', 'url', 'common_name', 'distance', 'place_type', '_additional_properties', '_children', 'children_urls', 'lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.Place'
+    _fields = (('id', 'id'), ('url', 'url'), ('common_name', 'commonName'), ('distance', 'distance'), ('place_type', 'placeType'), ('_additional_properties', 'additionalProperties'), ('_children', 'children'), ('children_urls', 'childrenUrls'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('string', 'string', 'string', 'number', 'string', 'array', 'array', 'array', 'number', 'number')
+    additional_properties = EntityListField('AdditionalProperties')
+    children = EntityListField('Place')
+
+class AdditionalProperties(Entity):
+    """
+    Tfl.Api.Presentation.Entities.AdditionalProperties
+
+    Attributes
+    ----------
+    category : str
+    key : str
+    source_system_key : str
+    value : str
+    modified : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('category', 'key', 'source_system_key', 'value', '_modified')
+    _schema = 'Tfl.Api.Presentation.Entities.AdditionalProperties'
+    _fields = (('category', 'category'), ('key', 'key'), ('source_system_key', 'sourceSystemKey'), ('value', 'value'), ('_modified', 'modified'))
+    _types = ('string', 'string', 'string', 'string', 'date-time')
+    modified = DateTimeField()
+
+class CycleSuperhighway(Entity):
+    """
+    Tfl.Api.Presentation.Entities.CycleSuperhighway
+
+    Attributes
+    ----------
+    id : str
+    label : str
+    label_short : str
+    geography : DbGeography
+        Materialized on first access.
+    segmented : bool
+    modified : datetime
+        Parsed on first access.
+    status : str
+        One of Unknown, All, Open, In Progress, Planned, Planned - Subject to feasibility and consultation., Not Open.
+    route_type : str
+        One of Unknown, All, Cycle Superhighways, Quietways, Cycleways, Mini-Hollands, Central London Grid, Streetspace Route.
+    """
+    __slots__ = ('id', 'label', 'label_short', '_geography', 'segmented', '_modified', 'status', 'route_type')
+    _schema = 'Tfl.Api.Presentation.Entities.CycleSuperhighway'
+    _fields = (('id', 'id'), ('label', 'label'), ('label_short', 'labelShort'), ('_geography', 'geography'), ('segmented', 'segmented'), ('_modified', 'modified'), ('status', 'status'), ('route_type', 'routeType'))
+    _types = ('string', 'string', 'string', 'object', 'boolean', 'date-time', 'string', 'string')
+    geography = EntityField('DbGeography')
+    modified = DateTimeField()
+
+class DbGeography(Entity):
+    """
+    System.Data.Spatial.DbGeography
+
+    Attributes
+    ----------
+    geography : DbGeographyWellKnownValue
+        Materialized on first access.
+    """
+    __slots__ = ('_geography',)
+    _schema = 'System.Data.Spatial.DbGeography'
+    _fields = (('_geography', 'geography'),)
+    _types = ('object',)
+    geography = EntityField('DbGeographyWellKnownValue')
+
+class DbGeographyWellKnownValue(Entity):
+    """
+    System.Data.Spatial.DbGeographyWellKnownValue
+
+    Attributes
+    ----------
+    coordinate_system_id : int
+    well_known_text : str
+    well_known_binary : str
+    """
+    __slots__ = ('coordinate_system_id', 'well_known_text', 'well_known_binary')
+    _schema = 'System.Data.Spatial.DbGeographyWellKnownValue'
+    _fields = (('coordinate_system_id', 'coordinateSystemId'), ('well_known_text', 'wellKnownText'), ('well_known_binary', 'wellKnownBinary'))
+    _types = ('integer', 'string', 'string')
+
+class FaresFare(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.Fare
+
+    Attributes
+    ----------
+    id : int
+    passenger_type : str
+    valid_from : datetime
+        Parsed on first access.
+    valid_until : datetime
+        Parsed on first access.
+    ticket_time : str
+    ticket_type : str
+    cost : str
+    cap : float
+    description : str
+    zone : str
+    mode : str
+    """
+    __slots__ = ('id', 'passenger_type', '_valid_from', '_valid_until', 'ticket_time', 'ticket_type', 'cost', 'cap', 'description', 'zone', 'mode')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.Fare'
+    _fields = (('id', 'id'), ('passenger_type', 'passengerType'), ('_valid_from', 'validFrom'), ('_valid_until', 'validUntil'), ('ticket_time', 'ticketTime'), ('ticket_type', 'ticketType'), ('cost', 'cost'), ('cap', 'cap'), ('description', 'description'), ('zone', 'zone'), ('mode', 'mode'))
+    _types = ('integer', 'string', 'date-time', 'date-time', 'string', 'string', 'string', 'number', 'string', 'string', 'string')
+    valid_from = DateTimeField()
+    valid_until = DateTimeField()
+
+class FaresSection(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.FaresSection
+
+    Attributes
+    ----------
+    header : str
+    index : int
+    journey : FaresJourney
+        Materialized on first access.
+    rows : List[FareDetails]
+        Materialized on first access.
+    messages : List[Message]
+        Materialized on first access.
+    """
+    __slots__ = ('header', 'index', '_journey', '_rows', '_messages')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.FaresSection'
+    _fields = (('header', 'header'), ('index', 'index'), ('_journey', 'journey'), ('_rows', 'rows'), ('_messages', 'messages'))
+    _types = ('string', 'integer', 'object', 'array', 'array')
+    journey = EntityField('FaresJourney')
+    rows = EntityListField('FareDetails')
+    messages = EntityListField('Message')
+
+class FaresJourney(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.Journey
+
+    Attributes
+    ----------
+    from_station : FareStation
+        Materialized on first access.
+    to_station : FareStation
+        Materialized on first access.
+    """
+    __slots__ = ('_from_station', '_to_station')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.Journey'
+    _fields = (('_from_station', 'fromStation'), ('_to_station', 'toStation'))
+    _types = ('object', 'object')
+    from_station = EntityField('FareStation')
+    to_station = EntityField('FareStation')
+
+class FareDetails(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.FareDetails
+
+    Attributes
+    ----------
+    bounds_id : int
+    start_date : datetime
+        Parsed on first access.
+    end_date : datetime
+        Parsed on first access.
+    mode : str
+    passenger_type : str
+    contactless_payg_only_fare : bool
+    from_ : str
+    to : str
+    from_station : str
+    to_station : str
+    via : str
+    route_code : str
+    display_name : str
+    display_order : int
+    route_description : str
+    validator_information : str
+    operator : str
+    special_fare : bool
+    through_fare : bool
+    is_tour : bool
+    tickets_available : List[Ticket]
+        Materialized on first access.
+    messages : List[Message]
+        Materialized on first access.
+    """
+    __slots__ = ('bounds_id', '_start_date', '_end_date', 'mode', 'passenger_type', 'contactless_payg_only_fare', 'from_', 'to', 'from_station', 'to_station', 'via', 'route_code', 'display_name', 'display_order', 'route_description', 'validator_information', 'operator', 'special_fare', 'through_fare', 'is_tour', '_tickets_available', '_messages')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.FareDetails'
+    _fields = (('bounds_id', 'boundsId'), ('_start_date', 'startDate'), ('_end_date', 'endDate'), ('mode', 'mode'), ('passenger_type', 'passengerType'), ('contactless_payg_only_fare', 'contactlessPAYGOnlyFare'), ('from_', 'from'), ('to', 'to'), ('from_station', 'fromStation'), ('to_station', 'toStation'), ('via', 'via'), ('route_code', 'routeCode'), ('display_name', 'displayName'), ('display_order', 'displayOrder'), ('route_description', 'routeDescription'), ('validator_information', 'validatorInformation'), ('operator', 'operator'), ('special_fare', 'specialFare'), ('through_fare', 'throughFare'), ('is_tour', 'isTour'), ('_tickets_available', 'ticketsAvailable'), ('_messages', 'messages'))
+    _types = ('integer', 'date-time', 'date-time', 'string', 'string', 'boolean', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'integer', 'string', 'string', 'string', 'boolean', 'boolean', 'boolean', 'array', 'array')
+    start_date = DateTimeField()
+    end_date = DateTimeField()
+    tickets_available = EntityListField('Ticket')
+    messages = EntityListField('Message')
+
+class Message(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Message
+
+    Attributes
+    ----------
+    bullet_order : int
+    header : bool
+    message_text : str
+    link_text : str
+    url : str
+    """
+    __slots__ = ('bullet_order', 'header', 'message_text', 'link_text', 'url')
+    _schema = 'Tfl.Api.Presentation.Entities.Message'
+    _fields = (('bullet_order', 'bulletOrder'), ('header', 'header'), ('message_text', 'messageText'), ('link_text', 'linkText'), ('url', 'url'))
+    _types = ('integer', 'boolean', 'string', 'string', 'string')
+
+class FareStation(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.FareStation
+
+    Attributes
+    ----------
+    atco_code : str
+    common_name : str
+    fare_category : str
+        One of Cash, Oyster, Contactless, ContactlessOnly, All.
+    """
+    __slots__ = ('atco_code', 'common_name', 'fare_category')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.FareStation'
+    _fields = (('atco_code', 'atcoCode'), ('common_name', 'commonName'), ('fare_category', 'fareCategory'))
+    _types = ('string', 'string', 'string')
+
+class Ticket(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.Ticket
+
+    Attributes
+    ----------
+    passenger_type : str
+    ticket_type : TicketType
+        Materialized on first access.
+    ticket_time : TicketTime
+        Materialized on first access.
+    cost : str
+    description : str
+    mode : str
+    display_order : int
+    messages : List[Message]
+        Materialized on first access.
+    """
+    __slots__ = ('passenger_type', '_ticket_type', '_ticket_time', 'cost', 'description', 'mode', 'display_order', '_messages')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.Ticket'
+    _fields = (('passenger_type', 'passengerType'), ('_ticket_type', 'ticketType'), ('_ticket_time', 'ticketTime'), ('cost', 'cost'), ('description', 'description'), ('mode', 'mode'), ('display_order', 'displayOrder'), ('_messages', 'messages'))
+    _types = ('string', 'object', 'object', 'string', 'string', 'string', 'integer', 'array')
+    ticket_type = EntityField('TicketType')
+    ticket_time = EntityField('TicketTime')
+    messages = EntityListField('Message')
+
+class TicketType(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.TicketType
+
+    Attributes
+    ----------
+    type : str
+    description : str
+    """
+    __slots__ = ('type', 'description')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.TicketType'
+    _fields = (('type', 'type'), ('description', 'description'))
+    _types = ('string', 'string')
+
+class TicketTime(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.TicketTime
+
+    Attributes
+    ----------
+    type : str
+    description : str
+    """
+    __slots__ = ('type', 'description')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.TicketTime'
+    _fields = (('type', 'type'), ('description', 'description'))
+    _types = ('string', 'string')
+
+class FareBounds(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.FareBounds
+
+    Attributes
+    ----------
+    id : int
+    from_ : str
+    to : str
+    via : str
+    route_code : str
+    description : str
+    display_name : str
+    operator : str
+    display_order : int
+    is_popular_fare : bool
+    is_popular_travel_card : bool
+    is_tour : bool
+    messages : List[Message]
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'from_', 'to', 'via', 'route_code', 'description', 'display_name', 'operator', 'display_order', 'is_popular_fare', 'is_popular_travel_card', 'is_tour', '_messages')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.FareBounds'
+    _fields = (('id', 'id'), ('from_', 'from'), ('to', 'to'), ('via', 'via'), ('route_code', 'routeCode'), ('description', 'description'), ('display_name', 'displayName'), ('operator', 'operator'), ('display_order', 'displayOrder'), ('is_popular_fare', 'isPopularFare'), ('is_popular_travel_card', 'isPopularTravelCard'), ('is_tour', 'isTour'), ('_messages', 'messages'))
+    _types = ('integer', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'integer', 'boolean', 'boolean', 'boolean', 'array')
+    messages = EntityListField('Message')
+
+class FaresPeriod(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.FaresPeriod
+
+    Attributes
+    ----------
+    id : int
+    start_date : datetime
+        Parsed on first access.
+    viewable_date : datetime
+        Parsed on first access.
+    end_date : datetime
+        Parsed on first access.
+    is_future : bool
+    """
+    __slots__ = ('id', '_start_date', '_viewable_date', '_end_date', 'is_future')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.FaresPeriod'
+    _fields = (('id', 'id'), ('_start_date', 'startDate'), ('_viewable_date', 'viewableDate'), ('_end_date', 'endDate'), ('is_future', 'isFuture'))
+    _types = ('integer', 'date-time', 'date-time', 'date-time', 'boolean')
+    start_date = DateTimeField()
+    viewable_date = DateTimeField()
+    end_date = DateTimeField()
+
+class FaresMode(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.FaresMode
+
+    Attributes
+    ----------
+    id : int
+    name : str
+    description : str
+    """
+    __slots__ = ('id', 'name', 'description')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.FaresMode'
+    _fields = (('id', 'id'), ('name', 'name'), ('description', 'description'))
+    _types = ('integer', 'string', 'string')
+
+class PassengerType(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.PassengerType
+
+    Attributes
+    ----------
+    type : str
+    description : str
+    display_name : str
+    display_order : int
+    """
+    __slots__ = ('type', 'description', 'display_name', 'display_order')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.PassengerType'
+    _fields = (('type', 'type'), ('description', 'description'), ('display_name', 'displayName'), ('display_order', 'displayOrder'))
+    _types = ('string', 'string', 'string', 'integer')
+
+class Coordinate(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Coordinate
+
+    Attributes
+    ----------
+    longitude : float
+    latitude : float
+    easting : float
+    northing : float
+    x_coord : int
+    y_coord : int
+    """
+    __slots__ = ('longitude', 'latitude', 'easting', 'northing', 'x_coord', 'y_coord')
+    _schema = 'Tfl.Api.Presentation.Entities.Coordinate'
+    _fields = (('longitude', 'longitude'), ('latitude', 'latitude'), ('easting', 'easting'), ('northing', 'northing'), ('x_coord', 'xCoord'), ('y_coord', 'yCoord'))
+    _types = ('number', 'number', 'number', 'number', 'integer', 'integer')
+
+class GeoCodeSearchMatch(Entity):
+    """
+    Tfl.Api.Presentation.Entities.GeoCodeSearchMatch
+
+    Attributes
+    ----------
+    types : List[str]
+    address : str
+    id : str
+    url : str
+    name : str
+    lat : float
+    lon : float
+    """
+    __slots__ = ('types', 'address', 'id', 'url', 'name', 'lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.GeoCodeSearchMatch'
+    _fields = (('types', 'types'), ('address', 'address'), ('id', 'id'), ('url', 'url'), ('name', 'name'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('array', 'string', 'string', 'string', 'string', 'number', 'number')
+
+class Mode(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Mode
+
+    Attributes
+    ----------
+    is_tfl_service : bool
+    is_fare_paying : bool
+    is_scheduled_service : bool
+    mode_name : str
+    mot_type : str
+    network : str
+    """
+    __slots__ = ('is_tfl_service', 'is_fare_paying', 'is_scheduled_service', 'mode_name', 'mot_type', 'network')
+    _schema = 'Tfl.Api.Presentation.Entities.Mode'
+    _fields = (('is_tfl_service', 'isTflService'), ('is_fare_paying', 'isFarePaying'), ('is_scheduled_service', 'isScheduledService'), ('mode_name', 'modeName'), ('mot_type', 'motType'), ('network', 'network'))
+    _types = ('boolean', 'boolean', 'boolean', 'string', 'string', 'string')
+
+class ItineraryResult(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.ItineraryResult
+
+    Attributes
+    ----------
+    journeys : List[JourneyPlannerJourney]
+        Materialized on first access.
+    lines : List[Line]
+        Materialized on first access.
+    cycle_hire_docking_station_data : JourneyPlannerCycleHireDockingStationData
+        Materialized on first access.
+    stop_messages : List[str]
+    recommended_max_age_minutes : int
+    search_criteria : SearchCriteria
+        Materialized on first access.
+    journey_vector : JourneyVector
+        Materialized on first access.
+    """
+    __slots__ = ('_journeys', '_lines', '_cycle_hire_docking_station_data', 'stop_messages', 'recommended_max_age_minutes', '_search_criteria', '_journey_vector')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.ItineraryResult'
+    _fields = (('_journeys', 'journeys'), ('_lines', 'lines'), ('_cycle_hire_docking_station_data', 'cycleHireDockingStationData'), ('stop_messages', 'stopMessages'), ('recommended_max_age_minutes', 'recommendedMaxAgeMinutes'), ('_search_criteria', 'searchCriteria'), ('_journey_vector', 'journeyVector'))
+    _types = ('array', 'array', 'object', 'array', 'integer', 'object', 'object')
+    journeys = EntityListField('JourneyPlannerJourney')
+    lines = EntityListField('Line')
+    cycle_hire_docking_station_data = EntityField('JourneyPlannerCycleHireDockingStationData')
+    search_criteria = EntityField('SearchCriteria')
+    journey_vector = EntityField('JourneyVector')
+
+class JourneyPlannerJourney(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.Journey
+
+    Attributes
+    ----------
+    start_date_time : datetime
+        Parsed on first access.
+    duration : int
+    arrival_date_time : datetime
+        Parsed on first access.
+    description : str
+    alternative_route : bool
+    legs : List[Leg]
+        Materialized on first access.
+    fare : JourneyFare
+        Materialized on first access.
+    """
+    __slots__ = ('_start_date_time', 'duration', '_arrival_date_time', 'description', 'alternative_route', '_legs', '_fare')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.Journey'
+    _fields = (('_start_date_time', 'startDateTime'), ('duration', 'duration'), ('_arrival_date_time', 'arrivalDateTime'), ('description', 'description'), ('alternative_route', 'alternativeRoute'), ('_legs', 'legs'), ('_fare', 'fare'))
+    _types = ('date-time', 'integer', 'date-time', 'string', 'boolean', 'array', 'object')
+    start_date_time = DateTimeField()
+    arrival_date_time = DateTimeField()
+    legs = EntityListField('Leg')
+    fare = EntityField('JourneyFare')
+
+class Line(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Line
+
+    Attributes
+    ----------
+    id : str
+    name : str
+    mode_name : str
+    disruptions : List[Disruption]
+        Materialized on first access.
+    created : datetime
+        Parsed on first access.
+    modified : datetime
+        Parsed on first access.
+    line_statuses : List[LineStatus]
+        Materialized on first access.
+    route_sections : List[MatchedRoute]
+        Materialized on first access.
+    service_types : List[LineServiceTypeInfo]
+        Materialized on first access.
+    crowding : Crowding
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'name', 'mode_name', '_disruptions', '_created', '_modified', '_line_statuses', '_route_sections', '_service_types', '_crowding')
+    _schema = 'Tfl.Api.Presentation.Entities.Line'
+    _fields = (('id', 'id'), ('name', 'name'), ('mode_name', 'modeName'), ('_disruptions', 'disruptions'), ('_created', 'created'), ('_modified', 'modified'), ('_line_statuses', 'lineStatuses'), ('_route_sections', 'routeSections'), ('_service_types', 'serviceTypes'), ('_crowding', 'crowding'))
+    _types = ('string', 'string', 'string', 'array', 'date-time', 'date-time', 'array', 'array', 'array', 'object')
+    disruptions = EntityListField('Disruption')
+    created = DateTimeField()
+    modified = DateTimeField()
+    line_statuses = EntityListField('LineStatus')
+    route_sections = EntityListField('MatchedRoute')
+    service_types = EntityListField('LineServiceTypeInfo')
+    crowding = EntityField('Crowding')
+
+class JourneyPlannerCycleHireDockingStationData(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.JourneyPlannerCycleHireDockingStationData
+
+    Attributes
+    ----------
+    origin_number_of_bikes : int
+    destination_number_of_bikes : int
+    origin_number_of_empty_slots : int
+    destination_number_of_empty_slots : int
+    origin_id : str
+    destination_id : str
+    """
+    __slots__ = ('origin_number_of_bikes', 'destination_number_of_bikes', 'origin_number_of_empty_slots', 'destination_number_of_empty_slots', 'origin_id', 'destination_id')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.JourneyPlannerCycleHireDockingStationData'
+    _fields = (('origin_number_of_bikes', 'originNumberOfBikes'), ('destination_number_of_bikes', 'destinationNumberOfBikes'), ('origin_number_of_empty_slots', 'originNumberOfEmptySlots'), ('destination_number_of_empty_slots', 'destinationNumberOfEmptySlots'), ('origin_id', 'originId'), ('destination_id', 'destinationId'))
+    _types = ('integer', 'integer', 'integer', 'integer', 'string', 'string')
+
+class SearchCriteria(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.SearchCriteria
+
+    Attributes
+    ----------
+    date_time : datetime
+        Parsed on first access.
+    date_time_type : str
+        One of Arriving, Departing.
+    time_adjustments : TimeAdjustments
+        Materialized on first access.
+    """
+    __slots__ = ('_date_time', 'date_time_type', '_time_adjustments')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.SearchCriteria'
+    _fields = (('_date_time', 'dateTime'), ('date_time_type', 'dateTimeType'), ('_time_adjustments', 'timeAdjustments'))
+    _types = ('date-time', 'string', 'object')
+    date_time = DateTimeField()
+    time_adjustments = EntityField('TimeAdjustments')
+
+class JourneyVector(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.JourneyVector
+
+    Attributes
+    ----------
+    from_ : str
+    to : str
+    via : str
+    uri : str
+    """
+    __slots__ = ('from_', 'to', 'via', 'uri')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.JourneyVector'
+    _fields = (('from_', 'from'), ('to', 'to'), ('via', 'via'), ('uri', 'uri'))
+    _types = ('string', 'string', 'string', 'string')
+
+class Leg(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.Leg
+
+    Attributes
+    ----------
+    duration : int
+    speed : str
+    instruction : Instruction
+        Materialized on first access.
+    obstacles : List[Obstacle]
+        Materialized on first access.
+    departure_time : datetime
+        Parsed on first access.
+    arrival_time : datetime
+        Parsed on first access.
+    departure_point : Point
+        Materialized on first access.
+    arrival_point : Point
+        Materialized on first access.
+    path : Path
+        Materialized on first access.
+    route_options : List[RouteOption]
+        Materialized on first access.
+    mode : Identifier
+        Materialized on first access.
+    disruptions : List[Disruption]
+        Materialized on first access.
+    planned_works : List[PlannedWork]
+        Materialized on first access.
+    distance : float
+    is_disrupted : bool
+    has_fixed_locations : bool
+    scheduled_departure_time : datetime
+        Parsed on first access.
+    scheduled_arrival_time : datetime
+        Parsed on first access.
+    inter_change_duration : str
+    inter_change_position : str
+    """
+    __slots__ = ('duration', 'speed', '_instruction', '_obstacles', '_departure_time', '_arrival_time', '_departure_point', '_arrival_point', '_path', '_route_options', '_mode', '_disruptions', '_planned_works', 'distance', 'is_disrupted', 'has_fixed_locations', '_scheduled_departure_time', '_scheduled_arrival_time', 'inter_change_duration', 'inter_change_position')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.Leg'
+    _fields = (('duration', 'duration'), ('speed', 'speed'), ('_instruction', 'instruction'), ('_obstacles', 'obstacles'), ('_departure_time', 'departureTime'), ('_arrival_time', 'arrivalTime'), ('_departure_point', 'departurePoint'), ('_arrival_point', 'arrivalPoint'), ('_path', 'path'), ('_route_options', 'routeOptions'), ('_mode', 'mode'), ('_disruptions', 'disruptions'), ('_planned_works', 'plannedWorks'), ('distance', 'distance'), ('is_disrupted', 'isDisrupted'), ('has_fixed_locations', 'hasFixedLocations'), ('_scheduled_departure_time', 'scheduledDepartureTime'), ('_scheduled_arrival_time', 'scheduledArrivalTime'), ('inter_change_duration', 'interChangeDuration'), ('inter_change_position', 'interChangePosition'))
+    _types = ('integer', 'string', 'object', 'array', 'date-time', 'date-time', 'object', 'object', 'object', 'array', 'object', 'array', 'array', 'number', 'boolean', 'boolean', 'date-time', 'date-time', 'string', 'string')
+    instruction = EntityField('Instruction')
+    obstacles = EntityListField('Obstacle')
+    departure_time = DateTimeField()
+    arrival_time = DateTimeField()
+    departure_point = EntityField('Point')
+    arrival_point = EntityField('Point')
+    path = EntityField('Path')
+    route_options = EntityListField('RouteOption')
+    mode = EntityField('Identifier')
+    disruptions = EntityListField('Disruption')
+    planned_works = EntityListField('PlannedWork')
+    scheduled_departure_time = DateTimeField()
+    scheduled_arrival_time = DateTimeField()
+
+class JourneyFare(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.JourneyFare
+
+    Attributes
+    ----------
+    total_cost : int
+    fares : List[JourneyPlannerFare]
+        Materialized on first access.
+    caveats : List[FareCaveat]
+        Materialized on first access.
+    """
+    __slots__ = ('total_cost', '_fares', '_caveats')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.JourneyFare'
+    _fields = (('total_cost', 'totalCost'), ('_fares', 'fares'), ('_caveats', 'caveats'))
+    _types = ('integer', 'array', 'array')
+    fares = EntityListField('JourneyPlannerFare')
+    caveats = EntityListField('FareCaveat')
+
+class Disruption(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Disruption
+
+    Attributes
+    ----------
+    category : str
+        One of Undefined, RealTime, PlannedWork, Information, Event, Crowding, StatusAlert.
+    type : str
+    category_description : str
+    description : str
+    summary : str
+    additional_info : str
+    created : datetime
+        Parsed on first access.
+    last_update : datetime
+        Parsed on first access.
+    affected_routes : List[DisruptedRoute]
+        Materialized on first access.
+    affected_stops : List[StopPoint]
+        Materialized on first access.
+    closure_text : str
+    """
+    __slots__ = ('category', 'type', 'category_description', 'description', 'summary', 'additional_info', '_created', '_last_update', '_affected_routes', '_affected_stops', 'closure_text')
+    _schema = 'Tfl.Api.Presentation.Entities.Disruption'
+    _fields = (('category', 'category'), ('type', 'type'), ('category_description', 'categoryDescription'), ('description', 'description'), ('summary', 'summary'), ('additional_info', 'additionalInfo'), ('_created', 'created'), ('_last_update', 'lastUpdate'), ('_affected_routes', 'affectedRoutes'), ('_affected_stops', 'affectedStops'), ('closure_text', 'closureText'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'date-time', 'date-time', 'array', 'array', 'string')
+    created = DateTimeField()
+    last_update = DateTimeField()
+    affected_routes = EntityListField('DisruptedRoute')
+    affected_stops = EntityListField('StopPoint')
+
+class LineStatus(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineStatus
+
+    Attributes
+    ----------
+    id : int
+    line_id : str
+    status_severity : int
+    status_severity_description : str
+    reason : str
+    created : datetime
+        Parsed on first access.
+    modified : datetime
+        Parsed on first access.
+    validity_periods : List[ValidityPeriod]
+        Materialized on first access.
+    disruption : Disruption
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'line_id', 'status_severity', 'status_severity_description', 'reason', '_created', '_modified', '_validity_periods', '_disruption')
+    _schema = 'Tfl.Api.Presentation.Entities.LineStatus'
+    _fields = (('id', 'id'), ('line_id', 'lineId'), ('status_severity', 'statusSeverity'), ('status_severity_description', 'statusSeverityDescription'), ('reason', 'reason'), ('_created', 'created'), ('_modified', 'modified'), ('_validity_periods', 'validityPeriods'), ('_disruption', 'disruption'))
+    _types = ('integer', 'string', 'integer', 'string', 'string', 'date-time', 'date-time', 'array', 'object')
+    created = DateTimeField()
+    modified = DateTimeField()
+    validity_periods = EntityListField('ValidityPeriod')
+    disruption = EntityField('Disruption')
+
+class MatchedRoute(Entity):
+    """
+    Tfl.Api.Presentation.Entities.MatchedRoute
+
+    Attributes
+    ----------
+    route_code : str
+    name : str
+    direction : str
+    origination_name : str
+    destination_name : str
+    originator : str
+    destination : str
+    service_type : str
+    valid_to : datetime
+        Parsed on first access.
+    valid_from : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('route_code', 'name', 'direction', 'origination_name', 'destination_name', 'originator', 'destination', 'service_type', '_valid_to', '_valid_from')
+    _schema = 'Tfl.Api.Presentation.Entities.MatchedRoute'
+    _fields = (('route_code', 'routeCode'), ('name', 'name'), ('direction', 'direction'), ('origination_name', 'originationName'), ('destination_name', 'destinationName'), ('originator', 'originator'), ('destination', 'destination'), ('service_type', 'serviceType'), ('_valid_to', 'validTo'), ('_valid_from', 'validFrom'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'date-time', 'date-time')
+    valid_to = DateTimeField()
+    valid_from = DateTimeField()
+
+class LineServiceTypeInfo(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineServiceTypeInfo
+
+    Attributes
+    ----------
+    name : str
+    uri : str
+    """
+    __slots__ = ('name', 'uri')
+    _schema = 'Tfl.Api.Presentation.Entities.LineServiceTypeInfo'
+    _fields = (('name', 'name'), ('uri', 'uri'))
+    _types = ('string', 'string')
+
+class Crowding(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Crowding
+
+    Attributes
+    ----------
+    passenger_flows : List[PassengerFlow]
+        Materialized on first access.
+    train_loadings : List[TrainLoading]
+        Materialized on first access.
+    """
+    __slots__ = ('_passenger_flows', '_train_loadings')
+    _schema = 'Tfl.Api.Presentation.Entities.Crowding'
+    _fields = (('_passenger_flows', 'passengerFlows'), ('_train_loadings', 'trainLoadings'))
+    _types = ('array', 'array')
+    passenger_flows = EntityListField('PassengerFlow')
+    train_loadings = EntityListField('TrainLoading')
+
+class TimeAdjustments(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.TimeAdjustments
+
+    Attributes
+    ----------
+    earliest : TimeAdjustment
+        Materialized on first access.
+    earlier : TimeAdjustment
+        Materialized on first access.
+    later : TimeAdjustment
+        Materialized on first access.
+    latest : TimeAdjustment
+        Materialized on first access.
+    """
+    __slots__ = ('_earliest', '_earlier', '_later', '_latest')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.TimeAdjustments'
+    _fields = (('_earliest', 'earliest'), ('_earlier', 'earlier'), ('_later', 'later'), ('_latest', 'latest'))
+    _types = ('object', 'object', 'object', 'object')
+    earliest = EntityField('TimeAdjustment')
+    earlier = EntityField('TimeAdjustment')
+    later = EntityField('TimeAdjustment')
+    latest = EntityField('TimeAdjustment')
+
+class Instruction(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Instruction
+
+    Attributes
+    ----------
+    summary : str
+    detailed : str
+    steps : List[InstructionStep]
+        Materialized on first access.
+    """
+    __slots__ = ('summary', 'detailed', '_steps')
+    _schema = 'Tfl.Api.Presentation.Entities.Instruction'
+    _fields = (('summary', 'summary'), ('detailed', 'detailed'), ('_steps', 'steps'))
+    _types = ('string', 'string', 'array')
+    steps = EntityListField('InstructionStep')
+
+class Obstacle(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.Obstacle
+
+    Attributes
+    ----------
+    type : str
+    incline : str
+    stop_id : int
+    position : str
+    """
+    __slots__ = ('type', 'incline', 'stop_id', 'position')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.Obstacle'
+    _fields = (('type', 'type'), ('incline', 'incline'), ('stop_id', 'stopId'), ('position', 'position'))
+    _types = ('string', 'string', 'integer', 'string')
+
+class Point(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Point
+
+    Attributes
+    ----------
+    lat : float
+    lon : float
+    """
+    __slots__ = ('lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.Point'
+    _fields = (('lat', 'lat'), ('lon', 'lon'))
+    _types = ('number', 'number')
+
+class Path(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.Path
+
+    Attributes
+    ----------
+    line_string : str
+    stop_points : List[Identifier]
+        Materialized on first access.
+    elevation : List[JpElevation]
+        Materialized on first access.
+    """
+    __slots__ = ('line_string', '_stop_points', '_elevation')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.Path'
+    _fields = (('line_string', 'lineString'), ('_stop_points', 'stopPoints'), ('_elevation', 'elevation'))
+    _types = ('string', 'array', 'array')
+    stop_points = EntityListField('Identifier')
+    elevation = EntityListField('JpElevation')
+
+class RouteOption(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.RouteOption
+
+    Attributes
+    ----------
+    id : str
+    name : str
+    directions : List[str]
+    line_identifier : Identifier
+        Materialized on first access.
+    direction : str
+    """
+    __slots__ = ('id', 'name', 'directions', '_line_identifier', 'direction')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.RouteOption'
+    _fields = (('id', 'id'), ('name', 'name'), ('directions', 'directions'), ('_line_identifier', 'lineIdentifier'), ('direction', 'direction'))
+    _types = ('string', 'string', 'array', 'object', 'string')
+    line_identifier = EntityField('Identifier')
+
+class Identifier(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Identifier
+
+    Attributes
+    ----------
+    id : str
+    name : str
+    uri : str
+    full_name : str
+    type : str
+    crowding : Crowding
+        Materialized on first access.
+    route_type : str
+        One of Unknown, All, Cycle Superhighways, Quietways, Cycleways, Mini-Hollands, Central London Grid, Streetspace Route.
+    status : str
+        One of Unknown, All, Open, In Progress, Planned, Planned - Subject to feasibility and consultation., Not Open.
+    mot_type : str
+    network : str
+    """
+    __slots__ = ('id', 'name', 'uri', 'full_name', 'type', '_crowding', 'route_type', 'status', 'mot_type', 'network')
+    _schema = 'Tfl.Api.Presentation.Entities.Identifier'
+    _fields = (('id', 'id'), ('name', 'name'), ('uri', 'uri'), ('full_name', 'fullName'), ('type', 'type'), ('_crowding', 'crowding'), ('route_type', 'routeType'), ('status', 'status'), ('mot_type', 'motType'), ('network', 'network'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'object', 'string', 'string', 'string', 'string')
+    crowding = EntityField('Crowding')
+
+class PlannedWork(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.PlannedWork
+
+    Attributes
+    ----------
+    id : str
+    description : str
+    created_date_time : datetime
+        Parsed on first access.
+    last_update_date_time : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('id', 'description', '_created_date_time', '_last_update_date_time')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.PlannedWork'
+    _fields = (('id', 'id'), ('description', 'description'), ('_created_date_time', 'createdDateTime'), ('_last_update_date_time', 'lastUpdateDateTime'))
+    _types = ('string', 'string', 'date-time', 'date-time')
+    created_date_time = DateTimeField()
+    last_update_date_time = DateTimeField()
+
+class JourneyPlannerFare(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.Fare
+
+    Attributes
+    ----------
+    low_zone : int
+    high_zone : int
+    cost : int
+    charge_profile_name : str
+    is_hopper_fare : bool
+    charge_level : str
+    peak : int
+    off_peak : int
+    taps : List[FareTap]
+        Materialized on first access.
+    """
+    __slots__ = ('low_zone', 'high_zone', 'cost', 'charge_profile_name', 'is_hopper_fare', 'charge_level', 'peak', 'off_peak', '_taps')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.Fare'
+    _fields = (('low_zone', 'lowZone'), ('high_zone', 'highZone'), ('cost', 'cost'), ('charge_profile_name', 'chargeProfileName'), ('is_hopper_fare', 'isHopperFare'), ('charge_level', 'chargeLevel'), ('peak', 'peak'), ('off_peak', 'offPeak'), ('_taps', 'taps'))
+    _types = ('integer', 'integer', 'integer', 'string', 'boolean', 'string', 'integer', 'integer', 'array')
+    taps = EntityListField('FareTap')
+
+class FareCaveat(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.FareCaveat
+
+    Attributes
+    ----------
+    text : str
+    type : str
+    """
+    __slots__ = ('text', 'type')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.FareCaveat'
+    _fields = (('text', 'text'), ('type', 'type'))
+    _types = ('string', 'string')
+
+class DisruptedRoute(Entity):
+    """
+    Tfl.Api.Presentation.Entities.DisruptedRoute
+
+    Attributes
+    ----------
+    id : str
+    line_id : str
+    route_code : str
+    name : str
+    line_string : str
+    direction : str
+    origination_name : str
+    destination_name : str
+    via : RouteSectionNaptanEntrySequence
+        Materialized on first access.
+    is_entire_route_section : bool
+    valid_to : datetime
+        Parsed on first access.
+    valid_from : datetime
+        Parsed on first access.
+    route_section_naptan_entry_sequence : List[RouteSectionNaptanEntrySequence]
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'line_id', 'route_code', 'name', 'line_string', 'direction', 'origination_name', 'destination_name', '_via', 'is_entire_route_section', '_valid_to', '_valid_from', '_route_section_naptan_entry_sequence')
+    _schema = 'Tfl.Api.Presentation.Entities.DisruptedRoute'
+    _fields = (('id', 'id'), ('line_id', 'lineId'), ('route_code', 'routeCode'), ('name', 'name'), ('line_string', 'lineString'), ('direction', 'direction'), ('origination_name', 'originationName'), ('destination_name', 'destinationName'), ('_via', 'via'), ('is_entire_route_section', 'isEntireRouteSection'), ('_valid_to', 'validTo'), ('_valid_from', 'validFrom'), ('_route_section_naptan_entry_sequence', 'routeSectionNaptanEntrySequence'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'object', 'boolean', 'date-time', 'date-time', 'array')
+    via = EntityField('RouteSectionNaptanEntrySequence')
+    valid_to = DateTimeField()
+    valid_from = DateTimeField()
+    route_section_naptan_entry_sequence = EntityListField('RouteSectionNaptanEntrySequence')
+
+class StopPoint(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StopPoint
+
+    Attributes
+    ----------
+    naptan_id : str
+    platform_name : str
+    indicator : str
+    stop_letter : str
+    modes : List[str]
+    ics_code : str
+    sms_code : str
+    stop_type : str
+    station_naptan : str
+    accessibility_summary : str
+    hub_naptan_code : str
+    lines : List[Identifier]
+        Materialized on first access.
+    line_group : List[LineGroup]
+        Materialized on first access.
+    line_mode_groups : List[LineModeGroup]
+        Materialized on first access.
+    full_name : str
+    naptan_mode : str
+    status : bool
+    individual_stop_id : str
+    id : str
+    url : str
+    common_name : str
+    distance : float
+    place_type : str
+    additional_properties : List[AdditionalProperties]
+        Materialized on first access.
+    children : List[Place]
+        Materialized on first access.
+    children_urls : List[str]
+    lat : float
+    lon : float
+    """
+    __slots__ = ('naptan_id', 'platform_name', 'indicator', 'stop_letter', 'modes', 'ics_code', 'sms_code', 'stop_type', 'station_naptan', 'accessibility_summary', 'hub_naptan_code', '_lines', '_line_group', '_line_mode_groups', 'full_name', 'naptan_mode', 'status', 'individual_stop_id', 'id', 'url', 'common_name', 'distance', 'place_type', '_additional_properties', '_children', 'children_urls', 'lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.StopPoint'
+    _fields = (('naptan_id', 'naptanId'), ('platform_name', 'platformName'), ('indicator', 'indicator'), ('stop_letter', 'stopLetter'), ('modes', 'modes'), ('ics_code', 'icsCode'), ('sms_code', 'smsCode'), ('stop_type', 'stopType'), ('station_naptan', 'stationNaptan'), ('accessibility_summary', 'accessibilitySummary'), ('hub_naptan_code', 'hubNaptanCode'), ('_lines', 'lines'), ('_line_group', 'lineGroup'), ('_line_mode_groups', 'lineModeGroups'), ('full_name', 'fullName'), ('naptan_mode', 'naptanMode'), ('status', 'status'), ('individual_stop_id', 'individualStopId'), ('id', 'id'), ('url', 'url'), ('common_name', 'commonName'), ('distance', 'distance'), ('place_type', 'placeType'), ('_additional_properties', 'additionalProperties'), ('_children', 'children'), ('children_urls', 'childrenUrls'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('string', 'string', 'string', 'string', 'array', 'string', 'string', 'string', 'string', 'string', 'string', 'array', 'array', 'array', 'string', 'string', 'boolean', 'string', 'string', 'string', 'string', 'number', 'string', 'array', 'array', 'array', 'number', 'number')
+    lines = EntityListField('Identifier')
+    line_group = EntityListField('LineGroup')
+    line_mode_groups = EntityListField('LineModeGroup')
+    additional_properties = EntityListField('AdditionalProperties')
+    children = EntityListField('Place')
+
+class ValidityPeriod(Entity):
+    """
+    Tfl.Api.Presentation.Entities.ValidityPeriod
+
+    Attributes
+    ----------
+    from_date : datetime
+        Parsed on first access.
+    to_date : datetime
+        Parsed on first access.
+    is_now : bool
+    """
+    __slots__ = ('_from_date', '_to_date', 'is_now')
+    _schema = 'Tfl.Api.Presentation.Entities.ValidityPeriod'
+    _fields = (('_from_date', 'fromDate'), ('_to_date', 'toDate'), ('is_now', 'isNow'))
+    _types = ('date-time', 'date-time', 'boolean')
+    from_date = DateTimeField()
+    to_date = DateTimeField()
+
+class PassengerFlow(Entity):
+    """
+    Tfl.Api.Presentation.Entities.PassengerFlow
+
+    Attributes
+    ----------
+    time_slice : str
+    value : int
+    """
+    __slots__ = ('time_slice', 'value')
+    _schema = 'Tfl.Api.Presentation.Entities.PassengerFlow'
+    _fields = (('time_slice', 'timeSlice'), ('value', 'value'))
+    _types = ('string', 'integer')
+
+class TrainLoading(Entity):
+    """
+    Tfl.Api.Presentation.Entities.TrainLoading
+
+    Attributes
+    ----------
+    line : str
+    line_direction : str
+    platform_direction : str
+    direction : str
+    naptan_to : str
+    time_slice : str
+    value : int
+    """
+    __slots__ = ('line', 'line_direction', 'platform_direction', 'direction', 'naptan_to', 'time_slice', 'value')
+    _schema = 'Tfl.Api.Presentation.Entities.TrainLoading'
+    _fields = (('line', 'line'), ('line_direction', 'lineDirection'), ('platform_direction', 'platformDirection'), ('direction', 'direction'), ('naptan_to', 'naptanTo'), ('time_slice', 'timeSlice'), ('value', 'value'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'integer')
+
+class TimeAdjustment(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.TimeAdjustment
+
+    Attributes
+    ----------
+    date : str
+    time : str
+    time_is : str
+    uri : str
+    """
+    __slots__ = ('date', 'time', 'time_is', 'uri')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.TimeAdjustment'
+    _fields = (('date', 'date'), ('time', 'time'), ('time_is', 'timeIs'), ('uri', 'uri'))
+    _types = ('string', 'string', 'string', 'string')
+
+class InstructionStep(Entity):
+    """
+    Tfl.Api.Presentation.Entities.InstructionStep
+
+    Attributes
+    ----------
+    description : str
+    turn_direction : str
+    street_name : str
+    distance : int
+    cumulative_distance : int
+    sky_direction : int
+    sky_direction_description : str
+        One of North, NorthEast, East, SouthEast, South, SouthWest, West, NorthWest.
+    cumulative_travel_time : int
+    latitude : float
+    longitude : float
+    path_attribute : PathAttribute
+        Materialized on first access.
+    description_heading : str
+    track_type : str
+        One of CycleSuperHighway, CanalTowpath, QuietRoad, ProvisionForCyclists, BusyRoads, None, PushBike, Quietway.
+    """
+    __slots__ = ('description', 'turn_direction', 'street_name', 'distance', 'cumulative_distance', 'sky_direction', 'sky_direction_description', 'cumulative_travel_time', 'latitude', 'longitude', '_path_attribute', 'description_heading', 'track_type')
+    _schema = 'Tfl.Api.Presentation.Entities.InstructionStep'
+    _fields = (('description', 'description'), ('turn_direction', 'turnDirection'), ('street_name', 'streetName'), ('distance', 'distance'), ('cumulative_distance', 'cumulativeDistance'), ('sky_direction', 'skyDirection'), ('sky_direction_description', 'skyDirectionDescription'), ('cumulative_travel_time', 'cumulativeTravelTime'), ('latitude', 'latitude'), ('longitude', 'longitude'), ('_path_attribute', 'pathAttribute'), ('description_heading', 'descriptionHeading'), ('track_type', 'trackType'))
+    _types = ('string', 'string', 'string', 'integer', 'integer', 'integer', 'string', 'integer', 'number', 'number', 'object', 'string', 'string')
+    path_attribute = EntityField('PathAttribute')
+
+class JpElevation(Entity):
+    """
+    Tfl.Api.Common.JourneyPlanner.JpElevation
+
+    Attributes
+    ----------
+    distance : int
+    start_lat : float
+    start_lon : float
+    end_lat : float
+    end_lon : float
+    height_from_previous_point : int
+    gradient : float
+    """
+    __slots__ = ('distance', 'start_lat', 'start_lon', 'end_lat', 'end_lon', 'height_from_previous_point', 'gradient')
+    _schema = 'Tfl.Api.Common.JourneyPlanner.JpElevation'
+    _fields = (('distance', 'distance'), ('start_lat', 'startLat'), ('start_lon', 'startLon'), ('end_lat', 'endLat'), ('end_lon', 'endLon'), ('height_from_previous_point', 'heightFromPreviousPoint'), ('gradient', 'gradient'))
+    _types = ('integer', 'number', 'number', 'number', 'number', 'integer', 'number')
+
+class FareTap(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.FareTap
+
+    Attributes
+    ----------
+    atco_code : str
+    tap_details : FareTapDetails
+        Materialized on first access.
+    """
+    __slots__ = ('atco_code', '_tap_details')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.FareTap'
+    _fields = (('atco_code', 'atcoCode'), ('_tap_details', 'tapDetails'))
+    _types = ('string', 'object')
+    tap_details = EntityField('FareTapDetails')
+
+class RouteSectionNaptanEntrySequence(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RouteSectionNaptanEntrySequence
+
+    Attributes
+    ----------
+    ordinal : int
+    stop_point : StopPoint
+        Materialized on first access.
+    """
+    __slots__ = ('ordinal', '_stop_point')
+    _schema = 'Tfl.Api.Presentation.Entities.RouteSectionNaptanEntrySequence'
+    _fields = (('ordinal', 'ordinal'), ('_stop_point', 'stopPoint'))
+    _types = ('integer', 'object')
+    stop_point = EntityField('StopPoint')
+
+class LineGroup(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineGroup
+
+    Attributes
+    ----------
+    naptan_id_reference : str
+    station_atco_code : str
+    line_identifier : List[str]
+    """
+    __slots__ = ('naptan_id_reference', 'station_atco_code', 'line_identifier')
+    _schema = 'Tfl.Api.Presentation.Entities.LineGroup'
+    _fields = (('naptan_id_reference', 'naptanIdReference'), ('station_atco_code', 'stationAtcoCode'), ('line_identifier', 'lineIdentifier'))
+    _types = ('string', 'string', 'array')
+
+class LineModeGroup(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineModeGroup
+
+    Attributes
+    ----------
+    mode_name : str
+    line_identifier : List[str]
+    """
+    __slots__ = ('mode_name', 'line_identifier')
+    _schema = 'Tfl.Api.Presentation.Entities.LineModeGroup'
+    _fields = (('mode_name', 'modeName'), ('line_identifier', 'lineIdentifier'))
+    _types = ('string', 'array')
+
+class PathAttribute(Entity):
+    """
+    Tfl.Api.Presentation.Entities.PathAttribute
+
+    Attributes
+    ----------
+    name : str
+    value : str
+    """
+    __slots__ = ('name', 'value')
+    _schema = 'Tfl.Api.Presentation.Entities.PathAttribute'
+    _fields = (('name', 'name'), ('value', 'value'))
+    _types = ('string', 'string')
+
+class FareTapDetails(Entity):
+    """
+    Tfl.Api.Presentation.Entities.JourneyPlanner.FareTapDetails
+
+    Attributes
+    ----------
+    mode_type : str
+    validation_type : str
+    host_device_type : str
+    bus_route_id : str
+    national_location_code : int
+    tap_timestamp : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('mode_type', 'validation_type', 'host_device_type', 'bus_route_id', 'national_location_code', '_tap_timestamp')
+    _schema = 'Tfl.Api.Presentation.Entities.JourneyPlanner.FareTapDetails'
+    _fields = (('mode_type', 'modeType'), ('validation_type', 'validationType'), ('host_device_type', 'hostDeviceType'), ('bus_route_id', 'busRouteId'), ('national_location_code', 'nationalLocationCode'), ('_tap_timestamp', 'tapTimestamp'))
+    _types = ('string', 'string', 'string', 'string', 'integer', 'date-time')
+    tap_timestamp = DateTimeField()
+
+class StatusSeverity(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StatusSeverity
+
+    Attributes
+    ----------
+    mode_name : str
+    severity_level : int
+    description : str
+    """
+    __slots__ = ('mode_name', 'severity_level', 'description')
+    _schema = 'Tfl.Api.Presentation.Entities.StatusSeverity'
+    _fields = (('mode_name', 'modeName'), ('severity_level', 'severityLevel'), ('description', 'description'))
+    _types = ('string', 'integer', 'string')
+
+class RouteSequence(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RouteSequence
+
+    Attributes
+    ----------
+    line_id : str
+    line_name : str
+    direction : str
+    is_outbound_only : bool
+    mode : str
+    line_strings : List[str]
+    stations : List[MatchedStop]
+        Materialized on first access.
+    stop_point_sequences : List[StopPointSequence]
+        Materialized on first access.
+    ordered_line_routes : List[OrderedRoute]
+        Materialized on first access.
+    """
+    __slots__ = ('line_id', 'line_name', 'direction', 'is_outbound_only', 'mode', 'line_strings', '_stations', '_stop_point_sequences', '_ordered_line_routes')
+    _schema = 'Tfl.Api.Presentation.Entities.RouteSequence'
+    _fields = (('line_id', 'lineId'), ('line_name', 'lineName'), ('direction', 'direction'), ('is_outbound_only', 'isOutboundOnly'), ('mode', 'mode'), ('line_strings', 'lineStrings'), ('_stations', 'stations'), ('_stop_point_sequences', 'stopPointSequences'), ('_ordered_line_routes', 'orderedLineRoutes'))
+    _types = ('string', 'string', 'string', 'boolean', 'string', 'array', 'array', 'array', 'array')
+    stations = EntityListField('MatchedStop')
+    stop_point_sequences = EntityListField('StopPointSequence')
+    ordered_line_routes = EntityListField('OrderedRoute')
+
+class MatchedStop(Entity):
+    """
+    Tfl.Api.Presentation.Entities.MatchedStop
+
+    Attributes
+    ----------
+    route_id : int
+    parent_id : str
+    station_id : str
+    ics_id : str
+    top_most_parent_id : str
+    direction : str
+    towards : str
+    modes : List[str]
+    stop_type : str
+    stop_letter : str
+    zone : str
+    accessibility_summary : str
+    has_disruption : bool
+    lines : List[Identifier]
+        Materialized on first access.
+    status : bool
+    id : str
+    url : str
+    name : str
+    lat : float
+    lon : float
+    """
+    __slots__ = ('route_id', 'parent_id', 'station_id', 'ics_id', 'top_most_parent_id', 'direction', 'towards', 'modes', 'stop_type', 'stop_letter', 'zone', 'accessibility_summary', 'has_disruption', '_lines', 'status', 'id', 'url', 'name', 'lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.MatchedStop'
+    _fields = (('route_id', 'routeId'), ('parent_id', 'parentId'), ('station_id', 'stationId'), ('ics_id', 'icsId'), ('top_most_parent_id', 'topMostParentId'), ('direction', 'direction'), ('towards', 'towards'), ('modes', 'modes'), ('stop_type', 'stopType'), ('stop_letter', 'stopLetter'), ('zone', 'zone'), ('accessibility_summary', 'accessibilitySummary'), ('has_disruption', 'hasDisruption'), ('_lines', 'lines'), ('status', 'status'), ('id', 'id'), ('url', 'url'), ('name', 'name'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('integer', 'string', 'string', 'string', 'string', 'string', 'string', 'array', 'string', 'string', 'string', 'string', 'boolean', 'array', 'boolean', 'string', 'string', 'string', 'number', 'number')
+    lines = EntityListField('Identifier')
+
+class StopPointSequence(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StopPointSequence
+
+    Attributes
+    ----------
+    line_id : str
+    line_name : str
+    direction : str
+    branch_id : int
+    next_branch_ids : List[int]
+    prev_branch_ids : List[int]
+    stop_point : List[MatchedStop]
+        Materialized on first access.
+    service_type : str
+        One of Regular, Night.
+    """
+    __slots__ = ('line_id', 'line_name', 'direction', 'branch_id', 'next_branch_ids', 'prev_branch_ids', '_stop_point', 'service_type')
+    _schema = 'Tfl.Api.Presentation.Entities.StopPointSequence'
+    _fields = (('line_id', 'lineId'), ('line_name', 'lineName'), ('direction', 'direction'), ('branch_id', 'branchId'), ('next_branch_ids', 'nextBranchIds'), ('prev_branch_ids', 'prevBranchIds'), ('_stop_point', 'stopPoint'), ('service_type', 'serviceType'))
+    _types = ('string', 'string', 'string', 'integer', 'array', 'array', 'array', 'string')
+    stop_point = EntityListField('MatchedStop')
+
+class OrderedRoute(Entity):
+    """
+    Tfl.Api.Presentation.Entities.OrderedRoute
+
+    Attributes
+    ----------
+    name : str
+    naptan_ids : List[str]
+    service_type : str
+    """
+    __slots__ = ('name', 'naptan_ids', 'service_type')
+    _schema = 'Tfl.Api.Presentation.Entities.OrderedRoute'
+    _fields = (('name', 'name'), ('naptan_ids', 'naptanIds'), ('service_type', 'serviceType'))
+    _types = ('string', 'array', 'string')
+
+class DateRange(Entity):
+    """
+    Tfl.Api.Common.DateRange
+
+    Attributes
+    ----------
+    start_date : datetime
+        Parsed on first access.
+    end_date : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('_start_date', '_end_date')
+    _schema = 'Tfl.Api.Common.DateRange'
+    _fields = (('_start_date', 'startDate'), ('_end_date', 'endDate'))
+    _types = ('date-time', 'date-time')
+    start_date = DateTimeField()
+    end_date = DateTimeField()
+
+class RouteSearchResponse(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RouteSearchResponse
+
+    Attributes
+    ----------
+    input : str
+    search_matches : List[RouteSearchMatch]
+        Materialized on first access.
+    """
+    __slots__ = ('input', '_search_matches')
+    _schema = 'Tfl.Api.Presentation.Entities.RouteSearchResponse'
+    _fields = (('input', 'input'), ('_search_matches', 'searchMatches'))
+    _types = ('string', 'array')
+    search_matches = EntityListField('RouteSearchMatch')
+
+class RouteSearchMatch(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RouteSearchMatch
+
+    Attributes
+    ----------
+    line_id : str
+    mode : str
+    line_name : str
+    line_route_section : List[LineRouteSection]
+        Materialized on first access.
+    matched_route_sections : List[MatchedRouteSections]
+        Materialized on first access.
+    matched_stops : List[MatchedStop]
+        Materialized on first access.
+    id : str
+    url : str
+    name : str
+    lat : float
+    lon : float
+    """
+    __slots__ = ('line_id', 'mode', 'line_name', '_line_route_section', '_matched_route_sections', '_matched_stops', 'id', 'url', 'name', 'lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.RouteSearchMatch'
+    _fields = (('line_id', 'lineId'), ('mode', 'mode'), ('line_name', 'lineName'), ('_line_route_section', 'lineRouteSection'), ('_matched_route_sections', 'matchedRouteSections'), ('_matched_stops', 'matchedStops'), ('id', 'id'), ('url', 'url'), ('name', 'name'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('string', 'string', 'string', 'array', 'array', 'array', 'string', 'string', 'string', 'number', 'number')
+    line_route_section = EntityListField('LineRouteSection')
+    matched_route_sections = EntityListField('MatchedRouteSections')
+    matched_stops = EntityListField('MatchedStop')
+
+class LineRouteSection(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineRouteSection
+
+    Attributes
+    ----------
+    route_id : int
+    direction : str
+    destination : str
+    from_station : str
+    to_station : str
+    service_type : str
+    vehicle_destination_text : str
+    """
+    __slots__ = ('route_id', 'direction', 'destination', 'from_station', 'to_station', 'service_type', 'vehicle_destination_text')
+    _schema = 'Tfl.Api.Presentation.Entities.LineRouteSection'
+    _fields = (('route_id', 'routeId'), ('direction', 'direction'), ('destination', 'destination'), ('from_station', 'fromStation'), ('to_station', 'toStation'), ('service_type', 'serviceType'), ('vehicle_destination_text', 'vehicleDestinationText'))
+    _types = ('integer', 'string', 'string', 'string', 'string', 'string', 'string')
+
+class MatchedRouteSections(Entity):
+    """
+    Tfl.Api.Presentation.Entities.MatchedRouteSections
+
+    Attributes
+    ----------
+    id : int
+    """
+    __slots__ = ('id',)
+    _schema = 'Tfl.Api.Presentation.Entities.MatchedRouteSections'
+    _fields = (('id', 'id'),)
+    _types = ('integer',)
+
+class TimetableResponse(Entity):
+    """
+    Tfl.Api.Presentation.Entities.TimetableResponse
+
+    Attributes
+    ----------
+    line_id : str
+    line_name : str
+    direction : str
+    pdf_url : str
+    stations : List[MatchedStop]
+        Materialized on first access.
+    stops : List[MatchedStop]
+        Materialized on first access.
+    timetable : Timetable
+        Materialized on first access.
+    disambiguation : Disambiguation
+        Materialized on first access.
+    status_error_message : str
+    """
+    __slots__ = ('line_id', 'line_name', 'direction', 'pdf_url', '_stations', '_stops', '_timetable', '_disambiguation', 'status_error_message')
+    _schema = 'Tfl.Api.Presentation.Entities.TimetableResponse'
+    _fields = (('line_id', 'lineId'), ('line_name', 'lineName'), ('direction', 'direction'), ('pdf_url', 'pdfUrl'), ('_stations', 'stations'), ('_stops', 'stops'), ('_timetable', 'timetable'), ('_disambiguation', 'disambiguation'), ('status_error_message', 'statusErrorMessage'))
+    _types = ('string', 'string', 'string', 'string', 'array', 'array', 'object', 'object', 'string')
+    stations = EntityListField('MatchedStop')
+    stops = EntityListField('MatchedStop')
+    timetable = EntityField('Timetable')
+    disambiguation = EntityField('Disambiguation')
+
+class Timetable(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Timetable
+
+    Attributes
+    ----------
+    departure_stop_id : str
+    routes : List[TimetableRoute]
+        Materialized on first access.
+    """
+    __slots__ = ('departure_stop_id', '_routes')
+    _schema = 'Tfl.Api.Presentation.Entities.Timetable'
+    _fields = (('departure_stop_id', 'departureStopId'), ('_routes', 'routes'))
+    _types = ('string', 'array')
+    routes = EntityListField('TimetableRoute')
+
+class Disambiguation(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Timetables.Disambiguation
+
+    Attributes
+    ----------
+    disambiguation_options : List[DisambiguationOption]
+        Materialized on first access.
+    """
+    __slots__ = ('_disambiguation_options',)
+    _schema = 'Tfl.Api.Presentation.Entities.Timetables.Disambiguation'
+    _fields = (('_disambiguation_options', 'disambiguationOptions'),)
+    _types = ('array',)
+    disambiguation_options = EntityListField('DisambiguationOption')
+
+class TimetableRoute(Entity):
+    """
+    Tfl.Api.Presentation.Entities.TimetableRoute
+
+    Attributes
+    ----------
+    station_intervals : List[StationInterval]
+        Materialized on first access.
+    schedules : List[Schedule]
+        Materialized on first access.
+    """
+    __slots__ = ('_station_intervals', '_schedules')
+    _schema = 'Tfl.Api.Presentation.Entities.TimetableRoute'
+    _fields = (('_station_intervals', 'stationIntervals'), ('_schedules', 'schedules'))
+    _types = ('array', 'array')
+    station_intervals = EntityListField('StationInterval')
+    schedules = EntityListField('Schedule')
+
+class DisambiguationOption(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Timetables.DisambiguationOption
+
+    Attributes
+    ----------
+    description : str
+    uri : str
+    """
+    __slots__ = ('description', 'uri')
+    _schema = 'Tfl.Api.Presentation.Entities.Timetables.DisambiguationOption'
+    _fields = (('description', 'description'), ('uri', 'uri'))
+    _types = ('string', 'string')
+
+class StationInterval(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StationInterval
+
+    Attributes
+    ----------
+    id : str
+    intervals : List[Interval]
+        Materialized on first access.
+    """
+    __slots__ = ('id', '_intervals')
+    _schema = 'Tfl.Api.Presentation.Entities.StationInterval'
+    _fields = (('id', 'id'), ('_intervals', 'intervals'))
+    _types = ('string', 'array')
+    intervals = EntityListField('Interval')
+
+class Schedule(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Schedule
+
+    Attributes
+    ----------
+    name : str
+    known_journeys : List[KnownJourney]
+        Materialized on first access.
+    first_journey : KnownJourney
+        Materialized on first access.
+    last_journey : KnownJourney
+        Materialized on first access.
+    periods : List[Period]
+        Materialized on first access.
+    """
+    __slots__ = ('name', '_known_journeys', '_first_journey', '_last_journey', '_periods')
+    _schema = 'Tfl.Api.Presentation.Entities.Schedule'
+    _fields = (('name', 'name'), ('_known_journeys', 'knownJourneys'), ('_first_journey', 'firstJourney'), ('_last_journey', 'lastJourney'), ('_periods', 'periods'))
+    _types = ('string', 'array', 'object', 'object', 'array')
+    known_journeys = EntityListField('KnownJourney')
+    first_journey = EntityField('KnownJourney')
+    last_journey = EntityField('KnownJourney')
+    periods = EntityListField('Period')
+
+class Interval(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Interval
+
+    Attributes
+    ----------
+    stop_id : str
+    time_to_arrival : float
+    """
+    __slots__ = ('stop_id', 'time_to_arrival')
+    _schema = 'Tfl.Api.Presentation.Entities.Interval'
+    _fields = (('stop_id', 'stopId'), ('time_to_arrival', 'timeToArrival'))
+    _types = ('string', 'number')
+
+class KnownJourney(Entity):
+    """
+    Tfl.Api.Presentation.Entities.KnownJourney
+
+    Attributes
+    ----------
+    hour : str
+    minute : str
+    interval_id : int
+    """
+    __slots__ = ('hour', 'minute', 'interval_id')
+    _schema = 'Tfl.Api.Presentation.Entities.KnownJourney'
+    _fields = (('hour', 'hour'), ('minute', 'minute'), ('interval_id', 'intervalId'))
+    _types = ('string', 'string', 'integer')
+
+class Period(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Period
+
+    Attributes
+    ----------
+    type : str
+        One of Normal, FrequencyHours, FrequencyMinutes, Unknown.
+    from_time : TwentyFourHourClockTime
+        Materialized on first access.
+    to_time : TwentyFourHourClockTime
+        Materialized on first access.
+    frequency : ServiceFrequency
+        Materialized on first access.
+    """
+    __slots__ = ('type', '_from_time', '_to_time', '_frequency')
+    _schema = 'Tfl.Api.Presentation.Entities.Period'
+    _fields = (('type', 'type'), ('_from_time', 'fromTime'), ('_to_time', 'toTime'), ('_frequency', 'frequency'))
+    _types = ('string', 'object', 'object', 'object')
+    from_time = EntityField('TwentyFourHourClockTime')
+    to_time = EntityField('TwentyFourHourClockTime')
+    frequency = EntityField('ServiceFrequency')
+
+class TwentyFourHourClockTime(Entity):
+    """
+    Tfl.Api.Presentation.Entities.TwentyFourHourClockTime
+
+    Attributes
+    ----------
+    hour : str
+    minute : str
+    """
+    __slots__ = ('hour', 'minute')
+    _schema = 'Tfl.Api.Presentation.Entities.TwentyFourHourClockTime'
+    _fields = (('hour', 'hour'), ('minute', 'minute'))
+    _types = ('string', 'string')
+
+class ServiceFrequency(Entity):
+    """
+    Tfl.Api.Presentation.Entities.ServiceFrequency
+
+    Attributes
+    ----------
+    lowest_frequency : float
+    highest_frequency : float
+    """
+    __slots__ = ('lowest_frequency', 'highest_frequency')
+    _schema = 'Tfl.Api.Presentation.Entities.ServiceFrequency'
+    _fields = (('lowest_frequency', 'lowestFrequency'), ('highest_frequency', 'highestFrequency'))
+    _types = ('number', 'number')
+
+class Prediction(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Prediction
+
+    Attributes
+    ----------
+    id : str
+    operation_type : int
+    vehicle_id : str
+    naptan_id : str
+    station_name : str
+    line_id : str
+    line_name : str
+    platform_name : str
+    direction : str
+    bearing : str
+    destination_naptan_id : str
+    destination_name : str
+    timestamp : datetime
+        Parsed on first access.
+    time_to_station : int
+    current_location : str
+    towards : str
+    expected_arrival : datetime
+        Parsed on first access.
+    time_to_live : datetime
+        Parsed on first access.
+    mode_name : str
+    timing : PredictionTiming
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'operation_type', 'vehicle_id', 'naptan_id', 'station_name', 'line_id', 'line_name', 'platform_name', 'direction', 'bearing', 'destination_naptan_id', 'destination_name', '_timestamp', 'time_to_station', 'current_location', 'towards', '_expected_arrival', '_time_to_live', 'mode_name', '_timing')
+    _schema = 'Tfl.Api.Presentation.Entities.Prediction'
+    _fields = (('id', 'id'), ('operation_type', 'operationType'), ('vehicle_id', 'vehicleId'), ('naptan_id', 'naptanId'), ('station_name', 'stationName'), ('line_id', 'lineId'), ('line_name', 'lineName'), ('platform_name', 'platformName'), ('direction', 'direction'), ('bearing', 'bearing'), ('destination_naptan_id', 'destinationNaptanId'), ('destination_name', 'destinationName'), ('_timestamp', 'timestamp'), ('time_to_station', 'timeToStation'), ('current_location', 'currentLocation'), ('towards', 'towards'), ('_expected_arrival', 'expectedArrival'), ('_time_to_live', 'timeToLive'), ('mode_name', 'modeName'), ('_timing', 'timing'))
+    _types = ('string', 'integer', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'date-time', 'integer', 'string', 'string', 'date-time', 'date-time', 'string', 'object')
+    timestamp = DateTimeField()
+    expected_arrival = DateTimeField()
+    time_to_live = DateTimeField()
+    timing = EntityField('PredictionTiming')
+
+class PredictionTiming(Entity):
+    """
+    Tfl.Api.Presentation.Entities.PredictionTiming
+
+    Attributes
+    ----------
+    countdown_server_adjustment : str
+    source : datetime
+        Parsed on first access.
+    insert : datetime
+        Parsed on first access.
+    read : datetime
+        Parsed on first access.
+    sent : datetime
+        Parsed on first access.
+    received : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('countdown_server_adjustment', '_source', '_insert', '_read', '_sent', '_received')
+    _schema = 'Tfl.Api.Presentation.Entities.PredictionTiming'
+    _fields = (('countdown_server_adjustment', 'countdownServerAdjustment'), ('_source', 'source'), ('_insert', 'insert'), ('_read', 'read'), ('_sent', 'sent'), ('_received', 'received'))
+    _types = ('string', 'date-time', 'date-time', 'date-time', 'date-time', 'date-time')
+    source = DateTimeField()
+    insert = DateTimeField()
+    read = DateTimeField()
+    sent = DateTimeField()
+    received = DateTimeField()
+
+class ActiveServiceType(Entity):
+    """
+    Tfl.Api.Presentation.Entities.ActiveServiceType
+
+    Attributes
+    ----------
+    mode : str
+    service_type : str
+    """
+    __slots__ = ('mode', 'service_type')
+    _schema = 'Tfl.Api.Presentation.Entities.ActiveServiceType'
+    _fields = (('mode', 'mode'), ('service_type', 'serviceType'))
+    _types = ('string', 'string')
+
+class NetworkStatus(Entity):
+    """
+    Tfl.Api.Presentation.Entities.NetworkStatus
+
+    Attributes
+    ----------
+    operator : str
+    status : str
+    message : str
+    status_level : int
+    """
+    __slots__ = ('operator', 'status', 'message', 'status_level')
+    _schema = 'Tfl.Api.Presentation.Entities.NetworkStatus'
+    _fields = (('operator', 'operator'), ('status', 'status'), ('message', 'message'), ('status_level', 'statusLevel'))
+    _types = ('string', 'string', 'string', 'integer')
+
+class CarParkOccupancy(Entity):
+    """
+    Tfl.Api.Presentation.Entities.CarParkOccupancy
+
+    Attributes
+    ----------
+    id : str
+    bays : List[Bay]
+        Materialized on first access.
+    name : str
+    car_park_details_url : str
+    """
+    __slots__ = ('id', '_bays', 'name', 'car_park_details_url')
+    _schema = 'Tfl.Api.Presentation.Entities.CarParkOccupancy'
+    _fields = (('id', 'id'), ('_bays', 'bays'), ('name', 'name'), ('car_park_details_url', 'carParkDetailsUrl'))
+    _types = ('string', 'array', 'string', 'string')
+    bays = EntityListField('Bay')
+
+class Bay(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Bay
+
+    Attributes
+    ----------
+    bay_type : str
+    bay_count : int
+    free : int
+    occupied : int
+    """
+    __slots__ = ('bay_type', 'bay_count', 'free', 'occupied')
+    _schema = 'Tfl.Api.Presentation.Entities.Bay'
+    _fields = (('bay_type', 'bayType'), ('bay_count', 'bayCount'), ('free', 'free'), ('occupied', 'occupied'))
+    _types = ('string', 'integer', 'integer', 'integer')
+
+class ChargeConnectorOccupancy(Entity):
+    """
+    Tfl.Api.Presentation.Entities.ChargeConnectorOccupancy
+
+    Attributes
+    ----------
+    id : int
+    source_system_place_id : str
+    status : str
+    """
+    __slots__ = ('id', 'source_system_place_id', 'status')
+    _schema = 'Tfl.Api.Presentation.Entities.ChargeConnectorOccupancy'
+    _fields = (('id', 'id'), ('source_system_place_id', 'sourceSystemPlaceId'), ('status', 'status'))
+    _types = ('integer', 'string', 'string')
+
+class BikePointOccupancy(Entity):
+    """
+    Tfl.Api.Presentation.Entities.BikePointOccupancy
+
+    Attributes
+    ----------
+    id : str
+    name : str
+    bikes_count : int
+    empty_docks : int
+    total_docks : int
+    standard_bikes_count : int
+    e_bikes_count : int
+    """
+    __slots__ = ('id', 'name', 'bikes_count', 'empty_docks', 'total_docks', 'standard_bikes_count', 'e_bikes_count')
+    _schema = 'Tfl.Api.Presentation.Entities.BikePointOccupancy'
+    _fields = (('id', 'id'), ('name', 'name'), ('bikes_count', 'bikesCount'), ('empty_docks', 'emptyDocks'), ('total_docks', 'totalDocks'), ('standard_bikes_count', 'standardBikesCount'), ('e_bikes_count', 'eBikesCount'))
+    _types = ('string', 'string', 'integer', 'integer', 'integer', 'integer', 'integer')
+
+class PlaceCategory(Entity):
+    """
+    Tfl.Api.Presentation.Entities.PlaceCategory
+
+    Attributes
+    ----------
+    category : str
+    available_keys : List[str]
+    """
+    __slots__ = ('category', 'available_keys')
+    _schema = 'Tfl.Api.Presentation.Entities.PlaceCategory'
+    _fields = (('category', 'category'), ('available_keys', 'availableKeys'))
+    _types = ('string', 'array')
+
+class SearchResponse(Entity):
+    """
+    Tfl.Api.Presentation.Entities.SearchResponse
+
+    Attributes
+    ----------
+    query : str
+    from_ : int
+    page : int
+    page_size : int
+    provider : str
+    total : int
+    matches : List[SearchMatch]
+        Materialized on first access.
+    max_score : float
+    """
+    __slots__ = ('query', 'from_', 'page', 'page_size', 'provider', 'total', '_matches', 'max_score')
+    _schema = 'Tfl.Api.Presentation.Entities.SearchResponse'
+    _fields = (('query', 'query'), ('from_', 'from'), ('page', 'page'), ('page_size', 'pageSize'), ('provider', 'provider'), ('total', 'total'), ('_matches', 'matches'), ('max_score', 'maxScore'))
+    _types = ('string', 'integer', 'integer', 'integer', 'string', 'integer', 'array', 'number')
+    matches = EntityListField('SearchMatch')
+
+class SearchMatch(Entity):
+    """
+    Tfl.Api.Presentation.Entities.SearchMatch
+
+    Attributes
+    ----------
+    id : str
+    url : str
+    name : str
+    lat : float
+    lon : float
+    """
+    __slots__ = ('id', 'url', 'name', 'lat', 'lon')
+    _schema = 'Tfl.Api.Presentation.Entities.SearchMatch'
+    _fields = (('id', 'id'), ('url', 'url'), ('name', 'name'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('string', 'string', 'string', 'number', 'number')
+
+class PostcodeInput(Entity):
+    """
+    Tfl.Api.Common.PostcodeInput
+
+    Attributes
+    ----------
+    postcode : str
+    """
+    __slots__ = ('postcode',)
+    _schema = 'Tfl.Api.Common.PostcodeInput'
+    _fields = (('postcode', 'postcode'),)
+    _types = ('string',)
+
+class PlacePolygon(Entity):
+    """
+    Tfl.Api.Presentation.Entities.PlacePolygon
+
+    Attributes
+    ----------
+    geo_points : List[GeoPoint]
+        Materialized on first access.
+    common_name : str
+    """
+    __slots__ = ('_geo_points', 'common_name')
+    _schema = 'Tfl.Api.Presentation.Entities.PlacePolygon'
+    _fields = (('_geo_points', 'geoPoints'), ('common_name', 'commonName'))
+    _types = ('array', 'string')
+    geo_points = EntityListField('GeoPoint')
+
+class GeoPoint(Entity):
+    """
+    Tfl.Api.Common.GeoPoint
+
+    Attributes
+    ----------
+    lat : float
+    lon : float
+    """
+    __slots__ = ('lat', 'lon')
+    _schema = 'Tfl.Api.Common.GeoPoint'
+    _fields = (('lat', 'lat'), ('lon', 'lon'))
+    _types = ('number', 'number')
+
+class PlaceGeo(Entity):
+    """
+    Tfl.Api.Common.PlaceGeo
+
+    Attributes
+    ----------
+    sw_lat : float
+    sw_lon : float
+    ne_lat : float
+    ne_lon : float
+    lat : float
+    lon : float
+    """
+    __slots__ = ('sw_lat', 'sw_lon', 'ne_lat', 'ne_lon', 'lat', 'lon')
+    _schema = 'Tfl.Api.Common.PlaceGeo'
+    _fields = (('sw_lat', 'swLat'), ('sw_lon', 'swLon'), ('ne_lat', 'neLat'), ('ne_lon', 'neLon'), ('lat', 'lat'), ('lon', 'lon'))
+    _types = ('number', 'number', 'number', 'number', 'number', 'number')
+
+class RoadCorridor(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RoadCorridor
+
+    Attributes
+    ----------
+    id : str
+    display_name : str
+    group : str
+    status_severity : str
+    status_severity_description : str
+    bounds : str
+    envelope : str
+    status_aggregation_start_date : datetime
+        Parsed on first access.
+    status_aggregation_end_date : datetime
+        Parsed on first access.
+    url : str
+    """
+    __slots__ = ('id', 'display_name', 'group', 'status_severity', 'status_severity_description', 'bounds', 'envelope', '_status_aggregation_start_date', '_status_aggregation_end_date', 'url')
+    _schema = 'Tfl.Api.Presentation.Entities.RoadCorridor'
+    _fields = (('id', 'id'), ('display_name', 'displayName'), ('group', 'group'), ('status_severity', 'statusSeverity'), ('status_severity_description', 'statusSeverityDescription'), ('bounds', 'bounds'), ('envelope', 'envelope'), ('_status_aggregation_start_date', 'statusAggregationStartDate'), ('_status_aggregation_end_date', 'statusAggregationEndDate'), ('url', 'url'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'string', 'date-time', 'date-time', 'string')
+    status_aggregation_start_date = DateTimeField()
+    status_aggregation_end_date = DateTimeField()
+
+class DateRangeNullable(Entity):
+    """
+    Tfl.Api.Common.DateRangeNullable
+
+    Attributes
+    ----------
+    start_date : datetime
+        Parsed on first access.
+    end_date : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('_start_date', '_end_date')
+    _schema = 'Tfl.Api.Common.DateRangeNullable'
+    _fields = (('_start_date', 'startDate'), ('_end_date', 'endDate'))
+    _types = ('date-time', 'date-time')
+    start_date = DateTimeField()
+    end_date = DateTimeField()
+
+class RoadDisruption(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RoadDisruption
+
+    Attributes
+    ----------
+    id : str
+    url : str
+    point : str
+    severity : str
+    ordinal : int
+    category : str
+    sub_category : str
+    comments : str
+    current_update : str
+    current_update_date_time : datetime
+        Parsed on first access.
+    corridor_ids : List[str]
+    start_date_time : datetime
+        Parsed on first access.
+    end_date_time : datetime
+        Parsed on first access.
+    last_modified_time : datetime
+        Parsed on first access.
+    level_of_interest : str
+    location : str
+    status : str
+    geography : DbGeography
+        Materialized on first access.
+    geometry : DbGeography
+        Materialized on first access.
+    streets : List[Street]
+        Materialized on first access.
+    is_provisional : bool
+    has_closures : bool
+    link_text : str
+    link_url : str
+    road_project : RoadProject
+        Materialized on first access.
+    publish_start_date : datetime
+        Parsed on first access.
+    publish_end_date : datetime
+        Parsed on first access.
+    time_frame : str
+    road_disruption_lines : List[RoadDisruptionLine]
+        Materialized on first access.
+    road_disruption_impact_areas : List[RoadDisruptionImpactArea]
+        Materialized on first access.
+    recurring_schedules : List[RoadDisruptionSchedule]
+        Materialized on first access.
+    """
+    __slots__ = ('id', 'url', 'point', 'severity', 'ordinal', 'category', 'sub_category', 'comments', 'current_update', '_current_update_date_time', 'corridor_ids', '_start_date_time', '_end_date_time', '_last_modified_time', 'level_of_interest', 'location', 'status', '_geography', '_geometry', '_streets', 'is_provisional', 'has_closures', 'link_text', 'link_url', '_road_project', '_publish_start_date', '_publish_end_date', 'time_frame', '_road_disruption_lines', '_road_disruption_impact_areas', '_recurring_schedules')
+    _schema = 'Tfl.Api.Presentation.Entities.RoadDisruption'
+    _fields = (('id', 'id'), ('url', 'url'), ('point', 'point'), ('severity', 'severity'), ('ordinal', 'ordinal'), ('category', 'category'), ('sub_category', 'subCategory'), ('comments', 'comments'), ('current_update', 'currentUpdate'), ('_current_update_date_time', 'currentUpdateDateTime'), ('corridor_ids', 'corridorIds'), ('_start_date_time', 'startDateTime'), ('_end_date_time', 'endDateTime'), ('_last_modified_time', 'lastModifiedTime'), ('level_of_interest', 'levelOfInterest'), ('location', 'location'), ('status', 'status'), ('_geography', 'geography'), ('_geometry', 'geometry'), ('_streets', 'streets'), ('is_provisional', 'isProvisional'), ('has_closures', 'hasClosures'), ('link_text', 'linkText'), ('link_url', 'linkUrl'), ('_road_project', 'roadProject'), ('_publish_start_date', 'publishStartDate'), ('_publish_end_date', 'publishEndDate'), ('time_frame', 'timeFrame'), ('_road_disruption_lines', 'roadDisruptionLines'), ('_road_disruption_impact_areas', 'roadDisruptionImpactAreas'), ('_recurring_schedules', 'recurringSchedules'))
+    _types = ('string', 'string', 'string', 'string', 'integer', 'string', 'string', 'string', 'string', 'date-time', 'array', 'date-time', 'date-time', 'date-time', 'string', 'string', 'string', 'object', 'object', 'array', 'boolean', 'boolean', 'string', 'string', 'object', 'date-time', 'date-time', 'string', 'array', 'array', 'array')
+    current_update_date_time = DateTimeField()
+    start_date_time = DateTimeField()
+    end_date_time = DateTimeField()
+    last_modified_time = DateTimeField()
+    geography = EntityField('DbGeography')
+    geometry = EntityField('DbGeography')
+    streets = EntityListField('Street')
+    road_project = EntityField('RoadProject')
+    publish_start_date = DateTimeField()
+    publish_end_date = DateTimeField()
+    road_disruption_lines = EntityListField('RoadDisruptionLine')
+    road_disruption_impact_areas = EntityListField('RoadDisruptionImpactArea')
+    recurring_schedules = EntityListField('RoadDisruptionSchedule')
+
+class Street(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Street
+
+    Attributes
+    ----------
+    name : str
+    closure : str
+    directions : str
+    segments : List[StreetSegment]
+        Materialized on first access.
+    source_system_id : int
+    source_system_key : str
+    """
+    __slots__ = ('name', 'closure', 'directions', '_segments', 'source_system_id', 'source_system_key')
+    _schema = 'Tfl.Api.Presentation.Entities.Street'
+    _fields = (('name', 'name'), ('closure', 'closure'), ('directions', 'directions'), ('_segments', 'segments'), ('source_system_id', 'sourceSystemId'), ('source_system_key', 'sourceSystemKey'))
+    _types = ('string', 'string', 'string', 'array', 'integer', 'string')
+    segments = EntityListField('StreetSegment')
+
+class RoadProject(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RoadProject
+
+    Attributes
+    ----------
+    project_id : str
+    scheme_name : str
+    project_name : str
+    project_description : str
+    project_page_url : str
+    consultation_page_url : str
+    consultation_start_date : datetime
+        Parsed on first access.
+    consultation_end_date : datetime
+        Parsed on first access.
+    construction_start_date : datetime
+        Parsed on first access.
+    construction_end_date : datetime
+        Parsed on first access.
+    boroughs_benefited : List[str]
+    cycle_superhighway_id : str
+    phase : str
+        One of Unscoped, Concept, ConsultationEnded, Consultation, Construction, Complete.
+    contact_name : str
+    contact_email : str
+    external_page_url : str
+    project_summary_page_url : str
+    """
+    __slots__ = ('project_id', 'scheme_name', 'project_name', 'project_description', 'project_page_url', 'consultation_page_url', '_consultation_start_date', '_consultation_end_date', '_construction_start_date', '_construction_end_date', 'boroughs_benefited', 'cycle_superhighway_id', 'phase', 'contact_name', 'contact_email', 'external_page_url', 'project_summary_page_url')
+    _schema = 'Tfl.Api.Presentation.Entities.RoadProject'
+    _fields = (('project_id', 'projectId'), ('scheme_name', 'schemeName'), ('project_name', 'projectName'), ('project_description', 'projectDescription'), ('project_page_url', 'projectPageUrl'), ('consultation_page_url', 'consultationPageUrl'), ('_consultation_start_date', 'consultationStartDate'), ('_consultation_end_date', 'consultationEndDate'), ('_construction_start_date', 'constructionStartDate'), ('_construction_end_date', 'constructionEndDate'), ('boroughs_benefited', 'boroughsBenefited'), ('cycle_superhighway_id', 'cycleSuperhighwayId'), ('phase', 'phase'), ('contact_name', 'contactName'), ('contact_email', 'contactEmail'), ('external_page_url', 'externalPageUrl'), ('project_summary_page_url', 'projectSummaryPageUrl'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'date-time', 'date-time', 'date-time', 'date-time', 'array', 'string', 'string', 'string', 'string', 'string', 'string')
+    consultation_start_date = DateTimeField()
+    consultation_end_date = DateTimeField()
+    construction_start_date = DateTimeField()
+    construction_end_date = DateTimeField()
+
+class RoadDisruptionLine(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RoadDisruptionLine
+
+    Attributes
+    ----------
+    id : int
+    road_disruption_id : str
+    is_diversion : bool
+    multi_line_string : DbGeography
+        Materialized on first access.
+    start_date : datetime
+        Parsed on first access.
+    end_date : datetime
+        Parsed on first access.
+    start_time : str
+    end_time : str
+    """
+    __slots__ = ('id', 'road_disruption_id', 'is_diversion', '_multi_line_string', '_start_date', '_end_date', 'start_time', 'end_time')
+    _schema = 'Tfl.Api.Presentation.Entities.RoadDisruptionLine'
+    _fields = (('id', 'id'), ('road_disruption_id', 'roadDisruptionId'), ('is_diversion', 'isDiversion'), ('_multi_line_string', 'multiLineString'), ('_start_date', 'startDate'), ('_end_date', 'endDate'), ('start_time', 'startTime'), ('end_time', 'endTime'))
+    _types = ('integer', 'string', 'boolean', 'object', 'date-time', 'date-time', 'string', 'string')
+    multi_line_string = EntityField('DbGeography')
+    start_date = DateTimeField()
+    end_date = DateTimeField()
+
+class RoadDisruptionImpactArea(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RoadDisruptionImpactArea
+
+    Attributes
+    ----------
+    id : int
+    road_disruption_id : str
+    polygon : DbGeography
+        Materialized on first access.
+    start_date : datetime
+        Parsed on first access.
+    end_date : datetime
+        Parsed on first access.
+    start_time : str
+    end_time : str
+    """
+    __slots__ = ('id', 'road_disruption_id', '_polygon', '_start_date', '_end_date', 'start_time', 'end_time')
+    _schema = 'Tfl.Api.Presentation.Entities.RoadDisruptionImpactArea'
+    _fields = (('id', 'id'), ('road_disruption_id', 'roadDisruptionId'), ('_polygon', 'polygon'), ('_start_date', 'startDate'), ('_end_date', 'endDate'), ('start_time', 'startTime'), ('end_time', 'endTime'))
+    _types = ('integer', 'string', 'object', 'date-time', 'date-time', 'string', 'string')
+    polygon = EntityField('DbGeography')
+    start_date = DateTimeField()
+    end_date = DateTimeField()
+
+class RoadDisruptionSchedule(Entity):
+    """
+    Tfl.Api.Presentation.Entities.RoadDisruptionSchedule
+
+    Attributes
+    ----------
+    start_time : datetime
+        Parsed on first access.
+    end_time : datetime
+        Parsed on first access.
+    """
+    __slots__ = ('_start_time', '_end_time')
+    _schema = 'Tfl.Api.Presentation.Entities.RoadDisruptionSchedule'
+    _fields = (('_start_time', 'startTime'), ('_end_time', 'endTime'))
+    _types = ('date-time', 'date-time')
+    start_time = DateTimeField()
+    end_time = DateTimeField()
+
+class StreetSegment(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StreetSegment
+
+    Attributes
+    ----------
+    toid : str
+    line_string : str
+    source_system_id : int
+    source_system_key : str
+    """
+    __slots__ = ('toid', 'line_string', 'source_system_id', 'source_system_key')
+    _schema = 'Tfl.Api.Presentation.Entities.StreetSegment'
+    _fields = (('toid', 'toid'), ('line_string', 'lineString'), ('source_system_id', 'sourceSystemId'), ('source_system_key', 'sourceSystemKey'))
+    _types = ('string', 'string', 'integer', 'string')
+
+class Redirect(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Redirect
+
+    Attributes
+    ----------
+    short_url : str
+    long_url : str
+    active : bool
+    """
+    __slots__ = ('short_url', 'long_url', 'active')
+    _schema = 'Tfl.Api.Presentation.Entities.Redirect'
+    _fields = (('short_url', 'shortUrl'), ('long_url', 'longUrl'), ('active', 'active'))
+    _types = ('string', 'string', 'boolean')
+
+class StopPointCategory(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StopPointCategory
+
+    Attributes
+    ----------
+    category : str
+    available_keys : List[str]
+    """
+    __slots__ = ('category', 'available_keys')
+    _schema = 'Tfl.Api.Presentation.Entities.StopPointCategory'
+    _fields = (('category', 'category'), ('available_keys', 'availableKeys'))
+    _types = ('string', 'array')
+
+class LineServiceType(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineServiceType
+
+    Attributes
+    ----------
+    line_name : str
+    line_specific_service_types : List[LineSpecificServiceType]
+        Materialized on first access.
+    """
+    __slots__ = ('line_name', '_line_specific_service_types')
+    _schema = 'Tfl.Api.Presentation.Entities.LineServiceType'
+    _fields = (('line_name', 'lineName'), ('_line_specific_service_types', 'lineSpecificServiceTypes'))
+    _types = ('string', 'array')
+    line_specific_service_types = EntityListField('LineSpecificServiceType')
+
+class LineSpecificServiceType(Entity):
+    """
+    Tfl.Api.Presentation.Entities.LineSpecificServiceType
+
+    Attributes
+    ----------
+    service_type : LineServiceTypeInfo
+        Materialized on first access.
+    stop_serves_service_type : bool
+    """
+    __slots__ = ('_service_type', 'stop_serves_service_type')
+    _schema = 'Tfl.Api.Presentation.Entities.LineSpecificServiceType'
+    _fields = (('_service_type', 'serviceType'), ('stop_serves_service_type', 'stopServesServiceType'))
+    _types = ('object', 'boolean')
+    service_type = EntityField('LineServiceTypeInfo')
+
+class ArrivalDeparture(Entity):
+    """
+    Tfl.Api.Presentation.Entities.ArrivalDeparture
+
+    Attributes
+    ----------
+    platform_name : str
+    destination_naptan_id : str
+    destination_name : str
+    naptan_id : str
+    station_name : str
+    estimated_time_of_arrival : datetime
+        Parsed on first access.
+    scheduled_time_of_arrival : datetime
+        Parsed on first access.
+    estimated_time_of_departure : datetime
+        Parsed on first access.
+    scheduled_time_of_departure : datetime
+        Parsed on first access.
+    minutes_and_seconds_to_arrival : str
+    minutes_and_seconds_to_departure : str
+    cause : str
+    departure_status : str
+        One of OnTime, Delayed, Cancelled, NotStoppingAtStation.
+    timing : PredictionTiming
+        Materialized on first access.
+    """
+    __slots__ = ('platform_name', 'destination_naptan_id', 'destination_name', 'naptan_id', 'station_name', '_estimated_time_of_arrival', '_scheduled_time_of_arrival', '_estimated_time_of_departure', '_scheduled_time_of_departure', 'minutes_and_seconds_to_arrival', 'minutes_and_seconds_to_departure', 'cause', 'departure_status', '_timing')
+    _schema = 'Tfl.Api.Presentation.Entities.ArrivalDeparture'
+    _fields = (('platform_name', 'platformName'), ('destination_naptan_id', 'destinationNaptanId'), ('destination_name', 'destinationName'), ('naptan_id', 'naptanId'), ('station_name', 'stationName'), ('_estimated_time_of_arrival', 'estimatedTimeOfArrival'), ('_scheduled_time_of_arrival', 'scheduledTimeOfArrival'), ('_estimated_time_of_departure', 'estimatedTimeOfDeparture'), ('_scheduled_time_of_departure', 'scheduledTimeOfDeparture'), ('minutes_and_seconds_to_arrival', 'minutesAndSecondsToArrival'), ('minutes_and_seconds_to_departure', 'minutesAndSecondsToDeparture'), ('cause', 'cause'), ('departure_status', 'departureStatus'), ('_timing', 'timing'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'date-time', 'date-time', 'date-time', 'date-time', 'string', 'string', 'string', 'string', 'object')
+    estimated_time_of_arrival = DateTimeField()
+    scheduled_time_of_arrival = DateTimeField()
+    estimated_time_of_departure = DateTimeField()
+    scheduled_time_of_departure = DateTimeField()
+    timing = EntityField('PredictionTiming')
+
+class ArrivalDepartureWithLine(Entity):
+    """
+    Tfl.Api.Presentation.Entities.ArrivalDepartureWithLine
+
+    Attributes
+    ----------
+    line_id : str
+    line_name : str
+    vehicle_id : str
+    platform_name : str
+    destination_naptan_id : str
+    destination_name : str
+    naptan_id : str
+    station_name : str
+    estimated_time_of_arrival : datetime
+        Parsed on first access.
+    scheduled_time_of_arrival : datetime
+        Parsed on first access.
+    estimated_time_of_departure : datetime
+        Parsed on first access.
+    scheduled_time_of_departure : datetime
+        Parsed on first access.
+    minutes_and_seconds_to_arrival : str
+    minutes_and_seconds_to_departure : str
+    cause : str
+    departure_status : str
+        One of OnTime, Delayed, Cancelled, NotStoppingAtStation.
+    timing : PredictionTiming
+        Materialized on first access.
+    """
+    __slots__ = ('line_id', 'line_name', 'vehicle_id', 'platform_name', 'destination_naptan_id', 'destination_name', 'naptan_id', 'station_name', '_estimated_time_of_arrival', '_scheduled_time_of_arrival', '_estimated_time_of_departure', '_scheduled_time_of_departure', 'minutes_and_seconds_to_arrival', 'minutes_and_seconds_to_departure', 'cause', 'departure_status', '_timing')
+    _schema = 'Tfl.Api.Presentation.Entities.ArrivalDepartureWithLine'
+    _fields = (('line_id', 'lineId'), ('line_name', 'lineName'), ('vehicle_id', 'vehicleId'), ('platform_name', 'platformName'), ('destination_naptan_id', 'destinationNaptanId'), ('destination_name', 'destinationName'), ('naptan_id', 'naptanId'), ('station_name', 'stationName'), ('_estimated_time_of_arrival', 'estimatedTimeOfArrival'), ('_scheduled_time_of_arrival', 'scheduledTimeOfArrival'), ('_estimated_time_of_departure', 'estimatedTimeOfDeparture'), ('_scheduled_time_of_departure', 'scheduledTimeOfDeparture'), ('minutes_and_seconds_to_arrival', 'minutesAndSecondsToArrival'), ('minutes_and_seconds_to_departure', 'minutesAndSecondsToDeparture'), ('cause', 'cause'), ('departure_status', 'departureStatus'), ('_timing', 'timing'))
+    _types = ('string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'date-time', 'date-time', 'date-time', 'date-time', 'string', 'string', 'string', 'string', 'object')
+    estimated_time_of_arrival = DateTimeField()
+    scheduled_time_of_arrival = DateTimeField()
+    estimated_time_of_departure = DateTimeField()
+    scheduled_time_of_departure = DateTimeField()
+    timing = EntityField('PredictionTiming')
+
+class StopPointRouteSection(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StopPointRouteSection
+
+    Attributes
+    ----------
+    naptan_id : str
+    line_id : str
+    mode : str
+    valid_from : datetime
+        Parsed on first access.
+    valid_to : datetime
+        Parsed on first access.
+    direction : str
+    route_section_name : str
+    line_string : str
+    is_active : bool
+    service_type : str
+    vehicle_destination_text : str
+    destination_name : str
+    """
+    __slots__ = ('naptan_id', 'line_id', 'mode', '_valid_from', '_valid_to', 'direction', 'route_section_name', 'line_string', 'is_active', 'service_type', 'vehicle_destination_text', 'destination_name')
+    _schema = 'Tfl.Api.Presentation.Entities.StopPointRouteSection'
+    _fields = (('naptan_id', 'naptanId'), ('line_id', 'lineId'), ('mode', 'mode'), ('_valid_from', 'validFrom'), ('_valid_to', 'validTo'), ('direction', 'direction'), ('route_section_name', 'routeSectionName'), ('line_string', 'lineString'), ('is_active', 'isActive'), ('service_type', 'serviceType'), ('vehicle_destination_text', 'vehicleDestinationText'), ('destination_name', 'destinationName'))
+    _types = ('string', 'string', 'string', 'date-time', 'date-time', 'string', 'string', 'string', 'boolean', 'string', 'string', 'string')
+    valid_from = DateTimeField()
+    valid_to = DateTimeField()
+
+class DisruptedPoint(Entity):
+    """
+    Tfl.Api.Presentation.Entities.DisruptedPoint
+
+    Attributes
+    ----------
+    atco_code : str
+    from_date : datetime
+        Parsed on first access.
+    to_date : datetime
+        Parsed on first access.
+    description : str
+    common_name : str
+    type : str
+    mode : str
+    station_atco_code : str
+    appearance : str
+    additional_information : str
+    """
+    __slots__ = ('atco_code', '_from_date', '_to_date', 'description', 'common_name', 'type', 'mode', 'station_atco_code', 'appearance', 'additional_information')
+    _schema = 'Tfl.Api.Presentation.Entities.DisruptedPoint'
+    _fields = (('atco_code', 'atcoCode'), ('_from_date', 'fromDate'), ('_to_date', 'toDate'), ('description', 'description'), ('common_name', 'commonName'), ('type', 'type'), ('mode', 'mode'), ('station_atco_code', 'stationAtcoCode'), ('appearance', 'appearance'), ('additional_information', 'additionalInformation'))
+    _types = ('string', 'date-time', 'date-time', 'string', 'string', 'string', 'string', 'string', 'string', 'string')
+    from_date = DateTimeField()
+    to_date = DateTimeField()
+
+class StopPointsResponse(Entity):
+    """
+    Tfl.Api.Presentation.Entities.StopPointsResponse
+
+    Attributes
+    ----------
+    centre_point : List[float]
+    stop_points : List[StopPoint]
+        Materialized on first access.
+    page_size : int
+    total : int
+    page : int
+    """
+    __slots__ = ('centre_point', '_stop_points', 'page_size', 'total', 'page')
+    _schema = 'Tfl.Api.Presentation.Entities.StopPointsResponse'
+    _fields = (('centre_point', 'centrePoint'), ('_stop_points', 'stopPoints'), ('page_size', 'pageSize'), ('total', 'total'), ('page', 'page'))
+    _types = ('array', 'array', 'integer', 'integer', 'integer')
+    stop_points = EntityListField('StopPoint')
+
+class RecommendationResponse(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.RecommendationResponse
+
+    Attributes
+    ----------
+    recommendations : List[Recommendation]
+        Materialized on first access.
+    """
+    __slots__ = ('_recommendations',)
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.RecommendationResponse'
+    _fields = (('_recommendations', 'recommendations'),)
+    _types = ('array',)
+    recommendations = EntityListField('Recommendation')
+
+class Recommendation(Entity):
+    """
+    Tfl.Api.Presentation.Entities.Fares.Recommendation
+
+    Attributes
+    ----------
+    id : int
+    rule : int
+    rank : int
+    fare_type : str
+    product : str
+    ticket_type : str
+    ticket_time : str
+    product_type : str
+    discount_card : str
+    zones : str
+    cost : str
+    price_description : str
+    price_comparison : str
+    recommended_top_up : str
+    notes : List[Message]
+        Materialized on first access.
+    key_features : List[Message]
+        Materialized on first access.
+    getting_your_ticket : List[Message]
+        Materialized on first access.
+    single_fare : float
+    """
+    __slots__ = ('id', 'rule', 'rank', 'fare_type', 'product', 'ticket_type', 'ticket_time', 'product_type', 'discount_card', 'zones', 'cost', 'price_description', 'price_comparison', 'recommended_top_up', '_notes', '_key_features', '_getting_your_ticket', 'single_fare')
+    _schema = 'Tfl.Api.Presentation.Entities.Fares.Recommendation'
+    _fields = (('id', 'id'), ('rule', 'rule'), ('rank', 'rank'), ('fare_type', 'fareType'), ('product', 'product'), ('ticket_type', 'ticketType'), ('ticket_time', 'ticketTime'), ('product_type', 'productType'), ('discount_card', 'discountCard'), ('zones', 'zones'), ('cost', 'cost'), ('price_description', 'priceDescription'), ('price_comparison', 'priceComparison'), ('recommended_top_up', 'recommendedTopUp'), ('_notes', 'notes'), ('_key_features', 'keyFeatures'), ('_getting_your_ticket', 'gettingYourTicket'), ('single_fare', 'singleFare'))
+    _types = ('integer', 'integer', 'integer', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'string', 'array', 'array', 'array', 'number')
+    notes = EntityListField('Message')
+    key_features = EntityListField('Message')
+    getting_your_ticket = EntityListField('Message')
+
+class ApiVersionInfo(Entity):
+    """
+    Tfl.Api.Common.ApiVersionInfo
+
+    Attributes
+    ----------
+    label : str
+    timestamp : datetime
+        Parsed on first access.
+    version : str
+    assemblies : List[str]
+    """
+    __slots__ = ('label', '_timestamp', 'version', 'assemblies')
+    _schema = 'Tfl.Api.Common.ApiVersionInfo'
+    _fields = (('label', 'label'), ('_timestamp', 'timestamp'), ('version', 'version'), ('assemblies', 'assemblies'))
+    _types = ('string', 'date-time', 'string', 'array')
+    timestamp = DateTimeField()
+
+RESPONSE_TYPES = ResponseTypes([
+    ('AccidentStats/{year}', 'AccidentDetail', True),
+    ('BikePoint', 'Place', True),
+    ('BikePoint/{id}', 'Place', False),
+    ('BikePoint/Search', 'Place', True),
+    ('Journey/Meta/Modes', 'Mode', True),
+    ('Journey/JourneyResults/{from}/to/{to}', 'ItineraryResult', False),
+    ('Line/Meta/Modes', 'Mode', True),
+    ('Line/Meta/Severity', 'StatusSeverity', True),
+    ('Line/{ids}', 'Line', True),
+    ('Line/Mode/{modes}', 'Line', True),
+    ('Line/Route', 'Line', True),
+    ('Line/{ids}/Route', 'Line', True),
+    ('Line/Mode/{modes}/Route', 'Line', True),
+    ('Line/{id}/Route/Sequence/{direction}', 'RouteSequence', False),
+    ('Line/{ids}/Status/{StartDate}/to/{EndDate}', 'Line', True),
+    ('Line/{ids}/Status', 'Line', True),
+    ('Line/Search/{query}', 'RouteSearchResponse', False),
+    ('Line/Status/{severity}', 'Line', True),
+    ('Line/Mode/{modes}/Status', 'Line', True),
+    ('Line/{id}/StopPoints', 'StopPoint', True),
+    ('Line/{id}/Timetable/{fromStopPointId}', 'TimetableResponse', False),
+    ('Line/{id}/Timetable/{fromStopPointId}/to/{toStopPointId}', 'TimetableResponse', False),
+    ('Line/{ids}/Disruption', 'Disruption', True),
+    ('Line/Mode/{modes}/Disruption', 'Disruption', True),
+    ('Line/{ids}/Arrivals/{stopPointId}', 'Prediction', True),
+    ('Mode/ActiveServiceTypes', 'ActiveServiceType', True),
+    ('Mode/{mode}/Arrivals', 'Prediction', True),
+    ('Occupancy/CarPark/{id}', 'CarParkOccupancy', False),
+    ('Occupancy/CarPark', 'CarParkOccupancy', True),
+    ('Occupancy/ChargeConnector/{ids}', 'ChargeConnectorOccupancy', True),
+    ('Occupancy/ChargeConnector', 'ChargeConnectorOccupancy', True),
+    ('Occupancy/BikePoints/{ids}', 'BikePointOccupancy', True),
+    ('Place/Meta/Categories', 'PlaceCategory', True),
+    ('Place/Meta/PlaceTypes', 'PlaceCategory', True),
+    ('Place/Type/{types}', 'Place', True),
+    ('Place/{id}', 'Place', True),
+    ('Place', 'StopPoint', True),
+    ('Place/Search', 'Place', True),
+    ('Road', 'RoadCorridor', True),
+    ('Road/{ids}', 'RoadCorridor', True),
+    ('Road/{ids}/Status', 'RoadCorridor', True),
+    ('Road/{ids}/Disruption', 'RoadDisruption', True),
+    ('Road/all/Disruption/{disruptionIds}', 'RoadDisruption', False),
+    ('Road/Meta/Severities', 'StatusSeverity', True),
+    ('Search', 'SearchResponse', False),
+    ('Search/BusSchedules', 'SearchResponse', False),
+    ('StopPoint/Meta/Categories', 'StopPointCategory', True),
+    ('StopPoint/Meta/Modes', 'Mode', True),
+    ('StopPoint/{ids}', 'StopPoint', True),
+    ('StopPoint/{id}/placeTypes', 'Place', True),
+    ('StopPoint/{id}/Crowding/{line}', 'StopPoint', True),
+    ('StopPoint/Type/{types}', 'StopPoint', True),
+    ('StopPoint/Type/{types}/page/{page}', 'StopPoint', True),
+    ('StopPoint/ServiceTypes', 'LineServiceType', True),
+    ('StopPoint/{id}/Arrivals', 'Prediction', True),
+    ('StopPoint/{id}/ArrivalDepartures', 'ArrivalDeparture', True),
+    ('StopPoint/{id}/CanReachOnLine/{lineId}', 'StopPoint', True),
+    ('StopPoint/{id}/Route', 'StopPointRouteSection', True),
+    ('StopPoint/Mode/{modes}/Disruption', 'DisruptedPoint', True),
+    ('StopPoint/{ids}/Disruption', 'DisruptedPoint', True),
+    ('StopPoint', 'StopPointsResponse', False),
+    ('StopPoint/Mode/{modes}', 'StopPointsResponse', False),
+    ('StopPoint/Search/{query}', 'SearchResponse', False),
+    ('StopPoint/Search', 'SearchResponse', False),
+    ('StopPoint/{stopPointId}/TaxiRanks', 'Place', True),
+    ('StopPoint/{stopPointId}/CarParks', 'Place', True),
+    ('Vehicle/{ids}/Arrivals', 'Prediction', True),
+])
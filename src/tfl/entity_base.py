@@ -0,0 +1,217 @@
+'''
+entity_base.py
+'''
+from typing import Any, Callable, Dict, List, Tuple
+from datetime import datetime
+from functools import lru_cache
+import re
+
+ENTITY_TYPES: Dict[str, type] = {}
+
+_FRACTION = re.compile(r'\.(\d+)')
+
+def parse_datetime(value: str) -> datetime|str:
+    """
+    Parse a TfL ISO 8601 timestamp such as '2023-12-25T15:49:28.801Z'.
+
+    Returns the original string if it cannot be parsed.
+    """
+    text = value.replace('Z', '+00:00') if value.endswith('Z') else value
+    # datetime.fromisoformat before Python 3.11 only accepts 3 or 6 fractional digits
+    text = _FRACTION.sub(lambda match: '.' + match.group(1)[:6].ljust(6, '0'), text, count=1)
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return value
+
+class _LazyField():
+    """
+    Descriptor that converts the raw JSON value held in a private slot on first access
+    and stores the converted value back in the slot.
+    """
+    __slots__ = ('slot', 'name')
+
+    def __init__(self) -> None:
+        self.slot = None
+        self.name = None
+
+    def __set_name__(self, owner, name) -> None:
+        self.name = name
+        self.slot = owner.__dict__['_' + name]
+
+    def is_raw(self, value) -> bool:
+        raise NotImplementedError
+
+    def convert(self, value):
+        raise NotImplementedError
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if value is not None and self.is_raw(value):
+            value = self.convert(value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        self.slot.__set__(obj, value)
+
+class DateTimeField(_LazyField):
+    """
+    Lazily parsed date-time field.
+    """
+    __slots__ = ()
+
+    def is_raw(self, value) -> bool:
+        return isinstance(value, str)
+
+    def convert(self, value):
+        return parse_datetime(value)
+
+class EntityField(_LazyField):
+    """
+    Lazily materialized nested entity.
+    """
+    __slots__ = ('entity_name',)
+
+    def __init__(self, entity_name: str) -> None:
+        super().__init__()
+        self.entity_name = entity_name
+
+    def is_raw(self, value) -> bool:
+        return isinstance(value, dict)
+
+    def convert(self, value):
+        return ENTITY_TYPES[self.entity_name].from_dict(value)
+
+class EntityListField(_LazyField):
+    """
+    Lazily materialized list of nested entities.
+    """
+    __slots__ = ('entity_name',)
+
+    def __init__(self, entity_name: str) -> None:
+        super().__init__()
+        self.entity_name = entity_name
+
+    def is_raw(self, value) -> bool:
+        return isinstance(value, list) and not isinstance(value, EntityList)
+
+    def convert(self, value):
+        return EntityList(ENTITY_TYPES[self.entity_name].from_dict(item) for item in value)
+
+class EntityList(list):
+    """
+    List of entities produced by an EntityListField.
+    """
+    __slots__ = ()
+
+class Entity():
+    """
+    Base class for the generated TfL API entities.
+
+    Scalar fields are plain slots; date-time, nested entity and entity list fields keep the
+    raw JSON value until they are first accessed.
+
+    Attributes
+    ----------
+    _fields : Tuple[Tuple[str, str], ...]
+        (slot name, JSON key) pairs for every field of the entity.
+    _types : Tuple[str, ...]
+        Swagger type of every field, in the order of _fields: 'string', 'integer', 'number',
+        'boolean', 'date-time', 'array' or 'object'.
+    """
+    __slots__ = ()
+    _fields: Tuple[Tuple[str, str], ...] = ()
+    _types: Tuple[str, ...] = ()
+    _schema: str = ''
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        ENTITY_TYPES[cls.__name__] = cls
+
+    def __init__(self, **kwargs) -> None:
+        for slot, _ in self._fields:
+            setattr(self, slot, kwargs.get(slot.lstrip('_')))
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """
+        Build an entity from a decoded JSON object without converting nested values.
+        """
+        obj = cls.__new__(cls)
+        get = data.get
+        for slot, key in cls._fields:
+            object.__setattr__(obj, slot, get(key))
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the entity as a JSON compatible dict keyed on the API field names.
+        """
+        result = {}
+        for slot, key in self._fields:
+            value = object.__getattribute__(self, slot)
+            result[key] = _to_json(value)
+        return result
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        shown = []
+        for slot, _ in self._fields[:3]:
+            shown.append(f'{slot.lstrip("_")}={object.__getattribute__(self, slot)!r}')
+        return f'{type(self).__name__}({", ".join(shown)}, ...)'
+
+def _to_json(value):
+    if isinstance(value, Entity):
+        return value.to_dict()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    return value
+
+def _compile_path(template: str) -> re.Pattern:
+    return re.compile('^' + re.sub(r'\\\{[^/]+?\\\}', '[^/]+', re.escape(template)) + '$')
+
+class ResponseTypes():
+    """
+    Maps request paths to the entity type of their response.
+
+    Parameters
+    ----------
+    routes : List[Tuple[str, str, bool]]
+        (path template, entity name, is array) triples, e.g. ('Line/{ids}/Status', 'Line', True).
+        Templates with more literal segments are tried first.
+    """
+    def __init__(self, routes: List[Tuple[str, str, bool]]) -> None:
+        ordered = sorted(routes, key=lambda route: -sum('{' not in part for part in route[0].split('/')))
+        self._routes = [(_compile_path(template), entity, is_array) for template, entity, is_array in ordered]
+        self.converter_for = lru_cache(maxsize=1024)(self._converter_for)
+
+    def entity_for(self, path: str) -> Tuple[type, bool]|None:
+        """
+        Returns the (entity type, is array) of the response for path, or None if it is not an entity.
+        """
+        path = path.strip('/')
+        for pattern, entity, is_array in self._routes:
+            if pattern.match(path):
+                return ENTITY_TYPES[entity], is_array
+        return None
+
+    def _converter_for(self, path: str) -> Callable[[Any], Any]|None:
+        """
+        Returns a function converting the decoded response for path into entities, or None.
+        """
+        match = self.entity_for(path)
+        if match is None:
+            return None
+        entity_type, is_array = match
+        if is_array:
+            return lambda data: EntityList(entity_type.from_dict(item) for item in data) if isinstance(data, list) else data
+        return lambda data: entity_type.from_dict(data) if isinstance(data, dict) else data
@@ -10,10 +10,13 @@ class TFLAPIException(Exception):
         try:
             json_res = json.loads(text)
         except ValueError:
-            self.message = f'Invalid JSON error message from TFL: {response.text}'
+            self.message = f'Invalid JSON error message from TFL: {text}'
         else:
-            self.code = json_res['httpStatusCode']
-            self.message = json_res['message']
+            if not isinstance(json_res, dict):
+                json_res = {}
+            # throttling answers from the API gateway use statusCode rather than httpStatusCode
+            self.code = json_res.get('httpStatusCode', json_res.get('statusCode', status_code))
+            self.message = json_res.get('message', text)
         self.status_code = status_code
         self.response = response
         self.request = getattr(response, 'request', None)
@@ -30,3 +33,9 @@ class TFLRequestException(Exception):
 
     def __str__(self):
         return f'TFLRequestException: {self.message}'
+
+class CircuitOpenError(TFLRequestException):
+    """
+    Exception for a request refused without being sent because the circuit breaker of its
+    endpoint is open and no earlier response is available.
+    """
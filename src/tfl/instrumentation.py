@@ -0,0 +1,188 @@
+'''
+instrumentation.py
+'''
+from typing import Any, Callable, Dict, List
+import threading
+import time
+
+BEFORE_REQUEST = 'before_request'
+AFTER_RESPONSE = 'after_response'
+ON_ERROR = 'on_error'
+HOOK_EVENTS = (BEFORE_REQUEST, AFTER_RESPONSE, ON_ERROR)
+
+# where a response came from
+NETWORK = 'network'
+CACHE = 'cache'
+SNAPSHOT = 'snapshot'
+COALESCED = 'coalesced'
+STALE = 'stale'
+
+class RequestRecord():
+    """
+    What happened to one client request, handed to the hooks.
+
+    A record is created per call of the client (e.g. one ``client.get``) and follows it through
+    the snapshot, the cache, single-flight and every HTTP attempt. The timings describe the last
+    HTTP attempt; they stay None when the response did not come from the network.
+
+    Attributes
+    ----------
+    method : str
+        'get', 'post', ...
+    path : str
+        Path relative to the api url e.g. 'StopPoint/940GZZLUOXC/Arrivals'.
+    params : Dict | None
+        Query parameters of the request.
+    start : float
+        ``time.perf_counter()`` when the request was made.
+    elapsed : float | None
+        Seconds until the response was returned or the error raised, retries included.
+    source : str | None
+        NETWORK, CACHE, SNAPSHOT, COALESCED (answered by the identical request in flight) or STALE
+        (the last good response, served by a ResiliencePolicy).
+    age : float | None
+        Age in seconds of a STALE response.
+    cache : str | None
+        'hit' or 'miss' when the request was cacheable by the client's cache, else None.
+    attempts : int
+        HTTP attempts made; more than one means throttled answers were retried.
+    status : int | None
+        HTTP status of the last attempt.
+    bytes : int | None
+        Size of the last response body.
+    connect, ttfb, download, decode : float | None
+        Seconds spent opening a connection (0 for a reused one), waiting for the response headers,
+        reading the body and decoding it.
+    error : BaseException | None
+        The exception raised to the caller, for ON_ERROR hooks.
+    """
+    __slots__ = ('method', 'path', 'params', 'start', 'elapsed', 'source', 'age', 'cache', 'attempts', 'status', 'bytes', 'connect', 'ttfb', 'download', 'decode', 'error')
+
+    def __init__(self, method: str, path: str, params: Dict|None = None) -> None:
+        self.method = method
+        self.path = path
+        self.params = params
+        self.start = time.perf_counter()
+        self.elapsed = None
+        self.source = None
+        self.age = None
+        self.cache = None
+        self.attempts = 0
+        self.status = None
+        self.bytes = None
+        self.connect = None
+        self.ttfb = None
+        self.download = None
+        self.decode = None
+        self.error = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def __repr__(self) -> str:
+        return f'RequestRecord({self.method.upper()} {self.path}, source={self.source}, status={self.status}, elapsed={self.elapsed})'
+
+class Hooks():
+    """
+    Callbacks run around the requests of a client.
+
+    ``before_request`` hooks run before every HTTP attempt, ``after_response`` hooks once a call
+    returns, wherever the response came from, and ``on_error`` hooks when a call raises. Each
+    receives the RequestRecord of the call. Exceptions raised by a hook propagate to the caller.
+
+    When no hook is subscribed the client skips all bookkeeping, so an idle Hooks costs nothing.
+
+    Examples
+    --------
+    >>> @client.hooks.subscribe(AFTER_RESPONSE)
+    ... def log(record):
+    ...     print(record.path, record.status, record.elapsed)
+    >>> client.hooks.add(MetricsCollector())
+    """
+    def __init__(self) -> None:
+        self._callbacks: Dict[str, List[Callable[[RequestRecord], Any]]] = {event: [] for event in HOOK_EVENTS}
+        self._active = False
+
+    def __bool__(self) -> bool:
+        return self._active
+
+    def subscribe(self, event: str, callback: Callable[[RequestRecord], Any]|None = None):
+        """
+        Call callback with the record of every request at event; usable as a decorator.
+        """
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown hook event {event}, expected any of {', '.join(HOOK_EVENTS)}")
+        if callback is None:
+            return lambda function: self.subscribe(event, function)
+        # copy on write so requests in other threads iterate over a stable list
+        self._callbacks[event] = self._callbacks[event] + [callback]
+        self._active = True
+        return callback
+
+    def unsubscribe(self, event: str, callback: Callable[[RequestRecord], Any]) -> None:
+        """
+        Stop calling callback at event.
+        """
+        callbacks = list(self._callbacks[event])
+        callbacks.remove(callback)
+        self._callbacks[event] = callbacks
+        self._active = any(self._callbacks.values())
+
+    def add(self, observer) -> None:
+        """
+        Subscribe the before_request, after_response and on_error methods that observer defines.
+        """
+        for event in HOOK_EVENTS:
+            if callable(getattr(observer, event, None)):
+                self.subscribe(event, getattr(observer, event))
+
+    def remove(self, observer) -> None:
+        """
+        Unsubscribe the methods subscribed by add.
+        """
+        for event in HOOK_EVENTS:
+            method = getattr(observer, event, None)
+            if method in self._callbacks[event]:
+                self.unsubscribe(event, method)
+
+    def emit(self, event: str, record: RequestRecord) -> None:
+        for callback in self._callbacks[event]:
+            callback(record)
+
+_connect_time = threading.local()
+
+def take_connect_time() -> float:
+    """
+    Returns the seconds the current thread spent opening connections since the last call.
+    """
+    seconds = getattr(_connect_time, 'seconds', 0.0)
+    _connect_time.seconds = 0.0
+    return seconds
+
+_POOL_CLASSES = None
+
+def timed_pool_classes() -> Dict[str, type]:
+    """
+    Returns urllib3 connection pool classes, by scheme, whose connections time their connect
+    (TCP and TLS handshakes) for ``take_connect_time``.
+    """
+    global _POOL_CLASSES
+    if _POOL_CLASSES is None:
+        from urllib3.connection import HTTPConnection, HTTPSConnection
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+        def timed(connection_class):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    connection_class.connect(self)
+                finally:
+                    _connect_time.seconds = getattr(_connect_time, 'seconds', 0.0) + time.perf_counter() - start
+            return type(f'Timed{connection_class.__name__}', (connection_class,), {'connect': connect})
+
+        _POOL_CLASSES = {
+            'http': type('TimedHTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': timed(HTTPConnection)}),
+            'https': type('TimedHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': timed(HTTPSConnection)}),
+        }
+    return _POOL_CLASSES
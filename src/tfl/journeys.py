@@ -0,0 +1,340 @@
+'''
+journeys.py
+'''
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+from collections import OrderedDict
+from datetime import datetime
+import hashlib
+import re
+import threading
+import time
+from tfl.entity_base import Entity
+
+_LAT_LON = re.compile(r'^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$')
+_POSTCODE = re.compile(r'^[A-Z]{1,2}\d[A-Z\d]?\d[A-Z]{2}$')
+_CODE = re.compile(r'^[0-9A-Za-z]+$')
+
+def normalize_location(value: str, precision: int = 3) -> Tuple:
+    """
+    Reduce a journey planner location to a cache key component.
+
+    "lat,lon" coordinates are rounded to precision decimals (3 is about 100 m), so nearby origins
+    share results. Postcodes and stop ids (NaPTAN or ICS) are upper cased without spaces and free
+    text is case folded with whitespace collapsed.
+    """
+    match = _LAT_LON.match(value)
+    if match:
+        return ('ll', round(float(match.group(1)), precision), round(float(match.group(2)), precision))
+    compact = value.replace(' ', '').upper()
+    if _POSTCODE.match(compact):
+        return ('postcode', compact)
+    if _CODE.match(value.strip()):
+        return ('id', value.strip().upper())
+    return ('text', ' '.join(value.split()).casefold())
+
+def _normalize_option(value: Any) -> Any:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(str(item).strip().lower() for item in value))
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+def lines_used(result: Any) -> Set[str]:
+    """
+    Returns the ids of the lines an ItineraryResult travels on, from its legs' route options.
+    """
+    if isinstance(result, Entity):
+        result = result.to_dict()
+    lines = {line['id'] for line in result.get('lines') or [] if line.get('id')}
+    for journey in result.get('journeys') or []:
+        for leg in journey.get('legs') or []:
+            for option in leg.get('routeOptions') or []:
+                identifier = option.get('lineIdentifier') or {}
+                if identifier.get('id'):
+                    lines.add(identifier['id'])
+    return lines
+
+def _disruption_digest(disruption: Dict) -> str:
+    parts = (disruption.get('category'), disruption.get('description'), disruption.get('lastUpdate'))
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+class _Entry():
+    __slots__ = ('value', 'fetched', 'lines', 'refreshing')
+
+    def __init__(self, value: Any, fetched: float, lines: Set[str]) -> None:
+        self.value = value
+        self.fetched = fetched
+        self.lines = lines
+        self.refreshing = False
+
+class JourneyCache():
+    """
+    Result cache in front of ``client.journey.journey_results``, the most expensive TfL call.
+
+    Requests are keyed on their normalized origin, destination and via (see normalize_location),
+    the time bucket they fall in and their remaining options with None dropped and lists sorted.
+    Departures "now" fall in the bucket of the current time. Results younger than ttl are served
+    from memory; results up to stale_ttl older than that are served at once while a background
+    refresh fetches a new one. Older results, and requests never seen, are fetched synchronously.
+
+    Every cached itinerary remembers the lines it travels on. check_disruptions asks
+    Line/{ids}/Disruption about those lines and drops the itineraries using a line whose
+    disruptions changed since the previous check; with disruption_interval set the check runs in
+    the background during lookups.
+
+    Parameters
+    ----------
+    client : Client
+        Blocking client used for the requests.
+    ttl : float, default: 120.0
+        Seconds a result is served without a refresh.
+    stale_ttl : float, default: 600.0
+        Further seconds a result is served while it is refreshed in the background.
+    time_bucket : float, default: 300.0
+        Width in seconds of the departure / arrival time buckets.
+    location_precision : int, default: 3
+        Decimals coordinates are rounded to.
+    max_entries : int, default: 512
+        Results kept, least recently used first out.
+    disruption_interval : float | None, default: 60.0
+        Seconds between background disruption checks, None to only check when check_disruptions
+        is called.
+    refresh_workers : int, default: 2
+        Threads for the background refreshes and disruption checks.
+    clock : Callable[[], float], default: time.time
+
+    Attributes
+    ----------
+    hits, stale_hits, misses, refreshes, invalidations : int
+        Counters since creation.
+    errors : int
+        Background refreshes and disruption checks that raised.
+    last_error : Exception | None
+        Exception of the latest failed background task.
+
+    Examples
+    --------
+    >>> journeys = JourneyCache(client)
+    >>> result = journeys.journey_results('940GZZLUOXC', '940GZZLUVIC', mode=['tube'])
+    >>> journeys.journey_results('940gzzluoxc', '940GZZLUVIC', mode=['tube'])  # from the cache
+    """
+    def __init__(self, client, ttl: float = 120.0, stale_ttl: float = 600.0, time_bucket: float = 300.0, location_precision: int = 3, max_entries: int = 512, disruption_interval: float|None = 60.0, refresh_workers: int = 2, clock: Callable[[], float] = time.time) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.time_bucket = time_bucket
+        self.location_precision = location_precision
+        self.max_entries = max_entries
+        self.disruption_interval = disruption_interval
+        self.refresh_workers = refresh_workers
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.invalidations = 0
+        self.errors = 0
+        self.last_error = None
+        self._entries: 'OrderedDict[Tuple, _Entry]' = OrderedDict()
+        self._by_line: Dict[str, Set[Tuple]] = {}
+        self._disruptions: Dict[str, Tuple[str, ...]] = {}
+        self._last_check = clock()
+        self._checking = False
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def key_for(self, from_: str, to: str, **options) -> Tuple:
+        """
+        Returns the cache key of a journey_results call.
+        """
+        via = options.pop('via', None)
+        date, time_of_day = options.pop('date', None), options.pop('time', None)
+        time_is = (options.pop('time_is', None) or 'departing').lower()
+        if date is None and time_of_day is None:
+            bucket = ('now', int(self.clock() // self.time_bucket))
+        else:
+            day = date or datetime.fromtimestamp(self.clock()).strftime('%Y%m%d')
+            minutes = int(time_of_day[:2]) * 60 + int(time_of_day[2:4]) if time_of_day else 0
+            bucket = (day, int(minutes * 60 // self.time_bucket))
+        normalized = tuple(sorted((name, _normalize_option(value)) for name, value in options.items() if value is not None))
+        precision = self.location_precision
+        return (
+            normalize_location(from_, precision),
+            normalize_location(to, precision),
+            None if via is None else normalize_location(via, precision),
+            time_is,
+            bucket,
+            normalized,
+        )
+
+    def journey_results(self, from_: str, to: str, **options) -> Any:
+        """
+        Cached ``client.journey.journey_results``, taking the same arguments.
+        """
+        key = self.key_for(from_, to, **options)
+        now = self.clock()
+        cached = refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.fetched < self.ttl + self.stale_ttl:
+                cached = True
+                self._entries.move_to_end(key)
+                if now - entry.fetched < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    refresh = not entry.refreshing
+                    entry.refreshing = True
+            else:
+                self.misses += 1
+            check = self._check_due(now)
+        if refresh:
+            self._submit(self._refresh, key, from_, to, options)
+        if check:
+            self._submit(self._background_check)
+        if cached:
+            return entry.value
+        return self._fetch(key, from_, to, options)
+
+    def _fetch(self, key: Tuple, from_: str, to: str, options: Dict) -> Any:
+        result = self.client.journey.journey_results(from_, to, **options)
+        if isinstance(result, (dict, Entity)):
+            self._store(key, result)
+        return result
+
+    def _refresh(self, key: Tuple, from_: str, to: str, options: Dict) -> None:
+        try:
+            self._fetch(key, from_, to, options)
+            with self._lock:
+                self.refreshes += 1
+        finally:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+
+    def _store(self, key: Tuple, result: Any) -> None:
+        lines = lines_used(result)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _Entry(result, self.clock(), lines)
+            for line in lines:
+                self._by_line.setdefault(line, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: Tuple) -> None:
+        # caller holds the lock
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for line in entry.lines:
+            keys = self._by_line.get(line)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    # no itinerary uses the line any more, so its disruptions stop being tracked
+                    del self._by_line[line]
+                    self._disruptions.pop(line, None)
+
+    def invalidate_lines(self, line_ids: Iterable[str]) -> int:
+        """
+        Drop every cached itinerary travelling on one of line_ids, returning how many were dropped.
+        """
+        with self._lock:
+            keys = set()
+            for line in line_ids:
+                keys |= self._by_line.get(line, set())
+            for key in keys:
+                self._discard(key)
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def check_disruptions(self) -> List[str]:
+        """
+        Compare the disruptions of the lines used by cached itineraries with the previous check and
+        invalidate the itineraries on lines whose disruptions changed.
+
+        A line seen for the first time only records its disruptions. Returns the changed line ids.
+        """
+        with self._lock:
+            line_ids = sorted(self._by_line)
+            self._last_check = self.clock()
+        if not line_ids:
+            return []
+        digests: Dict[str, List[str]] = {line: [] for line in line_ids}
+        for disruption in self.client.line.get_disruptions_for_line_ids(line_ids):
+            if isinstance(disruption, Entity):
+                disruption = disruption.to_dict()
+            affected = {route.get('lineId') for route in disruption.get('affectedRoutes') or []} & digests.keys()
+            # a disruption without affected routes is charged to every line asked about
+            for line in affected or line_ids:
+                digests[line].append(_disruption_digest(disruption))
+        changed = []
+        with self._lock:
+            for line in line_ids:
+                state = tuple(sorted(digests[line]))
+                previous = self._disruptions.get(line)
+                if previous is not None and previous != state:
+                    changed.append(line)
+                self._disruptions[line] = state
+        self.invalidate_lines(changed)
+        return changed
+
+    def _check_due(self, now: float) -> bool:
+        # caller holds the lock
+        if self.disruption_interval is None or self._checking or now - self._last_check < self.disruption_interval:
+            return False
+        self._checking = True
+        return True
+
+    def _background_check(self) -> None:
+        try:
+            self.check_disruptions()
+        finally:
+            with self._lock:
+                self._checking = False
+
+    def _submit(self, function: Callable, *args) -> None:
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=self.refresh_workers, thread_name_prefix='tfl-journey')
+            executor = self._executor
+        executor.submit(function, *args).add_done_callback(self._background_done)
+
+    def _background_done(self, future) -> None:
+        exc = None if future.cancelled() else future.exception()
+        if exc is not None:
+            with self._lock:
+                self.errors += 1
+                self.last_error = exc
+
+    def clear(self) -> None:
+        """
+        Drop every cached itinerary and the recorded disruptions.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._by_line.clear()
+            self._disruptions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters, including failed background tasks, and the number of cached
+        itineraries and lines they use.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses, 'refreshes': self.refreshes, 'invalidations': self.invalidations, 'errors': self.errors, 'entries': len(self._entries), 'lines': len(self._by_line)}
+
+    def close(self) -> None:
+        """
+        Wait for the background refreshes and checks in progress and stop their threads.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,236 @@
+'''
+metrics.py
+'''
+from typing import Dict, Iterable, List, Sequence, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+import re
+import threading
+from tfl.instrumentation import CACHE, NETWORK, RequestRecord
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_SIZE_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+PHASES = ('total', 'connect', 'ttfb', 'download', 'decode')
+OTHER = 'other'
+
+class TemplateMatcher():
+    """
+    Maps request paths to the path template of their API operation, e.g.
+    'StopPoint/940GZZLUOXC/Arrivals' to 'StopPoint/{id}/Arrivals', or OTHER.
+
+    Templates with more literal segments are tried first and lookups are memoized per path.
+    """
+    def __init__(self, templates: Iterable[str], cache_size: int = 4096) -> None:
+        ordered = sorted(set(templates), key=lambda template: -sum('{' not in part for part in template.split('/')))
+        self._by_head: Dict[str, List[Tuple[re.Pattern, str]]] = {}
+        for template in ordered:
+            pattern = re.compile('^' + re.sub(r'\\\{[^/]+?\\\}', '[^/]+', re.escape(template)) + '$', re.IGNORECASE)
+            self._by_head.setdefault(template.split('/')[0].lower(), []).append((pattern, template))
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, path: str) -> str:
+        path = path.strip('/')
+        for pattern, template in self._by_head.get(path.split('/')[0].lower(), ()):
+            if pattern.match(path):
+                return template
+        return OTHER
+
+class Histogram():
+    """
+    Fixed bucket histogram; counts are kept per bucket and made cumulative on export.
+    """
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        Returns the (upper bound, cumulative count) pairs, ending with '+Inf'.
+        """
+        total, pairs = 0, []
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            pairs.append((bound if isinstance(bound, str) else repr(bound), total))
+        return pairs
+
+    def to_dict(self) -> Dict:
+        return {'buckets': dict(self.cumulative()), 'sum': self.sum, 'count': self.count}
+
+class EndpointMetrics():
+    """
+    Metrics of the requests to one endpoint template.
+    """
+    __slots__ = ('requests', 'errors', 'retries', 'sources', 'statuses', 'cache', 'latency', 'bytes')
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.sources: Dict[str, int] = {}
+        self.statuses: Dict[int, int] = {}
+        self.cache = {'hit': 0, 'miss': 0}
+        self.latency = {phase: Histogram(latency_buckets) for phase in PHASES}
+        self.bytes = Histogram(size_buckets)
+
+    def to_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'sources': dict(self.sources),
+            'statuses': dict(self.statuses),
+            'cache': dict(self.cache),
+            'latency': {phase: histogram.to_dict() for phase, histogram in self.latency.items()},
+            'bytes': self.bytes.to_dict(),
+        }
+
+def _label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class MetricsCollector():
+    """
+    Per endpoint request metrics gathered through the client hooks.
+
+    Requests are grouped on their method and path template, so ids do not multiply the series.
+    For every group the collector counts requests by source (network, cache, snapshot,
+    coalesced), HTTP statuses, cache hits and misses, retries and errors, and keeps histograms of
+    the response sizes and of the latency of network responses, split into the connect, ttfb
+    (waiting for the response headers), download and decode phases next to the total.
+
+    Updating the metrics costs a memoized template lookup and a few bisections per request, cheap
+    enough to stay enabled in production.
+
+    Parameters
+    ----------
+    latency_buckets : Sequence[float], default: DEFAULT_LATENCY_BUCKETS
+        Upper bounds, in seconds, of the latency histogram buckets.
+    size_buckets : Sequence[float], default: DEFAULT_SIZE_BUCKETS
+        Upper bounds, in bytes, of the response size histogram buckets.
+    templates : Iterable[str] | None, optional
+        Path templates requests are grouped on, by default every GET operation of the API.
+
+    Examples
+    --------
+    >>> metrics = MetricsCollector().attach(client)
+    >>> client.line.get_line_status(['victoria'], False)
+    >>> metrics.to_dict()['GET Line/{ids}/Status']['latency']['ttfb']['sum']
+    >>> print(metrics.to_prometheus())
+    """
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS, templates: Iterable[str]|None = None) -> None:
+        if templates is None:
+            from tfl.endpoints import PATH_TEMPLATES
+            templates = PATH_TEMPLATES
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.matcher = TemplateMatcher(templates)
+        self.endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, client) -> 'MetricsCollector':
+        """
+        Subscribe to the hooks of client, returning the collector.
+        """
+        client.hooks.add(self)
+        return self
+
+    def detach(self, client) -> None:
+        client.hooks.remove(self)
+
+    def _metrics_for(self, record: RequestRecord) -> EndpointMetrics:
+        key = (record.method.upper(), self.matcher.match(record.path))
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints[key] = EndpointMetrics(self.latency_buckets, self.size_buckets)
+        return metrics
+
+    def _count(self, metrics: EndpointMetrics, record: RequestRecord) -> None:
+        metrics.requests += 1
+        metrics.retries += record.retries
+        if record.source is not None:
+            metrics.sources[record.source] = metrics.sources.get(record.source, 0) + 1
+        if record.cache is not None:
+            metrics.cache[record.cache] += 1
+        if record.status is not None and record.source != CACHE:
+            metrics.statuses[record.status] = metrics.statuses.get(record.status, 0) + 1
+
+    def after_response(self, record: RequestRecord) -> None:
+        with self._lock:
+            metrics = self._metrics_for(record)
+            self._count(metrics, record)
+            if record.source == NETWORK:
+                latency = metrics.latency
+                latency['total'].observe(record.elapsed)
+                # phases are None when the request was not timed, e.g. a stale answer
+                for phase in ('connect', 'ttfb', 'download', 'decode'):
+                    value = getattr(record, phase)
+                    if value is not None:
+                        latency[phase].observe(value)
+                if record.bytes is not None:
+                    metrics.bytes.observe(record.bytes)
+
+    def on_error(self, record: RequestRecord) -> None:
+        with self._lock:
+            metrics = self._metrics_for(record)
+            self._count(metrics, record)
+            metrics.errors += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints.clear()
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """
+        Returns the metrics keyed on 'METHOD template'.
+        """
+        with self._lock:
+            return {f'{method} {template}': metrics.to_dict() for (method, template), metrics in sorted(self.endpoints.items())}
+
+    def to_prometheus(self, prefix: str = 'tfl_client') -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        families = {
+            'requests_total': ('counter', 'Requests by source.', []),
+            'responses_total': ('counter', 'HTTP responses by status code.', []),
+            'cache_total': ('counter', 'Response cache lookups by result.', []),
+            'retries_total': ('counter', 'Retried HTTP attempts.', []),
+            'errors_total': ('counter', 'Requests that raised.', []),
+            'request_duration_seconds': ('histogram', 'Latency of network responses by phase.', []),
+            'response_size_bytes': ('histogram', 'Size of network response bodies.', []),
+        }
+        with self._lock:
+            for (method, template), metrics in sorted(self.endpoints.items()):
+                labels = f'method="{method}",endpoint="{_label(template)}"'
+                families['requests_total'][2].extend(f'{{{labels},source="{source}"}} {count}' for source, count in sorted(metrics.sources.items()))
+                families['responses_total'][2].extend(f'{{{labels},status="{status}"}} {count}' for status, count in sorted(metrics.statuses.items()))
+                if any(metrics.cache.values()):
+                    families['cache_total'][2].extend(f'{{{labels},result="{result}"}} {count}' for result, count in metrics.cache.items())
+                families['retries_total'][2].append(f'{{{labels}}} {metrics.retries}')
+                families['errors_total'][2].append(f'{{{labels}}} {metrics.errors}')
+                for phase, histogram in metrics.latency.items():
+                    families['request_duration_seconds'][2].extend(self._histogram_samples(f'{labels},phase="{phase}"', histogram))
+                families['response_size_bytes'][2].extend(self._histogram_samples(labels, metrics.bytes))
+        lines = []
+        for name, (kind, description, samples) in families.items():
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            for sample in samples:
+                # histogram samples carry their own suffix
+                lines.append(f'{prefix}_{name}{sample}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _histogram_samples(labels: str, histogram: Histogram) -> List[str]:
+        samples = [f'_bucket{{{labels},le="{bound}"}} {count}' for bound, count in histogram.cumulative()]
+        samples.append(f'_sum{{{labels}}} {histogram.sum!r}')
+        samples.append(f'_count{{{labels}}} {histogram.count}')
+        return samples
@@ -0,0 +1,295 @@
+'''
+network.py
+'''
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from array import array
+from collections import deque
+from pathlib import Path
+import json
+import struct
+
+_MAGIC = b'TFLNET'
+_VERSION = 1
+
+def _csr(count: int, pairs: Iterable[Tuple[int, int]], extra: Iterable[int]|None = None):
+    """
+    Build compressed sparse row arrays (offsets, targets[, extra]) from (row, target) pairs.
+    """
+    pairs = list(pairs)
+    extra = list(extra) if extra is not None else None
+    order = sorted(range(len(pairs)), key=lambda i: pairs[i])
+    offsets = array('i', [0]) * (count + 1)
+    for row, _ in pairs:
+        offsets[row + 1] += 1
+    for i in range(count):
+        offsets[i + 1] += offsets[i]
+    targets = array('i', (pairs[i][1] for i in order))
+    values = array('i', (extra[i] for i in order)) if extra is not None else None
+    return offsets, targets, values
+
+class NetworkIndex():
+    """
+    Compact stop/line graph built from RouteSequence responses for answering path questions offline.
+
+    Stop and line ids are interned to integers and adjacency is held in CSR-style ``array`` buffers:
+    ``offsets[s]:offsets[s + 1]`` slices ``targets`` (next stops) and ``edge_lines`` (line of each edge)
+    for stop ``s``, and likewise ``line_offsets`` / ``stop_lines`` give the lines calling at each stop.
+
+    Parameters
+    ----------
+    stop_ids : Sequence[str]
+        Interned stop ids; a stop's integer id is its position.
+    line_ids : Sequence[str]
+        Interned line ids.
+    edges : Iterable[Tuple[int, int, int]]
+        (from stop, to stop, line) triples.
+    stop_names : Dict[str, str] | None, optional
+        Display names keyed on stop id.
+
+    See Also
+    --------
+    NetworkIndex.from_route_sequences : Build an index from Line/{id}/Route/Sequence/{direction} responses.
+
+    Examples
+    --------
+    >>> index = NetworkIndex.from_client(client, ['victoria', 'jubilee'])
+    >>> index.shortest_path('940GZZLUBXN', '940GZZLUSTD')
+    >>> index.save('network.idx')
+    >>> index = NetworkIndex.load('network.idx')
+    """
+    def __init__(self, stop_ids: Sequence[str], line_ids: Sequence[str], edges: Iterable[Tuple[int, int, int]], stop_names: Dict[str, str]|None = None) -> None:
+        self.stop_ids = list(stop_ids)
+        self.line_ids = list(line_ids)
+        self.stop_names = dict(stop_names or {})
+        self._stop_index = {stop_id: i for i, stop_id in enumerate(self.stop_ids)}
+        self._line_index = {line_id: i for i, line_id in enumerate(self.line_ids)}
+        edges = sorted(set(edges))
+        self.offsets, self.targets, self.edge_lines = _csr(len(self.stop_ids), ((u, v) for u, v, _ in edges), (line for _, _, line in edges))
+        memberships = sorted({(u, line) for u, _, line in edges} | {(v, line) for _, v, line in edges})
+        self.line_offsets, self.stop_lines, _ = _csr(len(self.stop_ids), memberships)
+        line_stops = sorted((line, stop) for stop, line in memberships)
+        self.stop_offsets, self.line_stops, _ = _csr(len(self.line_ids), line_stops)
+
+    @classmethod
+    def from_route_sequences(cls, sequences: Iterable[Dict]) -> 'NetworkIndex':
+        """
+        Build an index from decoded RouteSequence responses.
+
+        Consecutive stops of each ``orderedLineRoutes[].naptanIds`` and of each
+        ``stopPointSequences[].stopPoint`` branch become edges labelled with the ``lineId``.
+        """
+        stop_index: Dict[str, int] = {}
+        line_index: Dict[str, int] = {}
+        names: Dict[str, str] = {}
+        edges: Set[Tuple[int, int, int]] = set()
+
+        def intern(table, key):
+            value = table.get(key)
+            if value is None:
+                value = table[key] = len(table)
+            return value
+
+        def add_path(stops, line):
+            previous = None
+            for stop_id in stops:
+                current = intern(stop_index, stop_id)
+                if previous is not None and previous != current:
+                    edges.add((previous, current, line))
+                previous = current
+
+        for sequence in sequences:
+            if hasattr(sequence, 'to_dict'):
+                sequence = sequence.to_dict()
+            line = intern(line_index, sequence['lineId'])
+            for branch in sequence.get('stopPointSequences') or []:
+                stops = branch.get('stopPoint') or []
+                for stop in stops:
+                    if stop.get('name'):
+                        names.setdefault(stop['id'], stop['name'])
+                add_path((stop['id'] for stop in stops), line)
+            for route in sequence.get('orderedLineRoutes') or []:
+                add_path(route.get('naptanIds') or [], line)
+        return cls(list(stop_index), list(line_index), edges, names)
+
+    @classmethod
+    def from_client(cls, client, line_ids: Iterable[str], directions: Sequence[str] = ('inbound', 'outbound'), service_types: List[str] = ["Regular"]) -> 'NetworkIndex':
+        """
+        Fetch the route sequences of line_ids in every direction through client and build an index.
+        """
+        sequences = [client.line.get_valid_routes_for_line_id(line_id, direction, service_types=service_types) for line_id in line_ids for direction in directions]
+        return cls.from_route_sequences(sequences)
+
+    def __len__(self) -> int:
+        return len(self.stop_ids)
+
+    def __contains__(self, stop_id: str) -> bool:
+        return stop_id in self._stop_index
+
+    def _stop(self, stop_id: str) -> int:
+        try:
+            return self._stop_index[stop_id]
+        except KeyError:
+            raise KeyError(f'Unknown stop id {stop_id!r}') from None
+
+    def neighbours(self, stop_id: str) -> List[Tuple[str, str]]:
+        """
+        Returns the (next stop id, line id) pairs reachable in one hop from stop_id.
+        """
+        s = self._stop(stop_id)
+        return [(self.stop_ids[self.targets[e]], self.line_ids[self.edge_lines[e]]) for e in range(self.offsets[s], self.offsets[s + 1])]
+
+    def lines_at(self, stop_id: str) -> List[str]:
+        """
+        Returns the ids of the lines calling at stop_id.
+        """
+        s = self._stop(stop_id)
+        return [self.line_ids[line] for line in self.stop_lines[self.line_offsets[s]:self.line_offsets[s + 1]]]
+
+    def stops_on(self, line_id: str) -> List[str]:
+        """
+        Returns the ids of the stops served by line_id.
+        """
+        line = self._line_index[line_id]
+        return [self.stop_ids[s] for s in self.line_stops[self.stop_offsets[line]:self.stop_offsets[line + 1]]]
+
+    def lines_between(self, from_stop_id: str, to_stop_id: str) -> List[str]:
+        """
+        Returns the ids of the lines on which to_stop_id can be reached from from_stop_id without changing.
+        """
+        start, goal = self._stop(from_stop_id), self._stop(to_stop_id)
+        connecting = []
+        for line in self.stop_lines[self.line_offsets[start]:self.line_offsets[start + 1]]:
+            if self._reaches_on_line(start, goal, line):
+                connecting.append(self.line_ids[line])
+        return connecting
+
+    def _reaches_on_line(self, start: int, goal: int, line: int) -> bool:
+        offsets, targets, edge_lines = self.offsets, self.targets, self.edge_lines
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            s = queue.popleft()
+            for e in range(offsets[s], offsets[s + 1]):
+                t = targets[e]
+                if edge_lines[e] == line and t not in seen:
+                    if t == goal:
+                        return True
+                    seen.add(t)
+                    queue.append(t)
+        return False
+
+    def reachable(self, stop_id: str, max_hops: int|None = None) -> Dict[str, int]:
+        """
+        Returns every stop reachable from stop_id, mapped to its distance in hops.
+
+        Parameters
+        ----------
+        stop_id : str
+            Starting stop.
+        max_hops : int | None, optional
+            Only include stops within this many hops, by default no limit.
+        """
+        offsets, targets = self.offsets, self.targets
+        start = self._stop(stop_id)
+        distance = {start: 0}
+        queue = deque([start])
+        while queue:
+            s = queue.popleft()
+            hops = distance[s] + 1
+            if max_hops is not None and hops > max_hops:
+                continue
+            for t in targets[offsets[s]:offsets[s + 1]]:
+                if t not in distance:
+                    distance[t] = hops
+                    queue.append(t)
+        return {self.stop_ids[s]: hops for s, hops in distance.items()}
+
+    def shortest_path(self, from_stop_id: str, to_stop_id: str) -> List[str]|None:
+        """
+        Returns the stop ids on a path with the fewest hops from from_stop_id to to_stop_id, or None.
+        """
+        offsets, targets = self.offsets, self.targets
+        start, goal = self._stop(from_stop_id), self._stop(to_stop_id)
+        previous = {start: -1}
+        queue = deque([start])
+        while queue and goal not in previous:
+            s = queue.popleft()
+            for t in targets[offsets[s]:offsets[s + 1]]:
+                if t not in previous:
+                    previous[t] = s
+                    queue.append(t)
+        if goal not in previous:
+            return None
+        path = []
+        s = goal
+        while s != -1:
+            path.append(self.stop_ids[s])
+            s = previous[s]
+        return path[::-1]
+
+    def interchanges(self, from_stop_id: str, to_stop_id: str, max_changes: int = 3) -> List[str]|None:
+        """
+        Returns a sequence of line ids connecting the two stops with the fewest changes, or None.
+
+        Lines are considered connected when they share a stop; direction of travel is not checked.
+        """
+        start, goal = self._stop(from_stop_id), self._stop(to_stop_id)
+        goal_lines = set(self.stop_lines[self.line_offsets[goal]:self.line_offsets[goal + 1]])
+        previous = {line: -1 for line in self.stop_lines[self.line_offsets[start]:self.line_offsets[start + 1]]}
+        frontier = list(previous)
+        for _ in range(max_changes + 1):
+            found = next((line for line in frontier if line in goal_lines), None)
+            if found is not None:
+                route = []
+                while found != -1:
+                    route.append(self.line_ids[found])
+                    found = previous[found]
+                return route[::-1]
+            next_frontier = []
+            for line in frontier:
+                for s in self.line_stops[self.stop_offsets[line]:self.stop_offsets[line + 1]]:
+                    for other in self.stop_lines[self.line_offsets[s]:self.line_offsets[s + 1]]:
+                        if other not in previous:
+                            previous[other] = line
+                            next_frontier.append(other)
+            frontier = next_frontier
+        return None
+
+    def save(self, path: str|Path) -> None:
+        """
+        Write the index to path in a compact binary format readable by NetworkIndex.load.
+        """
+        header = json.dumps({'stops': self.stop_ids, 'lines': self.line_ids, 'names': self.stop_names}, separators=(',', ':')).encode()
+        buffers = [self.offsets, self.targets, self.edge_lines]
+        with open(path, 'wb') as file:
+            file.write(_MAGIC + struct.pack('<HI', _VERSION, len(header)) + header)
+            for buffer in buffers:
+                file.write(struct.pack('<I', len(buffer)))
+                file.write(buffer.tobytes())
+
+    @classmethod
+    def load(cls, path: str|Path) -> 'NetworkIndex':
+        """
+        Read an index written by NetworkIndex.save.
+        """
+        data = Path(path).read_bytes()
+        if not data.startswith(_MAGIC):
+            raise ValueError(f'{path} is not a network index file')
+        position = len(_MAGIC)
+        version, header_length = struct.unpack_from('<HI', data, position)
+        if version != _VERSION:
+            raise ValueError(f'Unsupported network index version {version}')
+        position += struct.calcsize('<HI')
+        header = json.loads(data[position:position + header_length])
+        position += header_length
+        buffers = []
+        for _ in range(3):
+            (length,) = struct.unpack_from('<I', data, position)
+            position += 4
+            buffer = array('i')
+            buffer.frombytes(data[position:position + length * buffer.itemsize])
+            position += length * buffer.itemsize
+            buffers.append(buffer)
+        offsets, targets, edge_lines = buffers
+        edges = ((u, targets[e], edge_lines[e]) for u in range(len(offsets) - 1) for e in range(offsets[u], offsets[u + 1]))
+        return cls(header['stops'], header['lines'], edges, header['names'])
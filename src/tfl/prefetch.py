@@ -0,0 +1,199 @@
+'''
+prefetch.py
+'''
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+import asyncio
+from tfl.snapshot import SnapshotStore
+
+LINES = 'lines'
+ROUTES = 'routes'
+STOPS = 'stops'
+TIMETABLES = 'timetables'
+DEFAULT_INCLUDE = (ROUTES, STOPS, TIMETABLES)
+
+class PrefetchTask(NamedTuple):
+    """
+    One GET request of a prefetch plan.
+
+    Attributes
+    ----------
+    kind : str
+        LINES, ROUTES, STOPS or TIMETABLES.
+    path : str
+        Path relative to the api url, as requested by the matching LineEndpoint method.
+    params : Tuple[Tuple[str, Any], ...]
+        Query parameters as (name, value) pairs, as sent by the matching LineEndpoint method.
+    line_id : str | None
+        Line the request belongs to.
+    """
+    kind: str
+    path: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+    line_id: str|None = None
+
+class PrefetchProgress(NamedTuple):
+    """
+    Progress report passed to the progress callback after every request.
+
+    ``total`` grows while the plan unfolds, as requests are only planned once the response they
+    depend on has arrived.
+    """
+    completed: int
+    failed: int
+    total: int
+    task: PrefetchTask
+
+class Prefetcher():
+    """
+    Warm up the static data of whole modes with bounded concurrency.
+
+    The requests form a DAG: Line/Mode/{modes} first, then for every line its stations
+    (Line/{id}/StopPoints) and its route sequences in each direction, then the timetable at the
+    origin of every route. A request is started as soon as the one it depends on has completed, so
+    up to concurrency requests are always in flight.
+
+    Results go into the client's response cache as a side effect of the requests, when the client
+    has one, and can additionally be written to a snapshot file.
+
+    Parameters
+    ----------
+    client : Client | AsyncClient
+        Client used for the requests.
+    modes : Sequence[str]
+        Modes to prefetch e.g. ['tube', 'dlr'].
+    include : Sequence[str], default: DEFAULT_INCLUDE
+        Which of ROUTES, STOPS and TIMETABLES to fetch for every line. Timetables imply fetching
+        the routes they are planned from.
+    concurrency : int, default: 8
+        Maximum number of requests in flight.
+    directions : Sequence[str], default: ('inbound', 'outbound')
+        Route directions to fetch.
+    progress : Callable[[PrefetchProgress], None] | None, optional
+        Called after every completed or failed request.
+
+    Attributes
+    ----------
+    responses : Dict[PrefetchTask, Any]
+        Decoded response of every successful request.
+    errors : Dict[PrefetchTask, Exception]
+        Failed requests; their dependent requests are not planned.
+
+    Examples
+    --------
+    >>> client = Client(cache=ResponseCache(max_entries=50_000))
+    >>> client.prefetch(['bus'], include=['routes', 'stops'], concurrency=16, snapshot='bus.snapshot')
+    """
+    def __init__(self, client, modes: Sequence[str], include: Sequence[str] = DEFAULT_INCLUDE, concurrency: int = 8, directions: Sequence[str] = ('inbound', 'outbound'), progress: Callable[[PrefetchProgress], None]|None = None) -> None:
+        unknown = set(include) - set(DEFAULT_INCLUDE)
+        if unknown:
+            raise ValueError(f"Unknown prefetch include {', '.join(sorted(unknown))}, expected any of {', '.join(DEFAULT_INCLUDE)}")
+        self.client = client
+        self.modes = list(modes)
+        self.include = set(include)
+        self.concurrency = concurrency
+        self.directions = list(directions)
+        self.progress = progress
+        self.responses: Dict[PrefetchTask, Any] = {}
+        self.errors: Dict[PrefetchTask, Exception] = {}
+        self._planned = set()
+        self._total = 0
+
+    def _plan(self, tasks: Iterable[PrefetchTask]) -> List[PrefetchTask]:
+        planned = []
+        for task in tasks:
+            if task not in self._planned:
+                self._planned.add(task)
+                planned.append(task)
+        self._total += len(planned)
+        return planned
+
+    def roots(self) -> List[PrefetchTask]:
+        """
+        Returns the requests without dependencies.
+        """
+        return self._plan([PrefetchTask(LINES, f"Line/Mode/{','.join(self.modes)}")])
+
+    def expand(self, task: PrefetchTask, data) -> List[PrefetchTask]:
+        """
+        Returns the requests planned from the response to task.
+        """
+        children = []
+        if task.kind == LINES:
+            for line in data or ():
+                line_id = line['id']
+                if STOPS in self.include:
+                    children.append(PrefetchTask(STOPS, f'Line/{line_id}/StopPoints', (('tflOperatedNationalRailStationsOnly', False),), line_id))
+                if ROUTES in self.include or TIMETABLES in self.include:
+                    children.extend(PrefetchTask(ROUTES, f'Line/{line_id}/Route/Sequence/{direction}', (('serviceTypes', ('Regular',)), ('excludeCrowding', False)), line_id) for direction in self.directions)
+        elif task.kind == ROUTES and TIMETABLES in self.include:
+            for route in (data or {}).get('orderedLineRoutes') or []:
+                naptan_ids = route.get('naptanIds') or []
+                if naptan_ids:
+                    children.append(PrefetchTask(TIMETABLES, f'Line/{task.line_id}/Timetable/{naptan_ids[0]}', (), task.line_id))
+        return self._plan(children)
+
+    def _complete(self, task: PrefetchTask, data=None, error: Exception|None = None) -> List[PrefetchTask]:
+        if error is None:
+            self.responses[task] = data
+            children = self.expand(task, data)
+        else:
+            self.errors[task] = error
+            children = []
+        if self.progress is not None:
+            self.progress(PrefetchProgress(len(self.responses), len(self.errors), self._total, task))
+        return children
+
+    def _fetch(self, task: PrefetchTask):
+        # _request_api skips entity conversion; the plan is expanded from the decoded JSON
+        return self.client._request_api('get', task.path, params=dict(task.params) if task.params else None)
+
+    def run(self) -> Dict[PrefetchTask, Any]:
+        """
+        Execute the plan through a blocking client, returning the responses.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='tfl-prefetch')
+        try:
+            pending = {executor.submit(self._fetch, task): task for task in self.roots()}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    error = future.exception()
+                    for child in self._complete(task, None if error else future.result(), error):
+                        pending[executor.submit(self._fetch, child)] = child
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return self.responses
+
+    async def run_async(self) -> Dict[PrefetchTask, Any]:
+        """
+        Execute the plan through an AsyncClient, returning the responses.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(task):
+            async with semaphore:
+                return await self._fetch(task)
+
+        pending = {asyncio.ensure_future(fetch(task)): task for task in self.roots()}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    error = future.exception()
+                    for child in self._complete(task, None if error else future.result(), error):
+                        pending[asyncio.ensure_future(fetch(child))] = child
+        finally:
+            for future in pending:
+                future.cancel()
+        return self.responses
+
+    def save(self, path: str|Path) -> None:
+        """
+        Write the responses to a memory-mappable snapshot file, see ``tfl.snapshot.SnapshotStore``.
+        """
+        responses = ((task.path, dict(task.params) if task.params else None, data) for task, data in self.responses.items())
+        SnapshotStore.write(path, responses, metadata={'modes': self.modes, 'include': sorted(self.include)})
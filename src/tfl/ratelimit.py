@@ -0,0 +1,264 @@
+'''
+ratelimit.py
+'''
+from typing import Dict, Iterable, List, Tuple
+from datetime import datetime, timezone
+import fnmatch
+import heapq
+import itertools
+import random
+import re
+import threading
+import time
+
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+# First matching pattern wins. Live data goes ahead of bulk reference data refreshes.
+DEFAULT_PRIORITY_RULES: Tuple[Tuple[str, int], ...] = (
+    ('Line/*/Status/*/to/*', LOW),
+    ('Line/*/Arrivals/*', HIGH),
+    ('Line/*/Status', HIGH),
+    ('Line/Status/*', HIGH),
+    ('Line/*/Disruption', HIGH),
+    ('Line/Meta/*', LOW),
+    ('Line/*/Route*', LOW),
+    ('Line/Route', LOW),
+    ('Line/*/Timetable/*', LOW),
+    ('Line/*/StopPoints', LOW),
+)
+
+# TfL allows 500 requests per minute for a registered application key.
+DEFAULT_RATE = 500 / 60
+
+class RateLimiter():
+    """
+    Token bucket shared by every thread and event loop making requests with the same app key.
+
+    Callers waiting for a token are served in priority order (HIGH, NORMAL, LOW), then first come
+    first served, so live status requests overtake queued bulk refreshes.
+
+    Parameters
+    ----------
+    rate : float, default: DEFAULT_RATE
+        Tokens added per second, i.e. the sustained request rate.
+    burst : int | None, optional
+        Bucket capacity, i.e. how many requests may be sent back to back. By default one second of rate.
+    priority_rules : Iterable[Tuple[str, int]], optional
+        (path pattern, priority) pairs used by priority_for. By default DEFAULT_PRIORITY_RULES.
+
+    Attributes
+    ----------
+    acquired : int
+        Number of tokens handed out.
+    throttled : int
+        Number of times the bucket was paused after a 429 / Retry-After answer.
+
+    Examples
+    --------
+    >>> limiter = RateLimiter.shared('my-app-key', rate=500 / 60)
+    >>> client = Client(rate_limiter=limiter, retry_policy=RetryPolicy())
+    """
+    _registry: Dict[str, 'RateLimiter'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int|None = None, priority_rules: Iterable[Tuple[str, int]] = DEFAULT_PRIORITY_RULES) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self.acquired = 0
+        self.throttled = 0
+        self._priority_rules = [(re.compile(fnmatch.translate(pattern)), priority) for pattern, priority in priority_rules]
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+
+    @classmethod
+    def shared(cls, app_key: str, rate: float|None = None, burst: int|None = None) -> 'RateLimiter':
+        """
+        Returns the limiter for app_key, creating it on first use, so every client using the
+        same key in this process draws from one quota.
+
+        rate defaults to DEFAULT_RATE for a new limiter. Asking for an existing limiter with a
+        rate or burst other than its own raises ValueError, since a key has a single quota.
+        """
+        with cls._registry_lock:
+            limiter = cls._registry.get(app_key)
+            if limiter is None:
+                limiter = cls._registry[app_key] = cls(rate=DEFAULT_RATE if rate is None else rate, burst=burst)
+            elif (rate is not None and rate != limiter.rate) or (burst is not None and burst != limiter.capacity):
+                raise ValueError(f"the limiter shared for this app key has rate={limiter.rate} and burst={limiter.capacity}, not rate={rate} and burst={burst}")
+            return limiter
+
+    def priority_for(self, path: str) -> int:
+        """
+        Returns the scheduling priority of a request path.
+        """
+        path = path.strip('/')
+        for pattern, priority in self._priority_rules:
+            if pattern.match(path):
+                return priority
+        return NORMAL
+
+    def _wait_time(self, ticket: Tuple[int, int]) -> float:
+        # must be called with the lock held
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._waiters[0] != ticket:
+            return 1 / self.rate
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _grant(self) -> None:
+        heapq.heappop(self._waiters)
+        self._tokens -= 1
+        self.acquired += 1
+        self._condition.notify_all()
+
+    def _withdraw(self, ticket: Tuple[int, int]) -> None:
+        self._waiters.remove(ticket)
+        heapq.heapify(self._waiters)
+        self._condition.notify_all()
+
+    def acquire(self, priority: int = NORMAL) -> None:
+        """
+        Block the calling thread until a token is available for it.
+        """
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    wait = self._wait_time(ticket)
+                    if wait <= 0:
+                        self._grant()
+                        return
+                    self._condition.wait(wait)
+            except BaseException:
+                self._withdraw(ticket)
+                raise
+
+    async def acquire_async(self, priority: int = NORMAL) -> None:
+        """
+        Wait, without blocking the event loop, until a token is available.
+        """
+        import asyncio
+        with self._lock:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+        try:
+            while True:
+                with self._lock:
+                    wait = self._wait_time(ticket)
+                    if wait <= 0:
+                        self._grant()
+                        return
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._lock:
+                self._withdraw(ticket)
+            raise
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for the given number of seconds, e.g. after a 429 answer,
+        so that every caller backs off rather than only the one that was rejected.
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self.throttled += 1
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the counters, current token level and number of waiting callers.
+        """
+        with self._lock:
+            return {'acquired': self.acquired, 'throttled': self.throttled, 'tokens': self._tokens, 'waiting': len(self._waiters)}
+
+def parse_retry_after(value: str|None) -> float|None:
+    """
+    Parse a Retry-After header given either as delay seconds or as an HTTP date.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # HTTP dates are rare, email.utils is only imported when one is received
+    from email.utils import parsedate_to_datetime
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class RetryPolicy():
+    """
+    Retry schedule for throttled or temporarily unavailable responses.
+
+    Parameters
+    ----------
+    max_retries : int, default: 4
+        Maximum number of retries per request.
+    backoff : float, default: 0.5
+        Base delay in seconds; attempt n waits a random time up to backoff * 2 ** n (full jitter).
+    max_backoff : float, default: 30.0
+        Upper bound for a single exponential backoff delay.
+    max_retry_after : float, default: 120.0
+        Longest Retry-After honoured; a response asking for a longer wait is not retried.
+    statuses : Tuple[int, ...], default: (429, 503)
+        Status codes that are retried.
+
+    Attributes
+    ----------
+    retries : int
+        Number of retries scheduled.
+    """
+    def __init__(self, max_retries: int = 4, backoff: float = 0.5, max_backoff: float = 30.0, max_retry_after: float = 120.0, statuses: Tuple[int, ...] = (429, 503)) -> None:
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = statuses
+        self.retries = 0
+
+    def delay_for(self, status_code: int, headers, attempt: int) -> float|None:
+        """
+        Returns the delay before retrying a response, or None if it should not be retried.
+
+        Parameters
+        ----------
+        status_code : int
+            Status code of the failed response.
+        headers : Mapping
+            Response headers, consulted for Retry-After.
+        attempt : int
+            Number of retries already made for this request.
+        """
+        if attempt >= self.max_retries or status_code not in self.statuses:
+            return None
+        retry_after = parse_retry_after(headers.get('Retry-After') if headers is not None else None)
+        if retry_after is None:
+            delay = min(random.uniform(0, self.backoff * 2 ** attempt), self.max_backoff)
+        elif retry_after > self.max_retry_after:
+            # retrying earlier than the server asked would only be throttled again
+            return None
+        else:
+            delay = retry_after + random.uniform(0, self.backoff)
+        self.retries += 1
+        return delay
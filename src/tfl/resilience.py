@@ -0,0 +1,476 @@
+'''
+resilience.py
+'''
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Tuple
+from collections import OrderedDict
+import threading
+import time
+from tfl.exceptions import CircuitOpenError, TFLAPIException
+from tfl.entity_base import Entity, EntityList
+from tfl.instrumentation import RequestRecord
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class _Stale():
+    # mixin of the stale response types; _stale_age is read by stale_age
+    __slots__ = ()
+
+    @property
+    def age(self) -> float:
+        return self._stale_age
+
+class StaleDict(_Stale, dict):
+    """
+    A dict response served from the last good response; age is its age in seconds.
+    """
+
+class StaleList(_Stale, list):
+    """
+    A list response served from the last good response; age is its age in seconds.
+    """
+
+class StaleBytes(_Stale, bytes):
+    """
+    A raw response served from the last good response; age is its age in seconds.
+    """
+
+class StaleEntityList(_Stale, EntityList):
+    """
+    An entity list response served from the last good response; age is its age in seconds.
+    """
+    __slots__ = ('_stale_age',)
+
+# stale subclasses of the entity classes, created on first use
+_STALE_ENTITIES: Dict[type, type] = {}
+
+def _stale_entity(value: Entity, age: float) -> Entity:
+    cls = type(value)
+    stale_type = _STALE_ENTITIES.get(cls)
+    if stale_type is None:
+        # the subclass is not registered with ENTITY_TYPES under the name of the original
+        stale_type = _STALE_ENTITIES[cls] = type(f'Stale{cls.__name__}', (cls,), {'__slots__': ('_stale_age',)})
+    marked = stale_type.__new__(stale_type)
+    for slot, _ in cls._fields:
+        object.__setattr__(marked, slot, object.__getattribute__(value, slot))
+    marked._stale_age = age
+    return marked
+
+_STALE_TYPES = ((EntityList, StaleEntityList), (dict, StaleDict), (list, StaleList), (bytes, StaleBytes))
+
+def mark_stale(value: Any, age: float) -> Any:
+    """
+    Returns a shallow copy of value marked with its age, see stale_age.
+    """
+    if isinstance(value, Entity):
+        return _stale_entity(value, age)
+    for base, stale_type in _STALE_TYPES:
+        if isinstance(value, base):
+            marked = stale_type(value)
+            marked._stale_age = age
+            return marked
+    return value
+
+def stale_age(value: Any) -> float|None:
+    """
+    Returns the age in seconds of a response served stale by a ResiliencePolicy, or None for a
+    fresh response. Works for dicts, lists, raw bytes and entities alike.
+    """
+    return getattr(value, '_stale_age', None)
+
+def carry_stale(source: Any, value: Any) -> Any:
+    """
+    Returns value, a conversion of source, marked with the age of source if it was served stale.
+    """
+    age = stale_age(source)
+    return value if age is None else mark_stale(value, age)
+
+def is_failure(exc: BaseException) -> bool:
+    """
+    Whether an exception counts against the circuit breaker: connection errors, timeouts and 5xx
+    answers do, while 4xx answers show that the API is up.
+    """
+    return not isinstance(exc, TFLAPIException) or exc.status_code >= 500
+
+class CircuitBreaker():
+    """
+    Circuit breaker of one endpoint.
+
+    After failure_threshold consecutive failures the circuit opens and requests are refused for
+    reset_timeout seconds. It then lets a single probe request through (half open): a success
+    closes the circuit, a failure opens it again.
+
+    Attributes
+    ----------
+    state : str
+        CLOSED, OPEN or HALF_OPEN.
+    failures : int
+        Consecutive failures.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Whether a request may be sent now.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+class ResiliencePolicy():
+    """
+    Bounds the latency of GET requests when the API is slow or failing.
+
+    Three mechanisms, all per endpoint (path template):
+
+    - A CircuitBreaker per endpoint refuses requests to an endpoint that keeps failing, so callers
+      do not wait on timeouts. Refused requests raise CircuitOpenError.
+    - With hedge_after set, a GET without an answer after hedge_after seconds is sent a second
+      time and the first answer wins. GETs are idempotent, so the duplicate is harmless.
+    - The last good response of every request is kept. When the circuit is open, the request
+      fails or no answer came within stale_after seconds, that response is returned instead,
+      marked with its age (see stale_age). A slow request keeps running in the background and
+      refreshes the stored response when it completes.
+
+    Pass it to the client as ``resilience``; the snapshot, cache and single-flight are consulted
+    first as usual.
+
+    Parameters
+    ----------
+    failure_threshold : int, default: 5
+        Consecutive failures that open the circuit of an endpoint.
+    reset_timeout : float, default: 30.0
+        Seconds an open circuit refuses requests before letting a probe through.
+    hedge_after : float | None, optional
+        Seconds before a GET is hedged, by default GETs are not hedged. A value around the p95
+        latency of the endpoints hedges about 5% of the requests.
+    stale_after : float | None, default: 1.0
+        Seconds to wait for an answer before serving the last good response, None to only serve
+        it when the circuit is open or the request failed.
+    max_stale_age : float, default: 3600.0
+        Oldest response served stale, in seconds.
+    max_entries : int, default: 1024
+        Last good responses kept, least recently stored first out.
+    workers : int, default: 32
+        Limit of background attempts for blocking clients. Hedging and stale_after need a GET to
+        run on a thread of the policy so the caller can stop waiting for it; at most workers
+        attempts, including those left running after a stale answer, do so at a time. When all
+        are busy a GET runs on the caller's thread without hedge or deadline (a failure is still
+        answered with the last good response), so the limit never queues or caps requests.
+
+    Attributes
+    ----------
+    hedges : int
+        Hedged requests sent.
+    hedge_wins : int
+        Answers that came from the hedged request.
+    stale_served : int
+        Responses served stale.
+    rejected : int
+        Requests refused by an open circuit.
+    saturated : int
+        GETs run on the caller's thread because all workers were busy.
+
+    Examples
+    --------
+    >>> client = Client(resilience=ResiliencePolicy(hedge_after=0.3, stale_after=0.8))
+    >>> arrivals = client.get('StopPoint/940GZZLUOXC/Arrivals')
+    >>> stale_age(arrivals)  # None when fresh, else seconds since it was fetched
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, hedge_after: float|None = None, stale_after: float|None = 1.0, max_stale_age: float = 3600.0, max_entries: int = 1024, workers: int = 32) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_after = hedge_after
+        self.stale_after = stale_after
+        self.max_stale_age = max_stale_age
+        self.max_entries = max_entries
+        self.workers = workers
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.stale_served = 0
+        self.rejected = 0
+        self.saturated = 0
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._last_good: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._matcher = None
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(workers)
+        self._background = set()
+        self._lock = threading.Lock()
+
+    def breaker_for(self, path: str) -> CircuitBreaker:
+        """
+        Returns the circuit breaker of the endpoint path belongs to.
+        """
+        if self._matcher is None:
+            from tfl.endpoints import PATH_TEMPLATES
+            from tfl.metrics import TemplateMatcher
+            self._matcher = TemplateMatcher(PATH_TEMPLATES)
+        template = self._matcher.match(path)
+        breaker = self._breakers.get(template)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(template, CircuitBreaker(self.failure_threshold, self.reset_timeout))
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """
+        Returns the circuit state of every endpoint requested so far, keyed on its path template.
+        """
+        return {template: breaker.state for template, breaker in self._breakers.items()}
+
+    def remember(self, key: Hashable, value: Any) -> None:
+        """
+        Store value as the last good response of the request key.
+        """
+        with self._lock:
+            self._last_good[key] = (value, time.monotonic())
+            self._last_good.move_to_end(key)
+            while len(self._last_good) > self.max_entries:
+                self._last_good.popitem(last=False)
+
+    def last_good(self, key: Hashable) -> Tuple[Any, float]|None:
+        """
+        Returns the (response, stored at) pair kept for key if it is young enough to be served.
+        """
+        entry = self._last_good.get(key)
+        if entry is None or time.monotonic() - entry[1] > self.max_stale_age:
+            return None
+        return entry
+
+    def _serve_stale(self, entry: Tuple[Any, float], record: RequestRecord|None) -> Any:
+        with self._lock:
+            self.stale_served += 1
+        if record is not None:
+            record.error = None
+        return mark_stale(entry[0], time.monotonic() - entry[1])
+
+    def _admit(self, path: str, key: Hashable, record: RequestRecord|None) -> Tuple[CircuitBreaker, Tuple[Any, float]|None, Any]:
+        # (breaker, last good entry, stale response to return right away or None)
+        breaker = self.breaker_for(path)
+        stale = self.last_good(key)
+        if breaker.allow():
+            return breaker, stale, None
+        with self._lock:
+            self.rejected += 1
+        if stale is None:
+            raise CircuitOpenError(f'circuit open for {self._matcher.match(path)}, retry in {breaker.reset_timeout}s')
+        return breaker, stale, self._serve_stale(stale, record)
+
+    def _settle(self, breaker: CircuitBreaker, key: Hashable, value: Any = None, exc: BaseException|None = None) -> None:
+        if exc is not None and is_failure(exc):
+            breaker.record_failure()
+            return
+        breaker.record_success()
+        if exc is None and value is not None:
+            self.remember(key, value)
+
+    def _attempt(self, breaker: CircuitBreaker, key: Hashable, send: Callable[[RequestRecord|None], Any], record: RequestRecord|None) -> Any:
+        try:
+            value = send(record)
+        except Exception as exc:
+            self._settle(breaker, key, exc=exc)
+            raise
+        self._settle(breaker, key, value)
+        return value
+
+    def _pooled_attempt(self, breaker: CircuitBreaker, key: Hashable, send: Callable[[RequestRecord|None], Any], record: RequestRecord|None) -> Any:
+        try:
+            return self._attempt(breaker, key, send, record)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _attempt_record(record: RequestRecord|None) -> RequestRecord|None:
+        # every attempt of a call gets its own record, so concurrent attempts do not mix phases
+        return None if record is None else RequestRecord(record.method, record.path, record.params)
+
+    @staticmethod
+    def _adopt(record: RequestRecord|None, attempts, answer: RequestRecord|None = None) -> None:
+        # report the attempts of a call on the caller's record, with the phases of the answer
+        if record is None:
+            return
+        record.attempts = sum(attempt.attempts for attempt in attempts)
+        if answer is not None:
+            record.status, record.bytes = answer.status, answer.bytes
+            record.connect, record.ttfb, record.download, record.decode = answer.connect, answer.ttfb, answer.download, answer.decode
+
+    def _get_executor(self) -> 'ThreadPoolExecutor':
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='tfl-resilience')
+        return self._executor
+
+    def call(self, path: str, key: Hashable, send: Callable[[RequestRecord|None], Any], record: RequestRecord|None = None) -> Any:
+        """
+        Make a GET through send under the policy and return its response, or the last good one.
+
+        send(record) makes one request; it is called a second time to hedge. Every attempt gets
+        its own RequestRecord and the phases of the one that answered are copied into record.
+        """
+        breaker, stale, served = self._admit(path, key, record)
+        if served is not None:
+            return served
+        deadline = None if stale is None or self.stale_after is None else self.stale_after
+        background = self.hedge_after is not None or deadline is not None
+        if background and not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.saturated += 1
+            background = False
+        if not background:
+            try:
+                return self._attempt(breaker, key, send, record)
+            except Exception:
+                if stale is None:
+                    raise
+                return self._serve_stale(stale, record)
+        from concurrent.futures import FIRST_COMPLETED, wait
+        executor = self._get_executor()
+        start = time.monotonic()
+        first = self._attempt_record(record)
+        primary = executor.submit(self._pooled_attempt, breaker, key, send, first)
+        attempts = {primary: first}
+        pending = {primary}
+        hedge_at = self.hedge_after
+        error = None
+        while pending:
+            wakes = [at for at in (hedge_at, deadline) if at is not None]
+            timeout = max(0.0, min(wakes) - (time.monotonic() - start)) if wakes else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is not primary:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    self._adopt(record, attempts.values(), attempts[future])
+                    return future.result()
+                error = future.exception()
+            elapsed = time.monotonic() - start
+            if hedge_at is not None and elapsed >= hedge_at:
+                hedge_at = None
+                if pending and breaker.state == CLOSED and self._slots.acquire(blocking=False):
+                    with self._lock:
+                        self.hedges += 1
+                    hedge_record = self._attempt_record(record)
+                    hedge = executor.submit(self._pooled_attempt, breaker, key, send, hedge_record)
+                    attempts[hedge] = hedge_record
+                    pending.add(hedge)
+            if deadline is not None and elapsed >= deadline and pending:
+                # the requests carry on in the background and refresh the last good response
+                self._adopt(record, attempts.values())
+                return self._serve_stale(stale, record)
+        self._adopt(record, attempts.values())
+        if stale is None:
+            raise error
+        return self._serve_stale(stale, record)
+
+    async def call_async(self, path: str, key: Hashable, send: Callable[[RequestRecord|None], Awaitable[Any]], record: RequestRecord|None = None) -> Any:
+        """
+        Async counterpart of call for the AsyncClient, send(record) returning an awaitable.
+        """
+        import asyncio
+        breaker, stale, served = self._admit(path, key, record)
+        if served is not None:
+            return served
+
+        async def attempt(record):
+            try:
+                value = await send(record)
+            except Exception as exc:
+                self._settle(breaker, key, exc=exc)
+                raise
+            self._settle(breaker, key, value)
+            return value
+
+        deadline = None if stale is None or self.stale_after is None else self.stale_after
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        first = self._attempt_record(record)
+        primary = asyncio.ensure_future(attempt(first))
+        attempts = {primary: first}
+        pending = {primary}
+        hedge_at = self.hedge_after
+        error = None
+        while pending:
+            wakes = [at for at in (hedge_at, deadline) if at is not None]
+            timeout = max(0.0, min(wakes) - (loop.time() - start)) if wakes else None
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        self.hedge_wins += 1
+                    self._keep_running(pending)
+                    self._adopt(record, attempts.values(), attempts[task])
+                    return task.result()
+                error = task.exception()
+            elapsed = loop.time() - start
+            if hedge_at is not None and elapsed >= hedge_at:
+                hedge_at = None
+                if pending and breaker.state == CLOSED:
+                    self.hedges += 1
+                    hedge_record = self._attempt_record(record)
+                    hedge = asyncio.ensure_future(attempt(hedge_record))
+                    attempts[hedge] = hedge_record
+                    pending.add(hedge)
+            if deadline is not None and elapsed >= deadline and pending:
+                self._keep_running(pending)
+                self._adopt(record, attempts.values())
+                return self._serve_stale(stale, record)
+        self._adopt(record, attempts.values())
+        if stale is None:
+            raise error
+        return self._serve_stale(stale, record)
+
+    def _keep_running(self, tasks) -> None:
+        # hold references to the requests left in the background until they finish
+        for task in tasks:
+            self._background.add(task)
+            task.add_done_callback(self._finished)
+
+    def _finished(self, task) -> None:
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    def close(self) -> None:
+        """
+        Stop the threads of blocking clients, letting the requests in progress finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,165 @@
+'''
+snapshot.py
+'''
+from typing import Any, Dict, Iterable, Tuple
+from bisect import bisect_left
+from pathlib import Path
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from tfl.cache import DAY, make_cache_key
+from tfl.decoding import Decoder, get_decoder
+
+_MAGIC = b'TFLSNAP\0'
+_VERSION = 1
+_PREFIX = struct.Struct('<HIdQ')
+_KEY_LENGTH = struct.Struct('<I')
+
+def snapshot_key(path: str, params: Any = None) -> bytes:
+    """
+    Returns the key a GET of path with params is stored under, matching the client's cache keys.
+    """
+    return repr(make_cache_key('get', path, params)).encode()
+
+def _hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+def _pad(length: int) -> int:
+    return -length % 8
+
+class SnapshotStore():
+    """
+    Read-only, memory-mapped snapshot of decoded GET responses, e.g. the static data of a mode.
+
+    Opening a snapshot maps the file and reads a fixed size prefix; nothing else is parsed until a
+    response is requested, and the pages are shared by every process mapping the same file.
+
+    File layout (little endian): the magic bytes, a (format version, metadata length, created,
+    count) prefix, JSON metadata, then three sorted ``count`` long uint64 columns (key hashes,
+    record offsets, record lengths) looked up by binary search, then the records. A record is its
+    key (length prefixed) followed by the compact JSON of the response.
+
+    Parameters
+    ----------
+    path : str | Path
+        Snapshot file written by SnapshotStore.write.
+    max_age : float, default: DAY
+        Seconds after its creation during which the snapshot is considered fresh.
+    decoder : str | Callable[[bytes], Any] | None, optional
+        JSON decoder for the records, see ``tfl.decoding.get_decoder``.
+
+    Attributes
+    ----------
+    created : float
+        Unix time the snapshot was written.
+    metadata : Dict
+        Free-form metadata stored with the snapshot.
+    hits : int
+    misses : int
+
+    Examples
+    --------
+    >>> Client().prefetch(['tube'], snapshot='tube.snapshot')
+    >>> client = Client(snapshot=SnapshotStore('tube.snapshot'))
+    >>> client.line.get_valid_routes_for_line_id('victoria', 'inbound')  # served from the snapshot
+    """
+    def __init__(self, path: str|Path, max_age: float = DAY, decoder: str|Decoder|None = None) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self.decoder = get_decoder(decoder)
+        self.hits = 0
+        self.misses = 0
+        with open(self.path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(_MAGIC)] != _MAGIC:
+            self._map.close()
+            raise ValueError(f'{path} is not a snapshot file')
+        version, metadata_length, self.created, count = _PREFIX.unpack_from(self._map, len(_MAGIC))
+        if version != _VERSION:
+            self._map.close()
+            raise ValueError(f'Unsupported snapshot version {version}')
+        position = len(_MAGIC) + _PREFIX.size
+        self.metadata: Dict = json.loads(self._map[position:position + metadata_length])
+        position += metadata_length + _pad(position + metadata_length)
+        view = memoryview(self._map)
+        self._hashes = view[position:position + 8 * count].cast('Q')
+        self._offsets = view[position + 8 * count:position + 16 * count].cast('Q')
+        self._lengths = view[position + 16 * count:position + 24 * count].cast('Q')
+
+    @staticmethod
+    def write(path: str|Path, responses: Iterable[Tuple[str, Any, Any]], metadata: Dict|None = None, created: float|None = None) -> None:
+        """
+        Write (path, params, decoded response) triples to a snapshot file.
+
+        The file is written next to its destination and renamed into place, so readers never
+        map a partially written snapshot.
+        """
+        records = {}
+        for request_path, params, data in responses:
+            key = snapshot_key(request_path, params)
+            records[key] = _KEY_LENGTH.pack(len(key)) + key + json.dumps(data, separators=(',', ':')).encode()
+        entries = sorted((_hash(key), key) for key in records)
+        metadata_bytes = json.dumps(metadata or {}, separators=(',', ':')).encode()
+        head = _MAGIC + _PREFIX.pack(_VERSION, len(metadata_bytes), time.time() if created is None else created, len(entries)) + metadata_bytes
+        head += b'\0' * _pad(len(head))
+        offset = len(head) + 24 * len(entries)
+        hashes, offsets, lengths = [], [], []
+        for key_hash, key in entries:
+            hashes.append(key_hash)
+            offsets.append(offset)
+            lengths.append(len(records[key]))
+            offset += len(records[key])
+        column = struct.Struct(f'<{len(entries)}Q')
+        temporary = Path(f'{path}.{os.getpid()}.tmp')
+        with open(temporary, 'wb') as file:
+            file.write(head + column.pack(*hashes) + column.pack(*offsets) + column.pack(*lengths))
+            for _, key in entries:
+                file.write(records[key])
+        os.replace(temporary, path)
+
+    @property
+    def fresh(self) -> bool:
+        """
+        Whether the snapshot is younger than max_age.
+        """
+        return time.time() - self.created <= self.max_age
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def _find(self, key: bytes) -> bytes|None:
+        key_hash = _hash(key)
+        i = bisect_left(self._hashes, key_hash)
+        while i < len(self._hashes) and self._hashes[i] == key_hash:
+            start = self._offsets[i]
+            (key_length,) = _KEY_LENGTH.unpack_from(self._map, start)
+            start += _KEY_LENGTH.size
+            if self._map[start:start + key_length] == key:
+                return self._map[start + key_length:self._offsets[i] + self._lengths[i]]
+            i += 1
+        return None
+
+    def __contains__(self, request: Tuple[str, Any]) -> bool:
+        return self._find(snapshot_key(*request)) is not None
+
+    def get(self, path: str, params: Any = None, default: Any = None) -> Any:
+        """
+        Returns a freshly decoded copy of the response stored for a GET of path with params, or default.
+        """
+        body = self._find(snapshot_key(path, params))
+        if body is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self.decoder(body)
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        for view in (self._hashes, self._offsets, self._lengths):
+            view.release()
+        self._map.close()
@@ -0,0 +1,213 @@
+'''
+spatial.py
+'''
+from typing import Dict, Iterable, List, Sequence
+import math
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+EARTH_RADIUS = 6_371_000.0
+METRES_PER_DEGREE = 2 * math.pi * EARTH_RADIUS / 360
+
+def haversine(lat: float, lon: float, lats, lons):
+    """
+    Great-circle distance in metres from (lat, lon) to each point of the lats/lons arrays.
+    """
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - math.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+def _as_dicts(response):
+    # a response of a client made with entities=True, as the decoded JSON
+    if hasattr(response, 'to_dict'):
+        return response.to_dict()
+    if isinstance(response, list):
+        return [item.to_dict() if hasattr(item, 'to_dict') else item for item in response]
+    return response
+
+class SpatialIndex():
+    """
+    In-process grid index over StopPoints and Places (e.g. BikePoints) for radius, nearest and
+    bounding-box queries, returning the same result shapes as the remote endpoints.
+
+    Points are bucketed into a regular lat/lon grid held in CSR form (``cell_offsets`` into
+    ``order``); a query gathers the cells overlapping its bounding box and computes haversine
+    distances for those candidates with NumPy.
+
+    Parameters
+    ----------
+    records : Iterable[Dict]
+        StopPoint or Place dicts with 'lat' and 'lon'. Records without coordinates are skipped.
+    cell_size : float, default: 0.005
+        Grid cell size in degrees (about 550 m of latitude).
+
+    Notes
+    -----
+    Requires the optional ``numpy`` dependency (``pip install tfl[numpy]``).
+
+    Examples
+    --------
+    >>> index = SpatialIndex.from_client(client, modes=['tube', 'dlr'], bike_points=True)
+    >>> index.stop_points_by_radius(51.5154, -0.1419, radius=300, stop_types=['NaptanMetroStation'])
+    {'centrePoint': [51.5154, -0.1419], 'stopPoints': [...], 'pageSize': 3, 'total': 3, 'page': 1}
+    >>> index.nearest(51.5154, -0.1419, k=3)
+    """
+    def __init__(self, records: Iterable[Dict], cell_size: float = 0.005) -> None:
+        if np is None:
+            raise ImportError("SpatialIndex requires numpy, install it with 'pip install tfl[numpy]'")
+        self.records = [record for record in records if record.get('lat') is not None and record.get('lon') is not None]
+        self.cell_size = cell_size
+        self.lats = np.fromiter((record['lat'] for record in self.records), dtype=np.float64, count=len(self.records))
+        self.lons = np.fromiter((record['lon'] for record in self.records), dtype=np.float64, count=len(self.records))
+        if self.records:
+            self._row0 = int(math.floor(self.lats.min() / cell_size))
+            self._col0 = int(math.floor(self.lons.min() / cell_size))
+            rows = np.floor(self.lats / cell_size).astype(np.int64) - self._row0
+            cols = np.floor(self.lons / cell_size).astype(np.int64) - self._col0
+            self._rows = int(rows.max()) + 1
+            self._cols = int(cols.max()) + 1
+        else:
+            self._row0 = self._col0 = 0
+            self._rows = self._cols = 0
+            rows = cols = np.zeros(0, dtype=np.int64)
+        cells = rows * self._cols + cols
+        self.order = np.argsort(cells, kind='stable')
+        self.cell_offsets = np.searchsorted(cells[self.order], np.arange(self._rows * self._cols + 1))
+
+    @classmethod
+    def from_stop_points(cls, responses: Iterable, cell_size: float = 0.005) -> 'SpatialIndex':
+        """
+        Build an index from StopPointsResponse dicts (e.g. StopPoint/Mode/{modes} pages) and/or lists of
+        StopPoint / Place dicts (e.g. BikePoint). Entities, from clients made with entities=True,
+        are converted back to dicts.
+        """
+        records: List[Dict] = []
+        for response in responses:
+            response = _as_dicts(response)
+            if isinstance(response, dict):
+                records.extend(response.get('stopPoints') or [])
+            else:
+                records.extend(response)
+        return cls(records, cell_size)
+
+    @classmethod
+    def from_client(cls, client, modes: Sequence[str] = ('tube',), bike_points: bool = False, cell_size: float = 0.005) -> 'SpatialIndex':
+        """
+        Load every StopPoint of the given modes (following pagination) and optionally every
+        BikePoint through client, and build an index over them.
+        """
+        responses = []
+        if modes:
+            page = 1
+            while True:
+                response = _as_dicts(client.get(f"StopPoint/Mode/{','.join(modes)}", params={'page': page}))
+                responses.append(response)
+                fetched = sum(len(r.get('stopPoints') or []) for r in responses)
+                if not response.get('stopPoints') or fetched >= (response.get('total') or 0):
+                    break
+                page += 1
+        if bike_points:
+            responses.append(client.get('BikePoint'))
+        return cls.from_stop_points(responses, cell_size)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _candidates(self, south: float, west: float, north: float, east: float):
+        if not self.records:
+            return np.zeros(0, dtype=np.int64)
+        cell = self.cell_size
+        row_start = max(int(math.floor(south / cell)) - self._row0, 0)
+        row_end = min(int(math.floor(north / cell)) - self._row0, self._rows - 1)
+        col_start = max(int(math.floor(west / cell)) - self._col0, 0)
+        col_end = min(int(math.floor(east / cell)) - self._col0, self._cols - 1)
+        if row_start > row_end or col_start > col_end:
+            return np.zeros(0, dtype=np.int64)
+        # the cells of one grid row are contiguous in the CSR layout
+        slices = [self.order[self.cell_offsets[row * self._cols + col_start]:self.cell_offsets[row * self._cols + col_end + 1]] for row in range(row_start, row_end + 1)]
+        return np.concatenate(slices)
+
+    def _within(self, lat: float, lon: float, radius: float):
+        dlat = radius / METRES_PER_DEGREE
+        dlon = radius / (METRES_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        candidates = self._candidates(lat - dlat, lon - dlon, lat + dlat, lon + dlon)
+        distances = haversine(lat, lon, self.lats[candidates], self.lons[candidates])
+        mask = distances <= radius
+        candidates, distances = candidates[mask], distances[mask]
+        order = np.argsort(distances, kind='stable')
+        return candidates[order], distances[order]
+
+    @staticmethod
+    def _matches(record: Dict, types: Sequence[str]|None, modes: Sequence[str]|None) -> bool:
+        if types is not None and (record.get('stopType') or record.get('placeType')) not in types:
+            return False
+        if modes is not None and not set(record.get('modes') or ()).intersection(modes):
+            return False
+        return True
+
+    def _results(self, indices, distances, types, modes) -> List[Dict]:
+        return [dict(self.records[i], distance=distance) for i, distance in zip(indices.tolist(), distances.tolist()) if self._matches(self.records[i], types, modes)]
+
+    def places_by_radius(self, lat: float, lon: float, radius: float, types: Sequence[str]|None = None, modes: Sequence[str]|None = None) -> List[Dict]:
+        """
+        Returns the records within radius metres of (lat, lon), nearest first, each with a 'distance'
+        in metres, as returned by ``/Place?lat&lon&radius``.
+
+        Parameters
+        ----------
+        types : Sequence[str] | None, optional
+            Only return records whose stopType / placeType is one of these, e.g. ['NaptanMetroStation', 'BikePoint'].
+        modes : Sequence[str] | None, optional
+            Only return records serving one of these modes.
+        """
+        indices, distances = self._within(lat, lon, radius)
+        return self._results(indices, distances, types, modes)
+
+    def stop_points_by_radius(self, lat: float, lon: float, radius: float = 200, stop_types: Sequence[str]|None = None, modes: Sequence[str]|None = None) -> Dict:
+        """
+        Local equivalent of ``/StopPoint?lat&lon&radius&stopTypes``, returning a StopPointsResponse shaped dict.
+        """
+        stop_points = self.places_by_radius(lat, lon, radius, stop_types, modes)
+        return {'centrePoint': [lat, lon], 'stopPoints': stop_points, 'pageSize': len(stop_points), 'total': len(stop_points), 'page': 1}
+
+    def nearest(self, lat: float, lon: float, k: int = 5, max_distance: float|None = None, types: Sequence[str]|None = None, modes: Sequence[str]|None = None) -> List[Dict]:
+        """
+        Returns the k records nearest to (lat, lon), each with a 'distance' in metres.
+
+        The search radius starts at one grid cell and doubles until enough matching records are found,
+        max_distance is reached or the whole index has been covered.
+        """
+        if not self.records:
+            return []
+        span = METRES_PER_DEGREE * max(self._rows, self._cols) * self.cell_size
+        radius = self.cell_size * METRES_PER_DEGREE
+        while True:
+            if max_distance is not None:
+                radius = min(radius, max_distance)
+            results = self.places_by_radius(lat, lon, radius, types, modes)
+            if len(results) >= k or (max_distance is not None and radius >= max_distance) or radius > span + self._distance_to_extent(lat, lon):
+                return results[:k]
+            radius *= 2
+
+    def _distance_to_extent(self, lat: float, lon: float) -> float:
+        south, north = self._row0 * self.cell_size, (self._row0 + self._rows) * self.cell_size
+        west, east = self._col0 * self.cell_size, (self._col0 + self._cols) * self.cell_size
+        dlat = max(south - lat, 0.0, lat - north)
+        dlon = max(west - lon, 0.0, lon - east)
+        return math.hypot(dlat, dlon) * METRES_PER_DEGREE
+
+    def places_within_bounds(self, sw_lat: float, sw_lon: float, ne_lat: float, ne_lon: float, types: Sequence[str]|None = None, modes: Sequence[str]|None = None) -> List[Dict]:
+        """
+        Local equivalent of ``/Place?placeGeo.swLat&placeGeo.swLon&placeGeo.neLat&placeGeo.neLon``:
+        every record inside the bounding box.
+        """
+        candidates = self._candidates(sw_lat, sw_lon, ne_lat, ne_lon)
+        lats, lons = self.lats[candidates], self.lons[candidates]
+        mask = (lats >= sw_lat) & (lats <= ne_lat) & (lons >= sw_lon) & (lons <= ne_lon)
+        return [self.records[i] for i in candidates[mask].tolist() if self._matches(self.records[i], types, modes)]
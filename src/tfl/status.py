@@ -0,0 +1,219 @@
+'''
+status.py
+'''
+from typing import AsyncIterator, Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+import asyncio
+import hashlib
+import time
+
+class SeverityChanged(NamedTuple):
+    """
+    The status severities of a line changed, e.g. from Good Service (10) to Minor Delays (9).
+
+    Attributes
+    ----------
+    line_id : str
+    previous : Tuple[Tuple[int, str], ...]
+        (statusSeverity, statusSeverityDescription) pairs before the change, empty for a newly seen line.
+    current : Tuple[Tuple[int, str], ...]
+        The pairs after the change.
+    """
+    line_id: str
+    previous: Tuple[Tuple[int, str], ...]
+    current: Tuple[Tuple[int, str], ...]
+
+class DisruptionAdded(NamedTuple):
+    """
+    A disruption started affecting a line.
+    """
+    line_id: str
+    disruption: Dict
+
+class DisruptionCleared(NamedTuple):
+    """
+    A disruption no longer affects a line; disruption is its last known payload.
+    """
+    line_id: str
+    disruption: Dict
+
+StatusEvent = SeverityChanged|DisruptionAdded|DisruptionCleared
+
+class LineState(NamedTuple):
+    """
+    Compact last known status of a line: its severities and its disruptions keyed on a digest.
+    """
+    severities: Tuple[Tuple[int, str], ...]
+    disruptions: Dict[str, Dict]
+
+def _digest(*parts) -> str:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+def line_state(line: Dict) -> LineState:
+    """
+    Reduce a Line payload from Line/Mode/{modes}/Status to its LineState.
+    """
+    statuses = line.get('lineStatuses') or []
+    severities = tuple(sorted((status.get('statusSeverity'), status.get('statusSeverityDescription')) for status in statuses))
+    disruptions = {}
+    for disruption in [status['disruption'] for status in statuses if status.get('disruption')] + list(line.get('disruptions') or []):
+        disruptions[_digest(disruption.get('category'), disruption.get('description'))] = disruption
+    return LineState(severities, disruptions)
+
+class StatusWatcher():
+    """
+    Single shared poll of Line/Mode/{modes}/Status turned into a stream of status transition events.
+
+    Each response body is hashed before decoding, so an unchanged response costs neither a decode
+    nor a comparison. Changed responses are reduced to a LineState per line and compared with the
+    previous one, producing SeverityChanged, DisruptionAdded and DisruptionCleared events. The first
+    poll reports the starting severity of every line and its current disruptions.
+
+    Events are delivered to every subscribed callback and to every ``listen`` async iterator, so
+    many consumers can share one poll.
+
+    Parameters
+    ----------
+    client : Client | AsyncClient
+        Client used for the requests.
+    modes : Sequence[str]
+        Modes to watch, e.g. ['tube', 'dlr', 'overground', 'elizabeth-line'].
+    interval : float, default: 30.0
+        Seconds between polls.
+    detail : bool, default: True
+        Request disruption details.
+
+    Attributes
+    ----------
+    lines : Dict[str, LineState]
+        Last known state per line id.
+    polls : int
+        Number of polls made.
+    unchanged : int
+        Number of polls skipped because the response body was identical to the previous one.
+
+    Examples
+    --------
+    >>> watcher = StatusWatcher(client, ['tube', 'dlr'])
+    >>> watcher.subscribe(lambda event: print(event))
+    >>> watcher.run()
+    """
+    def __init__(self, client, modes: Sequence[str], interval: float = 30.0, detail: bool = True) -> None:
+        self.client = client
+        self.modes = list(modes)
+        self.interval = interval
+        self.detail = detail
+        self.lines: Dict[str, LineState] = {}
+        self.polls = 0
+        self.unchanged = 0
+        self._body_digest = None
+        self._callbacks: List[Callable[[StatusEvent], None]] = []
+        self._queues: List[asyncio.Queue] = []
+
+    def subscribe(self, callback: Callable[[StatusEvent], None]) -> Callable[[StatusEvent], None]:
+        """
+        Call callback with every event; returns callback so it can be used as a decorator.
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[StatusEvent], None]) -> None:
+        """
+        Stop calling callback.
+        """
+        self._callbacks.remove(callback)
+
+    def _request(self):
+        return self.client.get(f"Line/Mode/{','.join(self.modes)}/Status", raw=True, params={'detail': self.detail})
+
+    def update(self, body: bytes) -> List[StatusEvent]:
+        """
+        Process a raw response body, publishing and returning the resulting events.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == self._body_digest:
+            self.unchanged += 1
+            return []
+        self._body_digest = digest
+        events: List[StatusEvent] = []
+        lines = {}
+        for line in self.client.decoder(body):
+            line_id = line['id']
+            state = lines[line_id] = line_state(line)
+            previous = self.lines.get(line_id, LineState((), {}))
+            if state.severities != previous.severities:
+                events.append(SeverityChanged(line_id, previous.severities, state.severities))
+            events.extend(DisruptionAdded(line_id, disruption) for key, disruption in state.disruptions.items() if key not in previous.disruptions)
+            events.extend(DisruptionCleared(line_id, disruption) for key, disruption in previous.disruptions.items() if key not in state.disruptions)
+        for line_id, previous in self.lines.items():
+            if line_id not in lines:
+                events.extend(DisruptionCleared(line_id, disruption) for disruption in previous.disruptions.values())
+        self.lines = lines
+        self._publish(events)
+        return events
+
+    def _publish(self, events: List[StatusEvent]) -> None:
+        for event in events:
+            for callback in list(self._callbacks):
+                callback(event)
+            for queue in self._queues:
+                queue.put_nowait(event)
+
+    def poll(self) -> List[StatusEvent]:
+        """
+        Poll once through a blocking client.
+        """
+        self.polls += 1
+        return self.update(self._request())
+
+    async def poll_async(self) -> List[StatusEvent]:
+        """
+        Poll once through an AsyncClient.
+        """
+        self.polls += 1
+        return self.update(await self._request())
+
+    def events(self, max_polls: int|None = None) -> Iterator[StatusEvent]:
+        """
+        Poll every interval seconds, yielding events as they are detected.
+
+        Parameters
+        ----------
+        max_polls : int | None, optional
+            Stop after this many polls, by default poll forever.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            yield from self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.interval)
+
+    def run(self, max_polls: int|None = None) -> None:
+        """
+        Poll every interval seconds, delivering events to the subscribed callbacks only.
+        """
+        for _ in self.events(max_polls):
+            pass
+
+    async def arun(self, max_polls: int|None = None) -> None:
+        """
+        Async counterpart of run for use with an AsyncClient; also feeds the listen iterators.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            await self.poll_async()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(self.interval)
+
+    async def listen(self) -> AsyncIterator[StatusEvent]:
+        """
+        Async iterator over the events published from now on by the shared poll running in arun.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
@@ -0,0 +1,188 @@
+'''
+streaming.py
+'''
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+import codecs
+import json
+import re
+from tfl.exceptions import TFLRequestException
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',]' + _WHITESPACE
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+_STRING_END = re.compile(r'["\\]')
+
+class JSONArrayParser():
+    """
+    Incremental parser yielding the elements of a top-level JSON array as its bytes arrive.
+
+    Only the unparsed tail of the document is buffered, so memory stays proportional to the
+    largest single element rather than to the whole response. Objects, arrays and strings are
+    scanned for their closing delimiter as chunks arrive, keeping track of nesting and string
+    state, and decoded once complete, so an element spread over many chunks costs linear time.
+
+    Examples
+    --------
+    >>> parser = JSONArrayParser()
+    >>> parser.feed(b'[{"id": "victoria"}, {"id"')
+    [{'id': 'victoria'}]
+    >>> parser.feed(b': "circle"}]')
+    [{'id': 'circle'}]
+    >>> parser.close()
+    """
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = 'start'
+        # scan of the element at _pos: how far it got, its nesting depth and string state
+        self._scanned = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add a chunk of the response body and return the elements completed by it.
+        """
+        self._rebase(self._text.decode(chunk))
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body, returning any remaining elements.
+
+        Raises
+        ------
+        TFLRequestException
+            If the body was not a complete JSON array.
+        """
+        self._rebase(self._text.decode(b'', final=True))
+        items = self._parse(final=True)
+        if self._state != 'done' or self._buffer[self._pos:].strip(_WHITESPACE):
+            raise TFLRequestException(f'Invalid Response: truncated JSON array ({self._buffer[self._pos:self._pos + 80]!r})')
+        return items
+
+    def _rebase(self, text: str) -> None:
+        # drop the parsed head of the buffer and append text
+        self._buffer = self._buffer[self._pos:] + text
+        if self._scanned is not None:
+            self._scanned -= self._pos
+        self._pos = 0
+
+    def _element_end(self) -> int|None:
+        """
+        Returns the end of the object, array or string starting at _pos, or None if its closing
+        delimiter has not arrived yet. The scan resumes where the previous call stopped.
+        """
+        buffer = self._buffer
+        if self._scanned is None:
+            self._in_string = buffer[self._pos] == '"'
+            self._depth = 0 if self._in_string else 1
+            self._escaped = False
+            self._scanned = self._pos + 1
+        pos, size = self._scanned, len(buffer)
+        while pos < size:
+            if self._escaped:
+                pos += 1
+                self._escaped = False
+            elif self._in_string:
+                match = _STRING_END.search(buffer, pos)
+                if match is None:
+                    pos = size
+                elif match.group() == '\\':
+                    pos = match.end()
+                    self._escaped = True
+                else:
+                    pos = match.end()
+                    self._in_string = False
+                    if self._depth == 0:
+                        self._scanned = None
+                        return pos
+            else:
+                match = _STRUCTURE.search(buffer, pos)
+                if match is None:
+                    pos = size
+                    continue
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in '{[':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        self._scanned = None
+                        return pos
+        self._scanned = pos
+        return None
+
+    def _skip_whitespace(self) -> None:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        while True:
+            self._skip_whitespace()
+            if self._pos >= len(self._buffer) or self._state == 'done':
+                return items
+            char = self._buffer[self._pos]
+            if self._state == 'start':
+                if char != '[':
+                    raise TFLRequestException(f'Invalid Response: expected a JSON array, got {char!r}')
+                self._pos += 1
+                self._state = 'first'
+            elif self._state in ('first', 'value'):
+                if char == ']' and self._state == 'first':
+                    self._pos += 1
+                    self._state = 'done'
+                    continue
+                container = char in '{["'
+                if container and self._element_end() is None and not final:
+                    return items
+                try:
+                    item, end = self._decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError as exc:
+                    if final or container:
+                        raise TFLRequestException(f'Invalid Response: {exc}') from exc
+                    return items
+                # a number or literal is only complete once the delimiter after it has arrived,
+                # e.g. '-1' may continue as '-1.5e3' in the next chunk
+                if not final and not container and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+                    return items
+                items.append(item)
+                self._pos = end
+                self._state = 'separator'
+            else:
+                if char == ',':
+                    self._state = 'value'
+                elif char == ']':
+                    self._state = 'done'
+                else:
+                    raise TFLRequestException(f'Invalid Response: expected , or ] in JSON array, got {char!r}')
+                self._pos += 1
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array read from an iterable of byte chunks.
+    """
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Yield the elements of a top-level JSON array read from an async iterable of byte chunks.
+    """
+    parser = JSONArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -0,0 +1,339 @@
+'''
+tables.py
+'''
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+from datetime import datetime, timezone
+from tfl.entity_base import Entity, parse_datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+class Column(NamedTuple):
+    """
+    A column of a Table.
+
+    Attributes
+    ----------
+    name : str
+        Column name.
+    key : str
+        JSON key the values are read from.
+    type : str
+        Swagger type of the field: 'string', 'integer', 'number', 'boolean' or 'date-time'.
+    dictionary : bool
+        Whether the strings are dictionary encoded, for repeated values such as ids and names.
+    """
+    name: str
+    key: str
+    type: str
+    dictionary: bool = False
+
+class TableSpec(NamedTuple):
+    """
+    How a response flattens into rows.
+
+    Attributes
+    ----------
+    entity : str
+        Entity (``tfl.entities``) of the objects that become rows.
+    columns : Tuple[Tuple[str, str, bool], ...]
+        (column name, JSON key, dictionary encoded) of the row fields.
+    parent : str | None
+        Entity of the response items when the rows are a list nested in each of them, e.g. the
+        lineStatuses of each Line. None when the response items are the rows.
+    rows : str | None
+        JSON key of the nested list of rows in each parent.
+    parent_columns : Tuple[Tuple[str, str, bool], ...]
+        (column name, JSON key, dictionary encoded) of the parent fields repeated on each of its rows.
+    """
+    entity: str
+    columns: Tuple[Tuple[str, str, bool], ...]
+    parent: str|None = None
+    rows: str|None = None
+    parent_columns: Tuple[Tuple[str, str, bool], ...] = ()
+
+# one row per lineStatus of every Line
+LINE_STATUSES = TableSpec(
+    entity='LineStatus',
+    columns=(
+        ('status_severity', 'statusSeverity', False),
+        ('status_severity_description', 'statusSeverityDescription', True),
+        ('reason', 'reason', False),
+        ('created', 'created', False),
+        ('modified', 'modified', False),
+    ),
+    parent='Line',
+    rows='lineStatuses',
+    parent_columns=(('line_id', 'id', True), ('line_name', 'name', True), ('mode_name', 'modeName', True)),
+)
+
+# one row per Prediction
+ARRIVALS = TableSpec(
+    entity='Prediction',
+    columns=(
+        ('id', 'id', False),
+        ('vehicle_id', 'vehicleId', True),
+        ('naptan_id', 'naptanId', True),
+        ('station_name', 'stationName', True),
+        ('line_id', 'lineId', True),
+        ('line_name', 'lineName', True),
+        ('platform_name', 'platformName', True),
+        ('direction', 'direction', True),
+        ('destination_naptan_id', 'destinationNaptanId', True),
+        ('destination_name', 'destinationName', True),
+        ('towards', 'towards', True),
+        ('current_location', 'currentLocation', True),
+        ('mode_name', 'modeName', True),
+        ('time_to_station', 'timeToStation', False),
+        ('timestamp', 'timestamp', False),
+        ('expected_arrival', 'expectedArrival', False),
+        ('time_to_live', 'timeToLive', False),
+    ),
+)
+
+# one row per routeSection of every Line
+ROUTE_SECTIONS = TableSpec(
+    entity='MatchedRoute',
+    columns=(
+        ('route_code', 'routeCode', True),
+        ('name', 'name', True),
+        ('direction', 'direction', True),
+        ('origination_name', 'originationName', True),
+        ('destination_name', 'destinationName', True),
+        ('originator', 'originator', True),
+        ('destination', 'destination', True),
+        ('service_type', 'serviceType', True),
+        ('valid_from', 'validFrom', False),
+        ('valid_to', 'validTo', False),
+    ),
+    parent='Line',
+    rows='routeSections',
+    parent_columns=(('line_id', 'id', True), ('line_name', 'name', True), ('mode_name', 'modeName', True)),
+)
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('Tables require numpy, install it with `pip install tfl[numpy]`')
+
+def swagger_types(entity: str) -> Dict[str, str]:
+    """
+    Returns the swagger type of every JSON key of the entity, from the generated ``tfl.entities``.
+    """
+    import tfl.entities  # noqa: F401 - registers the generated entities
+    from tfl.entity_base import ENTITY_TYPES
+    cls = ENTITY_TYPES[entity]
+    return {key: type_ for (_, key), type_ in zip(cls._fields, cls._types)}
+
+def schema_for(spec: TableSpec) -> Tuple[Column, ...]:
+    """
+    Returns the columns of the tables built from spec, parent columns first, typed from swagger.
+    """
+    columns = []
+    for entity, fields in ((spec.parent, spec.parent_columns), (spec.entity, spec.columns)):
+        if not fields:
+            continue
+        types = swagger_types(entity)
+        columns += [Column(name, key, types[key], dictionary) for name, key, dictionary in fields]
+    return tuple(columns)
+
+def _encode(values: List) -> Tuple['np.ndarray', List[str]]:
+    # int32 codes into the distinct values in order of appearance, -1 for None
+    index: Dict[str, int] = {}
+    codes = [-1 if value is None else index.setdefault(value, len(index)) for value in values]
+    return np.array(codes, dtype=np.int32), list(index)
+
+def _utc_text(value: str) -> str|None:
+    parsed = parse_datetime(value)
+    if not isinstance(parsed, datetime):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat()
+
+def _timestamps(values: List) -> 'np.ndarray':
+    # datetime64[ms] in UTC, NaT for missing or unparseable values
+    texts = [value[:-1] if value is not None and value.endswith('Z') else value for value in values]
+    # numpy only parses naive timestamps; TfL sends 'Z' but anything with an offset is converted here
+    if not any(text is not None and ('+' in text[10:] or '-' in text[10:]) for text in texts):
+        try:
+            return np.array(texts, dtype='datetime64[ms]')
+        except ValueError:
+            pass
+    return np.array([None if value is None else _utc_text(value) for value in values], dtype='datetime64[ms]')
+
+def _convert(column: Column, values: List) -> Tuple['np.ndarray', 'np.ndarray|None']:
+    # (array, validity mask or None when no value is missing)
+    if column.type in ('integer', 'number', 'boolean'):
+        missing = [value is None for value in values]
+        valid = ~np.array(missing, dtype=bool) if any(missing) else None
+        dtype = {'integer': np.int64, 'number': np.float64, 'boolean': np.bool_}[column.type]
+        fill = {'integer': 0, 'number': np.nan, 'boolean': False}[column.type]
+        if valid is not None:
+            values = [fill if value is None else value for value in values]
+        return np.array(values, dtype=dtype), valid
+    if column.type == 'date-time':
+        return _timestamps(values), None
+    return np.array(values, dtype=object), None
+
+class Table():
+    """
+    Columnar form of a list response, built straight from the decoded JSON without row dicts.
+
+    Every column is a numpy array: int64, float64 and bool for the numeric fields, datetime64[ms]
+    (UTC, NaT when missing) for timestamps and object arrays for free text. Dictionary encoded
+    columns hold int32 codes (-1 when missing) into a list of distinct strings, so repeated line
+    ids, modes and stop names are stored once.
+
+    Attributes
+    ----------
+    schema : Tuple[Column, ...]
+        The columns, typed from the swagger definitions.
+    arrays : Dict[str, np.ndarray]
+        Values, or codes for dictionary encoded columns, per column name.
+    dictionaries : Dict[str, List[str]]
+        Distinct values of each dictionary encoded column.
+    valid : Dict[str, np.ndarray]
+        Validity masks of the numeric columns with missing values.
+
+    Examples
+    --------
+    >>> table = client.line.get_arrival_predictions_table(['victoria'], '940GZZLUOXC')
+    >>> table.column('time_to_station').mean()
+    >>> table.to_arrow().group_by('platform_name').aggregate([('time_to_station', 'min')])
+    """
+    def __init__(self, schema: Tuple[Column, ...], arrays: Dict[str, 'np.ndarray'], dictionaries: Dict[str, List[str]], valid: Dict[str, 'np.ndarray']) -> None:
+        self.schema = schema
+        self.arrays = arrays
+        self.dictionaries = dictionaries
+        self.valid = valid
+
+    @property
+    def column_names(self) -> List[str]:
+        return [column.name for column in self.schema]
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.arrays[self.schema[0].name]) if self.schema else 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def column(self, name: str) -> 'np.ndarray':
+        """
+        Returns the values of a column, decoding dictionary encoded columns to an object array.
+        """
+        values = self.arrays[name]
+        if name not in self.dictionaries:
+            return values
+        lookup = np.array(self.dictionaries[name] + [None], dtype=object)
+        return lookup[values]
+
+    def to_records(self) -> 'np.ndarray':
+        """
+        Returns the table as a numpy structured array with one field per column.
+
+        Strings are decoded to objects; missing numbers are 0, NaN or False.
+        """
+        dtype = [(column.name, self.arrays[column.name].dtype if column.name not in self.dictionaries else object) for column in self.schema]
+        records = np.empty(self.num_rows, dtype=dtype)
+        for column in self.schema:
+            records[column.name] = self.column(column.name)
+        return records
+
+    def to_arrow(self):
+        """
+        Returns the table as a ``pyarrow.Table``, with dictionary encoded columns as
+        ``pyarrow.DictionaryArray`` and missing values as nulls.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as error:
+            raise ImportError('to_arrow requires pyarrow, install it with `pip install tfl[arrow]`') from error
+        arrays = {}
+        for column in self.schema:
+            values = self.arrays[column.name]
+            if column.name in self.dictionaries:
+                codes = pa.array(values, type=pa.int32(), mask=values < 0)
+                arrays[column.name] = pa.DictionaryArray.from_arrays(codes, pa.array(self.dictionaries[column.name], type=pa.string()))
+            elif column.type == 'date-time':
+                arrays[column.name] = pa.array(values, type=pa.timestamp('ms', tz='UTC'), mask=np.isnat(values))
+            elif column.type == 'string':
+                arrays[column.name] = pa.array(values, type=pa.string())
+            else:
+                valid = self.valid.get(column.name)
+                arrays[column.name] = pa.array(values, mask=None if valid is None else ~valid)
+        return pa.table(arrays)
+
+    def __repr__(self) -> str:
+        return f'Table({self.num_rows} rows, columns={self.column_names})'
+
+def build_table(spec: TableSpec, items: Iterable[Any]) -> Table:
+    """
+    Flatten a list response into a Table according to spec.
+
+    Parameters
+    ----------
+    spec : TableSpec
+        LINE_STATUSES, ARRIVALS, ROUTE_SECTIONS or a custom spec.
+    items : Iterable[Dict | Entity]
+        Decoded response items, as dicts or entities.
+    """
+    _require_numpy()
+    items = [item.to_dict() if isinstance(item, Entity) else item for item in items]
+    schema = schema_for(spec)
+    arrays, dictionaries, valid = {}, {}, {}
+
+    def add(column: Column, values: List, repeats: 'np.ndarray|None' = None) -> None:
+        if column.dictionary:
+            array, dictionaries[column.name] = _encode(values)
+        else:
+            array, mask = _convert(column, values)
+            if mask is not None:
+                valid[column.name] = mask if repeats is None else np.repeat(mask, repeats)
+        arrays[column.name] = array if repeats is None else np.repeat(array, repeats)
+
+    if spec.rows is None:
+        rows = items
+    else:
+        rows, counts = [], []
+        for item in items:
+            children = item.get(spec.rows) or ()
+            rows.extend(children)
+            counts.append(len(children))
+        repeats = np.array(counts, dtype=np.intp)
+        # parent values are converted once per parent and repeated over its rows
+        for column in schema[:len(spec.parent_columns)]:
+            add(column, [item.get(column.key) for item in items], repeats)
+    for column in schema[len(spec.parent_columns):]:
+        add(column, [row.get(column.key) for row in rows])
+    return Table(schema, arrays, dictionaries, valid)
+
+def line_statuses_table(lines: Sequence[Dict]) -> Table:
+    """
+    One row per lineStatus of Line/{ids}/Status style responses, see LINE_STATUSES.
+    """
+    return build_table(LINE_STATUSES, lines)
+
+def arrivals_table(predictions: Sequence[Dict]) -> Table:
+    """
+    One row per prediction of an arrivals response, see ARRIVALS.
+    """
+    return build_table(ARRIVALS, predictions)
+
+def route_sections_table(lines: Sequence[Dict]) -> Table:
+    """
+    One row per routeSection of Line/.../Route style responses, see ROUTE_SECTIONS.
+    """
+    return build_table(ROUTE_SECTIONS, lines)
+
+def then(result, convert):
+    """
+    Apply convert to a response, awaiting it first when it comes from an AsyncClient.
+    """
+    if hasattr(result, '__await__'):
+        async def converted():
+            return convert(await result)
+        return converted()
+    return convert(result)
@@ -0,0 +1,268 @@
+'''
+timetable.py
+'''
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+from datetime import datetime, time as dt_time
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Series are laid out back to back in one array as series * _STRIDE + minutes, so a single
+# searchsorted answers queries for many series. Timetable hours run past 24 for late journeys.
+_STRIDE = 10_000
+
+SeriesKey = Tuple[str, str, str, str]
+
+class Departure(NamedTuple):
+    """
+    A scheduled departure: minutes counts from midnight of the service day and may exceed 1440.
+    """
+    stop_id: str
+    line_id: str
+    direction: str
+    day_type: str
+    minutes: float
+
+    @property
+    def time(self) -> str:
+        return format_minutes(self.minutes)
+
+class Journey(NamedTuple):
+    """
+    A scheduled trip between two stops of the same timetable route.
+    """
+    line_id: str
+    direction: str
+    day_type: str
+    departure: float
+    arrival: float
+
+def to_minutes(value) -> float:
+    """
+    Convert minutes, an 'HH:MM' string, a datetime.time or a datetime to minutes after midnight.
+    """
+    if isinstance(value, str):
+        hour, minute = value.split(':')[:2]
+        return int(hour) * 60 + float(minute)
+    if isinstance(value, (datetime, dt_time)):
+        return value.hour * 60 + value.minute + value.second / 60
+    return float(value)
+
+def format_minutes(minutes: float) -> str:
+    """
+    Format minutes after midnight as 'HH:MM', wrapping past midnight.
+    """
+    minutes = int(round(minutes))
+    return f'{minutes // 60 % 24:02d}:{minutes % 60:02d}'
+
+class _RouteTable(NamedTuple):
+    # journeys of one timetable route and schedule
+    line_id: str
+    direction: str
+    day_type: str
+    departures: 'np.ndarray'
+    intervals: 'np.ndarray'
+    stop_index: Dict[str, int]
+    offsets: 'np.ndarray'
+
+class Timetable():
+    """
+    Compiled form of Line/{id}/Timetable/{stopId} responses for fast departure queries.
+
+    Every (stop, line, direction, day type) gets a sorted series of departure minutes, built from
+    each schedule's knownJourneys shifted by the ``stationIntervals`` offsets of the stops they call
+    at. All series share one flat array keyed as ``series * _STRIDE + minutes``, so next-departure
+    queries, single or batched over thousands of stops, are a vectorised binary search.
+    "Arrive by" queries use the per-route journey tables and the interval offset matrices.
+
+    Parameters
+    ----------
+    responses : Iterable[Dict]
+        Decoded TimetableResponse dicts (or entities).
+
+    Notes
+    -----
+    Requires the optional ``numpy`` dependency (``pip install tfl[numpy]``). Day types are the
+    schedule names of the responses e.g. 'Monday - Friday', 'Saturday', 'Sunday'.
+
+    Examples
+    --------
+    >>> timetable = Timetable.from_client(client, 'victoria', ['940GZZLUBXN', '940GZZLUWWL'])
+    >>> timetable.next_departures('940GZZLUOXC', '08:15', n=3, day_type='Monday - Friday')
+    >>> timetable.arrive_by('940GZZLUOXC', '940GZZLUVXL', '09:00', day_type='Monday - Friday')
+    """
+    def __init__(self, responses: Iterable[Dict]) -> None:
+        if np is None:
+            raise ImportError("Timetable requires numpy, install it with 'pip install tfl[numpy]'")
+        self.routes: List[_RouteTable] = []
+        for response in responses:
+            if hasattr(response, 'to_dict'):
+                response = response.to_dict()
+            self.routes.extend(self._compile_response(response))
+        series: Dict[SeriesKey, List] = {}
+        for route in self.routes:
+            for stop_id, column in route.stop_index.items():
+                times = route.departures + route.offsets[route.intervals, column]
+                series.setdefault((stop_id, route.line_id, route.direction, route.day_type), []).append(times[~np.isnan(times)])
+        self.keys: List[SeriesKey] = sorted(series)
+        self._series_index = {key: i for i, key in enumerate(self.keys)}
+        self._stop_series: Dict[str, List[int]] = {}
+        for i, key in enumerate(self.keys):
+            self._stop_series.setdefault(key[0], []).append(i)
+        self._filtered_series: Dict[Tuple, List[int]] = {}
+        arrays = [np.unique(np.concatenate(series[key])) for key in self.keys]
+        self.series_offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in arrays], out=self.series_offsets[1:])
+        self.minutes = np.concatenate(arrays) if arrays else np.zeros(0)
+        self._series_of = np.repeat(np.arange(len(arrays)), np.diff(self.series_offsets))
+        self._flat = self._series_of * _STRIDE + self.minutes
+        self._series_stops = np.array([key[0] for key in self.keys], dtype=object)
+
+    @staticmethod
+    def _compile_response(response: Dict) -> List[_RouteTable]:
+        line_id = response.get('lineId')
+        direction = response.get('direction')
+        timetable = response.get('timetable') or {}
+        departure_stop = timetable.get('departureStopId')
+        tables = []
+        for route in timetable.get('routes') or []:
+            interval_ids = {}
+            stop_index = {departure_stop: 0}
+            rows = []
+            for station_interval in route.get('stationIntervals') or []:
+                interval_ids[str(station_interval.get('id'))] = len(rows)
+                row = {departure_stop: 0.0}
+                for interval in station_interval.get('intervals') or []:
+                    stop_index.setdefault(interval['stopId'], len(stop_index))
+                    row[interval['stopId']] = float(interval['timeToArrival'])
+                rows.append(row)
+            if not rows:
+                interval_ids['0'] = 0
+                rows.append({departure_stop: 0.0})
+            offsets = np.full((len(rows), len(stop_index)), np.nan)
+            for i, row in enumerate(rows):
+                for stop_id, offset in row.items():
+                    offsets[i, stop_index[stop_id]] = offset
+            for schedule in route.get('schedules') or []:
+                journeys = schedule.get('knownJourneys') or []
+                departures = np.array([int(j['hour']) * 60 + int(j['minute']) for j in journeys], dtype=np.float64)
+                intervals = np.array([interval_ids.get(str(j.get('intervalId', 0)), 0) for j in journeys], dtype=np.int64)
+                tables.append(_RouteTable(line_id, direction, schedule.get('name'), departures, intervals, stop_index, offsets))
+        return tables
+
+    @classmethod
+    def from_client(cls, client, line_id: str, stop_point_ids: Sequence[str]) -> 'Timetable':
+        """
+        Fetch the timetables of line_id from each of stop_point_ids through client and compile them.
+        """
+        return cls(client.line.get_timetable_for_station(line_id, stop_point_id) for stop_point_id in stop_point_ids)
+
+    @property
+    def day_types(self) -> List[str]:
+        return sorted({key[3] for key in self.keys})
+
+    def _matching_series(self, stop_id: str|None, line_id: str|None, direction: str|None, day_type: str|None) -> List[int]:
+        if None not in (stop_id, line_id, direction, day_type):
+            i = self._series_index.get((stop_id, line_id, direction, day_type))
+            return [] if i is None else [i]
+        if stop_id is not None:
+            return [i for i in self._stop_series.get(stop_id, ()) if self._matches(*self.keys[i][1:], line_id, direction, day_type)]
+        # stop-less filters come from batch queries and are few, so their scans are kept
+        filters = (line_id, direction, day_type)
+        series = self._filtered_series.get(filters)
+        if series is None:
+            series = self._filtered_series[filters] = [i for i, key in enumerate(self.keys) if self._matches(*key[1:], *filters)]
+        return series
+
+    @staticmethod
+    def _matches(line: str, d: str, day: str, line_id: str|None, direction: str|None, day_type: str|None) -> bool:
+        return (line_id is None or line == line_id) and (direction is None or d == direction) and (day_type is None or day == day_type)
+
+    def departures(self, stop_id: str, line_id: str, direction: str, day_type: str) -> 'np.ndarray':
+        """
+        Returns the sorted departure minutes of one series.
+        """
+        i = self._series_index[(stop_id, line_id, direction, day_type)]
+        return self.minutes[self.series_offsets[i]:self.series_offsets[i + 1]]
+
+    def next_departures(self, stop_id: str, after, n: int = 5, line_id: str|None = None, direction: str|None = None, day_type: str|None = None) -> List[Departure]:
+        """
+        Returns the next n departures from stop_id at or after the given time, earliest first.
+
+        Parameters
+        ----------
+        after : float | str | datetime.time | datetime
+            Minutes after midnight, or an 'HH:MM' string / time.
+        line_id, direction, day_type : str | None, optional
+            Restrict the search; by default every line, direction and day type at the stop.
+        """
+        after = to_minutes(after)
+        found = []
+        for i in self._matching_series(stop_id, line_id, direction, day_type):
+            start, end = self.series_offsets[i], self.series_offsets[i + 1]
+            position = start + np.searchsorted(self.minutes[start:end], after)
+            _, line, d, day = self.keys[i]
+            found.extend(Departure(stop_id, line, d, day, float(m)) for m in self.minutes[position:min(position + n, end)])
+        found.sort(key=lambda departure: departure.minutes)
+        return found[:n]
+
+    def next_departure_batch(self, stop_ids: Sequence[str], after, line_id: str|None = None, direction: str|None = None, day_type: str|None = None) -> 'np.ndarray':
+        """
+        Returns, for each of stop_ids, the minutes of the first departure at or after after (NaN if none).
+
+        after may be a single time or one time per stop.
+        """
+        stop_ids = np.asarray(stop_ids, dtype=object)
+        after = np.asarray([to_minutes(a) for a in np.atleast_1d(after)], dtype=np.float64)
+        # a time before midnight would search into the end of the previous series
+        after = np.broadcast_to(np.maximum(after, 0.0), stop_ids.shape)
+        result = np.full(stop_ids.shape, np.nan)
+        series = np.array(self._matching_series(None, line_id, direction, day_type), dtype=np.int64)
+        if not len(series) or not len(stop_ids):
+            return result
+        # pair every query with every matching series at its stop
+        order = np.argsort(self._series_stops[series])
+        series = series[order]
+        series_stops = self._series_stops[series]
+        left = np.searchsorted(series_stops, stop_ids, side='left')
+        right = np.searchsorted(series_stops, stop_ids, side='right')
+        counts = right - left
+        queries = np.repeat(np.arange(len(stop_ids)), counts)
+        if not len(queries):
+            return result
+        starts = np.repeat(left, counts)
+        pair_series = series[starts + np.arange(len(queries)) - np.repeat(np.cumsum(counts) - counts, counts)]
+        positions = np.searchsorted(self._flat, pair_series * _STRIDE + after[queries])
+        valid = positions < self.series_offsets[pair_series + 1]
+        times = np.where(valid, self.minutes[np.minimum(positions, len(self.minutes) - 1)], np.inf)
+        best = np.full(len(stop_ids), np.inf)
+        np.minimum.at(best, queries, times)
+        result[np.isfinite(best)] = best[np.isfinite(best)]
+        return result
+
+    def arrive_by(self, from_stop_id: str, to_stop_id: str, by, line_id: str|None = None, direction: str|None = None, day_type: str|None = None) -> Journey|None:
+        """
+        Returns the latest scheduled journey from from_stop_id reaching to_stop_id no later than by, or None.
+
+        line_id, direction and day_type restrict the search like in next_departures; the direction
+        of travel already follows from the order of the two stops on a route.
+        """
+        by = to_minutes(by)
+        best = None
+        for route in self.routes:
+            if not self._matches(route.line_id, route.direction, route.day_type, line_id, direction, day_type):
+                continue
+            a, x = route.stop_index.get(from_stop_id), route.stop_index.get(to_stop_id)
+            if a is None or x is None or not len(route.departures):
+                continue
+            departs = route.departures + route.offsets[route.intervals, a]
+            arrives = route.departures + route.offsets[route.intervals, x]
+            with np.errstate(invalid='ignore'):
+                mask = (departs < arrives) & (arrives <= by)
+            if mask.any():
+                j = int(np.flatnonzero(mask)[np.argmax(departs[mask])])
+                if best is None or departs[j] > best.departure:
+                    best = Journey(route.line_id, route.direction, route.day_type, float(departs[j]), float(arrives[j]))
+        return best
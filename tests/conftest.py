@@ -0,0 +1,55 @@
+'''
+conftest.py
+'''
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+import pytest
+
+class StubHandler(BaseHTTPRequestHandler):
+    '''
+    Serves canned JSON payloads registered on the owning server, keyed on the url path.
+    Routes map to (status, body) or (status, body, headers), or to a list of those served in
+    turn (the last one repeats); a route with an ETag header answers a matching If-None-Match
+    with 304 Not Modified.
+    '''
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        path = urlsplit(self.path).path.lstrip('/')
+        server.requests.append(self.path)
+        route = server.routes.get(path, (404, {'httpStatusCode': 404, 'message': 'Not found'}))
+        if isinstance(route, list):
+            route = route.pop(0) if len(route) > 1 else route[0]
+        status, body, *extra = route
+        headers = extra[0] if extra else {}
+        payload = json.dumps(body).encode()
+        if 'ETag' in headers and self.headers.get('If-None-Match') == headers['ETag']:
+            status, payload = 304, b''
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    '''
+    stub_server
+    '''
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.routes = {}
+    server.requests = []
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
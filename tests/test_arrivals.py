@@ -0,0 +1,79 @@
+'''
+test_arrivals.py
+'''
+import asyncio
+import pytest
+from tfl.client import Client
+from tfl.arrivals import ADDED, REMOVED, UPDATED, ArrivalsMonitor
+
+def prediction(id_, expected, time_to_station, platform='Northbound - Platform 1'):
+    '''
+    prediction
+    '''
+    return {'id': id_, 'naptanId': '940GZZLUOXC', 'vehicleId': id_, 'lineName': 'Victoria', 'expectedArrival': expected, 'timeToStation': time_to_station, 'platformName': platform}
+
+BOARDS = [
+    (200, [prediction('1', '10:00:00', 60), prediction('2', '10:05:00', 360)]),
+    (200, [prediction('1', '10:00:00', 50), prediction('2', '10:06:00', 400)]),
+    (200, [prediction('2', '10:06:00', 350), prediction('3', '10:12:00', 700)]),
+]
+
+def test_monitor_emits_only_changes(stub_server):
+    '''
+    test_monitor_emits_only_changes
+    '''
+    stub_server.routes['StopPoint/940GZZLUOXC/Arrivals'] = list(BOARDS)
+    monitor = ArrivalsMonitor(Client(api_url=stub_server.url), ['940GZZLUOXC'], min_interval=5, max_interval=120)
+    assert [(e.kind, e.key) for e in monitor.poll()] == [(ADDED, '1'), (ADDED, '2')]
+    assert monitor.interval == 5
+    events = monitor.poll()
+    assert [(e.kind, e.key) for e in events] == [(UPDATED, '2')]
+    assert events[0].previous['expectedArrival'] == '10:05:00'
+    assert [(e.kind, e.key) for e in monitor.poll()] == [(ADDED, '3'), (REMOVED, '1')]
+    # the next arrival is almost six minutes away, so back off
+    assert monitor.interval == pytest.approx(350 / 4)
+
+def test_monitor_async_iteration(stub_server):
+    '''
+    test_monitor_async_iteration
+    '''
+    pytest.importorskip('aiohttp')
+    from tfl.async_client import AsyncClient
+    stub_server.routes['Line/victoria/Arrivals/940GZZLUOXC'] = list(BOARDS)
+
+    async def run():
+        async with AsyncClient(api_url=stub_server.url) as client:
+            monitor = ArrivalsMonitor(client, ['940GZZLUOXC'], line_ids=['victoria'], min_interval=0, max_interval=0)
+            return [(event.kind, event.key) async for event in monitor.aevents(max_polls=3)]
+
+    assert asyncio.run(run()) == [(ADDED, '1'), (ADDED, '2'), (UPDATED, '2'), (ADDED, '3'), (REMOVED, '1')]
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_failed_stops_keep_their_boards(stub_server, use_async):
+    '''
+    test_failed_stops_keep_their_boards
+    '''
+    error = (500, {'httpStatusCode': 500, 'message': 'Internal error'})
+    other = {**prediction('9', '10:02:00', 100), 'naptanId': '940GZZLUGPK'}
+    stub_server.routes['StopPoint/940GZZLUOXC/Arrivals'] = [BOARDS[0], error, BOARDS[1]]
+    stub_server.routes['StopPoint/940GZZLUGPK/Arrivals'] = [(200, []), (200, [other])]
+    # a retired naptan id is answered with 404 on every poll
+    stub_server.routes['StopPoint/940GZZLURETIRED/Arrivals'] = (404, {'httpStatusCode': 404, 'message': 'Not found'})
+    stops = ['940GZZLUOXC', '940GZZLUGPK', '940GZZLURETIRED']
+    if use_async:
+        pytest.importorskip('aiohttp')
+        from tfl.async_client import AsyncClient
+
+        async def run():
+            async with AsyncClient(api_url=stub_server.url) as client:
+                monitor = ArrivalsMonitor(client, stops)
+                return [[(e.kind, e.key) for e in await monitor.poll_async()] for _ in range(3)], monitor
+
+        polls, monitor = asyncio.run(run())
+    else:
+        monitor = ArrivalsMonitor(Client(api_url=stub_server.url), stops)
+        polls = [[(e.kind, e.key) for e in monitor.poll()] for _ in range(3)]
+    # the failed poll of 940GZZLUOXC keeps its board, so its predictions are not removed
+    assert polls == [[(ADDED, '1'), (ADDED, '2')], [(ADDED, '9')], [(UPDATED, '2')]]
+    assert monitor.errors == 4 and set(monitor.failures) == {'940GZZLURETIRED'}
+    assert monitor.last_error.status_code == 404
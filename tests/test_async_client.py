@@ -0,0 +1,35 @@
+'''
+test_async_client.py
+'''
+import asyncio
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from tfl.async_client import AsyncClient
+from tfl.exceptions import TFLAPIException
+
+def test_async_client_concurrent_requests(stub_server):
+    '''
+    test_async_client_concurrent_requests
+    '''
+    stub_server.routes['Line/victoria/Status'] = (200, [{'id': 'victoria'}])
+
+    async def run():
+        async with AsyncClient(api_url=stub_server.url, pool_size=4) as client:
+            return await asyncio.gather(*(client.line.get_line_status(['victoria'], True) for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert results == [[{'id': 'victoria'}]] * 10
+    assert stub_server.requests[0].endswith('detail=true')
+
+def test_async_client_raises_api_exception(stub_server):
+    '''
+    test_async_client_raises_api_exception
+    '''
+    async def run():
+        async with AsyncClient(api_url=stub_server.url) as client:
+            await client.line.get_severity_codes()
+
+    with pytest.raises(TFLAPIException):
+        asyncio.run(run())
@@ -0,0 +1,76 @@
+'''
+test_batching.py
+'''
+import asyncio
+import threading
+import pytest
+from tfl.batching import AsyncMicroBatcher, MicroBatcher, chunk_ids
+from tfl.client import Client
+
+def test_chunk_ids_respects_count_and_length():
+    '''
+    test_chunk_ids_respects_count_and_length
+    '''
+    assert chunk_ids(['a', 'b', 'c'], max_ids=2) == ['a,b', 'c']
+    assert chunk_ids(['aaaa', 'bbbb', 'cccc'], max_chars=9) == ['aaaa,bbbb', 'cccc']
+    assert chunk_ids([]) == []
+
+def test_line_status_batches_long_id_lists(stub_server):
+    '''
+    test_line_status_batches_long_id_lists
+    '''
+    ids = [f'route{i}' for i in range(45)]
+    for chunk in chunk_ids(ids):
+        stub_server.routes[f'Line/{chunk}/Status'] = (200, [{'id': id_} for id_ in chunk.split(',')])
+    client = Client(api_url=stub_server.url)
+    result = client.line.get_line_status(ids, False)
+    assert [line['id'] for line in result] == ids
+    assert len(stub_server.requests) == 3
+
+def test_micro_batcher_combines_single_id_calls():
+    '''
+    test_micro_batcher_combines_single_id_calls
+    '''
+    requested = []
+
+    def fetch(ids):
+        requested.append(ids)
+        return [{'id': id_} for id_ in ids]
+
+    batcher = MicroBatcher(fetch, window=0.05)
+    results = {}
+    threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, batcher.get(f'line{i}'))) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(requested) == 1
+    assert results[3] == [{'id': 'line3'}]
+
+def test_async_micro_batcher_resolves_waiters_of_a_cancelled_fetch():
+    '''
+    test_async_micro_batcher_resolves_waiters_of_a_cancelled_fetch
+    '''
+    async def fetch(ids):
+        # a timeout inside fetch cancels the request
+        await asyncio.wait_for(asyncio.sleep(1), timeout=0.01)
+
+    async def main():
+        batcher = AsyncMicroBatcher(fetch, window=0.01)
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.get(f'line{i}') for i in range(3)), return_exceptions=True), timeout=1)
+        return results, batcher
+
+    results, batcher = asyncio.run(main())
+    assert len(results) == 3 and all(isinstance(result, BaseException) for result in results)
+    assert batcher.batches == 1 and not batcher._tasks
+
+    async def cancelled():
+        batcher = AsyncMicroBatcher(lambda ids: asyncio.sleep(1), window=0.0)
+        waiter = asyncio.ensure_future(batcher.get('line1'))
+        await asyncio.sleep(0.01)
+        for task in batcher._tasks:
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(cancelled())
@@ -0,0 +1,75 @@
+'''
+test_benchmarks.py
+'''
+from pathlib import Path
+import json
+import sys
+import pytest
+from tfl.client import Client
+from tfl.exceptions import TFLAPIException
+from tfl.ratelimit import RetryPolicy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from bench_client import bench_line_calls, compare
+from stub_server import StubTfLServer
+
+def test_stub_server_serves_swagger_endpoints(tmp_path):
+    '''
+    test_stub_server_serves_swagger_endpoints
+    '''
+    (tmp_path / 'BikePoint__BikePoints_1.json').write_text(json.dumps({'id': 'BikePoints_1'}))
+    with StubTfLServer(payload_scale=0.5, recordings=tmp_path) as server:
+        client = Client(api_url=server.url)
+        assert len(client.line.get_line_status(['victoria'], False)) == 10
+        assert client.get('BikePoint/BikePoints_1') == {'id': 'BikePoints_1'}
+        # synthesized from the swagger response schema
+        places = client.get('BikePoint')
+        assert len(places) == 10 and {'id', 'commonName', 'lat', 'lon'} <= set(places[0])
+        with pytest.raises(TFLAPIException):
+            client.get('NotAnEndpoint')
+
+def test_stub_server_injects_errors():
+    '''
+    test_stub_server_injects_errors
+    '''
+    with StubTfLServer(throttle_rate=1.0) as server:
+        client = Client(api_url=server.url, retry_policy=RetryPolicy(max_retries=2, backoff=0.001))
+        with pytest.raises(TFLAPIException) as error:
+            client.get('Line/Meta/Modes')
+        assert error.value.status_code == 429 and server.requests == 3
+        server.throttle_rate, server.error_rate = 0.0, 1.0
+        with pytest.raises(TFLAPIException) as error:
+            client.get('Line/Meta/Modes')
+        assert error.value.status_code == 500
+
+def test_compare_flags_regressions():
+    '''
+    test_compare_flags_regressions
+    '''
+    previous = {'metrics': {'line.get_line_status.requests_per_s': 1000.0, 'line.get_line_status.p99_ms': 2.0, 'memory.arrivals.dicts_kb': 100.0}}
+    current = {'metrics': {'line.get_line_status.requests_per_s': 850.0, 'line.get_line_status.p99_ms': 1.5, 'memory.arrivals.dicts_kb': 105.0, 'new.metric_ms': 1.0}}
+    rows = {row['metric']: row for row in compare(current, previous, threshold=0.1)}
+    assert set(rows) == set(previous['metrics'])
+    assert rows['line.get_line_status.requests_per_s']['regressed']
+    assert not rows['line.get_line_status.p99_ms']['regressed']
+    assert not rows['memory.arrivals.dicts_kb']['regressed']
+
+def test_compare_refuses_other_configurations():
+    '''
+    test_compare_refuses_other_configurations
+    '''
+    previous = {'meta': {'config': {'requests': 200, 'latency': 0.0}}, 'metrics': {'line.get_line_status.p99_ms': 2.0}}
+    current = {'meta': {'config': {'requests': 200, 'latency': 0.005}}, 'metrics': {'line.get_line_status.p99_ms': 7.0}}
+    with pytest.raises(ValueError, match='latency'):
+        compare(current, previous)
+    current['meta']['config']['latency'] = 0.0
+    assert len(compare(current, previous)) == 1
+
+def test_scenarios_survive_injected_errors():
+    '''
+    test_scenarios_survive_injected_errors
+    '''
+    with StubTfLServer(error_rate=0.2, throttle_rate=0.2) as server:
+        results = bench_line_calls(server, 10)
+    assert results['line.get_line_status.failures'] == 0
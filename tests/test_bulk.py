@@ -0,0 +1,71 @@
+'''
+test_bulk.py
+'''
+import time
+from tfl.bulk import BulkExecutor, Call
+from tfl.disk_cache import DiskCache
+from tfl.exceptions import TFLAPIException
+
+def count_statuses(call, value):
+    return len(value)
+
+def test_bulk_executor_shares_disk_cache(stub_server, tmp_path):
+    '''
+    test_bulk_executor_shares_disk_cache
+    '''
+    lines = ['victoria', 'central', 'jubilee', 'northern', 'bakerloo']
+    for line in lines:
+        stub_server.routes[f'Line/{line}/Status'] = (200, [{'id': line}, {'id': line}])
+    calls = [Call.of('line.get_line_status', [line], False) for line in lines] + [Call.of('get', 'Line/missing/Status')]
+    options = {'api_url': stub_server.url}
+    with BulkExecutor(processes=2, client_options=options, cache_dir=tmp_path, postprocess=count_statuses, chunksize=2) as executor:
+        results = list(executor.map(calls))
+        assert sorted(result.index for result in results) == list(range(len(calls)))
+        by_index = {result.index: result for result in results}
+        assert all(by_index[i].value == 2 and by_index[i].error is None for i in range(len(lines)))
+        assert isinstance(by_index[len(lines)].error, TFLAPIException)
+        assert by_index[len(lines)].error.status_code == 404
+        fetched = len(stub_server.requests)
+        # served by the other worker or this run's entries on disk
+        again = list(executor.map(calls[:len(lines)]))
+        assert len(stub_server.requests) == fetched
+        assert all(result.value == 2 for result in again)
+
+def test_disk_cache_entries_outlive_instances(tmp_path):
+    '''
+    test_disk_cache_entries_outlive_instances
+    '''
+    key = ('get', 'Line/victoria/Status', ())
+    DiskCache(tmp_path).set(key, [{'id': 'victoria'}], ttl=30)
+    DiskCache(tmp_path).set(('get', 'raw', ()), b'\x00raw', ttl=30)
+    DiskCache(tmp_path).set(('get', 'short', ()), [1], ttl=0.01)
+    cache = DiskCache(tmp_path)
+    assert cache.get(key) == [{'id': 'victoria'}]
+    assert cache.get(('get', 'raw', ())) == b'\x00raw'
+    time.sleep(0.02)
+    assert cache.get(('get', 'short', ()), 'missing') == 'missing'
+    assert len(cache) == 2 and cache.stats()['hits'] == 2
+    cache.invalidate(key)
+    assert cache.get(key) is None
+
+def test_disk_cache_survives_damaged_entries(tmp_path, monkeypatch):
+    '''
+    test_disk_cache_survives_damaged_entries
+    '''
+    import os
+    cache = DiskCache(tmp_path)
+    key = ('get', 'Line/victoria/Status', ())
+    cache.set(key, [{'id': 'victoria'}], ttl=30)
+    path = next(path for path in tmp_path.glob('*/*'))
+    path.write_bytes(path.read_bytes()[:5])
+    assert cache.get(key, 'missing') == 'missing' and not path.exists()
+    # a write failing e.g. on a full disk skips the entry and leaves no temporary file
+    monkeypatch.setattr(os, 'replace', lambda *args: (_ for _ in ()).throw(OSError(28, 'No space left on device')))
+    cache.set(key, [{'id': 'victoria'}], ttl=30)
+    monkeypatch.undo()
+    assert cache.get(key) is None and not list(tmp_path.glob('*/*'))
+    # clear leaves entries other processes are still writing
+    in_progress = path.with_name(f'{path.name}.1.2.tmp')
+    in_progress.write_bytes(b'partial')
+    cache.clear()
+    assert in_progress.exists()
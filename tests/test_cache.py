@@ -0,0 +1,79 @@
+'''
+test_cache.py
+'''
+import json
+from tfl.cache import ResponseCache, TTLRules, estimate_size, make_cache_key
+from tfl.client import Client
+
+def test_ttl_rules_first_match_wins():
+    '''
+    test_ttl_rules_first_match_wins
+    '''
+    rules = TTLRules()
+    assert rules.ttl_for('Line/Meta/Modes') >= 3600
+    assert rules.ttl_for('Line/victoria/Status') == 30
+    assert rules.ttl_for('Line/victoria/Arrivals/940GZZLUVIC') == 10
+    assert rules.ttl_for('StopPoint/Mode/bus') == 0
+
+def test_cache_key_ignores_param_order():
+    '''
+    test_cache_key_ignores_param_order
+    '''
+    assert make_cache_key('GET', '/Line/x/', {'a': 1, 'b': True}) == make_cache_key('get', 'Line/x', {'b': 'true', 'a': '1'})
+
+def test_cache_evicts_least_recently_used():
+    '''
+    test_cache_evicts_least_recently_used
+    '''
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.set('a', 1, ttl=60, size=10)
+    cache.set('b', 2, ttl=60, size=10)
+    assert cache.get('a') == 1
+    cache.set('c', 3, ttl=60, size=10)
+    assert cache.get('b') is None
+    cache.set('d', 4, ttl=60, size=85)
+    assert cache.get('a') is None
+    assert cache.stats()['evictions'] == 2
+    assert cache.stats()['bytes'] == 95
+
+def test_cache_expires_entries():
+    '''
+    test_cache_expires_entries
+    '''
+    cache = ResponseCache()
+    cache.set('a', 1, ttl=-1)
+    cache.set('b', 2, ttl=1e-9)
+    assert cache.get('a') is None
+    assert cache.get('b') is None
+    assert cache.stats()['misses'] == 2
+
+def test_client_serves_repeat_requests_from_cache(stub_server):
+    '''
+    test_client_serves_repeat_requests_from_cache
+    '''
+    stub_server.routes['Line/Meta/Modes'] = (200, [{'modeName': 'tube'}])
+    cache = ResponseCache()
+    client = Client(api_url=stub_server.url, cache=cache)
+    assert client.line.get_valid_modes() == [{'modeName': 'tube'}]
+    assert client.line.get_valid_modes() == [{'modeName': 'tube'}]
+    assert len(stub_server.requests) == 1
+    assert cache.stats()['hits'] == 1
+
+def test_entries_are_sized_by_body_length(stub_server):
+    '''
+    test_entries_are_sized_by_body_length
+    '''
+    body = [{'modeName': 'tube', 'isTflService': True}] * 3
+    stub_server.routes['Line/Meta/Modes'] = (200, body)
+    cache = ResponseCache()
+    Client(api_url=stub_server.url, cache=cache).line.get_valid_modes()
+    assert cache.stats()['bytes'] == len(json.dumps(body).encode())
+
+def test_estimate_size_samples_long_lists():
+    '''
+    test_estimate_size_samples_long_lists
+    '''
+    payload = [{'id': f'stop{i:05d}', 'lat': 51.5, 'modes': ['bus', 'tube'], 'name': None} for i in range(10000)]
+    exact = len(json.dumps(payload, separators=(',', ':')))
+    assert abs(estimate_size(payload) - exact) < exact * 0.05
+    assert estimate_size(b'raw body') == 8
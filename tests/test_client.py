@@ -1,10 +1,28 @@
 '''
 test_client.py
 '''
-from tfl.client import Client
+from tfl.client import Client, flatten_params
 
 def test_client_not_empty():
     '''
     test_client_not_empty
     '''
     assert Client() is not None
+
+def test_flatten_params():
+    '''
+    test_flatten_params
+    '''
+    assert flatten_params({'detail': True, 'modes': ['tube', 'dlr'], 'severityLevel': None, 'page': 2}) == {'detail': 'true', 'modes': 'tube,dlr', 'page': '2'}
+    assert flatten_params(None) is None
+
+def test_client_sends_clean_query_strings(stub_server, capsys):
+    '''
+    test_client_sends_clean_query_strings
+    '''
+    stub_server.routes['Line/victoria/Route/Sequence/inbound'] = (200, {'lineId': 'victoria'})
+    client = Client(api_url=stub_server.url + '/', connect_timeout=1, read_timeout=5)
+    client.line.get_valid_routes_for_line_id('victoria', 'inbound', service_types=['Regular', 'Night'])
+    assert stub_server.requests == ['/Line/victoria/Route/Sequence/inbound?serviceTypes=Regular%2CNight&excludeCrowding=false']
+    assert client.request_timeout == (1, 5)
+    assert capsys.readouterr().out == ''
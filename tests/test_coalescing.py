@@ -0,0 +1,102 @@
+'''
+test_coalescing.py
+'''
+import asyncio
+import threading
+import time
+import pytest
+from tfl.client import Client
+from tfl.coalescing import AsyncSingleFlight, SingleFlight
+
+def test_single_flight_shares_result_between_threads():
+    '''
+    test_single_flight_shares_result_between_threads
+    '''
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fetch():
+        started.set()
+        time.sleep(0.1)
+        return object()
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do('key', fetch)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do('key', fetch))) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader, *followers]:
+        thread.join()
+    assert len({id(result) for result in results}) == 1
+    assert flight.stats() == {'calls': 1, 'coalesced': 5, 'in_flight': 0}
+
+def test_single_flight_propagates_exceptions():
+    '''
+    test_single_flight_propagates_exceptions
+    '''
+    flight = SingleFlight()
+    with pytest.raises(KeyError):
+        flight.do('key', lambda: {}['missing'])
+    assert flight.do('key', lambda: 1) == 1
+
+def test_async_single_flight_shares_result():
+    '''
+    test_async_single_flight_shares_result
+    '''
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'status'
+
+    async def run():
+        return await asyncio.gather(*(flight.do('key', fetch) for _ in range(10)))
+
+    assert asyncio.run(run()) == ['status'] * 10
+    assert len(calls) == 1
+    assert flight.coalesced == 9
+
+def test_async_single_flight_survives_leader_cancellation():
+    '''
+    test_async_single_flight_survives_leader_cancellation
+    '''
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'status'
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do('key', fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    # the first follower runs fetch again for the others
+    assert asyncio.run(run()) == ['status'] * 3
+    assert len(calls) == 2 and flight.stats()['in_flight'] == 0
+
+def test_client_coalesces_identical_requests(stub_server):
+    '''
+    test_client_coalesces_identical_requests
+    '''
+    stub_server.routes['Line/victoria/Status'] = (200, [{'id': 'victoria'}])
+    client = Client(api_url=stub_server.url, coalesce=True)
+    threads = [threading.Thread(target=client.line.get_line_status, args=(['victoria'], True)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = client.single_flight.stats()
+    assert stats['calls'] + stats['coalesced'] == 8
+    assert len(stub_server.requests) == stats['calls']
@@ -0,0 +1,30 @@
+'''
+test_conditional.py
+'''
+from tfl.cache import ValidatorStore
+from tfl.client import Client
+
+def test_not_modified_serves_stored_payload(stub_server):
+    '''
+    test_not_modified_serves_stored_payload
+    '''
+    stub_server.routes['Line/Route'] = (200, [{'id': 'victoria'}], {'ETag': '"v1"'})
+    validators = ValidatorStore()
+    client = Client(api_url=stub_server.url, validators=validators)
+    first = client.line.get_valid_routes_for_all_lines()
+    second = client.line.get_valid_routes_for_all_lines()
+    assert second is first
+    assert len(stub_server.requests) == 2
+    assert validators.revalidated == 1
+
+def test_changed_resource_replaces_stored_payload(stub_server):
+    '''
+    test_changed_resource_replaces_stored_payload
+    '''
+    stub_server.routes['Line/Route'] = (200, [{'id': 'victoria'}], {'ETag': '"v1"'})
+    client = Client(api_url=stub_server.url, validators=ValidatorStore())
+    client.line.get_valid_routes_for_all_lines()
+    stub_server.routes['Line/Route'] = (200, [{'id': 'circle'}], {'ETag': '"v2"'})
+    assert client.line.get_valid_routes_for_all_lines() == [{'id': 'circle'}]
+    assert client.line.get_valid_routes_for_all_lines() == [{'id': 'circle'}]
+    assert client.validators.revalidated == 1
@@ -0,0 +1,38 @@
+'''
+test_decoding.py
+'''
+import json
+import pytest
+from tfl.cache import ResponseCache
+from tfl.client import Client
+from tfl.decoding import available_backends, get_decoder
+
+def test_get_decoder_falls_back_to_stdlib():
+    '''
+    test_get_decoder_falls_back_to_stdlib
+    '''
+    assert get_decoder('json') is json.loads
+    assert 'json' in available_backends()
+    assert get_decoder()(b'[1, {"a": null}]') == [1, {'a': None}]
+    with pytest.raises(ValueError):
+        get_decoder('yaml')
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_backends_raise_value_error(backend):
+    '''
+    test_backends_raise_value_error
+    '''
+    with pytest.raises(ValueError):
+        get_decoder(backend)(b'{not json')
+
+def test_raw_get_returns_undecoded_bytes(stub_server):
+    '''
+    test_raw_get_returns_undecoded_bytes
+    '''
+    stub_server.routes['Line/Meta/Modes'] = (200, [{'modeName': 'tube'}])
+    client = Client(api_url=stub_server.url, cache=ResponseCache())
+    body = client.get('Line/Meta/Modes', raw=True)
+    assert body == json.dumps([{'modeName': 'tube'}]).encode()
+    assert client.get('Line/Meta/Modes') == [{'modeName': 'tube'}]
+    assert client.get('Line/Meta/Modes', raw=True) is body
+    assert len(stub_server.requests) == 2
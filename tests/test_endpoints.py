@@ -0,0 +1,63 @@
+'''
+test_endpoints.py
+'''
+import pytest
+from tfl.client import Client
+from tfl.endpoint_base import Operation, Param
+from tfl.endpoints import ENDPOINT_GROUPS
+
+def test_generated_groups_cover_swagger_tags():
+    '''
+    test_generated_groups_cover_swagger_tags
+    '''
+    assert {'stoppoint', 'journey', 'road', 'bikepoint', 'occupancy', 'vehicle', 'mode', 'place', 'search', 'airquality', 'accidentstats'} <= set(ENDPOINT_GROUPS)
+    client = Client()
+    assert all(isinstance(getattr(client, name), group) for name, group in ENDPOINT_GROUPS.items())
+
+def test_operation_validates_parameters():
+    '''
+    test_operation_validates_parameters
+    '''
+    operation = Operation('Place/{type}/At/{Lat}/{Lon}', (Param('type', 'type', 'array', required=True), Param('lat', 'Lat', 'number', required=True), Param('lon', 'Lon', 'number', required=True)), (Param('direction', 'direction', 'string', enum=('inbound', 'outbound')),))
+    operation.check_path(0, ['Borough'])
+    operation.check_path(1, 51)
+    operation.check_query(0, None)
+    operation.check_query(0, 'inbound')
+    with pytest.raises(TypeError):
+        operation.check_path(1, '51.5')
+    with pytest.raises(TypeError):
+        operation.check_path(1, True)
+    with pytest.raises(TypeError):
+        operation.check_path(2, None)
+    with pytest.raises(TypeError):
+        operation.check_path(0, ['Borough', 1])
+    with pytest.raises(ValueError):
+        operation.check_query(0, 'sideways')
+
+def test_generated_methods_request_and_batch(stub_server):
+    '''
+    test_generated_methods_request_and_batch
+    '''
+    stub_server.routes['StopPoint/940GZZLUOXC/Arrivals'] = (200, [{'id': '1'}])
+    stub_server.routes['Journey/JourneyResults/1000001/to/1000002'] = (200, {'journeys': []})
+    client = Client(api_url=stub_server.url)
+    assert client.stoppoint.arrivals('940GZZLUOXC') == [{'id': '1'}]
+    assert client.journey.journey_results('1000001', '1000002', mode=['tube', 'dlr'], time_is='Arriving') == {'journeys': []}
+    assert stub_server.requests[-1] == '/Journey/JourneyResults/1000001/to/1000002?timeIs=Arriving&mode=tube%2Cdlr'
+    ids = [f'id{i}' for i in range(45)]
+    for batch in (ids[:20], ids[20:40], ids[40:]):
+        stub_server.routes[f"StopPoint/{','.join(batch)}"] = (200, [{'id': i} for i in batch])
+    assert [stop['id'] for stop in client.stoppoint.get(ids)] == ids
+    stub_server.routes['Place/Borough/At/51.5/-0.12'] = (200, [])
+    assert client.place.get_at(['Borough'], 51.5, -0.12) == []
+    requests = len(stub_server.requests)
+    with pytest.raises(ValueError):
+        client.journey.journey_results('a', 'b', time_is='Whenever')
+    # enum values are matched regardless of case and sent as given
+    stub_server.routes['Journey/JourneyResults/1000001/to/1000003'] = (200, {'journeys': []})
+    assert client.journey.journey_results('1000001', '1000003', time_is='arriving', journey_preference='leasttime') == {'journeys': []}
+    assert stub_server.requests[-1] == '/Journey/JourneyResults/1000001/to/1000003?timeIs=arriving&journeyPreference=leasttime'
+    requests = len(stub_server.requests)
+    with pytest.raises(TypeError):
+        client.place.get_at(['Borough'], '51.5', -0.12)
+    assert len(stub_server.requests) == requests
@@ -0,0 +1,59 @@
+'''
+test_entities.py
+'''
+from datetime import datetime, timezone
+import pytest
+from tfl.client import Client
+from tfl.entities import Line, LineStatus, RESPONSE_TYPES
+from tfl.entity_base import parse_datetime
+
+LINE = {
+    'id': 'victoria',
+    'name': 'Victoria',
+    'modeName': 'tube',
+    'created': '2023-12-25T15:49:28.801Z',
+    'lineStatuses': [{'statusSeverity': 10, 'statusSeverityDescription': 'Good Service'}],
+}
+
+def test_entities_use_slots():
+    '''
+    test_entities_use_slots
+    '''
+    line = Line.from_dict(LINE)
+    with pytest.raises(AttributeError):
+        line.unknown = 1
+    assert not hasattr(line, '__dict__')
+
+def test_nested_fields_are_decoded_on_access():
+    '''
+    test_nested_fields_are_decoded_on_access
+    '''
+    line = Line.from_dict(LINE)
+    assert object.__getattribute__(line, '_line_statuses') is LINE['lineStatuses']
+    assert isinstance(line.line_statuses[0], LineStatus)
+    assert line.line_statuses[0].status_severity_description == 'Good Service'
+    assert line.created == datetime(2023, 12, 25, 15, 49, 28, 801000, tzinfo=timezone.utc)
+    assert line.to_dict()['lineStatuses'][0]['statusSeverity'] == 10
+
+def test_parse_datetime_keeps_unparseable_values():
+    '''
+    test_parse_datetime_keeps_unparseable_values
+    '''
+    assert parse_datetime('2023-03-01T10:00:00.1234567Z').microsecond == 123456
+    assert parse_datetime('not a date') == 'not a date'
+
+def test_response_types_match_paths():
+    '''
+    test_response_types_match_paths
+    '''
+    assert RESPONSE_TYPES.converter_for('Line/Meta/DisruptionCategories') is None
+    lines = RESPONSE_TYPES.converter_for('Line/victoria,circle/Status')([LINE])
+    assert isinstance(lines[0], Line)
+
+def test_client_returns_entities_when_enabled(stub_server):
+    '''
+    test_client_returns_entities_when_enabled
+    '''
+    stub_server.routes['Line/victoria'] = (200, [LINE])
+    assert isinstance(Client(api_url=stub_server.url).line.get_lines_by_ids(['victoria'])[0], dict)
+    assert isinstance(Client(api_url=stub_server.url, entities=True).line.get_lines_by_ids(['victoria'])[0], Line)
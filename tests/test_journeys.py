@@ -0,0 +1,70 @@
+'''
+test_journeys.py
+'''
+from tfl.client import Client
+from tfl.journeys import JourneyCache
+
+PATH = 'Journey/JourneyResults/940GZZLUOXC/to/940GZZLUVIC'
+
+def itinerary(duration, line='victoria'):
+    return {'journeys': [{'duration': duration, 'legs': [{'routeOptions': [{'name': line, 'lineIdentifier': {'id': line}}]}]}]}
+
+class FakeClock():
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_keys_normalize_locations_time_and_options():
+    '''
+    test_keys_normalize_locations_time_and_options
+    '''
+    cache = JourneyCache(client=None, clock=FakeClock())
+    assert cache.key_for('51.51521,-0.14201', 'sw1a 1aa') == cache.key_for('51.5154, -0.1418', 'SW1A1AA')
+    assert cache.key_for('940gzzluoxc', ' 940GZZLUVIC ', mode=['tube', 'bus']) == cache.key_for('940GZZLUOXC', '940GZZLUVIC', mode=['bus', 'tube'], via=None)
+    assert cache.key_for('a', 'b', date='20240101', time='0801') == cache.key_for('a', 'b', date='20240101', time='0804', time_is='Departing')
+    assert cache.key_for('a', 'b', date='20240101', time='0801') != cache.key_for('a', 'b', date='20240101', time='0806')
+    assert cache.key_for('a', 'b', date='20240101', time='0801') != cache.key_for('a', 'b', date='20240101', time='0801', time_is='arriving')
+    assert cache.key_for('a', 'b') != cache.key_for('a', 'b', journey_preference='leasttime')
+
+def test_stale_results_are_served_while_refreshed(stub_server):
+    '''
+    test_stale_results_are_served_while_refreshed
+    '''
+    stub_server.routes[PATH] = [(200, itinerary(20)), (200, itinerary(25))]
+    clock = FakeClock()
+    cache = JourneyCache(Client(api_url=stub_server.url), ttl=60, stale_ttl=600, time_bucket=3600, disruption_interval=None, clock=clock)
+    assert cache.journey_results('940GZZLUOXC', '940GZZLUVIC')['journeys'][0]['duration'] == 20
+    assert cache.journey_results('940gzzluoxc', '940GZZLUVIC')['journeys'][0]['duration'] == 20
+    clock.now += 120
+    # stale: served at once, refreshed in the background
+    assert cache.journey_results('940GZZLUOXC', '940GZZLUVIC')['journeys'][0]['duration'] == 20
+    cache.close()
+    assert cache.journey_results('940GZZLUOXC', '940GZZLUVIC')['journeys'][0]['duration'] == 25
+    assert len(stub_server.requests) == 2
+    assert cache.stats() == {'hits': 2, 'stale_hits': 1, 'misses': 1, 'refreshes': 1, 'invalidations': 0, 'errors': 0, 'entries': 1, 'lines': 1}
+    # a failed refresh is counted and the stale result kept
+    stub_server.routes[PATH] = (500, {'httpStatusCode': 500, 'message': 'Internal error'})
+    clock.now += 120
+    assert cache.journey_results('940GZZLUOXC', '940GZZLUVIC')['journeys'][0]['duration'] == 25
+    cache.close()
+    assert cache.errors == 1 and cache.last_error.status_code == 500 and len(cache) == 1
+
+def test_disruption_changes_invalidate_itineraries(stub_server):
+    '''
+    test_disruption_changes_invalidate_itineraries
+    '''
+    stub_server.routes[PATH] = [(200, itinerary(20)), (200, itinerary(35))]
+    stub_server.routes['Journey/JourneyResults/940GZZLUOXC/to/940GZZLUBST'] = (200, itinerary(10, 'bakerloo'))
+    disruption = {'category': 'RealTime', 'description': 'Victoria line: signal failure', 'affectedRoutes': [{'lineId': 'victoria'}]}
+    stub_server.routes['Line/bakerloo,victoria/Disruption'] = [(200, []), (200, [disruption])]
+    cache = JourneyCache(Client(api_url=stub_server.url), disruption_interval=None, clock=FakeClock())
+    cache.journey_results('940GZZLUOXC', '940GZZLUVIC')
+    cache.journey_results('940GZZLUOXC', '940GZZLUBST')
+    assert cache.check_disruptions() == []
+    assert cache.check_disruptions() == ['victoria']
+    assert len(cache) == 1 and cache.invalidations == 1
+    # the recorded disruptions of a line go with its last itinerary
+    assert set(cache._disruptions) == {'bakerloo'}
+    assert cache.journey_results('940GZZLUOXC', '940GZZLUVIC')['journeys'][0]['duration'] == 35
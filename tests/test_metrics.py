@@ -0,0 +1,83 @@
+'''
+test_metrics.py
+'''
+import asyncio
+import pytest
+from tfl.async_client import AsyncClient
+from tfl.cache import ResponseCache
+from tfl.client import Client
+from tfl.exceptions import TFLAPIException
+from tfl.instrumentation import AFTER_RESPONSE, BEFORE_REQUEST, CACHE, NETWORK, ON_ERROR
+from tfl.metrics import OTHER, MetricsCollector, TemplateMatcher
+from tfl.ratelimit import RetryPolicy
+
+def test_hooks_follow_requests(stub_server):
+    '''
+    test_hooks_follow_requests
+    '''
+    stub_server.routes['Line/victoria/Status'] = (200, [{'id': 'victoria'}])
+    client = Client(api_url=stub_server.url, cache=ResponseCache())
+    seen = []
+    client.hooks.subscribe(BEFORE_REQUEST, lambda record: seen.append((BEFORE_REQUEST, record.path)))
+    records = []
+    client.hooks.subscribe(AFTER_RESPONSE)(records.append)
+    errors = []
+    client.hooks.subscribe(ON_ERROR, errors.append)
+    client.get('Line/victoria/Status')
+    client.get('Line/victoria/Status')
+    with pytest.raises(TFLAPIException):
+        client.get('Line/unknown/Status')
+    assert seen == [(BEFORE_REQUEST, 'Line/victoria/Status'), (BEFORE_REQUEST, 'Line/unknown/Status')]
+    network, cached = records
+    assert (network.source, network.cache, network.status, network.attempts) == (NETWORK, 'miss', 200, 1)
+    assert network.bytes == len(b'[{"id": "victoria"}]')
+    assert all(value >= 0 for value in (network.connect, network.ttfb, network.download, network.decode))
+    assert network.elapsed >= network.ttfb + network.download + network.decode
+    assert (cached.source, cached.cache, cached.status) == (CACHE, 'hit', None)
+    assert errors[0].status == 404 and isinstance(errors[0].error, TFLAPIException)
+
+def test_metrics_collector_groups_on_templates(stub_server):
+    '''
+    test_metrics_collector_groups_on_templates
+    '''
+    stub_server.routes['Line/a/Status'] = [(429, {}, {'Retry-After': '0'}), (200, [])]
+    stub_server.routes['Line/b/Status'] = (200, [{'id': 'b'}])
+    client = Client(api_url=stub_server.url, cache=ResponseCache(), retry_policy=RetryPolicy(backoff=0.01))
+    metrics = MetricsCollector().attach(client)
+    for line_id in ('a', 'b', 'b'):
+        client.get(f'Line/{line_id}/Status')
+    endpoint = metrics.to_dict()['GET Line/{ids}/Status']
+    assert endpoint['requests'] == 3 and endpoint['retries'] == 1
+    assert endpoint['sources'] == {NETWORK: 2, CACHE: 1}
+    assert endpoint['cache'] == {'hit': 1, 'miss': 2}
+    assert endpoint['statuses'] == {200: 2}
+    assert endpoint['latency']['ttfb']['count'] == 2
+    assert endpoint['bytes']['buckets']['+Inf'] == 2
+    text = metrics.to_prometheus()
+    assert '# TYPE tfl_client_request_duration_seconds histogram' in text
+    assert 'tfl_client_requests_total{method="GET",endpoint="Line/{ids}/Status",source="cache"} 1' in text
+    assert 'tfl_client_request_duration_seconds_count{method="GET",endpoint="Line/{ids}/Status",phase="decode"} 2' in text
+    metrics.detach(client)
+    assert not client.hooks
+
+def test_metrics_collector_async_and_templates(stub_server):
+    '''
+    test_metrics_collector_async_and_templates
+    '''
+    matcher = TemplateMatcher(['Line/{ids}/Status', 'Line/Mode/{modes}/Status', 'Line/Meta/Modes'])
+    assert matcher.match('Line/victoria,central/Status') == 'Line/{ids}/Status'
+    assert matcher.match('/line/mode/tube/Status') == 'Line/Mode/{modes}/Status'
+    assert matcher.match('Line/Meta/Modes') == 'Line/Meta/Modes'
+    assert matcher.match('Nowhere/1') == OTHER
+    stub_server.routes['Line/Mode/tube/Status'] = (200, [])
+
+    async def run():
+        async with AsyncClient(api_url=stub_server.url) as client:
+            metrics = MetricsCollector().attach(client)
+            await client.line.get_line_status_by_mode(['tube'], False)
+            return metrics.to_dict()
+
+    endpoint = asyncio.run(run())['GET Line/Mode/{modes}/Status']
+    assert endpoint['sources'] == {NETWORK: 1}
+    assert endpoint['latency']['connect']['count'] == 1
+    assert endpoint['latency']['connect']['sum'] > 0
@@ -0,0 +1,45 @@
+'''
+test_network.py
+'''
+from tfl.network import NetworkIndex
+
+def sequence(line_id, stops):
+    '''
+    sequence
+    '''
+    return {
+        'lineId': line_id,
+        'stopPointSequences': [{'stopPoint': [{'id': stop, 'name': stop.upper()} for stop in stops]}],
+        'orderedLineRoutes': [{'naptanIds': stops}],
+    }
+
+SEQUENCES = [
+    sequence('victoria', ['brixton', 'stockwell', 'vauxhall', 'green-park', 'oxford-circus']),
+    sequence('victoria', ['oxford-circus', 'green-park', 'vauxhall', 'stockwell', 'brixton']),
+    sequence('jubilee', ['stratford', 'canary-wharf', 'london-bridge', 'waterloo', 'green-park', 'bond-street']),
+    sequence('northern', ['morden', 'stockwell', 'kennington']),
+]
+
+def test_network_queries():
+    '''
+    test_network_queries
+    '''
+    index = NetworkIndex.from_route_sequences(SEQUENCES)
+    assert sorted(index.lines_at('green-park')) == ['jubilee', 'victoria']
+    assert index.lines_between('brixton', 'oxford-circus') == ['victoria']
+    assert index.lines_between('bond-street', 'stratford') == []
+    assert index.shortest_path('brixton', 'bond-street') == ['brixton', 'stockwell', 'vauxhall', 'green-park', 'bond-street']
+    assert index.reachable('stockwell', max_hops=1) == {'stockwell': 0, 'vauxhall': 1, 'brixton': 1, 'kennington': 1}
+    assert index.interchanges('morden', 'bond-street') == ['northern', 'victoria', 'jubilee']
+    assert index.stop_names['brixton'] == 'BRIXTON'
+
+def test_network_round_trips_through_disk(tmp_path):
+    '''
+    test_network_round_trips_through_disk
+    '''
+    index = NetworkIndex.from_route_sequences(SEQUENCES)
+    index.save(tmp_path / 'network.idx')
+    loaded = NetworkIndex.load(tmp_path / 'network.idx')
+    assert loaded.stop_ids == index.stop_ids
+    assert loaded.targets == index.targets
+    assert loaded.shortest_path('morden', 'stratford') == index.shortest_path('morden', 'stratford')
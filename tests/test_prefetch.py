@@ -0,0 +1,74 @@
+'''
+test_prefetch.py
+'''
+import asyncio
+import pytest
+from tfl.cache import ResponseCache, TTLRules
+from tfl.client import Client
+from tfl.prefetch import LINES, ROUTES, STOPS, TIMETABLES
+from tfl.snapshot import SnapshotStore
+
+def route_sequence(line_id, origin):
+    '''
+    route_sequence
+    '''
+    return {'lineId': line_id, 'orderedLineRoutes': [{'naptanIds': [origin, '940GZZLUOXC']}]}
+
+def add_routes(server):
+    '''
+    add_routes
+    '''
+    server.routes['Line/Mode/tube'] = (200, [{'id': 'victoria'}, {'id': 'bakerloo'}])
+    for line_id, origin in (('victoria', '940GZZLUBXN'), ('bakerloo', '940GZZLUEAC')):
+        server.routes[f'Line/{line_id}/StopPoints'] = (200, [{'id': origin}])
+        for direction in ('inbound', 'outbound'):
+            server.routes[f'Line/{line_id}/Route/Sequence/{direction}'] = (200, route_sequence(line_id, origin if direction == 'inbound' else '940GZZLUOXC'))
+        for stop in (origin, '940GZZLUOXC'):
+            server.routes[f'Line/{line_id}/Timetable/{stop}'] = (200, {'lineId': line_id, 'stop': stop})
+
+def test_prefetch_plans_dag_and_warms_cache(stub_server, tmp_path):
+    '''
+    test_prefetch_plans_dag_and_warms_cache
+    '''
+    add_routes(stub_server)
+    client = Client(api_url=stub_server.url, cache=ResponseCache(TTLRules(default_ttl=60)))
+    reports = []
+    prefetcher = client.prefetch(['tube'], concurrency=4, progress=reports.append, snapshot=tmp_path / 'tube.snapshot')
+    kinds = [task.kind for task in prefetcher.responses]
+    assert (kinds.count(LINES), kinds.count(STOPS), kinds.count(ROUTES), kinds.count(TIMETABLES)) == (1, 2, 4, 4)
+    assert not prefetcher.errors
+    assert reports[-1].completed == reports[-1].total == 11
+    requests = len(stub_server.requests)
+    # later endpoint calls are served from the warmed cache
+    client.line.get_valid_routes_for_line_id('victoria', 'inbound')
+    client.line.get_stations('bakerloo')
+    client.line.get_timetable_for_station('victoria', '940GZZLUBXN')
+    assert len(stub_server.requests) == requests
+    snapshot = SnapshotStore(tmp_path / 'tube.snapshot')
+    assert len(snapshot) == 11
+    assert snapshot.metadata['modes'] == ['tube']
+
+def test_prefetch_records_failures_and_skips_dependents(stub_server):
+    '''
+    test_prefetch_records_failures_and_skips_dependents
+    '''
+    add_routes(stub_server)
+    del stub_server.routes['Line/victoria/Route/Sequence/inbound']
+    prefetcher = Client(api_url=stub_server.url).prefetch(['tube'], include=['timetables'])
+    assert [task.path for task in prefetcher.errors] == ['Line/victoria/Route/Sequence/inbound']
+    assert sorted(task.path for task in prefetcher.responses if task.kind == TIMETABLES) == ['Line/bakerloo/Timetable/940GZZLUEAC', 'Line/bakerloo/Timetable/940GZZLUOXC', 'Line/victoria/Timetable/940GZZLUOXC']
+
+def test_async_prefetch(stub_server):
+    '''
+    test_async_prefetch
+    '''
+    pytest.importorskip('aiohttp')
+    from tfl.async_client import AsyncClient
+    add_routes(stub_server)
+
+    async def run():
+        async with AsyncClient(api_url=stub_server.url) as client:
+            return await client.prefetch(['tube'], include=['stops'], concurrency=2)
+
+    prefetcher = asyncio.run(run())
+    assert sorted(task.path for task in prefetcher.responses) == ['Line/Mode/tube', 'Line/bakerloo/StopPoints', 'Line/victoria/StopPoints']
@@ -0,0 +1,104 @@
+'''
+test_ratelimit.py
+'''
+import threading
+import time
+import pytest
+from tfl.client import Client
+from tfl.exceptions import TFLAPIException
+from tfl.ratelimit import HIGH, LOW, RateLimiter, RetryPolicy, parse_retry_after
+
+def test_rate_limiter_bounds_throughput():
+    '''
+    test_rate_limiter_bounds_throughput
+    '''
+    limiter = RateLimiter(rate=100, burst=5)
+    start = time.monotonic()
+    for _ in range(15):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+    assert limiter.stats()['acquired'] == 15
+
+def test_rate_limiter_serves_high_priority_first():
+    '''
+    test_rate_limiter_serves_high_priority_first
+    '''
+    limiter = RateLimiter(rate=20, burst=1)
+    limiter.acquire()
+    order = []
+    low = [threading.Thread(target=lambda: (limiter.acquire(LOW), order.append('low'))) for _ in range(3)]
+    for thread in low:
+        thread.start()
+    time.sleep(0.01)
+    high = threading.Thread(target=lambda: (limiter.acquire(HIGH), order.append('high')))
+    high.start()
+    for thread in [*low, high]:
+        thread.join()
+    assert order[0] == 'high'
+
+def test_priority_rules():
+    '''
+    test_priority_rules
+    '''
+    limiter = RateLimiter()
+    assert limiter.priority_for('Line/victoria/Status') == HIGH
+    assert limiter.priority_for('Line/victoria/Route/Sequence/inbound') == LOW
+    assert RateLimiter.shared('key') is RateLimiter.shared('key')
+    assert RateLimiter.shared('other key', rate=5, burst=2) is RateLimiter.shared('other key', rate=5)
+    with pytest.raises(ValueError):
+        RateLimiter.shared('other key', rate=10)
+
+def test_parse_retry_after():
+    '''
+    test_parse_retry_after
+    '''
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None
+
+def test_retry_after_is_not_truncated():
+    '''
+    test_retry_after_is_not_truncated
+    '''
+    policy = RetryPolicy(backoff=0.01, max_backoff=1.0, max_retry_after=60.0)
+    assert 5.0 <= policy.delay_for(429, {'Retry-After': '5'}, 0) < 5.1
+    assert policy.delay_for(429, {'Retry-After': '90'}, 0) is None
+    assert policy.delay_for(503, {}, 3) <= 1.0
+
+def test_client_retries_throttled_requests(stub_server):
+    '''
+    test_client_retries_throttled_requests
+    '''
+    throttled = (429, {'statusCode': 429, 'message': 'Rate limit is exceeded.'}, {'Retry-After': '0'})
+    stub_server.routes['Line/victoria/Status'] = [throttled, throttled, (200, [{'id': 'victoria'}])]
+    limiter = RateLimiter(rate=1000)
+    client = Client(api_url=stub_server.url, rate_limiter=limiter, retry_policy=RetryPolicy(backoff=0.01))
+    assert client.line.get_line_status(['victoria'], False) == [{'id': 'victoria'}]
+    assert len(stub_server.requests) == 3
+    assert limiter.throttled == 2
+
+def test_client_gives_up_after_max_retries(stub_server):
+    '''
+    test_client_gives_up_after_max_retries
+    '''
+    stub_server.routes['Line/victoria/Status'] = (429, {'statusCode': 429, 'message': 'Rate limit is exceeded.'})
+    client = Client(api_url=stub_server.url, retry_policy=RetryPolicy(max_retries=2, backoff=0.01))
+    with pytest.raises(TFLAPIException) as info:
+        client.line.get_line_status(['victoria'], False)
+    assert info.value.code == 429
+    assert len(stub_server.requests) == 3
+
+def test_streamed_requests_are_limited_retried_and_hooked(stub_server):
+    '''
+    test_streamed_requests_are_limited_retried_and_hooked
+    '''
+    from tfl.instrumentation import AFTER_RESPONSE
+    throttled = (429, {'statusCode': 429, 'message': 'Rate limit is exceeded.'}, {'Retry-After': '0'})
+    stub_server.routes['Line/Route'] = [throttled, (200, [{'id': 'victoria'}, {'id': 'central'}])]
+    limiter = RateLimiter(rate=1000)
+    client = Client(api_url=stub_server.url, rate_limiter=limiter, retry_policy=RetryPolicy(backoff=0.01))
+    records = []
+    client.hooks.subscribe(AFTER_RESPONSE, records.append)
+    assert [line['id'] for line in client.stream_get('Line/Route')] == ['victoria', 'central']
+    assert len(stub_server.requests) == 2 and limiter.acquired == 2 and limiter.throttled == 1
+    assert records[0].attempts == 2 and records[0].status == 200 and records[0].bytes > 0
@@ -0,0 +1,138 @@
+'''
+test_resilience.py
+'''
+import asyncio
+import threading
+import time
+import pytest
+from tfl.client import Client
+from tfl.exceptions import CircuitOpenError, TFLAPIException
+from tfl.instrumentation import AFTER_RESPONSE, STALE, RequestRecord
+from tfl.resilience import OPEN, ResiliencePolicy, stale_age
+
+ERROR = (500, {'httpStatusCode': 500, 'message': 'Internal error'})
+
+def test_circuit_breaker_serves_last_good_response(stub_server):
+    '''
+    test_circuit_breaker_serves_last_good_response
+    '''
+    stub_server.routes['Line/Meta/Modes'] = [(200, [{'modeName': 'tube'}]), ERROR]
+    stub_server.routes['Line/Meta/Severity'] = ERROR
+    policy = ResiliencePolicy(failure_threshold=2, reset_timeout=0.2, stale_after=None)
+    client = Client(api_url=stub_server.url, resilience=policy)
+    sources = []
+    client.hooks.subscribe(AFTER_RESPONSE, lambda record: sources.append((record.source, record.age)))
+    fresh = client.get('Line/Meta/Modes')
+    assert stale_age(fresh) is None
+    # the failure is answered with the last good response, marked with its age
+    stale = client.get('Line/Meta/Modes')
+    assert stale == fresh and stale_age(stale) >= 0
+    client.get('Line/Meta/Modes')
+    assert policy.states()['Line/Meta/Modes'] == OPEN
+    sent = len(stub_server.requests)
+    assert client.get('Line/Meta/Modes') == fresh and len(stub_server.requests) == sent
+    assert policy.rejected == 1 and policy.stale_served == 3
+    assert [source for source, _ in sources] == ['network', STALE, STALE, STALE] and sources[-1][1] >= 0
+    # breakers are per endpoint; without a good response an open circuit raises
+    for _ in range(2):
+        with pytest.raises(TFLAPIException):
+            client.get('Line/Meta/Severity')
+    with pytest.raises(CircuitOpenError):
+        client.get('Line/Meta/Severity')
+    # after reset_timeout a probe goes through and closes the circuit
+    stub_server.routes['Line/Meta/Modes'] = (200, [{'modeName': 'bus'}])
+    time.sleep(0.25)
+    assert client.get('Line/Meta/Modes') == [{'modeName': 'bus'}]
+    assert policy.states()['Line/Meta/Modes'] == 'closed'
+
+def test_hedging_and_stale_deadline():
+    '''
+    test_hedging_and_stale_deadline
+    '''
+    policy = ResiliencePolicy(hedge_after=0.05, stale_after=None)
+    calls = []
+
+    def send(record):
+        calls.append(record)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return ['slow']
+        return ['fast']
+
+    start = time.perf_counter()
+    record = RequestRecord('get', 'Line/Meta/Modes', {})
+    assert policy.call('Line/Meta/Modes', 'modes', send, record=record) == ['fast']
+    assert time.perf_counter() - start < 0.3
+    # each attempt has a record of its own
+    assert len(calls) == 2 and record not in calls and calls[0] is not calls[1]
+    assert policy.hedges == 1 and policy.hedge_wins == 1
+    # without a free worker the request runs on the calling thread, unhedged
+    busy = ResiliencePolicy(hedge_after=0.01, workers=0)
+    assert busy.call('Line/Meta/Modes', 'modes', lambda record: (time.sleep(0.05), threading.current_thread())[1]) is threading.current_thread()
+    assert busy.saturated == 1 and busy.hedges == 0
+
+    policy = ResiliencePolicy(stale_after=0.05)
+    policy.call('Line/Meta/Modes', 'modes', lambda record: ['v1'])
+
+    def slow(record):
+        time.sleep(0.3)
+        return ['v2']
+
+    start = time.perf_counter()
+    value = policy.call('Line/Meta/Modes', 'modes', slow)
+    assert time.perf_counter() - start < 0.2
+    assert value == ['v1'] and stale_age(value) is not None
+    # the slow request finished in the background and refreshed the stored response
+    time.sleep(0.4)
+    assert policy.last_good('modes')[0] == ['v2']
+    policy.close()
+
+def test_async_client_serves_stale_on_errors(stub_server):
+    '''
+    test_async_client_serves_stale_on_errors
+    '''
+    try:
+        from tfl.async_client import AsyncClient
+    except ImportError:
+        pytest.skip('aiohttp is not installed')
+    stub_server.routes['Line/Meta/Modes'] = [(200, [{'modeName': 'tube'}]), ERROR]
+
+    async def main():
+        async with AsyncClient(api_url=stub_server.url, resilience=ResiliencePolicy(stale_after=0.5)) as client:
+            fresh = await client.get('Line/Meta/Modes')
+            stale = await client.get('Line/Meta/Modes')
+            return fresh, stale
+
+    fresh, stale = asyncio.run(main())
+    assert stale_age(fresh) is None and stale == fresh and stale_age(stale) is not None
+
+def test_hedged_requests_report_the_winning_attempt(stub_server):
+    '''
+    test_hedged_requests_report_the_winning_attempt
+    '''
+    from tfl.metrics import MetricsCollector
+    stub_server.routes['Line/Meta/Modes'] = (200, [{'modeName': 'tube'}])
+    policy = ResiliencePolicy(hedge_after=0.0, stale_after=None)
+    client = Client(api_url=stub_server.url, resilience=policy)
+    metrics = MetricsCollector()
+    metrics.attach(client)
+    records = []
+    client.hooks.subscribe(AFTER_RESPONSE, records.append)
+    assert client.get('Line/Meta/Modes') == [{'modeName': 'tube'}]
+    record = records[0]
+    assert record.source == 'network' and record.status == 200 and record.attempts >= 1
+    assert record.ttfb is not None and record.bytes > 0
+    assert metrics.to_dict()['GET Line/Meta/Modes']['requests'] == 1
+    policy.close()
+
+def test_entities_keep_the_stale_mark(stub_server):
+    '''
+    test_entities_keep_the_stale_mark
+    '''
+    stub_server.routes['Line/Mode/tube'] = [(200, [{'id': 'victoria', 'name': 'Victoria'}]), ERROR]
+    client = Client(api_url=stub_server.url, resilience=ResiliencePolicy(stale_after=None), entities=True)
+    fresh = client.get('Line/Mode/tube')
+    stale = client.get('Line/Mode/tube')
+    assert stale_age(fresh) is None and stale_age(stale) is not None
+    from tfl.entities import Line
+    assert [line.id for line in stale] == ['victoria'] and isinstance(stale[0], Line)
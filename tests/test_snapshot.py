@@ -0,0 +1,48 @@
+'''
+test_snapshot.py
+'''
+import time
+import pytest
+from tfl.client import Client
+from tfl.snapshot import SnapshotStore
+
+ROUTES = {'lineId': 'victoria', 'orderedLineRoutes': [{'naptanIds': ['940GZZLUBXN', '940GZZLUWWL']}]}
+
+def write(path, created=None):
+    '''
+    write
+    '''
+    SnapshotStore.write(path, [
+        ('Line/victoria/Route/Sequence/inbound', {'serviceTypes': ['Regular'], 'excludeCrowding': False}, ROUTES),
+        ('Line/Meta/Modes', None, [{'modeName': 'tube'}]),
+    ] + [(f'Line/{i}/StopPoints', {'tflOperatedNationalRailStationsOnly': False}, [{'id': str(i)}]) for i in range(200)], metadata={'modes': ['tube']}, created=created)
+
+def test_snapshot_round_trip(tmp_path):
+    '''
+    test_snapshot_round_trip
+    '''
+    write(tmp_path / 'tube.snapshot')
+    store = SnapshotStore(tmp_path / 'tube.snapshot')
+    assert len(store) == 202 and store.fresh
+    assert store.get('Line/victoria/Route/Sequence/inbound', {'excludeCrowding': False, 'serviceTypes': ('Regular',)}) == ROUTES
+    assert all(store.get(f'Line/{i}/StopPoints', {'tflOperatedNationalRailStationsOnly': False}) == [{'id': str(i)}] for i in range(200))
+    assert store.get('Line/victoria/Route/Sequence/outbound') is None
+    assert (store.hits, store.misses) == (201, 1)
+    store.close()
+    (tmp_path / 'junk').write_bytes(b'not a snapshot')
+    with pytest.raises(ValueError):
+        SnapshotStore(tmp_path / 'junk')
+
+def test_client_serves_endpoint_calls_from_fresh_snapshot(stub_server, tmp_path):
+    '''
+    test_client_serves_endpoint_calls_from_fresh_snapshot
+    '''
+    write(tmp_path / 'tube.snapshot')
+    client = Client(api_url=stub_server.url, snapshot=SnapshotStore(tmp_path / 'tube.snapshot'))
+    assert client.line.get_valid_routes_for_line_id('victoria', 'inbound') == ROUTES
+    assert client.line.get_valid_modes() == [{'modeName': 'tube'}]
+    assert stub_server.requests == []
+    write(tmp_path / 'stale.snapshot', created=time.time() - 2 * 24 * 3600)
+    stub_server.routes['Line/Meta/Modes'] = (200, [{'modeName': 'bus'}])
+    client = Client(api_url=stub_server.url, snapshot=SnapshotStore(tmp_path / 'stale.snapshot'))
+    assert client.line.get_valid_modes() == [{'modeName': 'bus'}]
@@ -0,0 +1,79 @@
+'''
+test_spatial.py
+'''
+import math
+import random
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from tfl.spatial import SpatialIndex, haversine
+
+def make_records(count=2000, seed=1):
+    '''
+    make_records
+    '''
+    rng = random.Random(seed)
+    return [{
+        'id': f'stop{i}',
+        'stopType': 'NaptanPublicBusCoachTram' if i % 3 else 'NaptanMetroStation',
+        'modes': ['bus'] if i % 3 else ['tube'],
+        'lat': 51.3 + rng.random() * 0.4,
+        'lon': -0.5 + rng.random() * 0.7,
+    } for i in range(count)] + [{'id': 'nowhere', 'lat': None, 'lon': None}]
+
+def brute_force(records, lat, lon):
+    '''
+    brute_force
+    '''
+    return sorted((haversine(lat, lon, np.array([r['lat']]), np.array([r['lon']]))[0], r['id']) for r in records if r['lat'] is not None)
+
+def test_haversine_known_distance():
+    '''
+    test_haversine_known_distance
+    '''
+    # one degree of latitude
+    assert math.isclose(haversine(51.0, 0.0, np.array([52.0]), np.array([0.0]))[0], 111_195, rel_tol=1e-3)
+
+def test_radius_and_nearest_match_brute_force():
+    '''
+    test_radius_and_nearest_match_brute_force
+    '''
+    records = make_records()
+    index = SpatialIndex(records)
+    expected = brute_force(records, 51.5, -0.12)
+    response = index.stop_points_by_radius(51.5, -0.12, radius=1500)
+    assert [stop['id'] for stop in response['stopPoints']] == [id_ for distance, id_ in expected if distance <= 1500]
+    assert response['centrePoint'] == [51.5, -0.12]
+    assert [stop['id'] for stop in index.nearest(51.5, -0.12, k=7)] == [id_ for _, id_ in expected[:7]]
+    metro = index.nearest(51.5, -0.12, k=3, types=['NaptanMetroStation'])
+    assert all(stop['stopType'] == 'NaptanMetroStation' for stop in metro)
+
+def test_nearest_from_outside_the_grid():
+    '''
+    test_nearest_from_outside_the_grid
+    '''
+    index = SpatialIndex(make_records(50))
+    assert len(index.nearest(48.85, 2.35, k=3)) == 3
+
+def test_bounds_query():
+    '''
+    test_bounds_query
+    '''
+    records = make_records()
+    index = SpatialIndex(records)
+    found = {r['id'] for r in index.places_within_bounds(51.45, -0.2, 51.55, -0.1)}
+    assert found == {r['id'] for r in records if r['lat'] is not None and 51.45 <= r['lat'] <= 51.55 and -0.2 <= r['lon'] <= -0.1}
+
+@pytest.mark.parametrize('entities', [False, True])
+def test_from_client_follows_pages(stub_server, entities):
+    '''
+    test_from_client_follows_pages
+    '''
+    from tfl.client import Client
+    stops = [{'id': f'stop{i}', 'commonName': f'Stop {i}', 'lat': 51.5 + i / 1000, 'lon': -0.1} for i in range(3)]
+    stub_server.routes['StopPoint/Mode/tube'] = [(200, {'stopPoints': stops[:2], 'total': 3, 'page': 1}), (200, {'stopPoints': stops[2:], 'total': 3, 'page': 2})]
+    stub_server.routes['BikePoint'] = (200, [{'id': 'BikePoints_1', 'commonName': 'Bikes', 'lat': 51.5, 'lon': -0.1005}])
+    index = SpatialIndex.from_client(Client(api_url=stub_server.url, entities=entities), bike_points=True)
+    assert len(index) == 4 and len(stub_server.requests) == 3
+    assert [record['id'] for record in index.nearest(51.5, -0.1, k=2)] == ['stop0', 'BikePoints_1']
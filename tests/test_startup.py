@@ -0,0 +1,53 @@
+'''
+test_startup.py
+'''
+from pathlib import Path
+import json
+import os
+import subprocess
+import sys
+import pytest
+import tfl
+from tfl.client import Client
+from tfl.endpoints import StopPointEndpoint
+
+# generous enough for slow CI machines, far below the cost of loading requests and the generated modules
+IMPORT_BUDGET = 0.15
+DEFERRED_MODULES = ('requests', 'asyncio', 'concurrent.futures', 'tfl.endpoints', 'tfl.entities', 'tfl.snapshot')
+
+SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import tfl
+from tfl.client import Client
+Client()
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'loaded': [name for name in %r if name in sys.modules]}))
+''' % (DEFERRED_MODULES,)
+
+def run_startup():
+    env = dict(os.environ, PYTHONPATH=str(Path(tfl.__file__).resolve().parent.parent))
+    output = subprocess.run([sys.executable, '-c', SCRIPT], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+def test_import_and_construction_within_budget():
+    '''
+    test_import_and_construction_within_budget
+    '''
+    # best of three to keep a busy machine from failing the budget
+    results = [run_startup() for _ in range(3)]
+    assert results[0]['loaded'] == []
+    assert min(result['elapsed'] for result in results) < IMPORT_BUDGET
+
+def test_endpoint_groups_created_on_first_access():
+    '''
+    test_endpoint_groups_created_on_first_access
+    '''
+    client = Client()
+    assert 'stoppoint' not in vars(client)
+    assert isinstance(client.stoppoint, StopPointEndpoint)
+    assert client.stoppoint is client.stoppoint
+    assert 'journey' in dir(client)
+    assert client.session is None
+    with pytest.raises(AttributeError):
+        client.not_an_endpoint
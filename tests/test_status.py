@@ -0,0 +1,65 @@
+'''
+test_status.py
+'''
+import asyncio
+import pytest
+from tfl.client import Client
+from tfl.status import DisruptionAdded, DisruptionCleared, SeverityChanged, StatusWatcher
+
+GOOD = {'statusSeverity': 10, 'statusSeverityDescription': 'Good Service'}
+DELAYS = {'statusSeverity': 9, 'statusSeverityDescription': 'Minor Delays', 'disruption': {'category': 'RealTime', 'description': 'Signal failure at Brixton.'}}
+PATH = 'Line/Mode/tube,dlr/Status'
+
+def test_watcher_emits_transitions_and_skips_unchanged(stub_server):
+    '''
+    test_watcher_emits_transitions_and_skips_unchanged
+    '''
+    stub_server.routes[PATH] = [
+        (200, [{'id': 'victoria', 'lineStatuses': [GOOD]}, {'id': 'dlr', 'lineStatuses': [GOOD]}]),
+        (200, [{'id': 'victoria', 'lineStatuses': [GOOD]}, {'id': 'dlr', 'lineStatuses': [GOOD]}]),
+        (200, [{'id': 'victoria', 'lineStatuses': [DELAYS]}, {'id': 'dlr', 'lineStatuses': [GOOD]}]),
+        (200, [{'id': 'victoria', 'lineStatuses': [GOOD]}, {'id': 'dlr', 'lineStatuses': [GOOD]}]),
+    ]
+    watcher = StatusWatcher(Client(api_url=stub_server.url), ['tube', 'dlr'])
+    received = []
+    watcher.subscribe(received.append)
+    assert [type(event) for event in watcher.poll()] == [SeverityChanged, SeverityChanged]
+    assert watcher.poll() == []
+    assert watcher.unchanged == 1
+    assert watcher.poll() == [
+        SeverityChanged('victoria', ((10, 'Good Service'),), ((9, 'Minor Delays'),)),
+        DisruptionAdded('victoria', DELAYS['disruption']),
+    ]
+    assert watcher.poll() == [
+        SeverityChanged('victoria', ((9, 'Minor Delays'),), ((10, 'Good Service'),)),
+        DisruptionCleared('victoria', DELAYS['disruption']),
+    ]
+    assert len(received) == 6
+    assert stub_server.requests[0].endswith('detail=true')
+
+def test_watcher_feeds_async_listeners(stub_server):
+    '''
+    test_watcher_feeds_async_listeners
+    '''
+    pytest.importorskip('aiohttp')
+    from tfl.async_client import AsyncClient
+    stub_server.routes[PATH] = [
+        (200, [{'id': 'victoria', 'lineStatuses': [GOOD]}]),
+        (200, [{'id': 'victoria', 'lineStatuses': [DELAYS]}]),
+    ]
+
+    async def consume(listener, count):
+        return [await listener.__anext__() for _ in range(count)]
+
+    async def run():
+        async with AsyncClient(api_url=stub_server.url) as client:
+            watcher = StatusWatcher(client, ['tube', 'dlr'], interval=0)
+            first, second = watcher.listen(), watcher.listen()
+            consumers = asyncio.gather(consume(first, 3), consume(second, 3))
+            await asyncio.sleep(0)
+            await watcher.arun(max_polls=2)
+            return await consumers
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert [type(event) for event in first] == [SeverityChanged, SeverityChanged, DisruptionAdded]
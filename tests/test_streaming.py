@@ -0,0 +1,67 @@
+'''
+test_streaming.py
+'''
+import json
+import pytest
+from tfl.client import Client
+from tfl.exceptions import TFLRequestException
+from tfl.streaming import JSONArrayParser, iter_json_array
+
+def chunked(data: bytes, size: int):
+    '''
+    chunked
+    '''
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize('size', [1, 3, 7, 64])
+def test_iter_json_array_matches_json_loads(size):
+    '''
+    test_iter_json_array_matches_json_loads
+    '''
+    payload = [{'id': 'victoria', 'name': 'Victoria ✓'}, 12345, -1.5e3, 'a,]"', None, True, [1, [2]], {}]
+    data = json.dumps(payload, ensure_ascii=False).encode()
+    assert list(iter_json_array(chunked(data, size))) == payload
+
+def test_split_elements_are_decoded_once():
+    '''
+    test_split_elements_are_decoded_once
+    '''
+    payload = [{'name': 'a"]}\\', 'stops': [['x'] * 50, {'y': '[{'}]}, 'b\\"]', [[]]]
+    data = json.dumps(payload).encode()
+    parser = JSONArrayParser()
+    calls = []
+    decode = parser._decoder.raw_decode
+    parser._decoder.raw_decode = lambda *args: calls.append(args[1]) or decode(*args)
+    items = []
+    for chunk in chunked(data, 2):
+        items.extend(parser.feed(chunk))
+    assert items + parser.close() == payload
+    assert len(calls) == len(payload)
+
+def test_iter_json_array_empty_and_invalid():
+    '''
+    test_iter_json_array_empty_and_invalid
+    '''
+    assert list(iter_json_array([b' [ ', b'] '])) == []
+    with pytest.raises(TFLRequestException):
+        list(iter_json_array([b'{"id": 1}']))
+    with pytest.raises(TFLRequestException):
+        list(iter_json_array([b'[{"id": 1}, {"id"']))
+
+def test_parser_buffers_only_unparsed_tail():
+    '''
+    test_parser_buffers_only_unparsed_tail
+    '''
+    parser = JSONArrayParser()
+    parser.feed(b'[' + b','.join([b'{"id": "x"}'] * 1000) + b',')
+    parser.feed(b'{"id": "y"}')
+    assert len(parser._buffer) < 32
+
+def test_client_streams_list_responses(stub_server):
+    '''
+    test_client_streams_list_responses
+    '''
+    stub_server.routes['Line/Mode/bus/Route'] = (200, [{'id': str(i)} for i in range(500)])
+    items = Client(api_url=stub_server.url).line.iter_valid_routes_for_modes(['bus'])
+    assert [item['id'] for item in items] == [str(i) for i in range(500)]
+    assert stub_server.requests[0].endswith('serviceTypes=Regular')
@@ -0,0 +1,88 @@
+'''
+test_tables.py
+'''
+import asyncio
+import json
+from pathlib import Path
+import numpy as np
+import pytest
+from tfl.client import Client
+from tfl.tables import ARRIVALS, LINE_STATUSES, ROUTE_SECTIONS, arrivals_table, line_statuses_table, schema_for
+
+SWAGGER = Path(__file__).resolve().parent.parent / 'swagger_file.json'
+
+LINES = [
+    {'id': 'victoria', 'name': 'Victoria', 'modeName': 'tube', 'lineStatuses': [
+        {'statusSeverity': 10, 'statusSeverityDescription': 'Good Service', 'created': '2024-01-01T12:00:00Z'},
+    ]},
+    {'id': 'central', 'name': 'Central', 'modeName': 'tube', 'lineStatuses': [
+        {'statusSeverity': 9, 'statusSeverityDescription': 'Minor Delays', 'reason': 'Signal failure', 'created': '2024-01-01T13:00:00.5+01:00'},
+        {'statusSeverity': 10, 'statusSeverityDescription': 'Good Service'},
+    ]},
+    {'id': 'dlr', 'name': 'DLR', 'modeName': 'dlr', 'lineStatuses': []},
+]
+
+def test_schemas_follow_swagger_definitions():
+    '''
+    test_schemas_follow_swagger_definitions
+    '''
+    definitions = json.loads(SWAGGER.read_text())['definitions']
+    for spec in (LINE_STATUSES, ARRIVALS, ROUTE_SECTIONS):
+        parents = {column for column, _, _ in spec.parent_columns}
+        for column in schema_for(spec):
+            entity = spec.parent if column.name in parents else spec.entity
+            prop = definitions[f'Tfl.Api.Presentation.Entities.{entity}']['properties'][column.key]
+            assert column.type == ('date-time' if prop.get('format') == 'date-time' else prop['type'])
+            assert not column.dictionary or column.type == 'string'
+
+def test_line_statuses_flatten_to_one_row_per_status():
+    '''
+    test_line_statuses_flatten_to_one_row_per_status
+    '''
+    table = line_statuses_table(LINES)
+    assert len(table) == 3
+    assert table.dictionaries['line_id'] == ['victoria', 'central', 'dlr']
+    assert table.arrays['line_id'].tolist() == [0, 1, 1]
+    assert table.column('status_severity_description').tolist() == ['Good Service', 'Minor Delays', 'Good Service']
+    assert table.arrays['status_severity'].dtype == np.int64
+    assert table.column('reason').tolist() == [None, 'Signal failure', None]
+    created = table.column('created')
+    assert created[0] == np.datetime64('2024-01-01T12:00:00.000') and created[1] == np.datetime64('2024-01-01T12:00:00.500')
+    assert np.isnat(created[2])
+    records = table.to_records()
+    assert records['mode_name'].tolist() == ['tube', 'tube', 'tube'] and records['status_severity'].tolist() == [10, 9, 10]
+
+def test_endpoint_tables_from_both_clients(stub_server):
+    '''
+    test_endpoint_tables_from_both_clients
+    '''
+    predictions = [{'id': str(i), 'lineId': 'victoria', 'platformName': f'Platform {i % 2}', 'timeToStation': i * 30 if i else None} for i in range(4)]
+    stub_server.routes['Line/victoria/Arrivals/940GZZLUOXC'] = (200, predictions)
+    stub_server.routes['Line/Mode/tube/Route'] = (200, [{'id': 'victoria', 'routeSections': [{'name': 'Brixton - Walthamstow', 'validFrom': '2024-01-01T00:00:00Z'}]}])
+    client = Client(api_url=stub_server.url, entities=True)
+    table = client.line.get_arrival_predictions_table(['victoria'], '940GZZLUOXC')
+    assert table.dictionaries['platform_name'] == ['Platform 0', 'Platform 1']
+    assert table.valid['time_to_station'].tolist() == [False, True, True, True]
+    assert table.arrays['time_to_station'].tolist() == [0, 30, 60, 90]
+    assert arrivals_table([]).num_rows == 0
+    try:
+        from tfl.async_client import AsyncClient
+    except ImportError:
+        pytest.skip('aiohttp is not installed')
+
+    async def main():
+        async with AsyncClient(api_url=stub_server.url) as client:
+            return await client.line.get_valid_routes_for_modes_table(['tube'])
+
+    routes = asyncio.run(main())
+    assert routes.column('line_id').tolist() == ['victoria'] and routes.column('name').tolist() == ['Brixton - Walthamstow']
+
+def test_to_arrow_keeps_dictionaries_and_nulls():
+    '''
+    test_to_arrow_keeps_dictionaries_and_nulls
+    '''
+    pa = pytest.importorskip('pyarrow')
+    arrow = line_statuses_table(LINES).to_arrow()
+    assert pa.types.is_dictionary(arrow.schema.field('line_id').type)
+    assert arrow.column('line_id').to_pylist() == ['victoria', 'central', 'central']
+    assert arrow.column('created').null_count == 1
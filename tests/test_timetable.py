@@ -0,0 +1,66 @@
+'''
+test_timetable.py
+'''
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from tfl.timetable import Timetable, format_minutes
+
+def timetable_response(departure_stop, journeys, intervals, day='Monday - Friday'):
+    '''
+    timetable_response
+    '''
+    return {
+        'lineId': 'victoria', 'direction': 'outbound',
+        'timetable': {'departureStopId': departure_stop, 'routes': [{
+            'stationIntervals': [{'id': str(i), 'intervals': [{'stopId': stop, 'timeToArrival': t} for stop, t in interval]} for i, interval in enumerate(intervals)],
+            'schedules': [{'name': day, 'knownJourneys': [{'hour': str(h), 'minute': str(m), 'intervalId': i} for h, m, i in journeys]}],
+        }]},
+    }
+
+RESPONSES = [
+    timetable_response('BXN', [(8, 0, 0), (8, 10, 1), (8, 20, 0), (24, 5, 0)], [[('STK', 2), ('VXL', 4), ('PIM', 6)], [('STK', 2), ('VXL', 5)]]),
+    timetable_response('BXN', [(9, 0, 0)], [[('STK', 3)]], day='Sunday'),
+]
+
+def test_next_departures_and_arrive_by():
+    '''
+    test_next_departures_and_arrive_by
+    '''
+    timetable = Timetable(RESPONSES)
+    assert timetable.day_types == ['Monday - Friday', 'Sunday']
+    departures = timetable.next_departures('VXL', '08:05', n=2, day_type='Monday - Friday')
+    assert [d.time for d in departures] == ['08:15', '08:24']
+    assert format_minutes(timetable.next_departures('BXN', '23:00', day_type='Monday - Friday')[0].minutes) == '00:05'
+    journey = timetable.arrive_by('STK', 'PIM', '08:27')
+    assert (format_minutes(journey.departure), format_minutes(journey.arrival)) == ('08:22', '08:26')
+    # the 08:10 journey does not call at PIM
+    assert timetable.arrive_by('BXN', 'PIM', '08:25').departure == 8 * 60
+    assert timetable.arrive_by('PIM', 'BXN', '12:00') is None
+    assert timetable.arrive_by('STK', 'PIM', '08:27', direction='inbound') is None
+    assert timetable.arrive_by('STK', 'PIM', '08:27', line_id='victoria', direction='outbound') == journey
+    assert [d.minutes for d in timetable.next_departures('STK', '08:00', n=1, line_id='victoria', direction='outbound', day_type='Sunday')] == [9 * 60 + 3]
+
+def test_batch_matches_single_queries():
+    '''
+    test_batch_matches_single_queries
+    '''
+    timetable = Timetable(RESPONSES)
+    stops = ['BXN', 'STK', 'VXL', 'PIM', 'XXX'] * 200
+    times = np.tile([480.0, 485.0, 500.0, 1500.0, 0.0], 200)
+    result = timetable.next_departure_batch(stops, times, day_type='Monday - Friday')
+    for stop, after, minutes in zip(stops[:5], times[:5], result[:5]):
+        expected = timetable.next_departures(stop, after, n=1, day_type='Monday - Friday')
+        assert (expected[0].minutes if expected else None) == (None if np.isnan(minutes) else minutes)
+    assert np.array_equal(result[:5], result[5:10], equal_nan=True)
+    everything = timetable.next_departure_batch(['STK'], '08:50')
+    assert everything[0] == 9 * 60 + 3
+
+def test_batch_clamps_times_before_midnight():
+    '''
+    test_batch_clamps_times_before_midnight
+    '''
+    timetable = Timetable(RESPONSES)
+    # with the series laid out back to back, -9000 would land on the last departures of the series before
+    assert timetable.next_departure_batch(['STK', 'VXL'], -9000.0, day_type='Monday - Friday').tolist() == [8 * 60 + 2, 8 * 60 + 4]